@@ -0,0 +1,107 @@
+#! /usr/bin/env python
+#
+# BSF Python benchmark script to measure the memory consumption of bsf.data objects.
+# A cohort of Sample objects with PairedReads and Reads objects for a number of FASTQ chunks
+# is built as by the CASAVA discovery and the maximum resident set size is reported.
+#
+#
+# Copyright 2014 Michael K. Schuster
+#
+# Biomedical Sequencing Facility (BSF), part of the genomics core facility
+# of the Research Center for Molecular Medicine (CeMM) of the
+# Austrian Academy of Sciences and the Medical University of Vienna (MUW).
+#
+#
+# This file is part of BSF Python.
+#
+# BSF Python is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# BSF Python is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with BSF Python.  If not, see <http://www.gnu.org/licenses/>.
+
+
+from argparse import ArgumentParser
+import cPickle
+import resource
+import time
+
+from bsf.data import Reads, PairedReads, Sample
+
+argument_parser = ArgumentParser(
+    description='Benchmark the memory consumption of Sample, PairedReads and Reads objects.')
+
+argument_parser.add_argument(
+    '--chunks',
+    default=500000,
+    help='number of FASTQ chunks (i.e. PairedReads objects) [500000]',
+    required=False,
+    type=int)
+
+argument_parser.add_argument(
+    '--chunks-per-sample',
+    default=50,
+    dest='chunks_per_sample',
+    help='number of FASTQ chunks per Sample [50]',
+    required=False,
+    type=int)
+
+name_space = argument_parser.parse_args()
+
+baseline_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+start_time = time.time()
+
+sample_list = list()
+
+for sample_index in range(0, (name_space.chunks + name_space.chunks_per_sample - 1) // name_space.chunks_per_sample):
+    sample_name = 'sample_{:d}'.format(sample_index)
+    # Build the directory as a new string for each Sample, as os.path.join() does for each directory listing.
+    sample_path = '/'.join(('', 'data', 'Project_{:d}'.format(sample_index // 100), 'Sample_' + sample_name))
+
+    sample = Sample(file_path=sample_path, file_type='CASAVA', name=sample_name)
+
+    for chunk_index in range(0, min(name_space.chunks_per_sample,
+                                    name_space.chunks - sample_index * name_space.chunks_per_sample)):
+        lane = 'L{:03d}'.format(chunk_index // 10 + 1)
+        chunk = '{:03d}'.format(chunk_index % 10 + 1)
+        reads_list = list()
+
+        for read in ('R1', 'R2'):
+            file_name = '_'.join((sample_name, 'ACGTACGT', lane, read, chunk)) + '.fastq.gz'
+            reads_list.append(Reads(
+                file_path='/'.join((sample_path, file_name)),
+                file_type='CASAVA',
+                name=sample_name,
+                barcode='ACGTACGT',
+                lane=lane,
+                read=read,
+                chunk=chunk))
+
+        paired_reads = PairedReads(reads1=reads_list[0], reads2=reads_list[1])
+
+        sample.add_paired_reads(paired_reads=paired_reads)
+
+    sample_list.append(sample)
+
+build_seconds = time.time() - start_time
+build_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+print 'build Sample: {:d} PairedReads: {:d} Reads: {:d} seconds: {:.2f}'. \
+    format(len(sample_list), name_space.chunks, 2 * name_space.chunks, build_seconds)
+print 'maximum RSS: {:d} KiB increase: {:d} KiB bytes per PairedReads: {:.0f}'. \
+    format(build_rss, build_rss - baseline_rss, 1024.0 * (build_rss - baseline_rss) / max(name_space.chunks, 1))
+
+# Check that the objects survive pickling, as for Runnable objects.
+
+start_time = time.time()
+pickled_string = cPickle.dumps(sample_list[:100], cPickle.HIGHEST_PROTOCOL)
+cPickle.loads(pickled_string)
+print 'pickle 100 Sample objects bytes: {:d} seconds: {:.2f}'.format(len(pickled_string), time.time() - start_time)
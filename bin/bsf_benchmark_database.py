@@ -0,0 +1,145 @@
+#! /usr/bin/env python
+#
+# BSF Python benchmark script to measure the query performance of the job database.
+# A database is populated with ProcessSLURM rows and look-ups by job name and job identifier
+# are timed without and with the secondary indexes declared by the DatabaseAdaptor objects.
+# Finally, streaming all rows, as for reports, is timed with all columns and with a projection.
+#
+#
+# Copyright 2014 Michael K. Schuster
+#
+# Biomedical Sequencing Facility (BSF), part of the genomics core facility
+# of the Research Center for Molecular Medicine (CeMM) of the
+# Austrian Academy of Sciences and the Medical University of Vienna (MUW).
+#
+#
+# This file is part of BSF Python.
+#
+# BSF Python is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# BSF Python is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with BSF Python.  If not, see <http://www.gnu.org/licenses/>.
+
+
+from argparse import ArgumentParser
+import os
+import random
+import resource
+import tempfile
+import time
+
+from bsf.database import DatabaseConnection, ProcessSLURM, ProcessSLURMAdaptor
+
+argument_parser = ArgumentParser(
+    description='Benchmark job database look-ups without and with secondary indexes.')
+
+argument_parser.add_argument(
+    '--rows',
+    default=1000000,
+    help='number of ProcessSLURM rows [1000000]',
+    required=False,
+    type=int)
+
+argument_parser.add_argument(
+    '--queries',
+    default=1000,
+    help='number of look-ups of each kind [1000]',
+    required=False,
+    type=int)
+
+argument_parser.add_argument(
+    '--directory',
+    help='directory for the database file [system temporary directory]',
+    required=False,
+    type=str)
+
+name_space = argument_parser.parse_args()
+
+database_path = tempfile.mktemp(suffix='.db', prefix='bsfpython_benchmark_', dir=name_space.directory)
+
+database_connection = DatabaseConnection(file_path=database_path)
+database_connection.create_schema()
+
+process_slurm_adaptor = ProcessSLURMAdaptor(database_connection=database_connection)
+
+# Populate the database with rows resembling a multi-year job database, in which each job name has been
+# submitted a few times.
+
+start_time = time.time()
+
+chunk_size = 100000
+for offset in range(0, name_space.rows, chunk_size):
+    process_slurm_adaptor.insert_many(data_object_list=map(
+        lambda x: ProcessSLURM(job_id=str(1000000 + x), job_name='job_{:d}'.format(x // 4), state='COMPLETED'),
+        range(offset, min(offset + chunk_size, name_space.rows))))
+
+print 'insert_many rows: {:d} seconds: {:.2f}'.format(name_space.rows, time.time() - start_time)
+
+job_name_list = map(lambda x: 'job_{:d}'.format(random.randrange(0, name_space.rows // 4)),
+                    range(0, name_space.queries))
+job_id_list = map(lambda x: str(1000000 + random.randrange(0, name_space.rows)),
+                  range(0, name_space.queries))
+
+
+def report(label):
+    """Time and print look-ups by job name and job identifier.
+
+    @param label: Label
+    @type label: str
+    """
+
+    start = time.time()
+    for job_name in job_name_list:
+        process_slurm_adaptor.select_all_by_job_name(name=job_name)
+    seconds_name = time.time() - start
+
+    start = time.time()
+    for job_id in job_id_list:
+        process_slurm_adaptor.select_by_job_id(job_id=job_id)
+    seconds_id = time.time() - start
+
+    print '{:16s} select_all_by_job_name: {:.3f} ms select_by_job_id: {:.3f} ms'. \
+        format(label, 1000.0 * seconds_name / len(job_name_list), 1000.0 * seconds_id / len(job_id_list))
+
+
+# Simulate a database of an earlier version by dropping the secondary indexes.
+
+for index_name, column_expression in process_slurm_adaptor.index_definition:
+    database_connection.connection.execute('DROP INDEX {!r}'.format(index_name))
+database_connection.connection.commit()
+
+report(label='without indexes')
+
+# Upgrade the database, which adds the missing indexes.
+
+start_time = time.time()
+database_connection.create_schema()
+print 'create_schema upgrade seconds: {:.2f}'.format(time.time() - start_time)
+
+report(label='with indexes')
+
+
+# Time reporting over all rows, streamed in constant memory, with all columns and with a projection.
+
+for column_name_list in (None, ['job_name', 'state']):
+    start_time = time.time()
+    state_dict = dict()
+    for process_slurm in process_slurm_adaptor.iterate_all(column_name_list=column_name_list):
+        state_dict[process_slurm.state] = state_dict.get(process_slurm.state, 0) + 1
+    print 'iterate_all columns: {} rows: {:d} seconds: {:.2f} maximum RSS: {:d} KiB'. \
+        format(column_name_list if column_name_list else 'all', sum(state_dict.values()), time.time() - start_time,
+               resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)
+
+database_connection.close()
+
+for suffix in ('', '-wal', '-shm'):
+    if os.path.exists(database_path + suffix):
+        os.remove(database_path + suffix)
@@ -0,0 +1,200 @@
+#! /usr/bin/env python
+#
+# BSF Python benchmark script to measure the discovery of CASAVA ProcessedRunFolder trees.
+# A synthetic ProcessedRunFolder with Project, Sample and Reads (FASTQ) entries is created and
+# discovered via the former os.listdir and os.stat walk and via bsf.data with increasing numbers
+# of threads. Finally, the discovery cache is written and read back. All discovered object trees
+# are compared with each other.
+# Pass a directory on the network file system in question, since local file systems cache
+# directory entries and hide the latency of stat calls.
+#
+#
+# Copyright 2014 Michael K. Schuster
+#
+# Biomedical Sequencing Facility (BSF), part of the genomics core facility
+# of the Research Center for Molecular Medicine (CeMM) of the
+# Austrian Academy of Sciences and the Medical University of Vienna (MUW).
+#
+#
+# This file is part of BSF Python.
+#
+# BSF Python is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# BSF Python is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with BSF Python.  If not, see <http://www.gnu.org/licenses/>.
+
+
+from argparse import ArgumentParser
+import os
+import re
+import shutil
+from stat import *
+import tempfile
+import time
+
+import bsf.data
+from bsf.data import Project, ProcessedRunFolder, Reads, Sample
+
+argument_parser = ArgumentParser(
+    description='Benchmark the discovery of a synthetic CASAVA ProcessedRunFolder.')
+
+argument_parser.add_argument(
+    '--projects',
+    default=50,
+    help='number of Project directories [50]',
+    required=False,
+    type=int)
+
+argument_parser.add_argument(
+    '--samples',
+    default=5000,
+    help='total number of Sample directories [5000]',
+    required=False,
+    type=int)
+
+argument_parser.add_argument(
+    '--threads',
+    default='1,4,8,16',
+    help='comma-separated numbers of threads [1,4,8,16]',
+    required=False,
+    type=str)
+
+argument_parser.add_argument(
+    '--directory',
+    help='directory for the synthetic tree [system temporary directory]',
+    required=False,
+    type=str)
+
+name_space = argument_parser.parse_args()
+
+temporary_directory = tempfile.mkdtemp(prefix='bsfpython_benchmark_', dir=name_space.directory)
+
+prf_path = os.path.join(temporary_directory, 'BSF_0000_C00000ACXX_CASAVA182')
+
+
+def write_file(file_path):
+    """Write an empty file.
+
+    @param file_path: File path
+    @type file_path: str | unicode
+    """
+
+    open(file_path, 'w').close()
+
+
+# Create the synthetic tree, with paired FASTQ files and an unrelated file per Sample.
+
+start_time = time.time()
+
+os.mkdir(prf_path)
+write_file(file_path=os.path.join(prf_path, 'SampleSheet.csv'))
+
+for sample_index in range(0, name_space.samples):
+    project_path = os.path.join(prf_path, 'Project_project_{:d}'.format(sample_index % name_space.projects))
+    if not os.path.isdir(project_path):
+        os.mkdir(project_path)
+    sample_name = 'sample_{:d}'.format(sample_index)
+    sample_path = os.path.join(project_path, 'Sample_' + sample_name)
+    os.mkdir(sample_path)
+    write_file(file_path=os.path.join(sample_path, 'SampleSheet.csv'))
+    for read in ('R1', 'R2'):
+        write_file(file_path=os.path.join(sample_path, '{}_ACGTAC_L001_{}_001.fastq.gz'.format(sample_name, read)))
+
+print 'Created projects: {:d} samples: {:d} seconds: {:.2f}'. \
+    format(name_space.projects, name_space.samples, time.time() - start_time)
+
+
+def discover_legacy(file_path):
+    """Discover a CASAVA ProcessedRunFolder via os.listdir and os.stat, one directory at a time.
+
+    @param file_path: File path
+    @type file_path: str | unicode
+    @return: C{ProcessedRunFolder}
+    @rtype: ProcessedRunFolder
+    """
+
+    components = os.path.basename(file_path).split('_')
+
+    prf = ProcessedRunFolder(file_path=file_path, file_type='CASAVA', name=os.path.basename(file_path),
+                             prefix=components[0], flow_cell=components[1], version=components[2])
+
+    for project_name in os.listdir(file_path):
+        project_path = os.path.join(file_path, project_name)
+        match = re.search(pattern=r'^Project_(.*)$', string=project_name)
+        if not (S_ISDIR(os.stat(project_path).st_mode) and match):
+            continue
+        project = Project(file_path=project_path, file_type='CASAVA', name=match.group(1))
+        for sample_name in os.listdir(project_path):
+            sample_path = os.path.join(project_path, sample_name)
+            match = re.search(pattern=r'^Sample_(.*)$', string=sample_name)
+            if not (S_ISDIR(os.stat(sample_path).st_mode) and match):
+                continue
+            sample = Sample(file_path=sample_path, file_type='CASAVA', name=match.group(1))
+            for reads_name in os.listdir(sample_path):
+                reads_path = os.path.join(sample_path, reads_name)
+                match = re.search(pattern=r'fastq.gz$', string=reads_name)
+                if S_ISREG(os.stat(reads_path).st_mode) and match:
+                    sample.add_reads(reads=Reads.from_file_path(file_path=reads_path, file_type='CASAVA'))
+            project.add_sample(sample=sample)
+        prf.add_project(project=project)
+
+    return prf
+
+
+def get_tree(prf):
+    """Get a comparable representation of a C{ProcessedRunFolder} tree.
+
+    @param prf: C{ProcessedRunFolder}
+    @type prf: ProcessedRunFolder
+    @return: Python C{list} of nested Python C{tuple} objects
+    @rtype: list
+    """
+
+    tree_list = list()
+
+    for project in prf.get_all_projects():
+        for sample in project.get_all_samples():
+            tree_list.append((
+                project.name,
+                project.file_path,
+                sample.name,
+                sample.file_path,
+                map(lambda x: (x.reads1.file_path if x.reads1 else None,
+                               x.reads2.file_path if x.reads2 else None), sample.paired_reads_list)))
+
+    return tree_list
+
+
+start_time = time.time()
+reference_tree = get_tree(prf=discover_legacy(file_path=prf_path))
+print '{:24s} seconds: {:.2f}'.format('os.listdir and os.stat', time.time() - start_time)
+
+print 'scandir available: {}'.format(bsf.data.scandir is not None)
+
+for threads in map(int, name_space.threads.split(',')):
+    start_time = time.time()
+    tree = get_tree(prf=ProcessedRunFolder.from_file_path(
+        file_path=prf_path, file_type='CASAVA', threads=threads, cache=False))
+    print '{:24s} seconds: {:.2f} identical: {}'. \
+        format('threads: {:d}'.format(threads), time.time() - start_time, tree == reference_tree)
+
+# Directories modified within the second the discovery starts are not cached.
+
+time.sleep(1.0)
+
+for label in ('cache write', 'cache read'):
+    start_time = time.time()
+    tree = get_tree(prf=ProcessedRunFolder.from_file_path(file_path=prf_path, file_type='CASAVA', cache=True))
+    print '{:24s} seconds: {:.2f} identical: {}'.format(label, time.time() - start_time, tree == reference_tree)
+
+print 'cache file size: {:d} bytes'.format(os.path.getsize(ProcessedRunFolder.get_cache_path(file_path=prf_path)))
+
+shutil.rmtree(temporary_directory)
@@ -0,0 +1,127 @@
+#! /usr/bin/env python
+#
+# BSF Python benchmark script to measure the throughput of Runnable.run
+# for a child process writing large amounts of STDOUT into a file.
+# The direct redirection of the STDOUT file descriptor is compared to
+# the line-by-line copying through a Python thread.
+#
+#
+# Copyright 2014 Michael K. Schuster
+#
+# Biomedical Sequencing Facility (BSF), part of the genomics core facility
+# of the Research Center for Molecular Medicine (CeMM) of the
+# Austrian Academy of Sciences and the Medical University of Vienna (MUW).
+#
+#
+# This file is part of BSF Python.
+#
+# BSF Python is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# BSF Python is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with BSF Python.  If not, see <http://www.gnu.org/licenses/>.
+
+
+from argparse import ArgumentParser
+import os
+from subprocess import PIPE, Popen
+import sys
+import tempfile
+from threading import Lock
+import time
+
+from bsf import Executable, Runnable
+
+# A synthetic producer writing SAM-like records of about 200 bytes to STDOUT,
+# until the requested number of bytes has been written.
+
+producer_script = """
+import sys
+record = 'READ:1:1101:1000:2000\\t99\\tchr1\\t10000\\t60\\t101M\\t=\\t10200\\t301\\t' + 'A' * 101 + '\\t' + 'I' * 101 + '\\n'
+block = record * 4096
+total = int(sys.argv[1])
+written = 0
+while written < total:
+    sys.stdout.write(block)
+    written += len(block)
+"""
+
+argument_parser = ArgumentParser(
+    description='Benchmark Runnable.run STDOUT redirection throughput.')
+
+argument_parser.add_argument(
+    '--debug',
+    help='debug level',
+    required=False,
+    type=int)
+
+argument_parser.add_argument(
+    '--size',
+    default=10 * 1024 * 1024 * 1024,
+    help='number of bytes the synthetic producer writes to STDOUT [10 GiB]',
+    required=False,
+    type=int)
+
+argument_parser.add_argument(
+    '--directory',
+    help='directory for the STDOUT file [system temporary directory]',
+    required=False,
+    type=str)
+
+argument_parser.add_argument(
+    '--threaded',
+    action='store_true',
+    help='additionally benchmark line-by-line copying via a Python thread')
+
+name_space = argument_parser.parse_args()
+
+stdout_path = tempfile.mktemp(suffix='.sam', prefix='bsfpython_benchmark_', dir=name_space.directory)
+
+executable = Executable(name='producer', program=sys.executable, stdout_path=stdout_path)
+executable.arguments.append('-c')
+executable.arguments.append(producer_script)
+executable.arguments.append(str(name_space.size))
+
+
+def report(label, seconds):
+    """Print throughput information.
+
+    @param label: Label
+    @type label: str
+    @param seconds: Elapsed time in seconds
+    @type seconds: float
+    """
+
+    size = os.path.getsize(stdout_path)
+
+    print '{:10s} bytes: {:d} seconds: {:.2f} throughput: {:.1f} MiB/s'. \
+        format(label, size, seconds, size / seconds / 1024.0 / 1024.0)
+
+
+# Benchmark the direct redirection of the child STDOUT file descriptor.
+
+start_time = time.time()
+return_code = Runnable.run(executable=executable, debug=name_space.debug if name_space.debug else 0)
+report(label='direct', seconds=time.time() - start_time)
+os.remove(stdout_path)
+
+Runnable.evaluate_return_code(executable=executable, return_code=return_code)
+
+# Benchmark the line-by-line copying through a Python thread.
+
+if name_space.threaded:
+    start_time = time.time()
+    child_process = Popen(args=executable.command_list(), bufsize=0, stdin=PIPE, stdout=PIPE, shell=False)
+    Runnable.process_stdout(stdout_handle=child_process.stdout, thread_lock=Lock(), stdout_path=stdout_path)
+    return_code = child_process.wait()
+    report(label='threaded', seconds=time.time() - start_time)
+    os.remove(stdout_path)
+
+    Runnable.evaluate_return_code(executable=executable, return_code=return_code)
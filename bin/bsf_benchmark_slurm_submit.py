@@ -0,0 +1,153 @@
+#! /usr/bin/env python
+#
+# BSF Python benchmark script to measure the latency of submitting Executable objects
+# into the Simple Linux Utility for Resource Management (SLURM) via bsf.drms.slurm.submit.
+# A stub sbatch script, which only prints a job identifier, is put first on the PATH,
+# so that the benchmark measures the overhead of the submission code and the job database.
+#
+#
+# Copyright 2014 Michael K. Schuster
+#
+# Biomedical Sequencing Facility (BSF), part of the genomics core facility
+# of the Research Center for Molecular Medicine (CeMM) of the
+# Austrian Academy of Sciences and the Medical University of Vienna (MUW).
+#
+#
+# This file is part of BSF Python.
+#
+# BSF Python is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# BSF Python is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with BSF Python.  If not, see <http://www.gnu.org/licenses/>.
+
+
+from argparse import ArgumentParser
+import os
+import shutil
+import tempfile
+import time
+
+from bsf import DRMS, Executable
+import bsf.drms.slurm
+
+# A stub sbatch script printing a job identifier made unique from its process identifier and random numbers.
+
+stub_script = """#! /bin/bash
+echo "Submitted batch job $$$RANDOM$RANDOM"
+"""
+
+argument_parser = ArgumentParser(
+    description='Benchmark bsf.drms.slurm.submit latency against a stub sbatch.')
+
+argument_parser.add_argument(
+    '--debug',
+    default=0,
+    help='debug level, values above 0 do not run sbatch at all',
+    required=False,
+    type=int)
+
+argument_parser.add_argument(
+    '--executables',
+    default=1000,
+    help='number of Executable objects in each of the two DRMS stages [1000]',
+    required=False,
+    type=int)
+
+argument_parser.add_argument(
+    '--dependencies',
+    default=2,
+    help='number of first-stage Executable objects each second-stage Executable depends on [2]',
+    required=False,
+    type=int)
+
+argument_parser.add_argument(
+    '--resubmissions',
+    default=1,
+    help='number of times both stages are submitted into the same job database [1]',
+    required=False,
+    type=int)
+
+argument_parser.add_argument(
+    '--arrays',
+    action='store_true',
+    help='allow submitting SLURM job arrays for the first stage')
+
+argument_parser.add_argument(
+    '--directory',
+    help='directory for the job database and scripts [new temporary directory]',
+    required=False,
+    type=str)
+
+name_space = argument_parser.parse_args()
+
+if not name_space.arrays:
+    bsf.drms.slurm.array_minimum_size = name_space.executables + 1
+
+if name_space.directory:
+    work_directory = name_space.directory
+    remove_directory = False
+else:
+    work_directory = tempfile.mkdtemp(prefix='bsfpython_benchmark_')
+    remove_directory = True
+
+stub_directory = os.path.join(work_directory, 'bin')
+if not os.path.isdir(stub_directory):
+    os.makedirs(stub_directory)
+
+stub_path = os.path.join(stub_directory, 'sbatch')
+stub_file = open(stub_path, 'w')
+stub_file.write(stub_script)
+stub_file.close()
+os.chmod(stub_path, 0755)
+
+os.environ['PATH'] = stub_directory + os.pathsep + os.environ['PATH']
+
+
+def create_drms(name):
+    """Create a SLURM C{DRMS} object.
+
+    @param name: Name
+    @type name: str
+    @return: C{DRMS}
+    @rtype: DRMS
+    """
+
+    return DRMS(name=name, work_directory=work_directory, implementation='slurm', time_limit='60',
+                memory_limit_hard='4G', queue='shortq')
+
+
+for submission in range(0, name_space.resubmissions):
+    drms_first = create_drms(name='benchmark_first')
+    drms_second = create_drms(name='benchmark_second')
+
+    for index in range(0, name_space.executables):
+        executable = Executable(name='benchmark_first_{:06d}'.format(index), program='true')
+        executable.arguments.append(str(index))
+        drms_first.add_executable(executable=executable)
+
+        executable = Executable(name='benchmark_second_{:06d}'.format(index), program='true')
+        executable.arguments.append(str(index))
+        for offset in range(0, name_space.dependencies):
+            executable.dependencies.append(
+                'benchmark_first_{:06d}'.format((index + offset) % name_space.executables))
+        drms_second.add_executable(executable=executable)
+
+    start_time = time.time()
+    drms_first.submit(debug=name_space.debug)
+    drms_second.submit(debug=name_space.debug)
+    seconds = time.time() - start_time
+
+    print 'submission: {:d} executables: {:d} seconds: {:.2f} latency: {:.2f} ms'. \
+        format(submission + 1, 2 * name_space.executables, seconds,
+               1000.0 * seconds / (2 * name_space.executables))
+
+if remove_directory:
+    shutil.rmtree(path=work_directory, ignore_errors=True)
@@ -31,7 +31,7 @@ import os.path
 from pickle import Unpickler
 import shutil
 
-from bsf import Command, Default, Executable, Runnable
+from bsf import Command, Default, Executable, Pipeline, Runnable
 
 # Set the environment consistently.
 
@@ -96,7 +96,6 @@ if not os.path.isdir(path_temporary):
 
 path_fastq_1 = "{}{}_R1.fastq".format(prefix, replicate_key)
 path_fastq_2 = "{}{}_R2.fastq".format(prefix, replicate_key)
-path_aligned_sam = "{}{}_aligned.sam".format(prefix, replicate_key)
 path_cleaned_sam = "{}{}_cleaned.sam".format(prefix, replicate_key)
 path_header_sam = "{}{}_header.sam".format(prefix, replicate_key)
 path_temporary_sam = "{}{}_temporary.sam".format(prefix, replicate_key)
@@ -106,11 +105,11 @@ path_sorted_bam = "{}{}.bam".format(prefix, replicate_key)
 sam_header_pg = list()
 sam_header_rg = list()
 
-# Run BWA to produce an aligned SAM file.
+# Run BWA to produce aligned SAM, which gets streamed into Picard CleanSam without an intermediate file.
 
 run_bwa = pickler_dict['bwa_executable']
 assert isinstance(run_bwa, Executable)
-run_bwa.stdout_path = path_aligned_sam
+run_bwa.stdout_path = str()
 
 # Check if the run_bwa sub-command got a BAM file to align in mem mode.
 # If so, convert it first into FASTQ file(s).
@@ -195,18 +194,41 @@ if run_bwa.sub_command.command == 'mem' and run_bwa.sub_command.arguments[1][-4:
     if os.path.getsize(filename=path_fastq_2):
         run_bwa.sub_command.arguments.append(path_fastq_2)
 
-child_return_code = Runnable.run(executable=run_bwa)
 
-if child_return_code:
-    raise Exception('Could not complete the {!r} step.'.format(run_bwa.name))
+def sort_sam_executable(input_path):
+    """Create an Executable running Picard SortSam to convert SAM into a coordinate sorted BAM file.
 
-# Remove the temporary, uncompressed FASTQ files if they exist.
-if os.path.exists(path=path_fastq_1):
-    os.remove(path_fastq_1)
-if os.path.exists(path=path_fastq_2):
-    os.remove(path_fastq_2)
+    @param input_path: SAM file path
+    @type input_path: str | unicode
+    @return: Executable
+    @rtype: Executable
+    """
+
+    sort_sam_process = Executable(name='sort_sam', program='java', sub_command=Command(command=str()))
+    sort_sam_process.add_option_short(key='jar', value=os.path.join(classpath_picard, 'SortSam.jar'))
+    sort_sam_process.add_switch_short(key='d64')
+    sort_sam_process.add_switch_short(key='Xmx6G')
 
-# Run Picard CleanSam to convert the aligned SAM file into a cleaned SAM file.
+    sort_sam = sort_sam_process.sub_command
+    sort_sam.add_option_pair(key='INPUT', value=input_path)
+    sort_sam.add_option_pair(key='OUTPUT', value=path_sorted_bam)
+    sort_sam.add_option_pair(key='SORT_ORDER', value='coordinate')
+    sort_sam.add_option_pair(key='TMP_DIR', value=path_temporary)
+    sort_sam.add_option_pair(key='VERBOSITY', value='WARNING')
+    sort_sam.add_option_pair(key='QUIET', value='false')
+    sort_sam.add_option_pair(key='VALIDATION_STRINGENCY', value='STRICT')
+    sort_sam.add_option_pair(key='COMPRESSION_LEVEL', value='5')
+    sort_sam.add_option_pair(key='MAX_RECORDS_IN_RAM', value='4000000')
+    sort_sam.add_option_pair(key='CREATE_INDEX', value='true')
+    sort_sam.add_option_pair(key='CREATE_MD5_FILE', value='true')
+
+    return sort_sam_process
+
+
+# Run Picard CleanSam on the aligned SAM stream from BWA.
+# If no SAM header lines need retrofitting, stream the cleaned SAM further into Picard SortSam.
+
+retrofit_header = len(sam_header_pg) or len(sam_header_rg)
 
 java_process = Executable(name='clean_sam',
                           program='java',
@@ -216,21 +238,38 @@ java_process.add_option_short(key='jar', value=os.path.join(classpath_picard, 'C
 java_process.add_switch_short(key='Xmx4G')
 
 clean_sam = java_process.sub_command
-clean_sam.add_option_pair(key='INPUT', value=path_aligned_sam)
-clean_sam.add_option_pair(key='OUTPUT', value=path_cleaned_sam)
+clean_sam.add_option_pair(key='INPUT', value='/dev/stdin')
+if retrofit_header:
+    clean_sam.add_option_pair(key='OUTPUT', value=path_cleaned_sam)
+else:
+    clean_sam.add_option_pair(key='OUTPUT', value='/dev/stdout')
 clean_sam.add_option_pair(key='TMP_DIR', value=path_temporary)
 clean_sam.add_option_pair(key='VERBOSITY', value='WARNING')
 clean_sam.add_option_pair(key='QUIET', value='false')
 clean_sam.add_option_pair(key='VALIDATION_STRINGENCY', value='STRICT')
 
-child_return_code = Runnable.run(executable=java_process)
+pipeline = Pipeline(name='bwa_clean_sam')
+pipeline.add_executable(executable=run_bwa)
+pipeline.add_executable(executable=java_process)
+
+if not retrofit_header:
+    pipeline.add_executable(executable=sort_sam_executable(input_path='/dev/stdin'))
 
-if child_return_code:
-    raise Exception('Could not complete the {!r} step.'.format(java_process.name))
+child_return_code_list = pipeline.run()
+
+for index in range(0, len(pipeline.executable_list)):
+    if child_return_code_list[index]:
+        raise Exception('Could not complete the {!r} step.'.format(pipeline.executable_list[index].name))
+
+# Remove the temporary, uncompressed FASTQ files if they exist.
+if os.path.exists(path=path_fastq_1):
+    os.remove(path_fastq_1)
+if os.path.exists(path=path_fastq_2):
+    os.remove(path_fastq_2)
 
 # Retrofit the stored SAM header lines if required.
 
-if len(sam_header_pg) or len(sam_header_rg):
+if retrofit_header:
 
     samtools = Executable(name='samtools_view',
                           program='samtools',
@@ -298,35 +337,14 @@ if len(sam_header_pg) or len(sam_header_rg):
     # Remove the now redundant header file.
     os.remove(path_header_sam)
 
-# Remove the aligned SAM file.
+    # Run Picard SortSam to convert the cleaned SAM file into a coordinate sorted BAM file.
 
-if os.path.exists(path=path_aligned_sam):
-    os.remove(path_aligned_sam)
+    java_process = sort_sam_executable(input_path=path_cleaned_sam)
 
-# Run Picard SortSam to convert the cleaned SAM file into a coordinate sorted BAM file.
+    child_return_code = Runnable.run(executable=java_process)
 
-java_process = Executable(name='sort_sam', program='java', sub_command=Command(command=str()))
-java_process.add_option_short(key='jar', value=os.path.join(classpath_picard, 'SortSam.jar'))
-java_process.add_switch_short(key='d64')
-java_process.add_switch_short(key='Xmx6G')
-
-sort_sam = java_process.sub_command
-sort_sam.add_option_pair(key='INPUT', value=path_cleaned_sam)
-sort_sam.add_option_pair(key='OUTPUT', value=path_sorted_bam)
-sort_sam.add_option_pair(key='SORT_ORDER', value='coordinate')
-sort_sam.add_option_pair(key='TMP_DIR', value=path_temporary)
-sort_sam.add_option_pair(key='VERBOSITY', value='WARNING')
-sort_sam.add_option_pair(key='QUIET', value='false')
-sort_sam.add_option_pair(key='VALIDATION_STRINGENCY', value='STRICT')
-sort_sam.add_option_pair(key='COMPRESSION_LEVEL', value='5')
-sort_sam.add_option_pair(key='MAX_RECORDS_IN_RAM', value='4000000')
-sort_sam.add_option_pair(key='CREATE_INDEX', value='true')
-sort_sam.add_option_pair(key='CREATE_MD5_FILE', value='true')
-
-child_return_code = Runnable.run(executable=java_process)
-
-if child_return_code:
-    raise Exception('Could not complete the {!r} step.'.format(java_process.name))
+    if child_return_code:
+        raise Exception('Could not complete the {!r} step.'.format(java_process.name))
 
 # Remove the cleaned SAM file.
 
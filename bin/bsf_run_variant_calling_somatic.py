@@ -32,7 +32,7 @@ import os.path
 from pickle import Unpickler
 import shutil
 
-from bsf import Runnable
+from bsf import Checkpoint, Runnable
 
 
 def run_executable(key):
@@ -45,11 +45,32 @@ def run_executable(key):
     """
 
     executable = pickler_dict[key]
+
+    # Remove any previous record, so that an interrupted run is never considered complete.
+    if executable.name in checkpoint.record_dict:
+        checkpoint.remove_executable(name=executable.name)
+        checkpoint.to_file_path()
+
     child_return_code = Runnable.run(executable=executable)
 
     if child_return_code:
         raise Exception('Could not complete the {!r} step.'.format(executable.name))
 
+    checkpoint.add_executable(executable=executable)
+    checkpoint.to_file_path()
+
+
+def is_complete(key):
+    """Check whether an Executable defined in the Pickler dict is complete according to the Checkpoint.
+
+    :param key: Key for the Executable
+    :type key: str
+    :return: True if the Executable is complete, False otherwise
+    :rtype: bool
+    """
+
+    return checkpoint.is_complete(executable=pickler_dict[key], debug=args.debug if args.debug else 0)
+
 
 def run_mutect():
     """Run MuTect.
@@ -58,8 +79,7 @@ def run_mutect():
     :rtype: None
     """
 
-    if os.path.exists(pickler_dict['file_path_dict']['mutect_vcf']) \
-            and os.path.getsize(pickler_dict['file_path_dict']['mutect_vcf']):
+    if is_complete(key='mutect'):
         return
 
     run_executable(key='mutect')
@@ -72,8 +92,7 @@ def run_indel_genotyper():
     :rtype: None
     """
 
-    if os.path.exists(pickler_dict['file_path_dict']['indel_idx']) \
-            and os.path.getsize(pickler_dict['file_path_dict']['indel_idx']):
+    if is_complete(key='indel_genotyper'):
         return
 
     run_mutect()
@@ -88,8 +107,7 @@ def run_gatk_combine_variants():
     :rtype: None
     """
 
-    if os.path.exists(pickler_dict['file_path_dict']['combined_idx']) \
-            and os.path.getsize(pickler_dict['file_path_dict']['combined_idx']):
+    if is_complete(key='gatk_combine_variants'):
         return
 
     run_indel_genotyper()
@@ -108,8 +126,7 @@ def run_snpeff():
     :rtype: None
     """
 
-    if os.path.exists(pickler_dict['file_path_dict']['snpeff_vcf']) \
-            and os.path.getsize(pickler_dict['file_path_dict']['snpeff_vcf']):
+    if is_complete(key='snpeff'):
         return
 
     run_gatk_combine_variants()
@@ -123,8 +140,7 @@ def run_gatk_variant_annotator():
     :rtype: None
     """
 
-    if os.path.exists(pickler_dict['file_path_dict']['annotated_idx']) \
-            and os.path.getsize(pickler_dict['file_path_dict']['annotated_idx']):
+    if is_complete(key='gatk_variant_annotator'):
         return
 
     run_snpeff()
@@ -143,8 +159,7 @@ def run_gatk_variant_to_table():
     :rtype: None
     """
 
-    if os.path.exists(pickler_dict['file_path_dict']['annotated_csv']) \
-            and os.path.getsize(pickler_dict['file_path_dict']['annotated_csv']):
+    if is_complete(key='gatk_variants_to_table'):
         return
 
     run_gatk_variant_annotator()
@@ -183,6 +198,10 @@ pickler_dict = unpickler.load()
 
 pickler_file.close()
 
+# Read the checkpoint manifest next to the Pickler file.
+
+checkpoint = Checkpoint.from_file_path(file_path=os.path.splitext(args.pickler_path)[0] + '.checkpoint.json')
+
 # Create a temporary directory.
 
 path_temporary = pickler_dict['file_path_dict']['temporary_directory']
@@ -0,0 +1,97 @@
+#! /usr/bin/env python
+#
+# BSF Python script to synchronise the SGE accounting file into a job database incrementally.
+# The script is meant to run periodically (e.g. via cron), each run only reading the accounting
+# records appended since the previous run.
+#
+#
+# Copyright 2014 Michael K. Schuster
+#
+# Biomedical Sequencing Facility (BSF), part of the genomics core facility
+# of the Research Center for Molecular Medicine (CeMM) of the
+# Austrian Academy of Sciences and the Medical University of Vienna (MUW).
+#
+#
+# This file is part of BSF Python.
+#
+# BSF Python is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# BSF Python is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with BSF Python.  If not, see <http://www.gnu.org/licenses/>.
+
+
+from argparse import ArgumentParser
+import os
+
+from bsf.database import DatabaseConnection
+from bsf.drms.sge import get_accounting_file_path, synchronise_accounting
+
+argument_parser = ArgumentParser(
+    description='Synchronise the SGE accounting file into a job database.')
+
+argument_parser.add_argument(
+    '--database',
+    default='bsfpython_sge_jobs.db',
+    help='job database file path [bsfpython_sge_jobs.db]',
+    required=False,
+    type=str)
+
+argument_parser.add_argument(
+    '--accounting',
+    help='SGE accounting file path [$SGE_ROOT/$SGE_CELL/common/accounting]',
+    required=False,
+    type=str)
+
+argument_parser.add_argument(
+    '--qacct',
+    action='store_true',
+    help='read SGE qacct -j output rather than the accounting file')
+
+argument_parser.add_argument(
+    '--write-ahead-log',
+    action='store_true',
+    dest='write_ahead_log',
+    help='use the write-ahead log (WAL) journal mode, only if all processes run on this host')
+
+argument_parser.add_argument(
+    '--owner',
+    help='owner to restrict SGE qacct records to [all owners]',
+    required=False,
+    type=str)
+
+name_space = argument_parser.parse_args()
+
+if name_space.qacct:
+    accounting_path = None
+elif name_space.accounting:
+    accounting_path = name_space.accounting
+else:
+    accounting_path = get_accounting_file_path()
+
+    if accounting_path is None or not os.path.isfile(accounting_path):
+        raise Exception('Could not find the SGE accounting file, please set --accounting or --qacct.')
+
+database_connection = DatabaseConnection(file_path=name_space.database,
+                                         write_ahead_log=name_space.write_ahead_log)
+database_connection.create_schema()
+
+process_sge_sync = synchronise_accounting(
+    database_connection=database_connection,
+    file_path=accounting_path,
+    owner=name_space.owner)
+
+print 'Synchronised {} accounting records from {}, high-water mark {} job {}.'.format(
+    process_sge_sync.job_count,
+    process_sge_sync.source,
+    process_sge_sync.end_time,
+    process_sge_sync.job_number)
+
+database_connection.close()
@@ -0,0 +1,159 @@
+#! /usr/bin/env python
+#
+# BSF Python script to simulate the scheduling of an Analysis on a model of a cluster,
+# without submitting any jobs. The Analysis is run to create its DRMS objects, the wall time
+# of each Executable is estimated from the job databases and the dependency graph is replayed
+# with and without the packing configured for each DRMS and with and without critical path priorities.
+#
+#
+# Copyright 2014 Michael K. Schuster
+#
+# Biomedical Sequencing Facility (BSF), part of the genomics core facility
+# of the Research Center for Molecular Medicine (CeMM) of the
+# Austrian Academy of Sciences and the Medical University of Vienna (MUW).
+#
+#
+# This file is part of BSF Python.
+#
+# BSF Python is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# BSF Python is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with BSF Python.  If not, see <http://www.gnu.org/licenses/>.
+
+
+from argparse import ArgumentParser
+import datetime
+import importlib
+
+from bsf.drms import get_memory
+from bsf.graph import ExecutableGraph
+from bsf.simulation import ClusterModel, Simulation
+
+argument_parser = ArgumentParser(
+    description='Simulate the scheduling of an Analysis on a model of a cluster.')
+
+argument_parser.add_argument(
+    '--debug',
+    default=0,
+    help='debug level [0]',
+    required=False,
+    type=int)
+
+argument_parser.add_argument(
+    '--analysis',
+    default='bsf.analyses.RunFastQC',
+    help='Analysis class [bsf.analyses.RunFastQC]',
+    required=False,
+    type=str)
+
+argument_parser.add_argument(
+    '--nodes',
+    default=1,
+    help='number of nodes [1]',
+    required=False,
+    type=int)
+
+argument_parser.add_argument(
+    '--cores',
+    default=1,
+    help='number of cores per node [1]',
+    required=False,
+    type=int)
+
+argument_parser.add_argument(
+    '--memory',
+    default='0',
+    help='memory per node with an optional k, M, G or T suffix or 0 for unlimited memory [0]',
+    required=False,
+    type=str)
+
+argument_parser.add_argument(
+    '--job-overhead',
+    default=60,
+    dest='job_overhead',
+    help='scheduling and start-up overhead per job in seconds [60]',
+    required=False,
+    type=int)
+
+argument_parser.add_argument(
+    'configuration',
+    help='configuration file (*.ini)')
+
+name_space = argument_parser.parse_args()
+
+(module_name, class_name) = name_space.analysis.rsplit('.', 1)
+
+analysis_class = getattr(importlib.import_module(module_name), class_name)
+
+analysis = analysis_class.from_config_file_path(config_path=name_space.configuration)
+
+if name_space.debug:
+    analysis.debug = name_space.debug
+
+analysis.run()
+
+executable_graph = ExecutableGraph.from_drms_list(drms_list=analysis.drms_list)
+
+print executable_graph.report()
+
+cluster_model = ClusterModel(
+    nodes=name_space.nodes,
+    cores=name_space.cores,
+    memory=get_memory(memory=name_space.memory))
+
+# Simulate the packing configured for each DRMS, without packing the DRMS objects themselves.
+
+pack_dict = dict()
+
+for drms in analysis.drms_list:
+    if drms.get_pack_size() > 1:
+        pack_dict[drms.name] = (drms.get_pack_size(), max(1, drms.pack_threads))
+
+scenario_list = list()
+
+if len(pack_dict):
+    scenario_list.append(('packed', pack_dict, True))
+    scenario_list.append(('packed', pack_dict, False))
+
+scenario_list.append(('unpacked', None, True))
+scenario_list.append(('unpacked', None, False))
+
+print 'Scenario                Jobs  Makespan            Seconds  Core utilisation'
+
+simulation_list = list()
+
+for (packing, scenario_pack_dict, prioritise) in scenario_list:
+    simulation = Simulation.from_executable_graph(
+        executable_graph=executable_graph,
+        cluster_model=cluster_model,
+        job_overhead=name_space.job_overhead,
+        pack_dict=scenario_pack_dict)
+    simulation.run(prioritise=prioritise)
+    simulation_list.append(simulation)
+
+    if simulation.makespan:
+        utilisation = simulation.core_seconds / (cluster_model.nodes * cluster_model.cores * simulation.makespan)
+    else:
+        utilisation = 0.0
+
+    print '{:8s} {:10s} {:8d}  {:>16s}  {:9d}  {:.1%}'.format(
+        packing,
+        'priority' if prioritise else 'submission',
+        len(simulation.job_list),
+        str(datetime.timedelta(seconds=int(simulation.makespan))),
+        int(simulation.makespan),
+        utilisation)
+
+print
+print simulation_list[0].report()
+
+if name_space.debug > 1:
+    print executable_graph.trace(1)
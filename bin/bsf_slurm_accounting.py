@@ -0,0 +1,82 @@
+#! /usr/bin/env python
+#
+# BSF Python script to synchronise the SLURM accounting database into a job database incrementally.
+# The script is meant to run periodically (e.g. via cron), each run only fetching jobs that are new
+# or have changed since the high-water mark of the previous run.
+#
+#
+# Copyright 2014 Michael K. Schuster
+#
+# Biomedical Sequencing Facility (BSF), part of the genomics core facility
+# of the Research Center for Molecular Medicine (CeMM) of the
+# Austrian Academy of Sciences and the Medical University of Vienna (MUW).
+#
+#
+# This file is part of BSF Python.
+#
+# BSF Python is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# BSF Python is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with BSF Python.  If not, see <http://www.gnu.org/licenses/>.
+
+
+from argparse import ArgumentParser
+
+from bsf.database import DatabaseConnection
+from bsf.drms.slurm import synchronise_accounting
+
+argument_parser = ArgumentParser(
+    description='Synchronise the SLURM accounting database into a job database.')
+
+argument_parser.add_argument(
+    '--database',
+    default='bsfpython_slurm_jobs.db',
+    help='job database file path [bsfpython_slurm_jobs.db]',
+    required=False,
+    type=str)
+
+argument_parser.add_argument(
+    '--user',
+    help='user name to synchronise jobs for [current user]',
+    required=False,
+    type=str)
+
+argument_parser.add_argument(
+    '--write-ahead-log',
+    action='store_true',
+    dest='write_ahead_log',
+    help='use the write-ahead log (WAL) journal mode, only if all processes run on this host')
+
+argument_parser.add_argument(
+    '--start-time',
+    dest='start_time',
+    help='start time in ISO 8601 format for the first synchronisation [midnight]',
+    required=False,
+    type=str)
+
+name_space = argument_parser.parse_args()
+
+database_connection = DatabaseConnection(file_path=name_space.database,
+                                         write_ahead_log=name_space.write_ahead_log)
+database_connection.create_schema()
+
+process_slurm_sync = synchronise_accounting(
+    database_connection=database_connection,
+    user=name_space.user,
+    start_time=name_space.start_time)
+
+print 'Synchronised {} job records since {}, high-water mark {} job {}.'.format(
+    process_slurm_sync.job_count,
+    process_slurm_sync.start_time,
+    process_slurm_sync.end_time,
+    process_slurm_sync.job_id)
+
+database_connection.close()
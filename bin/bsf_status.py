@@ -0,0 +1,118 @@
+#! /usr/bin/env python
+#
+# BSF Python script to report the progress of the Executable objects of an Analysis after their
+# submission into a DRMS. Each poll queries the DRMS once per implementation and job database,
+# regardless of the number of jobs, and reports pending, running, failed and done Executable objects
+# of each DRMS together with their throughput and the estimated time of arrival (ETA).
+#
+#
+# Copyright 2014 Michael K. Schuster
+#
+# Biomedical Sequencing Facility (BSF), part of the genomics core facility
+# of the Research Center for Molecular Medicine (CeMM) of the
+# Austrian Academy of Sciences and the Medical University of Vienna (MUW).
+#
+#
+# This file is part of BSF Python.
+#
+# BSF Python is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# BSF Python is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with BSF Python.  If not, see <http://www.gnu.org/licenses/>.
+
+
+from argparse import ArgumentParser
+import importlib
+import time
+
+from bsf.status import AnalysisStatus
+
+argument_parser = ArgumentParser(
+    description='Report the progress of an Analysis submitted into a DRMS.')
+
+argument_parser.add_argument(
+    '--debug',
+    default=0,
+    help='debug level [0]',
+    required=False,
+    type=int)
+
+argument_parser.add_argument(
+    '--analysis',
+    default='bsf.analyses.RunFastQC',
+    help='Analysis class [bsf.analyses.RunFastQC]',
+    required=False,
+    type=str)
+
+argument_parser.add_argument(
+    '--user',
+    help='user name to restrict DRMS queries to',
+    required=False,
+    type=str)
+
+argument_parser.add_argument(
+    '--window',
+    default=3600,
+    help='time window in seconds for calculating the throughput [3600]',
+    required=False,
+    type=int)
+
+argument_parser.add_argument(
+    '--interval',
+    default=0,
+    help='poll interval in seconds or 0 to poll once [0]',
+    required=False,
+    type=int)
+
+argument_parser.add_argument(
+    '--synchronise',
+    action='store_true',
+    help='synchronise the accounting records of the job databases before each poll',
+    required=False)
+
+argument_parser.add_argument(
+    'configuration',
+    help='configuration file (*.ini)')
+
+name_space = argument_parser.parse_args()
+
+(module_name, class_name) = name_space.analysis.rsplit('.', 1)
+
+analysis_class = getattr(importlib.import_module(module_name), class_name)
+
+analysis = analysis_class.from_config_file_path(config_path=name_space.configuration)
+
+if name_space.debug:
+    analysis.debug = name_space.debug
+
+# Run the Analysis to create its DRMS objects, without submitting them.
+
+analysis.run()
+
+while True:
+    analysis_status = AnalysisStatus.from_analysis(
+        analysis=analysis,
+        user=name_space.user,
+        window=name_space.window,
+        synchronise=name_space.synchronise)
+
+    print analysis_status.report()
+
+    if name_space.debug > 1:
+        for drms_status in analysis_status.drms_status_list:
+            print drms_status.trace(1)
+
+    summary = analysis_status.get_summary()
+
+    if not name_space.interval or not summary.get_remaining():
+        break
+
+    time.sleep(name_space.interval)
@@ -285,6 +285,13 @@ for key in key_list:
     sub_command.add_option_long(key='vcf', value=file_path_somatic['mutect_vcf'])
     sub_command.add_option_long(key='coverage_file', value=file_path_somatic['mutect_wig'])
 
+    java_process.input_path_list.append(
+        'variant_calling_process_sample_{}_realigned.bam'.format(analysis.comparisons[key][0][1][0].name))
+    java_process.input_path_list.append(
+        'variant_calling_process_sample_{}_realigned.bam'.format(analysis.comparisons[key][-1][1][0].name))
+    java_process.output_path_list.append(file_path_somatic['mutect_vcf'])
+    java_process.output_path_list.append(file_path_somatic['mutect_out'])
+
     pickler_dict_somatic[java_process.name] = java_process
 
     # Run the Indel Genotyper analysis
@@ -333,6 +340,12 @@ for key in key_list:
 
     sub_command.add_option_long(key='window_size', value='1000')
 
+    java_process.input_path_list.append(
+        'variant_calling_process_sample_{}_realigned.bam'.format(analysis.comparisons[key][0][1][0].name))
+    java_process.input_path_list.append(
+        'variant_calling_process_sample_{}_realigned.bam'.format(analysis.comparisons[key][-1][1][0].name))
+    java_process.output_path_list.append(file_path_somatic['indel_vcf'])
+
     pickler_dict_somatic[java_process.name] = java_process
 
     # Run the GATK Combine Variants analysis
@@ -358,6 +371,11 @@ for key in key_list:
     sub_command.add_option_long(key='variant', value=file_path_somatic['indel_vcf'])
     sub_command.add_option_long(key='out', value=file_path_somatic['combined_vcf'])
 
+    java_process.input_path_list.append(file_path_somatic['mutect_vcf'])
+    java_process.input_path_list.append(file_path_somatic['indel_vcf'])
+    java_process.output_path_list.append(file_path_somatic['combined_vcf'])
+    java_process.output_path_list.append(file_path_somatic['combined_idx'])
+
     pickler_dict_somatic[java_process.name] = java_process
 
     # Run the snpEff tool for functional variant annotation.
@@ -380,6 +398,9 @@ for key in key_list:
     sub_command.arguments.append(snpeff_genome_version)
     sub_command.arguments.append(file_path_somatic['combined_vcf'])
 
+    java_process.input_path_list.append(file_path_somatic['combined_vcf'])
+    java_process.output_path_list.append(file_path_somatic['snpeff_vcf'])
+
     pickler_dict_somatic[java_process.name] = java_process
 
     # Run the GATK Variant Annotator
@@ -421,6 +442,11 @@ for key in key_list:
     sub_command.add_option_long(key='snpEffFile', value=file_path_somatic['snpeff_vcf'])
     sub_command.add_option_long(key='out', value=file_path_somatic['annotated_vcf'])
 
+    java_process.input_path_list.append(file_path_somatic['combined_vcf'])
+    java_process.input_path_list.append(file_path_somatic['snpeff_vcf'])
+    java_process.output_path_list.append(file_path_somatic['annotated_vcf'])
+    java_process.output_path_list.append(file_path_somatic['annotated_idx'])
+
     pickler_dict_somatic[java_process.name] = java_process
 
     # Run the GATK VariantsToTable step.
@@ -483,6 +509,9 @@ for key in key_list:
                     key='fields',
                     value=string.join(words=(annotation_resource, annotation), sep='.'))
 
+    java_process.input_path_list.append(file_path_somatic['annotated_vcf'])
+    java_process.output_path_list.append(file_path_somatic['annotated_csv'])
+
     pickler_dict_somatic[java_process.name] = java_process
 
     # Write the Pickler dict file for somatic variant calling.
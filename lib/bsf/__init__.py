@@ -31,20 +31,27 @@ Reference: http://www.biomedical-sequencing.at/
 from ConfigParser import SafeConfigParser
 import datetime
 import errno
+import hashlib
 import importlib
+import json
 import os
 from pickle import Pickler, Unpickler, HIGHEST_PROTOCOL
+from Queue import Queue
 import re
+import signal
 from stat import *
 import string
 from subprocess import PIPE, Popen
 import sys
 from threading import Lock, Thread
+import time
 import uuid
 import warnings
 
 from bsf import defaults
 from bsf.data import Collection, Sample, SampleGroup
+from bsf.drms import consult_result_cache, get_wave_list, record_result_cache, record_sizing, size_executables
+from bsf.graph import ExecutableGraph
 from bsf.argument import *
 
 
@@ -79,6 +86,11 @@ class Analysis(object):
     @type comparisons: dict
     @ivar samples: Python C{list} of C{Sample} objects
     @type samples: list
+    @ivar critical_path: Assign priorities to C{Executable} objects along the critical path of
+        their dependency graph across all C{DRMS} objects and report the expected makespan on submission
+    @type critical_path: bool
+    @ivar discovery_cache: Read and write the discovery cache of CASAVA C{ProcessedRunFolder} objects
+    @type discovery_cache: bool
     """
 
     @classmethod
@@ -123,7 +135,8 @@ class Analysis(object):
                  input_directory=None, output_directory=None,
                  project_directory=None, genome_directory=None,
                  sas_file=None, sas_prefix=None, e_mail=None, debug=0, drms_list=None,
-                 runnable_dict=None, collection=None, comparisons=None, samples=None):
+                 runnable_dict=None, collection=None, comparisons=None, samples=None, critical_path=False,
+                 discovery_cache=False):
         """Initialise an C{Analysis} object.
 
         @param configuration: C{Configuration}
@@ -162,6 +175,10 @@ class Analysis(object):
         @type comparisons: dict
         @param samples: Python C{list} of C{Sample} objects
         @type samples: list
+        @param critical_path: Assign priorities along the critical path and report the expected makespan
+        @type critical_path: bool
+        @param discovery_cache: Read and write the discovery cache of CASAVA C{ProcessedRunFolder} objects
+        @type discovery_cache: bool
         """
 
         if configuration:
@@ -238,6 +255,9 @@ class Analysis(object):
         else:
             self.samples = list()
 
+        self.critical_path = critical_path
+        self.discovery_cache = discovery_cache
+
     def trace(self, level):
         """Trace an C{Analysis} object.
 
@@ -264,6 +284,8 @@ class Analysis(object):
         output += '{}  collection: {!r}\n'.format(indent, self.collection)
         output += '{}  comparisons: {!r}\n'.format(indent, self.comparisons)
         output += '{}  samples: {!r}\n'.format(indent, self.samples)
+        output += '{}  critical_path: {!r}\n'.format(indent, self.critical_path)
+        output += '{}  discovery_cache: {!r}\n'.format(indent, self.discovery_cache)
 
         output += '{}  Python dict of Runnable objects:\n'.format(indent)
         keys = self.runnable_dict.keys()
@@ -361,6 +383,12 @@ class Analysis(object):
         if configuration.config_parser.has_option(section=section, option='e_mail'):
             self.e_mail = configuration.config_parser.get(section=section, option='e_mail')
 
+        if configuration.config_parser.has_option(section=section, option='critical_path'):
+            self.critical_path = configuration.config_parser.getboolean(section=section, option='critical_path')
+
+        if configuration.config_parser.has_option(section=section, option='discovery_cache'):
+            self.discovery_cache = configuration.config_parser.getboolean(section=section, option='discovery_cache')
+
     def run(self):
         """Run the C{Analysis}.
 
@@ -431,7 +459,8 @@ class Analysis(object):
                 file_type='Automatic',
                 name=self.project_name,
                 sas_path=self.sas_file,
-                sas_prefix=self.sas_prefix)
+                sas_prefix=self.sas_prefix,
+                discovery_cache=self.discovery_cache)
 
             if self.debug > 1:
                 print '{!r} Collection name: {!r}'.format(self, self.collection.name)
@@ -666,6 +695,8 @@ class Analysis(object):
     def submit(self, drms_name=None):
         """Submit each C{DRMS} object and pickle each C{Runnable} object.
 
+        If requested, C{Executable} objects of all C{DRMS} objects get priorities along the critical path
+        of their dependency graph via the C{ExecutableGraph} class, which also reports the expected makespan.
         @param drms_name: Only submit C{Executable} objects linked to C{DRMS.name}
         @type drms_name: str
         """
@@ -675,6 +706,57 @@ class Analysis(object):
         for key in self.runnable_dict.keys():
             self.runnable_dict[key].to_pickler_path()
 
+        # Share a single Python dict of packed Executable names between the DRMS objects of this Analysis,
+        # so that dependencies on Executable objects packed by another DRMS can be resolved.
+        # Entries of DRMS objects packed before are kept.
+
+        pack_name_dict = dict()
+
+        for drms in self.drms_list:
+            pack_name_dict.update(drms.pack_name_dict)
+
+        for drms in self.drms_list:
+            drms.pack_name_dict = pack_name_dict
+
+        # Share a new Python dict of input sizes between the DRMS objects of this Analysis,
+        # so that the sizing of an Executable can account for the input of upstream Executable objects
+        # of another DRMS, but not for Executable objects of another Analysis.
+
+        input_size_dict = dict()
+
+        for drms in self.drms_list:
+            drms.input_size_dict = input_size_dict
+
+        # Share a new Python set of submitted Executable names and a new Python dict of output file cache keys
+        # between the DRMS objects of this Analysis, so that the result cache can account for upstream
+        # Executable objects of another DRMS, but not for Executable objects of another Analysis.
+
+        result_cache_submitted_set = set()
+        result_cache_output_dict = dict()
+
+        for drms in self.drms_list:
+            drms.result_cache_submitted_set = result_cache_submitted_set
+            drms.result_cache_output_dict = result_cache_output_dict
+
+        # Consult the result cache and pack Executable objects of all Distributed Resource Management System
+        # objects in order, so that dependencies on packed Executable objects can be resolved, even if only
+        # a single DRMS object gets submitted.
+
+        for drms in self.drms_list:
+            drms.pack(debug=self.debug)
+
+        # Prioritise Executable objects with a long chain of dependent Executable objects ahead of them,
+        # regardless of the order of the DRMS objects.
+
+        if self.critical_path:
+            executable_graph = ExecutableGraph.from_drms_list(drms_list=self.drms_list,
+                                                              name_dict=pack_name_dict)
+            executable_graph.assign_priorities()
+            print executable_graph.report()
+
+            if self.debug > 1:
+                print executable_graph.trace(1)
+
         # Submit all Executable objects of all Distributed Resource Management System objects.
 
         submit = 0
@@ -1454,8 +1536,117 @@ class DRMS(object):
     @type is_script: bool
     @ivar executables: Python list of Executable objects
     @type executables: list
+    @ivar pack_size: Maximum number of Executable objects packed into a single job or 0 to disable packing
+    @type pack_size: int
+    @ivar pack_minutes: Target number of CPU minutes, based on the time limit of each Executable,
+        packed into a single job or 0 to disable packing
+    @type pack_minutes: int
+    @ivar pack_threads: Number of packed Executable objects running concurrently in a single job
+    @type pack_threads: int
+    @ivar packed: Executable objects have been packed
+    @type packed: bool
+    @ivar pack_name_dict: Python dict of Python str (packed Executable.name) key data and
+        Python str (packing Executable.name) value data, shared by all DRMS objects of an Analysis
+    @type pack_name_dict: dict
+    @ivar input_size_dict: Python dict of Python str (Executable.name) key data and
+        Python int (input size in bytes) value data of all sized Executable objects,
+        shared by all DRMS objects of an Analysis
+    @type input_size_dict: dict
+    @ivar submit_threads: Number of concurrent submissions into the DRMS
+    @type submit_threads: int
+    @ivar sizing: Predict the memory and time limit of each Executable from the resource usage of
+        earlier Executable objects of the same DRMS name
+    @type sizing: bool
+    @ivar sizing_margin: Safety margin factor applied to predicted memory and time limits
+    @type sizing_margin: float
+    @ivar sizing_samples: Minimum number of earlier Executable objects required for a prediction
+    @type sizing_samples: int
+    @ivar sizing_database: Job database file path with the resource usage or
+        an empty string for the job database of the implementation in the work directory
+    @type sizing_database: str
+    @ivar result_cache: Skip Executable objects, whose results have been cached in the work directory
+    @type result_cache: bool
+    @ivar result_cache_submitted_set: Python set of Python str (Executable.name) objects of all
+        Executable objects submitted despite a result cache, shared by all DRMS objects of an Analysis
+    @type result_cache_submitted_set: set
+    @ivar result_cache_output_dict: Python dict of Python str (output file path) key data and
+        Python str (cache key) value data, shared by all DRMS objects of an Analysis
+    @type result_cache_output_dict: dict
+    @ivar result_cache_list: Python list of bsf.database.ResultCache objects to record after submission
+    @type result_cache_list: list
+    @ivar database_write_ahead_log: Use the write-ahead log (WAL) journal mode for job databases,
+        which is only safe, if all submitters run on the same host
+    @type database_write_ahead_log: bool
+    @cvar pack_output_directory: Directory for STDOUT and STDERR files of packed Executable objects
+    @type pack_output_directory: str
     """
 
+    pack_output_directory = 'bsfpython_pack_output'
+
+    @staticmethod
+    def get_minutes(time_limit):
+        """Convert a SLURM-style time limit into minutes.
+
+        Supported formats are I{minutes}, I{minutes:seconds}, I{hours:minutes:seconds},
+        I{days-hours}, I{days-hours:minutes} and I{days-hours:minutes:seconds}.
+        @param time_limit: Time limit
+        @type time_limit: str
+        @return: Time limit in minutes or 0, if it could not be parsed
+        @rtype: int
+        """
+
+        match = re.search(pattern=r'^(?:(\d+)-)?(\d+)(?::(\d+))?(?::(\d+))?$', string=time_limit.strip())
+
+        if not match:
+            return 0
+
+        days = int(match.group(1)) if match.group(1) else 0
+        fields = map(lambda x: int(x), filter(lambda x: x is not None, match.group(2, 3, 4)))
+
+        if match.group(1):
+            # days-hours[:minutes[:seconds]]
+            fields.extend([0] * (3 - len(fields)))
+            (hours, minutes, seconds) = fields
+        elif len(fields) == 3:
+            (hours, minutes, seconds) = fields
+        elif len(fields) == 2:
+            (hours, minutes, seconds) = (0, fields[0], fields[1])
+        else:
+            (hours, minutes, seconds) = (0, fields[0], 0)
+
+        return days * 24 * 60 + hours * 60 + minutes + (1 if seconds else 0)
+
+    @staticmethod
+    def get_time_limit(minutes):
+        """Convert minutes into a SLURM-style I{days-hours:minutes:seconds} time limit.
+
+        @param minutes: Minutes
+        @type minutes: int
+        @return: Time limit
+        @rtype: str
+        """
+
+        return '{:d}-{:02d}:{:02d}:00'.format(minutes // (24 * 60), minutes % (24 * 60) // 60, minutes % 60)
+
+    @staticmethod
+    def scale_memory(memory, factor):
+        """Scale a memory specification with an optional I{k}, I{M}, I{G} or I{T} suffix by a factor.
+
+        @param memory: Memory specification
+        @type memory: str
+        @param factor: Factor
+        @type factor: int
+        @return: Scaled memory specification or the original one, if it could not be parsed
+        @rtype: str
+        """
+
+        match = re.search(pattern=r'^(\d+)([kKmMgGtT]?)$', string=memory)
+
+        if not match:
+            return memory
+
+        return str(int(match.group(1)) * factor) + match.group(2)
+
     @classmethod
     def from_analysis(cls, name, work_directory, analysis):
         """Create a DRMS object from an Analysis object.
@@ -1546,7 +1737,17 @@ class DRMS(object):
                  threads=1,
                  hold=None,
                  is_script=False,
-                 executables=None):
+                 executables=None,
+                 pack_size=0,
+                 pack_minutes=0,
+                 pack_threads=1,
+                 submit_threads=1,
+                 sizing=False,
+                 sizing_margin=1.2,
+                 sizing_samples=5,
+                 sizing_database=None,
+                 result_cache=False,
+                 database_write_ahead_log=False):
         """Initialise a DRMS object.
 
         @param name: Name
@@ -1580,6 +1781,30 @@ class DRMS(object):
         @type is_script: bool
         @param executables: Python list of Executable objects
         @type executables: list
+        @param pack_size: Maximum number of Executable objects packed into a single job or 0 to disable packing
+        @type pack_size: int
+        @param pack_minutes: Target number of CPU minutes, based on the time limit of each Executable,
+            packed into a single job or 0 to disable packing
+        @type pack_minutes: int
+        @param pack_threads: Number of packed Executable objects running concurrently in a single job
+        @type pack_threads: int
+        @param submit_threads: Number of concurrent submissions into the DRMS
+        @type submit_threads: int
+        @param sizing: Predict the memory and time limit of each Executable from the resource usage of
+            earlier Executable objects of the same DRMS name
+        @type sizing: bool
+        @param sizing_margin: Safety margin factor applied to predicted memory and time limits
+        @type sizing_margin: float
+        @param sizing_samples: Minimum number of earlier Executable objects required for a prediction
+        @type sizing_samples: int
+        @param sizing_database: Job database file path with the resource usage or
+            an empty string for the job database of the implementation in the work directory
+        @type sizing_database: str
+        @param result_cache: Skip Executable objects, whose results have been cached in the work directory
+        @type result_cache: bool
+        @param database_write_ahead_log: Use the write-ahead log (WAL) journal mode for job databases,
+            which is only safe, if all submitters run on the same host
+        @type database_write_ahead_log: bool
         """
 
         if name:
@@ -1651,6 +1876,28 @@ class DRMS(object):
         else:
             self.executables = list()
 
+        self.pack_size = pack_size
+        self.pack_minutes = pack_minutes
+        self.pack_threads = pack_threads
+        self.packed = False
+        self.pack_name_dict = dict()
+        self.input_size_dict = dict()
+        self.submit_threads = submit_threads
+        self.sizing = sizing
+        self.sizing_margin = sizing_margin
+        self.sizing_samples = sizing_samples
+
+        if sizing_database:
+            self.sizing_database = sizing_database
+        else:
+            self.sizing_database = str()
+
+        self.result_cache = result_cache
+        self.result_cache_submitted_set = set()
+        self.result_cache_output_dict = dict()
+        self.result_cache_list = list()
+        self.database_write_ahead_log = database_write_ahead_log
+
     def trace(self, level):
         """Trace a DRMS object.
 
@@ -1691,6 +1938,28 @@ class DRMS(object):
             format(indent, self.hold)
         output += '{}  is_script:            {!r}\n'. \
             format(indent, self.is_script)
+        output += '{}  pack_size:            {!r}\n'. \
+            format(indent, self.pack_size)
+        output += '{}  pack_minutes:         {!r}\n'. \
+            format(indent, self.pack_minutes)
+        output += '{}  pack_threads:         {!r}\n'. \
+            format(indent, self.pack_threads)
+        output += '{}  packed:               {!r}\n'. \
+            format(indent, self.packed)
+        output += '{}  submit_threads:       {!r}\n'. \
+            format(indent, self.submit_threads)
+        output += '{}  sizing:               {!r}\n'. \
+            format(indent, self.sizing)
+        output += '{}  sizing_margin:        {!r}\n'. \
+            format(indent, self.sizing_margin)
+        output += '{}  sizing_samples:       {!r}\n'. \
+            format(indent, self.sizing_samples)
+        output += '{}  sizing_database:      {!r}\n'. \
+            format(indent, self.sizing_database)
+        output += '{}  result_cache:         {!r}\n'. \
+            format(indent, self.result_cache)
+        output += '{}  database_write_ahead_log: {!r}\n'. \
+            format(indent, self.database_write_ahead_log)
 
         output += '{}  executables:\n'.format(indent)
 
@@ -1767,6 +2036,47 @@ class DRMS(object):
             self.threads = configuration.config_parser.get(section=section,
                                                            option='threads')
 
+        if configuration.config_parser.has_option(section=section, option='pack_size'):
+            self.pack_size = configuration.config_parser.getint(section=section,
+                                                                option='pack_size')
+
+        if configuration.config_parser.has_option(section=section, option='pack_minutes'):
+            self.pack_minutes = configuration.config_parser.getint(section=section,
+                                                                   option='pack_minutes')
+
+        if configuration.config_parser.has_option(section=section, option='pack_threads'):
+            self.pack_threads = configuration.config_parser.getint(section=section,
+                                                                   option='pack_threads')
+
+        if configuration.config_parser.has_option(section=section, option='submit_threads'):
+            self.submit_threads = configuration.config_parser.getint(section=section,
+                                                                     option='submit_threads')
+
+        if configuration.config_parser.has_option(section=section, option='sizing'):
+            self.sizing = configuration.config_parser.getboolean(section=section,
+                                                                 option='sizing')
+
+        if configuration.config_parser.has_option(section=section, option='sizing_margin'):
+            self.sizing_margin = configuration.config_parser.getfloat(section=section,
+                                                                      option='sizing_margin')
+
+        if configuration.config_parser.has_option(section=section, option='sizing_samples'):
+            self.sizing_samples = configuration.config_parser.getint(section=section,
+                                                                     option='sizing_samples')
+
+        if configuration.config_parser.has_option(section=section, option='sizing_database'):
+            self.sizing_database = configuration.config_parser.get(section=section,
+                                                                   option='sizing_database')
+
+        if configuration.config_parser.has_option(section=section, option='result_cache'):
+            self.result_cache = configuration.config_parser.getboolean(section=section,
+                                                                       option='result_cache')
+
+        if configuration.config_parser.has_option(section=section, option='database_write_ahead_log'):
+            self.database_write_ahead_log = configuration.config_parser.getboolean(
+                section=section,
+                option='database_write_ahead_log')
+
     def set_default(self, default):
         """Set instance variables of a DRMS object via a Default object.
 
@@ -1799,19 +2109,187 @@ class DRMS(object):
 
         self.executables.append(executable)
 
+    def get_pack_size(self):
+        """Get the number of Executable objects to pack into a single job.
+
+        @return: Number of Executable objects or 0, if packing is disabled
+        @rtype: int
+        """
+
+        pack_size = self.pack_size
+
+        if self.pack_minutes:
+            minutes = DRMS.get_minutes(time_limit=self.time_limit)
+            if minutes:
+                if pack_size:
+                    pack_size = min(pack_size, max(1, self.pack_minutes // minutes))
+                else:
+                    pack_size = max(1, self.pack_minutes // minutes)
+            else:
+                warnings.warn(
+                    'Cannot pack by CPU minutes, as the time limit {!r} of DRMS {!r} cannot be parsed.'.
+                    format(self.time_limit, self.name),
+                    UserWarning)
+
+        return pack_size
+
+    def pack(self, debug=0):
+        """Pack Executable objects into jobs, each running a group of them inside a single allocation.
+
+        If requested, Executable objects whose results have been cached are marked as not to be submitted via
+        the bsf.drms.consult_result_cache function first, since packed Executable objects cannot be cached.
+        Executable objects that are to be submitted are grouped by topological wave (see
+        bsf.drms.get_wave_list) and in order within each wave, so that no group contains an Executable and
+        one of its ancestors and groups cannot depend on each other circularly. Each group is replaced by an
+        Executable running the Runner script on a Runnable in the bsf.runnables.pack module. The packed Executable
+        objects write STDOUT and STDERR into separate files
+        in the DRMS.pack_output_directory. Dependencies on packed Executable objects by name are redirected
+        to the packing Executable via DRMS.pack_name_dict. The number of threads, the hard and soft memory
+        limits and the time limit of the DRMS are scaled to the number of Executable objects in each job.
+        Packing happens only once, subsequent calls have no effect.
+        @param debug: Debug level
+        @type debug: int
+        """
+
+        if self.packed:
+            return
+
+        self.packed = True
+
+        if self.result_cache:
+            self.result_cache_list = consult_result_cache(
+                drms=self,
+                submitted_name_set=self.result_cache_submitted_set,
+                output_key_dict=self.result_cache_output_dict,
+                debug=debug)
+        else:
+            self.result_cache_submitted_set.update(map(lambda x: x.name, filter(lambda x: x.submit, self.executables)))
+
+        pack_size = self.get_pack_size()
+
+        if pack_size < 2:
+            return
+
+        pack_threads = max(1, self.pack_threads)
+
+        output_directory_path = os.path.join(self.work_directory, DRMS.pack_output_directory)
+
+        # Executable objects that are not submitted keep their order ahead of the groups.
+
+        executable_list = filter(lambda x: not x.submit, self.executables)
+
+        for wave in get_wave_list(executables=filter(lambda x: x.submit, self.executables)):
+            for index in range(0, len(wave), pack_size):
+                executable_list.append(wave[index:index + pack_size])
+
+        if not os.path.isdir(output_directory_path):
+            # In principle, a race condition could occur as the directory
+            # could have been created after its existence has been checked.
+            try:
+                os.makedirs(output_directory_path)
+            except OSError as exception:
+                if exception.errno != errno.EEXIST:
+                    raise
+
+        self.executables = list()
+        pack_index = 0
+
+        for item in executable_list:
+            if isinstance(item, Executable):
+                self.executables.append(item)
+                continue
+
+            pack_index += 1
+            name = '{}_pack_{:04d}'.format(self.name, pack_index)
+
+            runnable = Runnable(
+                name=name,
+                code_module='bsf.runnables.pack',
+                working_directory=self.work_directory,
+                threads=pack_threads)
+
+            packing_executable = Executable(name=name, program=Runnable.runner_script)
+            packing_executable.add_option_long(key='pickler-path', value=runnable.pickler_path)
+
+            member_names = map(lambda x: x.name, item)
+
+            for executable in item:
+                if not executable.stdout_path:
+                    executable.stdout_path = os.path.join(output_directory_path, executable.name + '.out')
+                if not executable.stderr_path:
+                    executable.stderr_path = os.path.join(output_directory_path, executable.name + '.err')
+
+                runnable.add_executable(executable=executable)
+
+                if executable.hold:
+                    packing_executable.hold = executable.hold
+
+                for dependency in executable.dependencies:
+                    if dependency not in member_names:
+                        dependency = self.pack_name_dict.get(dependency, dependency)
+                        if dependency not in packing_executable.dependencies:
+                            packing_executable.dependencies.append(dependency)
+
+                self.pack_name_dict[executable.name] = name
+
+            runnable.to_pickler_path()
+
+            self.executables.append(packing_executable)
+
+        # Scale the resources of the DRMS to the concurrently and sequentially running Executable objects.
+
+        if pack_threads > 1:
+            self.threads = int(self.threads) * pack_threads
+            self.memory_limit_hard = DRMS.scale_memory(memory=self.memory_limit_hard, factor=pack_threads)
+            self.memory_limit_soft = DRMS.scale_memory(memory=self.memory_limit_soft, factor=pack_threads)
+            self.memory_free_mem = DRMS.scale_memory(memory=self.memory_free_mem, factor=pack_threads)
+            self.memory_free_swap = DRMS.scale_memory(memory=self.memory_free_swap, factor=pack_threads)
+            self.memory_free_virtual = DRMS.scale_memory(memory=self.memory_free_virtual, factor=pack_threads)
+
+        minutes = DRMS.get_minutes(time_limit=self.time_limit)
+        if minutes:
+            self.time_limit = DRMS.get_time_limit(minutes=minutes * ((pack_size + pack_threads - 1) // pack_threads))
+
     def submit(self, debug=0):
         """Submit a command line for each Executable object.
 
+        Executable objects are packed first, if requested. Dependencies on Executable objects that have
+        been packed are redirected to the packing Executable. If requested, the memory and time limits
+        of Executable objects that have not been packed are predicted via the bsf.drms.size_executables
+        function and recorded in the job database after submission. If requested, Executable objects
+        whose results have been cached are not submitted (see DRMS.pack) and the result cache of the
+        others is recorded after submission.
         @param debug: Debug level
         @type debug: int
         """
 
+        self.pack(debug=debug)
+
+        for executable in self.executables:
+            dependencies = list()
+            for dependency in executable.dependencies:
+                dependency = self.pack_name_dict.get(dependency, dependency)
+                if dependency != executable.name and dependency not in dependencies:
+                    dependencies.append(dependency)
+            executable.dependencies = dependencies
+
         # Dynamically import the module specific for the configured DRMS implementation.
 
         module = importlib.import_module(string.join(words=(__name__, 'drms', self.implementation), sep='.'))
 
+        if self.sizing and self.get_pack_size() < 2:
+            resource_sizing_list = size_executables(drms=self)
+        else:
+            resource_sizing_list = list()
+
         module.submit(drms=self, debug=debug)
 
+        if len(resource_sizing_list) and debug == 0:
+            record_sizing(drms=self, resource_sizing_list=resource_sizing_list)
+
+        if len(self.result_cache_list) and debug == 0:
+            record_result_cache(drms=self, result_cache_list=self.result_cache_list)
+
 
 class Command(object):
     """Command class representing one (subordinate) command,
@@ -2220,6 +2698,19 @@ class Executable(Command):
     @type process_identifier: str
     @ivar process_name: Process name
     @type process_name: str
+    @ivar input_path_list: Python C{list} of Python C{str} (file path) objects read by the Executable,
+        which define dependencies on other C{Executable} objects of the same C{Runnable}
+    @type input_path_list: list
+    @ivar output_path_list: Python C{list} of Python C{str} (file path) objects written by the Executable,
+        which indicate its completion
+    @type output_path_list: list
+    @ivar memory_limit_hard: Memory limit (hard) overriding the one of the DRMS
+    @type memory_limit_hard: str
+    @ivar time_limit: Time limit overriding the one of the DRMS
+    @type time_limit: str
+    @ivar priority: Scheduling priority from 0.0 (lowest) to 1.0 (highest, i.e. on the critical path)
+        or None to leave scheduling to the DRMS
+    @type priority: float
     """
 
     @classmethod
@@ -2281,6 +2772,18 @@ class Executable(Command):
         executable = cls(name=runnable.name, program=Runnable.runner_script)
         executable.set_configuration(configuration=analysis.configuration, section=runnable.code_module)
         executable.add_option_long(key='pickler-path', value=runnable.pickler_path)
+
+        # Declare the files that the Runnable reads, but does not write itself, as input of the Executable.
+
+        output_path_set = set()
+        for runnable_executable in runnable.executable_dict.itervalues():
+            output_path_set.update(runnable_executable.output_path_list)
+
+        for runnable_executable in runnable.executable_dict.itervalues():
+            for file_path in runnable_executable.input_path_list:
+                if file_path not in output_path_set and file_path not in executable.input_path_list:
+                    executable.input_path_list.append(file_path)
+
         # executable.add_option_long(key='runnable_name', value=runnable.name)
         # executable.add_option_long(key='debug', value=str(analysis.debug))
 
@@ -2313,7 +2816,9 @@ class Executable(Command):
     def __init__(self, name,
                  program=None, options=None, arguments=None, sub_command=None,
                  stdout_path=None, stderr_path=None, dependencies=None, hold=None,
-                 submit=True, process_identifier=None, process_name=None):
+                 submit=True, process_identifier=None, process_name=None,
+                 input_path_list=None, output_path_list=None, memory_limit_hard=None, time_limit=None,
+                 priority=None):
         """Initialise an Executable object.
 
         @param name: Name
@@ -2341,6 +2846,19 @@ class Executable(Command):
         @type process_identifier: str
         @param process_name: Process name
         @type process_name: str
+        @param input_path_list: Python C{list} of Python C{str} (file path) objects read by the Executable,
+            which define dependencies on other C{Executable} objects of the same C{Runnable}
+        @type input_path_list: list
+        @param output_path_list: Python C{list} of Python C{str} (file path) objects written by the Executable,
+            which indicate its completion
+        @type output_path_list: list
+        @param memory_limit_hard: Memory limit (hard) overriding the one of the DRMS
+        @type memory_limit_hard: str
+        @param time_limit: Time limit overriding the one of the DRMS
+        @type time_limit: str
+        @param priority: Scheduling priority from 0.0 (lowest) to 1.0 (highest, i.e. on the critical path)
+            or None to leave scheduling to the DRMS
+        @type priority: float
         """
 
         self.name = name
@@ -2380,6 +2898,28 @@ class Executable(Command):
         else:
             self.process_name = str()
 
+        if input_path_list:
+            self.input_path_list = input_path_list
+        else:
+            self.input_path_list = list()
+
+        if output_path_list:
+            self.output_path_list = output_path_list
+        else:
+            self.output_path_list = list()
+
+        if memory_limit_hard:
+            self.memory_limit_hard = memory_limit_hard
+        else:
+            self.memory_limit_hard = str()
+
+        if time_limit:
+            self.time_limit = time_limit
+        else:
+            self.time_limit = str()
+
+        self.priority = priority
+
     def trace(self, level):
         """Trace an Executable object.
 
@@ -2406,6 +2946,12 @@ class Executable(Command):
             format(indent, self.process_identifier)
         output += '{}  process_name:       {!r}\n'. \
             format(indent, self.process_name)
+        output += '{}  memory_limit_hard:  {!r}\n'. \
+            format(indent, self.memory_limit_hard)
+        output += '{}  time_limit:         {!r}\n'. \
+            format(indent, self.time_limit)
+        output += '{}  priority:           {!r}\n'. \
+            format(indent, self.priority)
 
         # List all dependencies.
 
@@ -2416,6 +2962,22 @@ class Executable(Command):
             output += '{}    {:2d} {!r}\n'.format(indent, i, dependency)
             i += 1
 
+        # List all input and output file paths.
+
+        output += '{}  input_path_list:\n'.format(indent)
+
+        i = 0
+        for file_path in self.input_path_list:
+            output += '{}    {:2d} {!r}\n'.format(indent, i, file_path)
+            i += 1
+
+        output += '{}  output_path_list:\n'.format(indent)
+
+        i = 0
+        for file_path in self.output_path_list:
+            output += '{}    {:2d} {!r}\n'.format(indent, i, file_path)
+            i += 1
+
         # Trace the Command super-class.
 
         output += super(Executable, self).trace(level=level + 1)
@@ -2453,6 +3015,568 @@ class Executable(Command):
         return command
 
 
+class Pipeline(object):
+    """The C{Pipeline} class represents a chain of C{Executable} objects that run concurrently,
+    with the I{STDOUT} stream of each C{Executable} connected to the I{STDIN} stream of the next one.
+
+    An C{Executable} with a C{Executable.stdout_path} writes into that file instead and the next
+    C{Executable} in the C{Pipeline} does not get its I{STDIN} connected. For programs that require
+    file paths rather than standard streams, named pipes (FIFOs) can be declared, which the C{Pipeline}
+    creates before and removes after running.
+
+    Attributes:
+    @ivar name: Name
+    @type name: str
+    @ivar executable_list: Python C{list} of C{Executable} objects in the order of the I{STDOUT} to
+        I{STDIN} connections
+    @type executable_list: list
+    @ivar named_pipe_list: Python C{list} of Python C{str} (named pipe file path) objects
+    @type named_pipe_list: list
+    """
+
+    def __init__(self, name, executable_list=None, named_pipe_list=None):
+        """Initialise a C{Pipeline} object.
+
+        @param name: Name
+        @type name: str
+        @param executable_list: Python C{list} of C{Executable} objects in the order of the I{STDOUT} to
+            I{STDIN} connections
+        @type executable_list: list
+        @param named_pipe_list: Python C{list} of Python C{str} (named pipe file path) objects
+        @type named_pipe_list: list
+        """
+
+        self.name = name
+
+        if executable_list:
+            self.executable_list = executable_list
+        else:
+            self.executable_list = list()
+
+        if named_pipe_list:
+            self.named_pipe_list = named_pipe_list
+        else:
+            self.named_pipe_list = list()
+
+    def trace(self, level):
+        """Trace a C{Pipeline} object.
+
+        @param level: Indentation level
+        @type level: int
+        @return: Trace information
+        @rtype: str
+        """
+
+        indent = '  ' * level
+        output = str()
+        output += '{}{!r}\n'.format(indent, self)
+        output += '{}  name:            {!r}\n'.format(indent, self.name)
+        output += '{}  named_pipe_list: {!r}\n'.format(indent, self.named_pipe_list)
+
+        output += '{}  executable_list:\n'.format(indent)
+
+        for executable in self.executable_list:
+            output += executable.trace(level=level + 2)
+
+        return output
+
+    def add_executable(self, executable):
+        """Add an C{Executable} to the end of the C{Pipeline}.
+
+        @param executable: C{Executable}
+        @type executable: Executable
+        """
+
+        assert isinstance(executable, Executable)
+
+        self.executable_list.append(executable)
+
+    def add_named_pipe(self, file_path):
+        """Add a named pipe (FIFO) file path to the C{Pipeline}.
+
+        @param file_path: Named pipe file path
+        @type file_path: str | unicode
+        """
+
+        if file_path not in self.named_pipe_list:
+            self.named_pipe_list.append(file_path)
+
+    def _create_named_pipes(self):
+        """Create all named pipes (FIFOs) of the C{Pipeline}.
+
+        @raise Exception: A file path exists, but is not a named pipe
+        """
+
+        for file_path in self.named_pipe_list:
+            if os.path.exists(file_path):
+                if not S_ISFIFO(os.stat(file_path).st_mode):
+                    raise Exception('File path {!r} exists, but is not a named pipe.'.format(file_path))
+            else:
+                os.mkfifo(file_path)
+
+    def _remove_named_pipes(self):
+        """Remove all named pipes (FIFOs) of the C{Pipeline}.
+        """
+
+        for file_path in self.named_pipe_list:
+            if os.path.exists(file_path):
+                os.remove(file_path)
+
+    @staticmethod
+    def _restore_signals():
+        """Restore the default I{SIGPIPE} handler in the child process.
+
+        Python ignores I{SIGPIPE}, which child processes would otherwise inherit, so that a program writing into
+        a pipe, whose reader has already terminated, would not terminate, too.
+        """
+
+        signal.signal(signal.SIGPIPE, signal.SIG_DFL)
+
+    def run(self, debug=0):
+        """Run all C{Executable} objects of the C{Pipeline} concurrently.
+
+        If any C{Executable} fails, all C{Executable} objects still running get terminated,
+        so that the failure propagates through the complete C{Pipeline}.
+        @param debug: Debug level
+        @type debug: int
+        @return: Python C{list} of return values of the child processes in C{Pipeline.executable_list} order,
+            negative values indicate that the child received a signal
+        @rtype: list
+        """
+
+        on_posix = 'posix' in sys.builtin_module_names
+
+        executable_number = len(self.executable_list)
+
+        self._create_named_pipes()
+
+        try:
+            # Connect STDOUT of each Executable to STDIN of the next one, unless it writes into a file.
+
+            stdin_list = [None] * executable_number
+            stdout_list = [None] * executable_number
+
+            for index in range(0, executable_number - 1):
+                if not self.executable_list[index].stdout_path:
+                    (read_descriptor, write_descriptor) = os.pipe()
+                    stdout_list[index] = write_descriptor
+                    stdin_list[index + 1] = read_descriptor
+
+            thread_lock = Lock()
+            thread_list = list()
+            process_list = [None] * executable_number
+
+            try:
+                # Start the child processes in reverse order, so that readers of named pipes are already
+                # running, when writers open them.
+
+                for index in reversed(range(0, executable_number)):
+                    executable = self.executable_list[index]
+
+                    stdin_object = None
+                    stdout_object = None
+                    stderr_object = None
+
+                    try:
+                        if stdin_list[index] is not None:
+                            stdin_object = stdin_list[index]
+                        else:
+                            stdin_object = open(os.devnull, 'rb')
+
+                        if executable.stdout_path:
+                            stdout_object = open(executable.stdout_path, 'wb')
+                        elif stdout_list[index] is not None:
+                            stdout_object = stdout_list[index]
+                        else:
+                            stdout_object = PIPE
+
+                        if executable.stderr_path:
+                            stderr_object = open(executable.stderr_path, 'wb')
+                        else:
+                            stderr_object = PIPE
+
+                        if debug > 0:
+                            print '[{}] Pipeline {!r} starting child process {!r}.'. \
+                                format(datetime.datetime.now().isoformat(), self.name, executable.name)
+
+                        process_list[index] = Popen(args=executable.command_list(),
+                                                    bufsize=0,
+                                                    stdin=stdin_object,
+                                                    stdout=stdout_object,
+                                                    stderr=stderr_object,
+                                                    shell=False,
+                                                    close_fds=on_posix,
+                                                    preexec_fn=Pipeline._restore_signals)
+                    finally:
+                        # The child process holds its own copies of the file descriptors.
+
+                        for file_object in (stdin_object, stdout_object, stderr_object):
+                            if isinstance(file_object, file):
+                                file_object.close()
+                            elif isinstance(file_object, int) and file_object != PIPE:
+                                os.close(file_object)
+
+                        stdin_list[index] = None
+                        stdout_list[index] = None
+
+                    if process_list[index].stdout:
+                        thread_out = Thread(target=Runnable.process_stdout,
+                                            kwargs={'stdout_handle': process_list[index].stdout,
+                                                    'thread_lock': thread_lock,
+                                                    'debug': debug})
+                        thread_out.daemon = True  # Thread dies with the program.
+                        thread_out.start()
+                        thread_list.append(thread_out)
+
+                    if process_list[index].stderr:
+                        thread_err = Thread(target=Runnable.process_stderr,
+                                            kwargs={'stderr_handle': process_list[index].stderr,
+                                                    'thread_lock': thread_lock,
+                                                    'debug': debug})
+                        thread_err.daemon = True  # Thread dies with the program.
+                        thread_err.start()
+                        thread_list.append(thread_err)
+            except:
+                # Starting a child process failed, so that the Pipeline cannot run. Close the pipe file
+                # descriptors of child processes not yet started, terminate and wait for the child processes
+                # already started and wait for their STDOUT and STDERR threads to drain and close the pipes.
+
+                for file_descriptor in stdin_list + stdout_list:
+                    if file_descriptor is not None:
+                        os.close(file_descriptor)
+
+                for process in process_list:
+                    if process is not None:
+                        try:
+                            process.terminate()
+                        except OSError as exception:
+                            if exception.errno != errno.ESRCH:
+                                raise
+                        process.wait()
+
+                for thread in thread_list:
+                    thread.join()
+
+                for process in process_list:
+                    if process is not None:
+                        for file_handle in (process.stdout, process.stderr):
+                            if file_handle:
+                                file_handle.close()
+
+                raise
+
+            # Wait for the child processes in separate threads, so that the first failure is noticed
+            # regardless of the position of the Executable in the Pipeline.
+
+            return_code_queue = Queue()
+
+            def wait_for_process(process_index):
+                return_code_queue.put((process_index, process_list[process_index].wait()))
+
+            for index in range(0, executable_number):
+                thread_wait = Thread(target=wait_for_process, args=(index,))
+                thread_wait.daemon = True  # Thread dies with the program.
+                thread_wait.start()
+
+            return_code_list = [None] * executable_number
+            failed = False
+
+            for counter in range(0, executable_number):
+                (index, child_return_code) = return_code_queue.get(True)
+                return_code_list[index] = child_return_code
+
+                if debug > 0:
+                    print '[{}] Pipeline {!r} child process {!r} finished with return code {}.'. \
+                        format(datetime.datetime.now().isoformat(), self.name, self.executable_list[index].name,
+                               child_return_code)
+
+                if child_return_code and not failed:
+                    failed = True
+                    for other_index in range(0, executable_number):
+                        if return_code_list[other_index] is None and process_list[other_index].returncode is None:
+                            try:
+                                process_list[other_index].terminate()
+                            except OSError as exception:
+                                if exception.errno != errno.ESRCH:
+                                    raise
+
+            for thread in thread_list:
+                thread.join()
+        finally:
+            self._remove_named_pipes()
+
+        return return_code_list
+
+    @staticmethod
+    def evaluate_return_codes(pipeline, return_code_list):
+        """Evaluate a Python C{list} of return codes from the run method.
+
+        @param pipeline: C{Pipeline}
+        @type pipeline: Pipeline
+        @param return_code_list: Python C{list} of return codes
+        @type return_code_list: list
+        """
+
+        for index in range(0, len(pipeline.executable_list)):
+            Runnable.evaluate_return_code(executable=pipeline.executable_list[index],
+                                          return_code=return_code_list[index])
+
+
+class Checkpoint(object):
+    """The C{Checkpoint} class represents a manifest of completed C{Executable} objects of a C{Runnable}.
+
+    For each completed C{Executable}, the command line as well as the size and modification time of all
+    files on the C{Executable.input_path_list} and C{Executable.output_path_list} are recorded.
+    An C{Executable} remains complete as long as its command line and all recorded files are unchanged,
+    so that only file system metadata needs checking upon restarting a C{Runnable}. If MD5 checksums were
+    recorded, a file with a changed modification time, but an unchanged checksum is still accepted.
+    Input files that no longer exist, such as intermediate files removed by subsequent steps, are not
+    considered.
+
+    Attributes:
+    @ivar file_path: Checkpoint manifest (JSON) file path
+    @type file_path: str | unicode
+    @ivar checksum: Record MD5 checksums of output files
+    @type checksum: bool
+    @ivar record_dict: Python C{dict} of C{Executable.name} key and Python C{dict} record value data
+    @type record_dict: dict
+    """
+
+    @staticmethod
+    def get_md5(file_path, block_size=8 * 1024 * 1024):
+        """Calculate the MD5 checksum of a file.
+
+        @param file_path: File path
+        @type file_path: str | unicode
+        @param block_size: Block size for reading the file
+        @type block_size: int
+        @return: Hexadecimal MD5 digest
+        @rtype: str
+        """
+
+        md5 = hashlib.md5()
+
+        input_file = open(file_path, 'rb')
+        while True:
+            block = input_file.read(block_size)
+            if not block:
+                break
+            md5.update(block)
+        input_file.close()
+
+        return md5.hexdigest()
+
+    @staticmethod
+    def get_fingerprint(file_path, checksum=False):
+        """Get the fingerprint of a file.
+
+        @param file_path: File path
+        @type file_path: str | unicode
+        @param checksum: Include the MD5 checksum of the file
+        @type checksum: bool
+        @return: Python C{dict} of I{size}, I{mtime} and optionally I{md5} keys or C{None},
+            if the file does not exist
+        @rtype: dict
+        """
+
+        try:
+            stat_result = os.stat(file_path)
+        except OSError as exception:
+            if exception.errno == errno.ENOENT:
+                return None
+            raise
+
+        fingerprint_dict = {'size': stat_result.st_size, 'mtime': stat_result.st_mtime}
+
+        if checksum and S_ISREG(stat_result.st_mode):
+            fingerprint_dict['md5'] = Checkpoint.get_md5(file_path=file_path)
+
+        return fingerprint_dict
+
+    @staticmethod
+    def match_fingerprint(file_path, fingerprint_dict):
+        """Match a file against a recorded fingerprint.
+
+        @param file_path: File path
+        @type file_path: str | unicode
+        @param fingerprint_dict: Recorded fingerprint
+        @type fingerprint_dict: dict
+        @return: C{True} if the file matches the recorded fingerprint, C{False} otherwise
+        @rtype: bool
+        """
+
+        current_dict = Checkpoint.get_fingerprint(file_path=file_path)
+
+        if current_dict is None:
+            return False
+
+        if current_dict['size'] != fingerprint_dict['size']:
+            return False
+
+        if current_dict['mtime'] == fingerprint_dict['mtime']:
+            return True
+
+        # The modification time has changed, which is acceptable only if the content has not.
+
+        if 'md5' in fingerprint_dict:
+            return Checkpoint.get_md5(file_path=file_path) == fingerprint_dict['md5']
+
+        return False
+
+    @classmethod
+    def from_file_path(cls, file_path, checksum=False):
+        """Create a C{Checkpoint} object from a checkpoint manifest (JSON) file.
+
+        A missing or unreadable manifest file results in an empty C{Checkpoint} object,
+        so that all C{Executable} objects are run.
+        @param file_path: Checkpoint manifest (JSON) file path
+        @type file_path: str | unicode
+        @param checksum: Record MD5 checksums of output files
+        @type checksum: bool
+        @return: C{Checkpoint}
+        @rtype: Checkpoint
+        """
+
+        record_dict = None
+
+        if os.path.exists(file_path):
+            checkpoint_file = open(file_path, 'r')
+            try:
+                record_dict = json.load(fp=checkpoint_file)
+            except ValueError:
+                warnings.warn('Ignoring the corrupt checkpoint manifest file {!r}.'.format(file_path), UserWarning)
+            checkpoint_file.close()
+
+        return cls(file_path=file_path, checksum=checksum, record_dict=record_dict)
+
+    def __init__(self, file_path, checksum=False, record_dict=None):
+        """Initialise a C{Checkpoint} object.
+
+        @param file_path: Checkpoint manifest (JSON) file path
+        @type file_path: str | unicode
+        @param checksum: Record MD5 checksums of output files
+        @type checksum: bool
+        @param record_dict: Python C{dict} of C{Executable.name} key and Python C{dict} record value data
+        @type record_dict: dict
+        """
+
+        self.file_path = file_path
+        self.checksum = checksum
+
+        if record_dict:
+            self.record_dict = record_dict
+        else:
+            self.record_dict = dict()
+
+    def trace(self, level):
+        """Trace a C{Checkpoint} object.
+
+        @param level: Indentation level
+        @type level: int
+        @return: Trace information
+        @rtype: str
+        """
+
+        indent = '  ' * level
+        output = str()
+        output += '{}{!r}\n'.format(indent, self)
+        output += '{}  file_path:   {!r}\n'.format(indent, self.file_path)
+        output += '{}  checksum:    {!r}\n'.format(indent, self.checksum)
+        output += '{}  record_dict: {!r}\n'.format(indent, self.record_dict)
+
+        return output
+
+    def to_file_path(self):
+        """Write the C{Checkpoint} object as checkpoint manifest (JSON) file.
+
+        The file is written into a temporary file first and then renamed, so that a killed process
+        never leaves a partially written manifest behind.
+        """
+
+        temporary_path = self.file_path + '.tmp'
+        checkpoint_file = open(temporary_path, 'w')
+        json.dump(obj=self.record_dict, fp=checkpoint_file, indent=2, sort_keys=True)
+        checkpoint_file.close()
+        os.rename(temporary_path, self.file_path)
+
+    def add_executable(self, executable):
+        """Record a completed C{Executable}.
+
+        @param executable: C{Executable}
+        @type executable: Executable
+        """
+
+        input_dict = dict()
+        for file_path in executable.input_path_list:
+            fingerprint_dict = Checkpoint.get_fingerprint(file_path=file_path)
+            if fingerprint_dict is not None:
+                input_dict[file_path] = fingerprint_dict
+
+        output_dict = dict()
+        for file_path in executable.output_path_list:
+            output_dict[file_path] = Checkpoint.get_fingerprint(file_path=file_path, checksum=self.checksum)
+
+        self.record_dict[executable.name] = {
+            'command': executable.command_str(),
+            'completion_time': datetime.datetime.now().isoformat(),
+            'input_dict': input_dict,
+            'output_dict': output_dict,
+        }
+
+    def remove_executable(self, name):
+        """Remove the record of an C{Executable}.
+
+        @param name: C{Executable.name}
+        @type name: str
+        """
+
+        if name in self.record_dict:
+            del self.record_dict[name]
+
+    def is_complete(self, executable, debug=0):
+        """Check whether an C{Executable} has been completed and neither its command line nor its files changed.
+
+        @param executable: C{Executable}
+        @type executable: Executable
+        @param debug: Debug level
+        @type debug: int
+        @return: C{True} if the C{Executable} is complete, C{False} otherwise
+        @rtype: bool
+        """
+
+        if executable.name not in self.record_dict:
+            return False
+
+        record = self.record_dict[executable.name]
+        reason = None
+
+        if record['command'] != executable.command_str():
+            reason = 'the command line changed'
+        else:
+            for file_path in executable.output_path_list:
+                if file_path not in record['output_dict'] or record['output_dict'][file_path] is None:
+                    reason = 'output file {!r} was not recorded'.format(file_path)
+                    break
+                if not Checkpoint.match_fingerprint(file_path=file_path,
+                                                    fingerprint_dict=record['output_dict'][file_path]):
+                    reason = 'output file {!r} changed'.format(file_path)
+                    break
+            else:
+                for file_path, fingerprint_dict in record['input_dict'].iteritems():
+                    if os.path.exists(file_path) and \
+                            not Checkpoint.match_fingerprint(file_path=file_path, fingerprint_dict=fingerprint_dict):
+                        reason = 'input file {!r} changed'.format(file_path)
+                        break
+
+        if reason:
+            if debug > 0:
+                print '[{}] Checkpoint of Executable {!r} is invalid, because {}.'. \
+                    format(datetime.datetime.now().isoformat(), executable.name, reason)
+            return False
+
+        return True
+
+
 class Runnable(object):
     """The C{Runnable} class holds all information to run one or more C{Executable} objects through the
     I{Runner} script.
@@ -2473,6 +3597,16 @@ class Runnable(object):
     @type working_directory: str | unicode
     @ivar debug: Debug level
     @type debug: int
+    @ivar resource_usage_list: Python C{list} of Python C{dict} objects with resource usage information
+        of each attempt to run a child process, as written to the C{Runnable.resource_usage_path}
+    @type resource_usage_list: list
+    @ivar checksum: Record MD5 checksums of output files in the C{Checkpoint}
+    @type checksum: bool
+    @ivar checkpoint: C{Checkpoint} read from the C{Runnable.checkpoint_path} upon first use
+    @type checkpoint: Checkpoint
+    @ivar threads: Maximum number of concurrent C{Executable} objects in C{Runnable.run_executable_graph},
+        defaults to the number of threads allocated by the DRMS
+    @type threads: int
     """
 
     runner_script = 'bsf_runner.py'
@@ -2564,9 +3698,13 @@ class Runnable(object):
                                        debug=debug)
 
     @staticmethod
-    def run(executable, max_loop_counter=1, max_thread_joins=10, thread_join_timeout=10, debug=0):
+    def run(executable, max_loop_counter=1, max_thread_joins=10, thread_join_timeout=10, debug=0,
+            resource_usage_list=None):
         """C{Runnable} function to run an C{Executable} object as Python C{subprocess.Popen}.
 
+        If C{Executable.stdout_path} or C{Executable.stderr_path} are set, the corresponding streams of the
+        child process are redirected into files directly. Only streams without a file path are processed by
+        threads and printed to the console.
         @param executable: Executable
         @type executable: Executable
         @param max_loop_counter: Maximum number of retries
@@ -2577,6 +3715,9 @@ class Runnable(object):
         @type thread_join_timeout: int
         @param debug: Debug level
         @type debug: int
+        @param resource_usage_list: Python C{list} to append a Python C{dict} of resource usage information
+            for each attempt to run the child process
+        @type resource_usage_list: list
         @return: Return value of the child in the Python subprocess,
             negative values indicate that the child received a signal
         @rtype: int
@@ -2589,42 +3730,108 @@ class Runnable(object):
 
         while loop_counter < max_loop_counter:
 
-            child_process = Popen(args=executable.command_list(),
-                                  bufsize=0,
-                                  stdin=PIPE,
-                                  stdout=PIPE,
-                                  stderr=PIPE,
-                                  shell=False,
-                                  close_fds=on_posix)
+            # Streams bound to a file are passed to the child process as file descriptors,
+            # so that large outputs (e.g. SAM from aligners) never pass through the Python process.
+            # Only streams bound to the console are captured via threads and pipes.
+
+            start_time = time.time()
+
+            stdout_file = None
+            stderr_file = None
+
+            try:
+                if executable.stdout_path:
+                    stdout_file = open(executable.stdout_path, 'wb')
+                    if debug > 0:
+                        print '[{}] Opened STDOUT file {!r}.'. \
+                            format(datetime.datetime.now().isoformat(), executable.stdout_path)
+
+                if executable.stderr_path:
+                    stderr_file = open(executable.stderr_path, 'wb')
+                    if debug > 0:
+                        print '[{}] Opened STDERR file {!r}.'. \
+                            format(datetime.datetime.now().isoformat(), executable.stderr_path)
+
+                child_process = Popen(args=executable.command_list(),
+                                      bufsize=0,
+                                      stdin=PIPE,
+                                      stdout=stdout_file if stdout_file else PIPE,
+                                      stderr=stderr_file if stderr_file else PIPE,
+                                      shell=False,
+                                      close_fds=on_posix)
+            finally:
+                # The child process holds its own copies of the file descriptors,
+                # while those of this process need closing, even if the child process could not be started.
+
+                if stdout_file:
+                    stdout_file.close()
+                if stderr_file:
+                    stderr_file.close()
 
             # Two threads, thread_out and thread_err reading STDOUT and STDERR, respectively,
             # should make sure that buffers are not filling up.
 
             thread_lock = Lock()
 
-            thread_out = Thread(target=Runnable.process_stdout,
-                                kwargs={'stdout_handle': child_process.stdout,
-                                        'thread_lock': thread_lock,
-                                        'stdout_path': executable.stdout_path,
-                                        'debug': debug})
-            thread_out.daemon = True  # Thread dies with the program.
-            thread_out.start()
-
-            thread_err = Thread(target=Runnable.process_stderr,
-                                kwargs={'stderr_handle': child_process.stderr,
-                                        'thread_lock': thread_lock,
-                                        'stderr_path': executable.stderr_path,
-                                        'debug': debug})
-            thread_err.daemon = True  # Thread dies with the program.
-            thread_err.start()
-
-            # Wait for the child process to finish.
+            thread_out = None
+            if child_process.stdout:
+                thread_out = Thread(target=Runnable.process_stdout,
+                                    kwargs={'stdout_handle': child_process.stdout,
+                                            'thread_lock': thread_lock,
+                                            'debug': debug})
+                thread_out.daemon = True  # Thread dies with the program.
+                thread_out.start()
+
+            thread_err = None
+            if child_process.stderr:
+                thread_err = Thread(target=Runnable.process_stderr,
+                                    kwargs={'stderr_handle': child_process.stderr,
+                                            'thread_lock': thread_lock,
+                                            'debug': debug})
+                thread_err.daemon = True  # Thread dies with the program.
+                thread_err.start()
+
+            # Wait for the child process to finish and collect its resource usage.
+
+            if hasattr(os, 'wait4'):
+                while True:
+                    try:
+                        (child_pid, child_status, child_resource_usage) = os.wait4(child_process.pid, 0)
+                        break
+                    except OSError as exception:
+                        if exception.errno != errno.EINTR:
+                            raise
+
+                if os.WIFSIGNALED(child_status):
+                    child_return_code = -os.WTERMSIG(child_status)
+                else:
+                    child_return_code = os.WEXITSTATUS(child_status)
 
-            child_return_code = child_process.wait()
+                # The child process has been reaped, so that the Popen object must not wait for it again.
+                child_process.returncode = child_return_code
+            else:
+                child_resource_usage = None
+                child_return_code = child_process.wait()
+
+            if resource_usage_list is not None:
+                resource_usage_dict = {
+                    'name': executable.name,
+                    'attempt': loop_counter + 1,
+                    'start_time': datetime.datetime.fromtimestamp(start_time).isoformat(),
+                    'wall_time': time.time() - start_time,
+                    'return_code': child_return_code,
+                }
+                if child_resource_usage:
+                    resource_usage_dict['user_time'] = child_resource_usage.ru_utime
+                    resource_usage_dict['system_time'] = child_resource_usage.ru_stime
+                    resource_usage_dict['max_rss'] = child_resource_usage.ru_maxrss
+                    resource_usage_dict['block_input'] = child_resource_usage.ru_inblock
+                    resource_usage_dict['block_output'] = child_resource_usage.ru_oublock
+                resource_usage_list.append(resource_usage_dict)
 
             thread_join_counter = 0
 
-            while thread_out.is_alive() and thread_join_counter < max_thread_joins:
+            while thread_out and thread_out.is_alive() and thread_join_counter < max_thread_joins:
                 thread_lock.acquire(True)
                 if debug > 0:
                     print '[{}] Waiting for STDOUT processor to finish.'. \
@@ -2636,7 +3843,7 @@ class Runnable(object):
 
             thread_join_counter = 0
 
-            while thread_err.is_alive() and thread_join_counter < max_thread_joins:
+            while thread_err and thread_err.is_alive() and thread_join_counter < max_thread_joins:
                 thread_lock.acquire(True)
                 if debug > 0:
                     print '[{}] Waiting for STDERR processor to finish.'. \
@@ -2655,6 +3862,8 @@ class Runnable(object):
                 if debug > 0:
                     print '[{}] Child process {!r} received signal {}.'. \
                         format(datetime.datetime.now().isoformat(), executable.name, -child_return_code)
+                # A child process terminated by a signal is not re-run.
+                break
             else:
                 if debug > 0:
                     print '[{}] Child process {!r} completed successfully {}.'. \
@@ -2688,7 +3897,8 @@ class Runnable(object):
             print '[{}] Child process {!r} completed with return code {}.'. \
                 format(datetime.datetime.now().isoformat(), executable.name, +return_code)
 
-    def __init__(self, name, code_module, working_directory, file_path_dict=None, executable_dict=None, debug=0):
+    def __init__(self, name, code_module, working_directory, file_path_dict=None, executable_dict=None, debug=0,
+                 resource_usage_list=None, checksum=False, threads=None):
         """Initialise a C{Runnable} object.
 
         @param name: Name
@@ -2706,6 +3916,14 @@ class Runnable(object):
         @type executable_dict: dict
         @param debug: Integer debugging level
         @type debug: int
+        @param resource_usage_list: Python C{list} of Python C{dict} objects with resource usage information
+            of each attempt to run a child process
+        @type resource_usage_list: list
+        @param checksum: Record MD5 checksums of output files in the C{Checkpoint}
+        @type checksum: bool
+        @param threads: Maximum number of concurrent C{Executable} objects in C{Runnable.run_executable_graph},
+            defaults to the number of threads allocated by the DRMS
+        @type threads: int
         """
 
         self.name = name
@@ -2724,6 +3942,15 @@ class Runnable(object):
 
         self.debug = debug
 
+        if resource_usage_list:
+            self.resource_usage_list = resource_usage_list
+        else:
+            self.resource_usage_list = list()
+
+        self.checksum = checksum
+        self.checkpoint = None
+        self.threads = threads
+
     def trace(self, level=1):
         """Trace a C{Runnable} object.
 
@@ -2742,6 +3969,10 @@ class Runnable(object):
         output += '{}  file_path_dict: {!r}\n'.format(indent, self.file_path_dict)
         output += '{}  executable_dict: {!r}\n'.format(indent, self.executable_dict)
         output += '{}  debug: {!r}\n'.format(indent, self.debug)
+        output += '{}  resource_usage_list: {!r}\n'.format(indent, self.resource_usage_list)
+        output += '{}  checksum: {!r}\n'.format(indent, self.checksum)
+        output += '{}  checkpoint: {!r}\n'.format(indent, self.checkpoint)
+        output += '{}  threads: {!r}\n'.format(indent, self.threads)
 
         output += '{}  Python dict of Python str (file path) objects:\n'.format(indent)
         keys = self.file_path_dict.keys()
@@ -2786,7 +4017,17 @@ class Runnable(object):
         """
 
         executable = self.executable_dict[name]
-        child_return_code = Runnable.run(executable=executable)
+
+        # Remove any previous record, so that an interrupted run is never considered complete.
+
+        checkpoint = self.get_checkpoint()
+        if executable.name in checkpoint.record_dict:
+            checkpoint.remove_executable(name=executable.name)
+            checkpoint.to_file_path()
+
+        child_return_code = Runnable.run(executable=executable, resource_usage_list=self.resource_usage_list)
+
+        self.to_resource_usage_path()
 
         if child_return_code > 0:
             raise Exception('[{}] Child process {!r} failed with return code {}'.
@@ -2795,6 +4036,270 @@ class Runnable(object):
             raise Exception('[{}] Child process {!r} received signal {}.'.
                             format(datetime.datetime.now().isoformat(), executable.name, -child_return_code))
 
+        checkpoint.add_executable(executable=executable)
+        checkpoint.to_file_path()
+
+    def get_checkpoint(self):
+        """Get the C{Checkpoint} of the C{Runnable}, reading the C{Runnable.checkpoint_path} upon first use.
+
+        @return: C{Checkpoint}
+        @rtype: Checkpoint
+        """
+
+        if self.checkpoint is None:
+            self.checkpoint = Checkpoint.from_file_path(file_path=self.checkpoint_path, checksum=self.checksum)
+
+        return self.checkpoint
+
+    def is_complete(self, name):
+        """Check whether an C{Executable} defined in the C{Runnable} object is complete according to the
+        C{Checkpoint}.
+
+        @param name: C{Executable.name}
+        @type name: str
+        @return: C{True} if the C{Executable} is complete, C{False} otherwise
+        @rtype: bool
+        """
+
+        if name not in self.executable_dict:
+            return False
+
+        return self.get_checkpoint().is_complete(executable=self.executable_dict[name], debug=self.debug)
+
+    @staticmethod
+    def get_allocated_threads():
+        """Get the number of threads allocated to the job by the DRMS.
+
+        The number of threads is read from the I{SLURM_CPUS_PER_TASK} (SLURM) or
+        I{NSLOTS} (SGE) environment variables.
+        @return: Number of allocated threads, defaults to 1
+        @rtype: int
+        """
+
+        for variable in ('SLURM_CPUS_PER_TASK', 'NSLOTS'):
+            if variable in os.environ:
+                try:
+                    return max(1, int(os.environ[variable]))
+                except ValueError:
+                    pass
+
+        return 1
+
+    @staticmethod
+    def get_allocated_memory():
+        """Get the memory allocated to the job by the DRMS.
+
+        The memory is read from the I{SLURM_MEM_PER_NODE} or I{SLURM_MEM_PER_CPU} (SLURM) environment variables.
+        @return: Allocated memory in MiB or 0, if unknown
+        @rtype: int
+        """
+
+        if 'SLURM_MEM_PER_NODE' in os.environ:
+            try:
+                return int(os.environ['SLURM_MEM_PER_NODE'])
+            except ValueError:
+                pass
+
+        if 'SLURM_MEM_PER_CPU' in os.environ:
+            try:
+                return int(os.environ['SLURM_MEM_PER_CPU']) * Runnable.get_allocated_threads()
+            except ValueError:
+                pass
+
+        return 0
+
+    @staticmethod
+    def get_memory_requirement(executable):
+        """Get the memory requirement of an C{Executable} from a Java I{-Xmx} heap size switch.
+
+        @param executable: C{Executable}
+        @type executable: Executable
+        @return: Memory requirement in MiB or 0, if unknown
+        @rtype: int
+        """
+
+        factor_dict = {'': 1.0 / 1024 / 1024, 'k': 1.0 / 1024, 'm': 1, 'g': 1024, 't': 1024 * 1024}
+
+        for key in executable.options.keys():
+            match = re.search(pattern=r'^Xmx(\d+)([kKmMgGtT]?)$', string=key)
+            if match:
+                return int(int(match.group(1)) * factor_dict[match.group(2).lower()])
+
+        return 0
+
+    def get_executable_graph(self):
+        """Build the dependency graph of C{Executable} objects in the C{Runnable}.
+
+        An C{Executable} depends on another C{Executable}, if it lists its name in C{Executable.dependencies}
+        or if it reads a file path listed in the C{Executable.output_path_list} of the other one.
+        @return: Python C{dict} of Python C{str} (C{Executable.name}) key data and
+            Python C{set} of Python C{str} (C{Executable.name}) value data of predecessors
+        @rtype: dict
+        @raise Exception: A file path is written by more than one C{Executable} or
+            the dependency graph contains a cycle
+        """
+
+        producer_dict = dict()
+
+        for executable in self.executable_dict.itervalues():
+            for file_path in executable.output_path_list:
+                if file_path in producer_dict:
+                    raise Exception('File path {!r} is written by both, Executable {!r} and {!r}.'.
+                                    format(file_path, producer_dict[file_path], executable.name))
+                producer_dict[file_path] = executable.name
+
+        predecessor_dict = dict()
+
+        for executable in self.executable_dict.itervalues():
+            predecessors = set()
+            for name in executable.dependencies:
+                if name in self.executable_dict:
+                    predecessors.add(name)
+            for file_path in executable.input_path_list:
+                if file_path in producer_dict:
+                    predecessors.add(producer_dict[file_path])
+            predecessors.discard(executable.name)
+            predecessor_dict[executable.name] = predecessors
+
+        # Check that the graph is acyclic by repeatedly removing nodes without remaining predecessors.
+
+        remaining_dict = dict(map(lambda x: (x, set(predecessor_dict[x])), predecessor_dict.keys()))
+
+        while len(remaining_dict):
+            free_names = filter(lambda x: not len(remaining_dict[x]), remaining_dict.keys())
+            if not len(free_names):
+                raise Exception('The Executable objects {!r} of Runnable {!r} contain a dependency cycle.'.
+                                format(sorted(remaining_dict.keys()), self.name))
+            for name in free_names:
+                del remaining_dict[name]
+            for predecessors in remaining_dict.itervalues():
+                predecessors.difference_update(free_names)
+
+        return predecessor_dict
+
+    def run_executable_graph(self, threads=None, memory=None, debug=0):
+        """Run all C{Executable} objects of the C{Runnable} concurrently in the order of their dependency graph.
+
+        An C{Executable} is complete, if the C{Checkpoint} of the C{Runnable} has an unchanged record of it.
+        Incomplete C{Executable} objects are run, if they have no successors or at least one of
+        their successors needs running. Ready C{Executable} objects are admitted as long as the
+        number of threads and the memory, as estimated from Java I{-Xmx} heap size switches, permit.
+        @param threads: Maximum number of concurrent C{Executable} objects,
+            defaults to C{Runnable.threads} or the number of threads allocated by the DRMS
+        @type threads: int
+        @param memory: Maximum memory in MiB, defaults to the memory allocated by the DRMS or unlimited
+        @type memory: int
+        @param debug: Debug level
+        @type debug: int
+        @raise Exception: Child process failed with return code or received a signal
+        """
+
+        if not threads:
+            threads = self.threads
+
+        if not threads:
+            threads = Runnable.get_allocated_threads()
+
+        if memory is None:
+            memory = Runnable.get_allocated_memory()
+
+        predecessor_dict = self.get_executable_graph()
+
+        successor_dict = dict(map(lambda x: (x, set()), predecessor_dict.keys()))
+        for name, predecessors in predecessor_dict.iteritems():
+            for predecessor in predecessors:
+                successor_dict[predecessor].add(name)
+
+        # Determine the Executable objects that need running, starting from those without successors.
+
+        pending_names = set()
+        visited_names = set()
+
+        def needs_running(executable_name):
+            if executable_name in visited_names:
+                return executable_name in pending_names
+            visited_names.add(executable_name)
+            if self.is_complete(name=executable_name):
+                return False
+            successors = successor_dict[executable_name]
+            if not len(successors) or len(filter(needs_running, successors)):
+                pending_names.add(executable_name)
+                return True
+            return False
+
+        for name in sorted(predecessor_dict.keys()):
+            needs_running(name)
+
+        # Remove records of the Executable objects that need running,
+        # so that an interrupted run is never considered complete.
+
+        checkpoint = self.get_checkpoint()
+        for name in pending_names:
+            checkpoint.remove_executable(name=name)
+        checkpoint.to_file_path()
+
+        running_dict = dict()
+        finished_names = set()
+        failed_names = list()
+        return_code_queue = Queue()
+
+        def run_executable_thread(executable):
+            resource_usage_list = list()
+            child_return_code = Runnable.run(executable=executable, debug=debug,
+                                             resource_usage_list=resource_usage_list)
+            return_code_queue.put((executable.name, child_return_code, resource_usage_list))
+
+        while len(pending_names) or len(running_dict):
+
+            # Admit ready Executable objects, unless a failure has occurred.
+
+            if not len(failed_names):
+                ready_names = sorted(filter(
+                    lambda x: not len(predecessor_dict[x] & pending_names) and
+                    not len(predecessor_dict[x] & set(running_dict.keys())),
+                    pending_names))
+
+                for name in ready_names:
+                    if len(running_dict) >= threads:
+                        break
+
+                    memory_requirement = Runnable.get_memory_requirement(executable=self.executable_dict[name])
+                    if memory and len(running_dict) and \
+                            sum(running_dict.values()) + memory_requirement > memory:
+                        continue
+
+                    if debug > 0:
+                        print '[{}] Runnable {!r} starting Executable {!r}.'. \
+                            format(datetime.datetime.now().isoformat(), self.name, name)
+
+                    pending_names.discard(name)
+                    running_dict[name] = memory_requirement
+
+                    thread = Thread(target=run_executable_thread, args=(self.executable_dict[name],))
+                    thread.daemon = True  # Thread dies with the program.
+                    thread.start()
+
+            if not len(running_dict):
+                break
+
+            (name, child_return_code, resource_usage_list) = return_code_queue.get(True)
+            del running_dict[name]
+            finished_names.add(name)
+
+            self.resource_usage_list.extend(resource_usage_list)
+            self.to_resource_usage_path()
+
+            if child_return_code:
+                Runnable.evaluate_return_code(executable=self.executable_dict[name], return_code=child_return_code)
+                failed_names.append(name)
+            else:
+                checkpoint.add_executable(executable=self.executable_dict[name])
+                checkpoint.to_file_path()
+
+        if len(failed_names):
+            raise Exception('[{}] Child processes {!r} of Runnable {!r} failed.'.
+                            format(datetime.datetime.now().isoformat(), failed_names, self.name))
+
     @property
     def pickler_path(self):
         """Get the Python C{pickle.Pickler} file path.
@@ -2805,6 +4310,39 @@ class Runnable(object):
 
         return os.path.join(self.working_directory, string.join(words=(self.name, 'pkl'), sep='.'))
 
+    @property
+    def checkpoint_path(self):
+        """Get the C{Checkpoint} manifest (JSON) file path next to the Python C{pickle.Pickler} file.
+
+        @return: C{Checkpoint} manifest (JSON) file path
+        @rtype: str | unicode
+        """
+
+        return os.path.join(self.working_directory, string.join(words=(self.name, 'checkpoint', 'json'), sep='.'))
+
+    @property
+    def resource_usage_path(self):
+        """Get the resource usage JSON file path next to the Python C{pickle.Pickler} file.
+
+        @return: Resource usage JSON file path
+        @rtype: str | unicode
+        """
+
+        return os.path.join(self.working_directory, string.join(words=(self.name, 'resource_usage', 'json'), sep='.'))
+
+    def to_resource_usage_path(self):
+        """Write the C{Runnable.resource_usage_list} as JSON file into the working directory.
+
+        The file is written into a temporary file first and then renamed, so that readers never see
+        a partially written file.
+        """
+
+        temporary_path = self.resource_usage_path + '.tmp'
+        resource_usage_file = open(temporary_path, 'w')
+        json.dump(obj=self.resource_usage_list, fp=resource_usage_file, indent=2, sort_keys=True)
+        resource_usage_file.close()
+        os.rename(temporary_path, self.resource_usage_path)
+
     def to_pickler_path(self):
         """Write this C{Runnable} object as a Python C{pickle.Pickler} file into the working directory.
         """
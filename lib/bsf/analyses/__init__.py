@@ -2173,7 +2173,10 @@ class RunFastQC(Analysis):
 
             # A configuration option 'projects' has been set ...
 
-            prf = ProcessedRunFolder.from_file_path(file_path=self.input_directory, file_type='Automatic')
+            prf = ProcessedRunFolder.from_file_path(
+                file_path=self.input_directory,
+                file_type='Automatic',
+                cache=self.discovery_cache)
 
             projects = config_parser.get(section=config_section, option='projects')
             components = projects.split(',')
@@ -2200,7 +2203,10 @@ class RunFastQC(Analysis):
                 # Automatically discover sample information from a CASAVA
                 # Processed Run Folder and a CASAVA Project name.
 
-                prf = ProcessedRunFolder.from_file_path(file_path=self.input_directory, file_type='Automatic')
+                prf = ProcessedRunFolder.from_file_path(
+                    file_path=self.input_directory,
+                    file_type='Automatic',
+                    cache=self.discovery_cache)
                 project = prf.projects[self.project_name]
                 for sample in project.get_all_samples():
                     self.add_sample(sample=sample)
@@ -537,6 +537,12 @@ class ChIPSeq(Analysis):
                     analysis=self)
                 alignment_drms.add_executable(executable=run_bwa)
 
+                # Declare the FASTQ files as input and the final result file as output for the result cache.
+                run_bwa.input_path_list.extend(reads1)
+                run_bwa.input_path_list.extend(reads2)
+                run_bwa.output_path_list.append(
+                    os.path.join(self.genome_directory, file_path_chipseq_alignment['aligned_md5']))
+
                 # Only submit this Executable if the final result file does not exist.
                 if (os.path.exists(
                         os.path.join(self.genome_directory, file_path_chipseq_alignment['aligned_md5']))
@@ -623,6 +623,9 @@ class IlluminaToBam(Analysis):
             itb = Executable.from_analysis_runnable(analysis=self, runnable_name=runnable.name)
             itb_drms.add_executable(executable=itb)
 
+            # Declare the final result file as output for the result cache.
+            itb.output_path_list.append(file_path_dict['sorted_md5'])
+
             # Only submit this Executable if the final result file does not exist.
             if (os.path.exists(file_path_dict['sorted_md5'])
                     and os.path.getsize(file_path_dict['sorted_md5'])):
@@ -911,6 +911,12 @@ class VariantCallingGATK(Analysis):
                     analysis=self)
                 vc_align_lane_drms.add_executable(executable=run_bwa)
 
+                # Declare the FASTQ files as input and the final result file as output for the result cache.
+                run_bwa.input_path_list.extend(reads1)
+                run_bwa.input_path_list.extend(reads2)
+                run_bwa.output_path_list.append(
+                    os.path.join(self.genome_directory, file_path_align_lane['aligned_md5']))
+
                 # Only submit this Executable if the final result file does not exist.
                 if (os.path.exists(
                         os.path.join(self.genome_directory, file_path_align_lane['aligned_md5']))
@@ -981,8 +987,11 @@ class VariantCallingGATK(Analysis):
 
                     sub_command = java_process.sub_command
                     sub_command.add_option_pair(key='INPUT', value=file_path_dict_lane['aligned_bam'])
+                    java_process.input_path_list.append(file_path_dict_lane['aligned_bam'])
                     sub_command.add_option_pair(key='OUTPUT', value=file_path_dict_lane['duplicates_marked_bam'])
+                    java_process.output_path_list.append(file_path_dict_lane['duplicates_marked_bam'])
                     sub_command.add_option_pair(key='METRICS_FILE', value=file_path_dict_lane['duplicate_metrics'])
+                    java_process.output_path_list.append(file_path_dict_lane['duplicate_metrics'])
                     # Since read names typically contain a dash and an underscore, the READ_NAME_REGEX needs adjusting,
                     # as otherwise, optical duplicates could not be detected. This is a consequence of using
                     # Illumina2bam rather than Picard ExtractIlluminaBarcodes, IlluminaBasecallsToFastq and
@@ -1033,9 +1042,12 @@ class VariantCallingGATK(Analysis):
                     sub_command.add_option_long(key='known', value=file_path)
                 if self.skip_mark_duplicates:
                     sub_command.add_option_long(key='input_file', value=file_path_dict_lane['aligned_bam'])
+                    java_process.input_path_list.append(file_path_dict_lane['aligned_bam'])
                 else:
                     sub_command.add_option_long(key='input_file', value=file_path_dict_lane['duplicates_marked_bam'])
+                    java_process.input_path_list.append(file_path_dict_lane['duplicates_marked_bam'])
                 sub_command.add_option_long(key='out', value=file_path_dict_lane['realigner_targets'])
+                java_process.output_path_list.append(file_path_dict_lane['realigner_targets'])
 
                 # Run the GATK IndelRealigner step as a second-pass walker after the GATK RealignerTargetCreator step.
 
@@ -1069,10 +1081,14 @@ class VariantCallingGATK(Analysis):
                     sub_command.add_option_long(key='knownAlleles', value=file_path)
                 if self.skip_mark_duplicates:
                     sub_command.add_option_long(key='input_file', value=file_path_dict_lane['aligned_bam'])
+                    java_process.input_path_list.append(file_path_dict_lane['aligned_bam'])
                 else:
                     sub_command.add_option_long(key='input_file', value=file_path_dict_lane['duplicates_marked_bam'])
+                    java_process.input_path_list.append(file_path_dict_lane['duplicates_marked_bam'])
                 sub_command.add_option_long(key='targetIntervals', value=file_path_dict_lane['realigner_targets'])
+                java_process.input_path_list.append(file_path_dict_lane['realigner_targets'])
                 sub_command.add_option_long(key='out', value=file_path_dict_lane['realigned_bam'])
+                java_process.output_path_list.append(file_path_dict_lane['realigned_bam'])
 
                 # Run the GATK BaseRecalibrator step as a first-pass walker for the GATK PrintReads step.
 
@@ -1105,7 +1121,9 @@ class VariantCallingGATK(Analysis):
                 for file_path in self.known_sites_recalibration:
                     sub_command.add_option_long(key='knownSites', value=file_path)
                 sub_command.add_option_long(key='input_file', value=file_path_dict_lane['realigned_bam'])
+                java_process.input_path_list.append(file_path_dict_lane['realigned_bam'])
                 sub_command.add_option_long(key='out', value=file_path_dict_lane['recalibration_table_pre'])
+                java_process.output_path_list.append(file_path_dict_lane['recalibration_table_pre'])
 
                 # Run the GATK BaseRecalibrator on-the-fly recalibration step to generate plots.
 
@@ -1138,8 +1156,11 @@ class VariantCallingGATK(Analysis):
                 for file_path in self.known_sites_recalibration:
                     sub_command.add_option_long(key='knownSites', value=file_path)
                 sub_command.add_option_long(key='BQSR', value=file_path_dict_lane['recalibration_table_pre'])
+                java_process.input_path_list.append(file_path_dict_lane['recalibration_table_pre'])
                 sub_command.add_option_long(key='input_file', value=file_path_dict_lane['realigned_bam'])
+                java_process.input_path_list.append(file_path_dict_lane['realigned_bam'])
                 sub_command.add_option_long(key='out', value=file_path_dict_lane['recalibration_table_post'])
+                java_process.output_path_list.append(file_path_dict_lane['recalibration_table_post'])
 
                 # Run the GATK AnalyzeCovariates step to create a recalibration plot.
 
@@ -1171,10 +1192,13 @@ class VariantCallingGATK(Analysis):
                     sub_command.add_option_long(key='intervals', value=interval)
                 sub_command.add_option_long(key='afterReportFile',
                                             value=file_path_dict_lane['recalibration_table_post'])
+                java_process.input_path_list.append(file_path_dict_lane['recalibration_table_post'])
                 sub_command.add_option_long(key='beforeReportFile',
                                             value=file_path_dict_lane['recalibration_table_pre'])
+                java_process.input_path_list.append(file_path_dict_lane['recalibration_table_pre'])
                 sub_command.add_option_long(key='plotsReportFile',
                                             value=file_path_dict_lane['recalibration_plot'])
+                java_process.output_path_list.append(file_path_dict_lane['recalibration_plot'])
                 # sub_command.add_option_long(key='logging_level', value='DEBUG')
 
                 # Run the GATK PrintReads step as second-pass walker after the BaseRecalibrator step.
@@ -1206,8 +1230,11 @@ class VariantCallingGATK(Analysis):
                 for interval in self.include_intervals_list:
                     sub_command.add_option_long(key='intervals', value=interval)
                 sub_command.add_option_long(key='input_file', value=file_path_dict_lane['realigned_bam'])
+                java_process.input_path_list.append(file_path_dict_lane['realigned_bam'])
                 sub_command.add_option_long(key='BQSR', value=file_path_dict_lane['recalibration_table_pre'])
+                java_process.input_path_list.append(file_path_dict_lane['recalibration_table_pre'])
                 sub_command.add_option_long(key='out', value=file_path_dict_lane['recalibrated_bam'])
+                java_process.output_path_list.append(file_path_dict_lane['recalibrated_bam'])
 
                 # Run the Picard CollectAlignmentSummaryMetrics step.
 
@@ -1230,7 +1257,9 @@ class VariantCallingGATK(Analysis):
 
                 sub_command = java_process.sub_command
                 sub_command.add_option_pair(key='INPUT', value=file_path_dict_lane['recalibrated_bam'])
+                java_process.input_path_list.append(file_path_dict_lane['recalibrated_bam'])
                 sub_command.add_option_pair(key='OUTPUT', value=file_path_dict_lane['alignment_summary_metrics'])
+                java_process.output_path_list.append(file_path_dict_lane['alignment_summary_metrics'])
                 sub_command.add_option_pair(key='METRIC_ACCUMULATION_LEVEL', value='ALL_READS')
                 sub_command.add_option_pair(key='REFERENCE_SEQUENCE', value=self.bwa_genome_db)
                 sub_command.add_option_pair(key='TMP_DIR', value=file_path_dict_lane['temporary_directory'])
@@ -1322,7 +1351,9 @@ class VariantCallingGATK(Analysis):
             sub_command = java_process.sub_command
             for file_path in vc_process_sample_replicates:
                 sub_command.add_option_pair(key='INPUT', value=file_path)
+                java_process.input_path_list.append(file_path)
             sub_command.add_option_pair(key='OUTPUT', value=file_path_dict_sample['merged_bam'])
+            java_process.output_path_list.append(file_path_dict_sample['merged_bam'])
             sub_command.add_option_pair(key='COMMENT', value='Merged from the following files:')
             for file_path in vc_process_sample_replicates:
                 sub_command.add_option_pair(key='COMMENT', value=file_path)
@@ -1358,8 +1389,11 @@ class VariantCallingGATK(Analysis):
 
                 sub_command = java_process.sub_command
                 sub_command.add_option_pair(key='INPUT', value=file_path_dict_sample['merged_bam'])
+                java_process.input_path_list.append(file_path_dict_sample['merged_bam'])
                 sub_command.add_option_pair(key='OUTPUT', value=file_path_dict_sample['duplicates_marked_bam'])
+                java_process.output_path_list.append(file_path_dict_sample['duplicates_marked_bam'])
                 sub_command.add_option_pair(key='METRICS_FILE', value=file_path_dict_sample['duplicate_metrics'])
+                java_process.output_path_list.append(file_path_dict_sample['duplicate_metrics'])
                 # Since read names typically contain a dash and an underscore, the READ_NAME_REGEX needs adjusting,
                 # as otherwise optical duplicates could not be detected. This is a consequence of using Illumina2bam
                 # rather than Picard ExtractIlluminaBarcodes, IlluminaBasecallsToFastq and IlluminaBasecallsToSam.
@@ -1409,9 +1443,12 @@ class VariantCallingGATK(Analysis):
                 sub_command.add_option_long(key='known', value=file_path)
             if self.skip_mark_duplicates:
                 sub_command.add_option_long(key='input_file', value=file_path_dict_sample['merged_bam'])
+                java_process.input_path_list.append(file_path_dict_sample['merged_bam'])
             else:
                 sub_command.add_option_long(key='input_file', value=file_path_dict_sample['duplicates_marked_bam'])
+                java_process.input_path_list.append(file_path_dict_sample['duplicates_marked_bam'])
             sub_command.add_option_long(key='out', value=file_path_dict_sample['realigner_targets'])
+            java_process.output_path_list.append(file_path_dict_sample['realigner_targets'])
 
             # Run the GATK IndelRealigner step as a second-pass walker after the GATK RealignerTargetCreator step.
 
@@ -1445,10 +1482,14 @@ class VariantCallingGATK(Analysis):
                 sub_command.add_option_long(key='knownAlleles', value=file_path)
             if self.skip_mark_duplicates:
                 sub_command.add_option_long(key='input_file', value=file_path_dict_sample['merged_bam'])
+                java_process.input_path_list.append(file_path_dict_sample['merged_bam'])
             else:
                 sub_command.add_option_long(key='input_file', value=file_path_dict_sample['duplicates_marked_bam'])
+                java_process.input_path_list.append(file_path_dict_sample['duplicates_marked_bam'])
             sub_command.add_option_long(key='targetIntervals', value=file_path_dict_sample['realigner_targets'])
+            java_process.input_path_list.append(file_path_dict_sample['realigner_targets'])
             sub_command.add_option_long(key='out', value=file_path_dict_sample['realigned_bam'])
+            java_process.output_path_list.append(file_path_dict_sample['realigned_bam'])
             # For debugging only.
             # sub_command.add_option_long(key='logging_level', value='DEBUG')
 
@@ -1473,7 +1514,9 @@ class VariantCallingGATK(Analysis):
 
             sub_command = java_process.sub_command
             sub_command.add_option_pair(key='INPUT', value=file_path_dict_sample['realigned_bam'])
+            java_process.input_path_list.append(file_path_dict_sample['realigned_bam'])
             sub_command.add_option_pair(key='OUTPUT', value=file_path_dict_sample['alignment_summary_metrics'])
+            java_process.output_path_list.append(file_path_dict_sample['alignment_summary_metrics'])
             sub_command.add_option_pair(key='METRIC_ACCUMULATION_LEVEL', value='ALL_READS')
             sub_command.add_option_pair(key='REFERENCE_SEQUENCE', value=self.bwa_genome_db)
             sub_command.add_option_pair(key='TMP_DIR', value=file_path_dict_sample['temporary_directory'])
@@ -1523,7 +1566,10 @@ class VariantCallingGATK(Analysis):
             if self.known_sites_discovery:
                 sub_command.add_option_long(key='dbsnp', value=self.known_sites_discovery)
             sub_command.add_option_long(key='input_file', value=file_path_dict_sample['realigned_bam'])
+            java_process.input_path_list.append(file_path_dict_sample['realigned_bam'])
             sub_command.add_option_long(key='out', value=file_path_dict_sample['raw_variants_gvcf_vcf'])
+            java_process.output_path_list.append(file_path_dict_sample['raw_variants_gvcf_vcf'])
+            java_process.output_path_list.append(file_path_dict_sample['raw_variants_gvcf_idx'])
             # Parameter to pass to the VCF/BCF IndexCreator
             sub_command.add_option_long(key='variant_index_type', value='LINEAR')
             sub_command.add_option_long(key='variant_index_parameter', value='128000')
@@ -1647,6 +1693,10 @@ class VariantCallingGATK(Analysis):
             sub_command.add_option_long(key='variant', value=file_path)
         sub_command.add_option_long(key='out', value=file_path_dict_cohort['combined_gvcf_vcf'])
 
+        java_process.input_path_list.extend(vc_process_cohort_replicates)
+        java_process.output_path_list.append(file_path_dict_cohort['combined_gvcf_vcf'])
+        java_process.output_path_list.append(file_path_dict_cohort['combined_gvcf_idx'])
+
         # Run an additional GATK CombineGVCFs step to merge into a super-cohort.
 
         if len(self.accessory_cohort_gvcfs):
@@ -1679,6 +1729,11 @@ class VariantCallingGATK(Analysis):
             sub_command.add_option_long(key='variant', value=file_path_dict_cohort['combined_gvcf_vcf'])
             sub_command.add_option_long(key='out', value=file_path_dict_cohort['temporary_gvcf_vcf'])
 
+            java_process.input_path_list.extend(self.accessory_cohort_gvcfs)
+            java_process.input_path_list.append(file_path_dict_cohort['combined_gvcf_vcf'])
+            java_process.output_path_list.append(file_path_dict_cohort['temporary_gvcf_vcf'])
+            java_process.output_path_list.append(file_path_dict_cohort['temporary_gvcf_idx'])
+
         # Run the GATK GenotypeGVCFs step.
 
         java_process = Executable(
@@ -1709,10 +1764,15 @@ class VariantCallingGATK(Analysis):
             sub_command.add_option_long(key='dbsnp', value=self.known_sites_discovery)
         if len(self.accessory_cohort_gvcfs):
             sub_command.add_option_long(key='variant', value=file_path_dict_cohort['temporary_gvcf_vcf'])
+            java_process.input_path_list.append(file_path_dict_cohort['temporary_gvcf_vcf'])
         else:
             sub_command.add_option_long(key='variant', value=file_path_dict_cohort['combined_gvcf_vcf'])
+            java_process.input_path_list.append(file_path_dict_cohort['combined_gvcf_vcf'])
         sub_command.add_option_long(key='out', value=file_path_dict_cohort['genotyped_raw_vcf'])
 
+        java_process.output_path_list.append(file_path_dict_cohort['genotyped_raw_vcf'])
+        java_process.output_path_list.append(file_path_dict_cohort['genotyped_raw_idx'])
+
         # Run the GATK VariantRecalibrator for SNPs.
 
         java_process = Executable(
@@ -1757,6 +1817,10 @@ class VariantCallingGATK(Analysis):
         sub_command.add_option_long(key='tranches_file', value=file_path_dict_cohort['tranches_snp'])
         sub_command.add_option_long(key='rscript_file', value=file_path_dict_cohort['plots_snp'])
 
+        java_process.input_path_list.append(file_path_dict_cohort['genotyped_raw_vcf'])
+        java_process.output_path_list.append(file_path_dict_cohort['recalibration_snp'])
+        java_process.output_path_list.append(file_path_dict_cohort['tranches_snp'])
+
         # Run the GATK VariantRecalibrator for INDELs.
 
         java_process = Executable(
@@ -1802,6 +1866,10 @@ class VariantCallingGATK(Analysis):
         sub_command.add_option_long(key='tranches_file', value=file_path_dict_cohort['tranches_indel'])
         sub_command.add_option_long(key='rscript_file', value=file_path_dict_cohort['plots_indel'])
 
+        java_process.input_path_list.append(file_path_dict_cohort['genotyped_raw_vcf'])
+        java_process.output_path_list.append(file_path_dict_cohort['recalibration_indel'])
+        java_process.output_path_list.append(file_path_dict_cohort['tranches_indel'])
+
         # Run the GATK ApplyRecalibration step for SNPs.
 
         java_process = Executable(
@@ -1833,6 +1901,13 @@ class VariantCallingGATK(Analysis):
         sub_command.add_option_long(key='recal_file', value=file_path_dict_cohort['recalibration_snp'])
         sub_command.add_option_long(key='tranches_file', value=file_path_dict_cohort['tranches_snp'])
         sub_command.add_option_long(key='out', value=file_path_dict_cohort['recalibrated_snp_raw_indel_vcf'])
+
+        java_process.input_path_list.append(file_path_dict_cohort['genotyped_raw_vcf'])
+        java_process.input_path_list.append(file_path_dict_cohort['recalibration_snp'])
+        java_process.input_path_list.append(file_path_dict_cohort['tranches_snp'])
+        java_process.output_path_list.append(file_path_dict_cohort['recalibrated_snp_raw_indel_vcf'])
+        java_process.output_path_list.append(file_path_dict_cohort['recalibrated_snp_raw_indel_idx'])
+
         # The lodCutoff (VQSLOD score) filter is not applied for the moment.
         if self.truth_sensitivity_filter_level_snp:
             sub_command.add_option_long(key='ts_filter_level', value=self.truth_sensitivity_filter_level_snp)
@@ -1868,6 +1943,13 @@ class VariantCallingGATK(Analysis):
         sub_command.add_option_long(key='recal_file', value=file_path_dict_cohort['recalibration_indel'])
         sub_command.add_option_long(key='tranches_file', value=file_path_dict_cohort['tranches_indel'])
         sub_command.add_option_long(key='out', value=file_path_dict_cohort['recalibrated_snp_recalibrated_indel_vcf'])
+
+        java_process.input_path_list.append(file_path_dict_cohort['recalibrated_snp_raw_indel_vcf'])
+        java_process.input_path_list.append(file_path_dict_cohort['recalibration_indel'])
+        java_process.input_path_list.append(file_path_dict_cohort['tranches_indel'])
+        java_process.output_path_list.append(file_path_dict_cohort['recalibrated_snp_recalibrated_indel_vcf'])
+        java_process.output_path_list.append(file_path_dict_cohort['recalibrated_snp_recalibrated_indel_idx'])
+
         # The lodCutoff (VQSLOD score) filter is not applied for the moment.
         if self.truth_sensitivity_filter_level_indel:
             sub_command.add_option_long(key='ts_filter_level', value=self.truth_sensitivity_filter_level_indel)
@@ -1909,6 +1991,10 @@ class VariantCallingGATK(Analysis):
                 sub_command.add_option_long(key='sample_name', value=sample.name)
             sub_command.add_switch_long(key='excludeNonVariants')
 
+            java_process.input_path_list.append(file_path_dict_cohort['recalibrated_snp_recalibrated_indel_vcf'])
+            java_process.output_path_list.append(file_path_dict_cohort['multi_sample_vcf'])
+            java_process.output_path_list.append(file_path_dict_cohort['multi_sample_idx'])
+
         # Run the snpEff tool for functional variant annotation.
 
         java_process = Executable(
@@ -1938,8 +2024,12 @@ class VariantCallingGATK(Analysis):
         sub_command.arguments.append(self.snpeff_genome_version)
         if len(self.accessory_cohort_gvcfs):
             sub_command.arguments.append(file_path_dict_cohort['multi_sample_vcf'])
+            java_process.input_path_list.append(file_path_dict_cohort['multi_sample_vcf'])
         else:
             sub_command.arguments.append(file_path_dict_cohort['recalibrated_snp_recalibrated_indel_vcf'])
+            java_process.input_path_list.append(file_path_dict_cohort['recalibrated_snp_recalibrated_indel_vcf'])
+
+        java_process.output_path_list.append(file_path_dict_cohort['snpeff_vcf'])
 
         # Run the GATK VariantAnnotator
 
@@ -1985,16 +2075,22 @@ class VariantCallingGATK(Analysis):
             sub_command.add_option_long(
                 key='variant',
                 value=file_path_dict_cohort['multi_sample_vcf'])
+            java_process.input_path_list.append(file_path_dict_cohort['multi_sample_vcf'])
         else:
             sub_command.add_option_long(
                 key='variant',
                 value=file_path_dict_cohort['recalibrated_snp_recalibrated_indel_vcf'])
+            java_process.input_path_list.append(file_path_dict_cohort['recalibrated_snp_recalibrated_indel_vcf'])
         # The AlleleBalanceBySample annotation does not seem to work in either GATK 3.1-1 or GATK 3.2-0.
         # sub_command.add_option_long(key='annotation', value='AlleleBalanceBySample')
         sub_command.add_option_long(key='annotation', value='SnpEff')
         sub_command.add_option_long(key='snpEffFile', value=file_path_dict_cohort['snpeff_vcf'])
         sub_command.add_option_long(key='out', value=file_path_dict_cohort['annotated_vcf'])
 
+        java_process.input_path_list.append(file_path_dict_cohort['snpeff_vcf'])
+        java_process.output_path_list.append(file_path_dict_cohort['annotated_vcf'])
+        java_process.output_path_list.append(file_path_dict_cohort['annotated_idx'])
+
         # Re-process the cohort by sample.
 
         # TODO: It is no longer possible to pickle this dictionary.
@@ -2041,6 +2137,9 @@ class VariantCallingGATK(Analysis):
             sub_command.add_option_long(key='sample_name', value=sample.name)
             sub_command.add_switch_long(key='excludeNonVariants')
 
+            java_process.input_path_list.append(file_path_dict_cohort['annotated_vcf'])
+            java_process.output_path_list.append(file_path_dict_cohort['sample_vcf_' + sample.name])
+
             # Run the GATK VariantsToTable step.
 
             file_path_dict_cohort['sample_csv_' + sample.name] = prefix_cohort + '_sample_{}.csv'.format(sample.name)
@@ -2072,6 +2171,9 @@ class VariantCallingGATK(Analysis):
 
             sub_command.add_option_long(key='variant', value=file_path_dict_cohort['sample_vcf_' + sample.name])
             sub_command.add_option_long(key='out', value=file_path_dict_cohort['sample_csv_' + sample.name])
+
+            java_process.input_path_list.append(file_path_dict_cohort['sample_vcf_' + sample.name])
+            java_process.output_path_list.append(file_path_dict_cohort['sample_csv_' + sample.name])
             sub_command.add_switch_long(key='allowMissingData')
             sub_command.add_switch_long(key='showFiltered')
             # Set of standard VCF fields.
@@ -25,14 +25,242 @@ A package of classes and methods modelling data directories and files.
 #
 # You should have received a copy of the GNU Lesser General Public License
 # along with BSF Python.  If not, see <http://www.gnu.org/licenses/>.
+import errno
+import json
 import os
 import re
 from stat import *
 import string
+import time
 import warnings
 import weakref
 
 from bsf.annotation import SampleAnnotationSheet
+from bsf.drms import run_concurrently
+
+# Python 2 provides scandir via the optional scandir package, otherwise directories are listed via os.listdir.
+try:
+    from os import scandir
+except ImportError:
+    try:
+        from scandir import scandir
+    except ImportError:
+        scandir = None
+
+# Default number of concurrent directory listings upon discovering a ProcessedRunFolder.
+discovery_threads = 8
+
+casava_project_pattern = re.compile(pattern=r'^Project_(.*)$')
+
+casava_sample_pattern = re.compile(pattern=r'^Sample_(.*)$')
+
+casava_reads_pattern = re.compile(pattern=r'fastq.gz$')
+
+# Registry of FASTQ file name parsers as Python list of Python tuple objects of
+# Python str (parser name) and compiled regular expression pattern objects, tried in order.
+# Each pattern defines the groups name, barcode, lane, read and chunk.
+#   bcl2fastq2: name_Sn_Lnnn_Rn_001.fastq.gz, where the sample number takes the place of the barcode and
+#       the lane is missing without lane splitting (e.g. Undetermined_S0_L001_R1_001.fastq.gz)
+#   CASAVA: name_index_Lnnn_Rn_chunk.fastq.gz of CASAVA 1.8
+#       (e.g. lane1_Undetermined_L001_R1_001.fastq.gz or name_NoIndex_L001_R1_001.fastq.gz)
+# Index reads have read numbers I1 and I2.
+reads_parser_list = [
+    ('bcl2fastq2', re.compile(
+        pattern=r'^(?P<name>.+)_(?P<barcode>S[0-9]+)(?:_(?P<lane>L[0-9]{3}))?_(?P<read>[RI][0-9])_'
+                r'(?P<chunk>[0-9]{3})\.fastq(?:\.gz)?$')),
+    ('CASAVA', re.compile(
+        pattern=r'^(?P<name>[^.]*)_(?P<barcode>[^._]*)_(?P<lane>[^._]*)_(?P<read>[^._]*)_(?P<chunk>[^._]*)\.')),
+]
+
+# Directory for discovery cache (JSON) files next to ProcessedRunFolder directories.
+discovery_cache_directory = '.bsfpython_discovery'
+
+# Version of the discovery cache file format.
+discovery_cache_version = 2
+
+
+def list_directory(file_path, pattern, directory):
+    """List the entries of a directory matching a pattern and a file type.
+
+    Entries are matched against the pattern first, so that only matching entries need checking of their
+    file type. If available, the file type is taken from the directory entry (i.e. I{d_type}) returned by
+    I{scandir}, saving a I{stat} call for each entry. Symbolic links are followed.
+    Entries are returned in the order of the directory listing.
+    @param file_path: Directory path
+    @type file_path: str | unicode
+    @param pattern: Compiled regular expression pattern
+    @type pattern: _sre.SRE_Pattern
+    @param directory: Match directories, or alternatively regular files
+    @type directory: bool
+    @return: Python C{list} of Python C{tuple} objects of Python C{str} (file path) and
+        C{_sre.SRE_Match} objects
+    @rtype: list
+    """
+
+    entry_list = list()
+
+    if scandir is None:
+        for file_name in os.listdir(file_path):
+            match = pattern.search(file_name)
+            if match:
+                entry_path = os.path.join(file_path, file_name)
+                mode = os.stat(entry_path).st_mode
+                if S_ISDIR(mode) if directory else S_ISREG(mode):
+                    entry_list.append((entry_path, match))
+    else:
+        for directory_entry in scandir(file_path):
+            match = pattern.search(directory_entry.name)
+            if match and (directory_entry.is_dir() if directory else directory_entry.is_file()):
+                entry_list.append((directory_entry.path, match))
+
+    return entry_list
+
+
+def parse_reads_file_name(file_name):
+    """Parse a FASTQ file name by the first matching parser of the C{reads_parser_list} registry.
+
+    @param file_name: File name
+    @type file_name: str | unicode
+    @return: Python C{dict} of Python C{str} (i.e. I{parser}, I{name}, I{barcode}, I{lane}, I{read} and
+        I{chunk}) key and Python C{str} value data or C{None}, if no parser matched
+    @rtype: dict | None
+    """
+
+    for parser_name, pattern in reads_parser_list:
+        match = pattern.match(file_name)
+        if match:
+            reads_dict = match.groupdict(str())
+            reads_dict['parser'] = parser_name
+            return reads_dict
+
+    return None
+
+
+def parse_reads_directory(file_path):
+    """List a directory and parse all FASTQ file names in bulk.
+
+    File names not matching any parser of the C{reads_parser_list} registry are skipped with a warning.
+    @param file_path: Directory path
+    @type file_path: str | unicode
+    @return: Python C{list} of Python C{tuple} objects of Python C{str} (file path) and
+        Python C{dict} objects as returned by C{parse_reads_file_name}, in the order of the directory listing
+    @rtype: list
+    """
+
+    entry_list = list()
+
+    for entry_path, match in list_directory(file_path=file_path, pattern=casava_reads_pattern, directory=False):
+        reads_dict = parse_reads_file_name(file_name=os.path.basename(entry_path))
+        if reads_dict is None:
+            warnings.warn('Unsupported FASTQ file name {!r}.'.format(entry_path), UserWarning)
+        else:
+            entry_list.append((entry_path, reads_dict))
+
+    return entry_list
+
+
+def _decode_cache_object(object_dict):
+    """Decode Python C{unicode} values of a JSON object into Python C{str} objects, as upon discovery.
+
+    @param object_dict: Python C{dict} of a JSON object
+    @type object_dict: dict
+    @return: Python C{dict} with Python C{str} values
+    @rtype: dict
+    """
+
+    for key, value in object_dict.iteritems():
+        if isinstance(value, unicode):
+            object_dict[key] = value.encode('utf-8')
+
+    return object_dict
+
+
+def get_mtime_dict(file_path_list, threads=1):
+    """Get the modification times of files or directories, with a bounded number of concurrent I{stat} calls.
+
+    @param file_path_list: Python C{list} of Python C{str} (file path) objects
+    @type file_path_list: list
+    @param threads: Number of concurrent I{stat} calls
+    @type threads: int
+    @return: Python C{dict} of Python C{str} (file path) key data and Python C{float} (modification time)
+        or C{None}, if the file does not exist, value data
+    @rtype: dict
+    """
+
+    mtime_dict = dict()
+
+    def stat_chunk(chunk_list):
+        for file_path in chunk_list:
+            try:
+                mtime_dict[file_path] = os.stat(file_path).st_mtime
+            except OSError as exception:
+                if exception.errno != errno.ENOENT:
+                    raise
+                mtime_dict[file_path] = None
+
+    threads = max(1, threads)
+    chunk_size = max(1, (len(file_path_list) + threads - 1) // threads)
+
+    run_concurrently(
+        function=stat_chunk,
+        keywords_list=map(lambda x: {'chunk_list': file_path_list[x:x + chunk_size]},
+                          range(0, len(file_path_list), chunk_size)),
+        threads=threads)
+
+    return mtime_dict
+
+
+def _intern(value):
+    """Intern a Python C{str}, so that equal categorical values share a single object.
+
+    @param value: Value
+    @type value: str | unicode | None
+    @return: Interned Python C{str} or the value itself, if not a Python C{str}
+    @rtype: str | unicode | None
+    """
+
+    if type(value) is str:
+        return intern(value)
+    else:
+        return value
+
+
+def _get_state(instance, attribute_names):
+    """Get the state of a slotted object as Python C{dict} for pickling.
+
+    Weak references cannot be pickled and are stored as C{None}.
+    @param instance: Slotted object
+    @type instance: object
+    @param attribute_names: Python C{tuple} of Python C{str} (public attribute name) objects
+    @type attribute_names: tuple
+    @return: Python C{dict} of Python C{str} (attribute name) key and attribute value data
+    @rtype: dict
+    """
+
+    state_dict = dict()
+
+    for attribute_name in attribute_names:
+        if attribute_name.startswith('weak_reference_'):
+            state_dict[attribute_name] = None
+        else:
+            state_dict[attribute_name] = getattr(instance, attribute_name)
+
+    return state_dict
+
+
+def _set_state(instance, state_dict):
+    """Set the state of a slotted object from a Python C{dict} upon unpickling.
+
+    Weak references to child objects need re-establishing by the caller.
+    This also accepts the instance dictionaries of objects pickled before the classes had slots.
+    @param instance: Slotted object
+    @type instance: object
+    @param state_dict: Python C{dict} of Python C{str} (attribute name) key and attribute value data
+    @type state_dict: dict
+    """
+
+    for attribute_name, value in state_dict.iteritems():
+        setattr(instance, attribute_name, value)
 
 
 class Reads(object):
@@ -60,13 +288,26 @@ class Reads(object):
     @type weak_reference_paired_reads: PairedReads
     """
 
+    # Since many Reads objects exist, they are slotted. The file path is stored as an interned directory
+    # shared with all Reads objects of the same directory and a file name. Categorical attributes are interned.
+
+    __slots__ = (
+        '_directory', '_file_name', '_file_type', 'name', '_barcode', '_lane', '_read', '_chunk',
+        'weak_reference_paired_reads'
+    )
+
+    _attribute_names = (
+        'file_path', 'file_type', 'name', 'barcode', 'lane', 'read', 'chunk', 'weak_reference_paired_reads'
+    )
+
     @classmethod
     def from_file_path(cls, file_path, file_type):
         """Construct a C{Reads} object from a file path.
 
-        For a I{file_type} I{CASAVA}, C{Reads.file_path} obeys a I{Sample_name_Index_Lane_Read_Chunk} schema,
+        For a I{file_type} I{CASAVA}, C{Reads.file_path} obeys a I{name_Index_Lane_Read_Chunk} schema
+        of CASAVA 1.8 or a I{name_SampleNumber_Lane_Read_001} schema of bcl2fastq2,
         so that C{Reads.name}, C{Reads.barcode}, C{Reads.lane}, C{Reads.read} and C{Reads.chunk}
-        can be populated automatically.
+        can be populated automatically by the C{reads_parser_list} registry.
         For I{file_type} I{External}, the attributes need to be populated manually.
         @param file_path: File path
         @type file_path: str | unicode
@@ -74,31 +315,43 @@ class Reads(object):
         @type file_type: str
         @return: C{Reads} object
         @rtype: Reads
+        @raise Exception: If the file name is not supported by any parser
         """
 
         if file_type == 'CASAVA':
 
             file_name = os.path.basename(file_path.rstrip('/ '))
 
-            # CASAVA Reads obey a Sample_name_Index_Lane_Read_Chunk schema.
+            reads_dict = parse_reads_file_name(file_name=file_name)
 
-            components = file_name.split('.')
-            components[0] = components[0].split('_')
+            if reads_dict is None:
+                raise Exception('Unsupported FASTQ file name {!r}.'.format(file_name))
 
-            name = string.join(words=components[0][:-4], sep='_')
-            barcode = components[0][-4]
-            lane = components[0][-3]
-            read = components[0][-2]
-            chunk = components[0][-1]
-
-            reads = cls(file_path=file_path, file_type=file_type, name=name,
-                        barcode=barcode, lane=lane, read=read, chunk=chunk)
+            reads = cls.from_reads_dict(file_path=file_path, file_type=file_type, reads_dict=reads_dict)
 
         else:
             raise Exception('Unsupported file_type {!r}.'.format(file_type))
 
         return reads
 
+    @classmethod
+    def from_reads_dict(cls, file_path, file_type, reads_dict):
+        """Construct a C{Reads} object from a Python C{dict} of parsed file name components.
+
+        @param file_path: File path
+        @type file_path: str | unicode
+        @param file_type: File type
+        @type file_type: str
+        @param reads_dict: Python C{dict} as returned by C{parse_reads_file_name}
+        @type reads_dict: dict
+        @return: C{Reads} object
+        @rtype: Reads
+        """
+
+        return cls(file_path=file_path, file_type=file_type, name=reads_dict['name'],
+                   barcode=reads_dict['barcode'], lane=reads_dict['lane'], read=reads_dict['read'],
+                   chunk=reads_dict['chunk'])
+
     def __init__(self, file_path=None, file_type=None, name=None,
                  barcode=None, lane=None, read=None, chunk=None,
                  weak_reference_paired_reads=None):
@@ -162,6 +415,146 @@ class Reads(object):
         else:
             self.weak_reference_paired_reads = None
 
+    def __getstate__(self):
+        """Get the state for pickling.
+
+        @return: Python C{dict} of public attribute names and values
+        @rtype: dict
+        """
+
+        return _get_state(instance=self, attribute_names=self._attribute_names)
+
+    def __setstate__(self, state):
+        """Set the state upon unpickling.
+
+        @param state: Python C{dict} of public attribute names and values
+        @type state: dict
+        """
+
+        _set_state(instance=self, state_dict=state)
+
+    @property
+    def file_path(self):
+        """Get the file path.
+
+        @return: File path
+        @rtype: str | unicode
+        """
+
+        return self._directory + self._file_name
+
+    @file_path.setter
+    def file_path(self, value):
+        """Set the file path.
+
+        @param value: File path
+        @type value: str | unicode
+        """
+
+        index = value.rfind('/') + 1
+        self._directory = _intern(value[:index])
+        self._file_name = value[index:]
+
+    @property
+    def file_type(self):
+        """Get the file type.
+
+        @return: File type
+        @rtype: str
+        """
+
+        return self._file_type
+
+    @file_type.setter
+    def file_type(self, value):
+        """Set the file type.
+
+        @param value: File type
+        @type value: str
+        """
+
+        self._file_type = _intern(value)
+
+    @property
+    def barcode(self):
+        """Get the barcode.
+
+        @return: Barcode
+        @rtype: str
+        """
+
+        return self._barcode
+
+    @barcode.setter
+    def barcode(self, value):
+        """Set the barcode.
+
+        @param value: Barcode
+        @type value: str
+        """
+
+        self._barcode = _intern(value)
+
+    @property
+    def lane(self):
+        """Get the lane number.
+
+        @return: Lane number
+        @rtype: str
+        """
+
+        return self._lane
+
+    @lane.setter
+    def lane(self, value):
+        """Set the lane number.
+
+        @param value: Lane number
+        @type value: str
+        """
+
+        self._lane = _intern(value)
+
+    @property
+    def read(self):
+        """Get the read number.
+
+        @return: Read number (e.g. I{R1}, I{R2}, ...)
+        @rtype: str
+        """
+
+        return self._read
+
+    @read.setter
+    def read(self, value):
+        """Set the read number.
+
+        @param value: Read number (e.g. I{R1}, I{R2}, ...)
+        @type value: str
+        """
+
+        self._read = _intern(value)
+
+    @property
+    def chunk(self):
+        """Get the chunk number.
+
+        @return: Chunk number (e.g. I{001}, I{002}, ...)
+        @rtype: str
+        """
+
+        return self._chunk
+
+    @chunk.setter
+    def chunk(self, value):
+        """Set the chunk number.
+
+        @param value: Chunk number (e.g. I{001}, I{002}, ...)
+        @type value: str
+        """
+
+        self._chunk = _intern(value)
+
     def trace(self, level):
         """Trace a C{Reads} object.
 
@@ -283,6 +676,10 @@ class PairedReads(object):
     @type weak_reference_sample: Sample
     """
 
+    __slots__ = ('reads1', 'reads2', 'read_group', 'weak_reference_sample', '__weakref__')
+
+    _attribute_names = ('reads1', 'reads2', 'read_group', 'weak_reference_sample')
+
     def __init__(self, reads1=None, reads2=None, read_group=None, weak_reference_sample=None):
         """Initialise a C{PairedReads} object.
 
@@ -349,6 +746,28 @@ class PairedReads(object):
         else:
             self.weak_reference_sample = None
 
+    def __getstate__(self):
+        """Get the state for pickling.
+
+        @return: Python C{dict} of public attribute names and values
+        @rtype: dict
+        """
+
+        return _get_state(instance=self, attribute_names=self._attribute_names)
+
+    def __setstate__(self, state):
+        """Set the state upon unpickling.
+
+        @param state: Python C{dict} of public attribute names and values
+        @type state: dict
+        """
+
+        _set_state(instance=self, state_dict=state)
+
+        for reads in (self.reads1, self.reads2):
+            if reads is not None:
+                reads.weak_reference_paired_reads = weakref.ref(self)
+
     def trace(self, level):
         """Trace a C{PairedReads} object.
 
@@ -467,6 +886,7 @@ class PairedReads(object):
         C{Reads.name}, C{Reads.barcode} and C{Reads.lane} attributes, preferentially derived from
         the first C{Reads} object in the C{PairedReads} object.
         If the I{full} parameter is set, C{Reads.read} and C{Reads.chunk} are also added.
+        Empty attributes (e.g. the lane of bcl2fastq files without lane splitting) are omitted.
         @param full: Return the full name including read and chunk information
         @type full: bool
         @return: Name
@@ -481,10 +901,13 @@ class PairedReads(object):
             return
 
         if reads.file_type == 'CASAVA':
+            # Omit empty components (e.g. the lane without lane splitting).
             if full:
-                name = string.join(words=(reads.name, reads.barcode, reads.lane, reads.read, reads.chunk), sep='_')
+                name = string.join(
+                    words=filter(None, (reads.name, reads.barcode, reads.lane, reads.read, reads.chunk)),
+                    sep='_')
             else:
-                name = string.join(words=(reads.name, reads.barcode, reads.lane), sep='_')
+                name = string.join(words=filter(None, (reads.name, reads.barcode, reads.lane)), sep='_')
         else:
             name = reads.name
 
@@ -512,6 +935,10 @@ class Sample(object):
     @type weak_reference_project: Project
     """
 
+    __slots__ = ('file_path', '_file_type', 'name', 'paired_reads_list', 'weak_reference_project', '__weakref__')
+
+    _attribute_names = ('file_path', 'file_type', 'name', 'paired_reads_list', 'weak_reference_project')
+
     default_key = 'Default'
 
     @classmethod
@@ -520,6 +947,9 @@ class Sample(object):
 
         For a I{file_type} I{CASAVA} the name is automatically populated,
         while C{PairedReads} objects are automatically discovered.
+        The FASTQ file names of the directory are parsed in bulk and paired by name, barcode, lane and chunk.
+        C{PairedReads} objects are added ordered by these attributes. Index reads (i.e. I{I1} and I{I2})
+        are not part of C{PairedReads} objects and therefore skipped.
         @param file_path: File path
         @type file_path: str | unicode
         @param file_type: File type
@@ -538,16 +968,35 @@ class Sample(object):
 
             name = string.join(words=components[1:], sep='_')
 
-            sample = cls(file_path=file_path, file_type=file_type, name=name)
-
             # Automatically discover CASAVA Reads files ...
+            # Python dict of Python tuple (name, barcode, lane, chunk) key and
+            # Python dict of Python str (read) key and Reads value data.
+
+            reads_dict_dict = dict()
+
+            for reads_path, reads_dict in parse_reads_directory(file_path=file_path):
+                if reads_dict['read'].startswith('I'):
+                    continue
+                if reads_dict['read'] not in ('R1', 'R2'):
+                    raise Exception('Unknown Reads read attribute {!r}.'.format(reads_dict['read']))
+
+                key = (reads_dict['name'], reads_dict['barcode'], reads_dict['lane'], reads_dict['chunk'])
+                if key not in reads_dict_dict:
+                    reads_dict_dict[key] = dict()
+                if reads_dict['read'] in reads_dict_dict[key]:
+                    raise Exception(
+                        'Reads {!r} and {!r} have the same name, barcode, lane, read and chunk.'.
+                        format(reads_dict_dict[key][reads_dict['read']].file_path, reads_path))
+                reads_dict_dict[key][reads_dict['read']] = Reads.from_reads_dict(
+                    file_path=reads_path, file_type=file_type, reads_dict=reads_dict)
+
+            paired_reads_list = list()
 
-            for file_name in os.listdir(sample.file_path):
-                file_path = os.path.join(sample.file_path, file_name)
-                mode = os.stat(file_path).st_mode
-                match = re.search(pattern=r'fastq.gz$', string=file_name)
-                if S_ISREG(mode) and match:
-                    sample.add_reads(reads=Reads.from_file_path(file_path=file_path, file_type=file_type))
+            for key in sorted(reads_dict_dict):
+                read_dict = reads_dict_dict[key]
+                paired_reads_list.append(PairedReads(reads1=read_dict.get('R1'), reads2=read_dict.get('R2')))
+
+            sample = cls(file_path=file_path, file_type=file_type, name=name, paired_reads_list=paired_reads_list)
 
         else:
             raise Exception('Unsupported file_type {!r}.'.format(file_type))
@@ -638,6 +1087,47 @@ class Sample(object):
         else:
             self.weak_reference_project = None
 
+    def __getstate__(self):
+        """Get the state for pickling.
+
+        @return: Python C{dict} of public attribute names and values
+        @rtype: dict
+        """
+
+        return _get_state(instance=self, attribute_names=self._attribute_names)
+
+    def __setstate__(self, state):
+        """Set the state upon unpickling.
+
+        @param state: Python C{dict} of public attribute names and values
+        @type state: dict
+        """
+
+        _set_state(instance=self, state_dict=state)
+
+        for paired_reads in self.paired_reads_list:
+            paired_reads.weak_reference_sample = weakref.ref(self)
+
+    @property
+    def file_type(self):
+        """Get the file type.
+
+        @return: File type
+        @rtype: str
+        """
+
+        return self._file_type
+
+    @file_type.setter
+    def file_type(self, value):
+        """Set the file type.
+
+        @param value: File type
+        @type value: str
+        """
+
+        self._file_type = _intern(value)
+
     def trace(self, level):
         """Trace a C{Sample} object.
 
@@ -819,13 +1309,17 @@ class Project(object):
     default_key = 'Default'
 
     @classmethod
-    def from_file_path(cls, file_path, file_type):
+    def from_file_path(cls, file_path, file_type, threads=1):
         """Construct a C{Project} object from a file path.
 
+        For a I{file_type} I{CASAVA}, C{Sample} directories are listed concurrently,
+        but added in the order of the directory listing.
         @param file_path: File path
         @type file_path: str | unicode
         @param file_type: File type
         @type file_type: str
+        @param threads: Number of concurrent C{Sample} directory listings
+        @type threads: int
         @return: C{Project}
         @rtype: Project
         """
@@ -844,16 +1338,27 @@ class Project(object):
 
             # Automatically discover CASAVA Sample directories ...
 
-            for file_name in os.listdir(project.file_path):
-                file_path = os.path.join(project.file_path, file_name)
-                mode = os.stat(file_path).st_mode
-                match = re.search(pattern=r'^Sample_(.*)$', string=file_name)
-                if S_ISDIR(mode) and match:
-                    if match.group(1) in project.samples:
-                        raise Exception(
-                            'Sample with name {!r} already exists.'.format(match.group(1)))
-                    else:
-                        project.add_sample(sample=Sample.from_file_path(file_path=file_path, file_type=file_type))
+            entry_list = list_directory(file_path=project.file_path, pattern=casava_sample_pattern, directory=True)
+
+            name_set = set()
+            for file_path, match in entry_list:
+                if match.group(1) in name_set:
+                    raise Exception(
+                        'Sample with name {!r} already exists.'.format(match.group(1)))
+                name_set.add(match.group(1))
+
+            sample_dict = dict()
+
+            def discover_sample(sample_path):
+                sample_dict[sample_path] = Sample.from_file_path(file_path=sample_path, file_type=file_type)
+
+            run_concurrently(
+                function=discover_sample,
+                keywords_list=map(lambda x: {'sample_path': x[0]}, entry_list),
+                threads=threads)
+
+            for file_path, match in entry_list:
+                project.add_sample(sample=sample_dict[file_path])
 
         else:
             raise Exception('Unsupported file_type {!r}.'.format(file_type))
@@ -1013,18 +1518,178 @@ class ProcessedRunFolder(object):
         else:
             return 'External'
 
+    @staticmethod
+    def get_cache_path(file_path):
+        """Get the discovery cache (JSON) file path of a C{ProcessedRunFolder}.
+
+        Discovery cache files are kept in the C{discovery_cache_directory} next to the
+        C{ProcessedRunFolder} directory, so that the directory itself does not need to be writable.
+        @param file_path: C{ProcessedRunFolder} file path
+        @type file_path: str | unicode
+        @return: Discovery cache (JSON) file path
+        @rtype: str | unicode
+        """
+
+        file_path = file_path.rstrip('/ ')
+
+        return os.path.join(
+            os.path.dirname(file_path),
+            discovery_cache_directory,
+            os.path.basename(file_path) + '.json')
+
     @classmethod
-    def from_file_path(cls, file_path, file_type):
+    def from_cache(cls, file_path, threads=1):
+        """Construct a CASAVA C{ProcessedRunFolder} object from its discovery cache (JSON) file.
+
+        The cache is only valid, if the modification times of the C{ProcessedRunFolder}, all C{Project} and all
+        C{Sample} directories are unchanged, since adding, removing or renaming entries changes the
+        modification time of a directory. This costs one I{stat} call per directory, rather than listing each.
+        @param file_path: File path
+        @type file_path: str | unicode
+        @param threads: Number of concurrent I{stat} calls
+        @type threads: int
+        @return: C{ProcessedRunFolder} or C{None}, if no valid cache exists
+        @rtype: ProcessedRunFolder | None
+        """
+
+        cache_path = ProcessedRunFolder.get_cache_path(file_path=file_path)
+
+        try:
+            cache_file = open(cache_path, 'r')
+        except IOError:
+            return
+
+        try:
+            cache_dict = json.load(fp=cache_file, object_hook=_decode_cache_object)
+        except ValueError:
+            return
+        finally:
+            cache_file.close()
+
+        if cache_dict.get('cache_version') != discovery_cache_version or cache_dict['file_path'] != file_path:
+            return
+
+        recorded_dict = dict()
+        recorded_dict[cache_dict['file_path']] = cache_dict['mtime']
+        for project_dict in cache_dict['projects']:
+            recorded_dict[project_dict['file_path']] = project_dict['mtime']
+            for sample_dict in project_dict['samples']:
+                recorded_dict[sample_dict['file_path']] = sample_dict['mtime']
+
+        if get_mtime_dict(file_path_list=recorded_dict.keys(), threads=threads) != recorded_dict:
+            return
+
+        prf = cls(file_path=file_path, file_type='CASAVA', name=cache_dict['name'],
+                  prefix=cache_dict['prefix'], flow_cell=cache_dict['flow_cell'], version=cache_dict['version'])
+
+        for project_dict in cache_dict['projects']:
+            project = Project(file_path=project_dict['file_path'], file_type='CASAVA', name=project_dict['name'])
+            for sample_dict in project_dict['samples']:
+                sample = Sample(file_path=sample_dict['file_path'], file_type='CASAVA', name=sample_dict['name'])
+                for reads_path in sample_dict['reads']:
+                    sample.add_reads(reads=Reads.from_file_path(
+                        file_path=reads_path.encode('utf-8'),
+                        file_type='CASAVA'))
+                project.add_sample(sample=sample)
+            prf.add_project(project=project)
+
+        return prf
+
+    def to_cache(self, start_time, threads=1):
+        """Write the discovery cache (JSON) file of a CASAVA C{ProcessedRunFolder}.
+
+        No cache is written, if any directory has been modified since the start of the discovery, or if the
+        discovery cache directory cannot be written.
+        The file is written into a temporary file first and then renamed, so that concurrent readers never
+        see a partially written file.
+        @param start_time: Start time of the discovery in seconds since the epoch
+        @type start_time: float
+        @param threads: Number of concurrent I{stat} calls
+        @type threads: int
+        """
+
+        project_list = self.get_all_projects()
+
+        file_path_list = [self.file_path]
+        for project in project_list:
+            file_path_list.append(project.file_path)
+            file_path_list.extend(map(lambda x: x.file_path, project.get_all_samples()))
+
+        mtime_dict = get_mtime_dict(file_path_list=file_path_list, threads=threads)
+
+        # Since modification times may only have a resolution of seconds, directories modified
+        # within the second the discovery started are not cached either.
+
+        if filter(lambda x: x is None or x >= int(start_time), mtime_dict.itervalues()):
+            return
+
+        project_dict_list = list()
+        for project in project_list:
+            sample_dict_list = list()
+            for sample in project.get_all_samples():
+                reads_path_list = list()
+                for paired_reads in sample.paired_reads_list:
+                    if paired_reads.reads1:
+                        reads_path_list.append(paired_reads.reads1.file_path)
+                    if paired_reads.reads2:
+                        reads_path_list.append(paired_reads.reads2.file_path)
+                sample_dict_list.append({
+                    'file_path': sample.file_path,
+                    'name': sample.name,
+                    'mtime': mtime_dict[sample.file_path],
+                    'reads': reads_path_list})
+            project_dict_list.append({
+                'file_path': project.file_path,
+                'name': project.name,
+                'mtime': mtime_dict[project.file_path],
+                'samples': sample_dict_list})
+
+        cache_dict = {
+            'cache_version': discovery_cache_version,
+            'file_path': self.file_path,
+            'name': self.name,
+            'prefix': self.prefix,
+            'flow_cell': self.flow_cell,
+            'version': self.version,
+            'mtime': mtime_dict[self.file_path],
+            'projects': project_dict_list}
+
+        cache_path = ProcessedRunFolder.get_cache_path(file_path=self.file_path)
+        temporary_path = '{}.{:d}.tmp'.format(cache_path, os.getpid())
+
+        try:
+            if not os.path.isdir(os.path.dirname(cache_path)):
+                os.makedirs(os.path.dirname(cache_path))
+            cache_file = open(temporary_path, 'w')
+            json.dump(obj=cache_dict, fp=cache_file, separators=(',', ':'))
+            cache_file.close()
+            os.rename(temporary_path, cache_path)
+        except (IOError, OSError):
+            # Read-only sequence archives cannot hold a cache.
+            return
+
+    @classmethod
+    def from_file_path(cls, file_path, file_type, threads=None, cache=False):
         """Construct a C{ProcessedRunFolder} object from a file path.
 
         For the I{file_type} I{CASAVA}, the C{ProcessedRunFolder.name}, C{ProcessedRunFolder.prefix},
         C{ProcessedRunFolder.flow_cell} and C{ProcessedRunFolder.version}
         attributes can be automatically parsed from the I{file_path}, while
         C{Project} objects can be automatically discovered.
+        C{Project} directories are listed concurrently and the threads are split between the
+        C{Project} objects for listing their C{Sample} directories.
+        If requested, a I{CASAVA} C{ProcessedRunFolder} is read from its discovery cache, as long as no
+        directory has been modified, and the discovery cache is written after discovering it otherwise.
+        Since the discovery cache is written next to the C{ProcessedRunFolder} directory, it is not used by
+        default, so that read-only or shared sequence archives are not modified.
         @param file_path: File path
         @type file_path: str | unicode
         @param file_type: File type
         @type file_type: str
+        @param threads: Number of concurrent directory listings or C{None} for C{discovery_threads}
+        @type threads: int
+        @param cache: Use the discovery cache
+        @type cache: bool
         @return: C{ProcessedRunFolder}
         @rtype: ProcessedRunFolder
         """
@@ -1052,21 +1717,51 @@ class ProcessedRunFolder(object):
             flow_cell = components[1]
             version = components[2]
 
+            if threads is None:
+                threads = discovery_threads
+
+            if cache:
+                prf = cls.from_cache(file_path=file_path, threads=threads)
+                if prf is not None:
+                    return prf
+
+            # Directories modified during the discovery must not be cached.
+
+            start_time = time.time()
+
             prf = cls(file_path=file_path, file_type=file_type, name=name,
                       prefix=prefix, flow_cell=flow_cell, version=version)
 
             # Automatically discover CASAVA Project directories ...
 
-            for file_name in os.listdir(prf.file_path):
-                file_path = os.path.join(prf.file_path, file_name)
-                mode = os.stat(file_path).st_mode
-                match = re.search(pattern=r'^Project_(.*)$', string=file_name)
-                if S_ISDIR(mode) and match:
-                    if match.group(1) in prf.projects:
-                        raise Exception(
-                            'Project with name {!r} already exists.'.format(match.group(1)))
-                    else:
-                        prf.add_project(project=Project.from_file_path(file_path=file_path, file_type=file_type))
+            entry_list = list_directory(file_path=prf.file_path, pattern=casava_project_pattern, directory=True)
+
+            name_set = set()
+            for file_path, match in entry_list:
+                if match.group(1) in name_set:
+                    raise Exception(
+                        'Project with name {!r} already exists.'.format(match.group(1)))
+                name_set.add(match.group(1))
+
+            project_dict = dict()
+            project_threads = max(1, threads // max(1, len(entry_list)))
+
+            def discover_project(project_path):
+                project_dict[project_path] = Project.from_file_path(
+                    file_path=project_path,
+                    file_type=file_type,
+                    threads=project_threads)
+
+            run_concurrently(
+                function=discover_project,
+                keywords_list=map(lambda x: {'project_path': x[0]}, entry_list),
+                threads=threads)
+
+            for file_path, match in entry_list:
+                prf.add_project(project=project_dict[file_path])
+
+            if cache:
+                prf.to_cache(start_time=start_time, threads=threads)
 
         elif file_type == 'External':
 
@@ -1220,12 +1915,20 @@ class Collection(object):
     @type processed_run_folders: dict
     @ivar sample_groups: Python C{dict} of C{Sample} objects
     @type sample_groups: dict
+    @ivar _sample_group_set_dict: Python C{dict} of group name key and
+        Python C{set} of C{Sample} value data for membership tests on C{sample_groups}
+    @type _sample_group_set_dict: dict
+    @ivar _sample_index_dict: Python C{dict} of Python C{tuple} of C{ProcessedRunFolder}, C{Project} and
+        C{Sample} name key and C{Sample} value data for C{get_sample_from_row_dict}
+    @type _sample_index_dict: dict
+    @ivar discovery_cache: Use the discovery cache of automatically discovered C{ProcessedRunFolder} objects
+    @type discovery_cache: bool
     """
 
     default_key = 'Default'
 
     @classmethod
-    def from_sas_path(cls, file_path, file_type, name, sas_path, sas_prefix=None):
+    def from_sas_path(cls, file_path, file_type, name, sas_path, sas_prefix=None, discovery_cache=False):
         """Construct a C{Collection} from a sample annotation sheet.
 
         @param file_path: File path
@@ -1239,11 +1942,13 @@ class Collection(object):
         @param sas_prefix: Optional column header prefix
             (e.g. '[Control ]Sample', '[Treatment ]Sample', ...)
         @type sas_prefix: str
+        @param discovery_cache: Use the discovery cache of automatically discovered C{ProcessedRunFolder} objects
+        @type discovery_cache: bool
         @return: C{Collection}
         @rtype: Collection
         """
 
-        collection = cls(file_path=file_path, file_type=file_type, name=name)
+        collection = cls(file_path=file_path, file_type=file_type, name=name, discovery_cache=discovery_cache)
 
         sas = SampleAnnotationSheet.from_file_path(file_path=sas_path)
 
@@ -1253,7 +1958,7 @@ class Collection(object):
         return collection
 
     def __init__(self, file_path=None, file_type=None, name=None,
-                 processed_run_folders=None, sample_groups=None):
+                 processed_run_folders=None, sample_groups=None, discovery_cache=False):
         """Initialise a C{Collection} object.
 
         @param file_path: File path
@@ -1267,6 +1972,8 @@ class Collection(object):
         @param sample_groups: Python C{dict} of group name key data and second-level Python C{dict} value data
             Second-level Python C{dict} of C{Sample.name} key data and C{Sample} object value data
         @type sample_groups: dict
+        @param discovery_cache: Use the discovery cache of automatically discovered C{ProcessedRunFolder} objects
+        @type discovery_cache: bool
         """
 
         if file_path:
@@ -1294,6 +2001,10 @@ class Collection(object):
         else:
             self.sample_groups = dict()
 
+        self._sample_group_set_dict = dict()
+        self._sample_index_dict = dict()
+        self.discovery_cache = discovery_cache
+
     def trace(self, level):
         """Trace a C{Collection} object.
 
@@ -1309,6 +2020,7 @@ class Collection(object):
         output += '{}  name:      {!r}\n'.format(indent, self.name)
         output += '{}  file_path: {!r}\n'.format(indent, self.file_path)
         output += '{}  file_type: {!r}\n'.format(indent, self.file_type)
+        output += '{}  discovery_cache: {!r}\n'.format(indent, self.discovery_cache)
         output += '{}  processed_run_folders:\n'.format(indent)
 
         for key in self.processed_run_folders.keys():
@@ -1366,7 +2078,10 @@ class Collection(object):
             if not os.path.isabs(file_path):
                 file_path = os.path.join(self.file_path, file_path)
 
-            prf = ProcessedRunFolder.from_file_path(file_path=file_path, file_type=file_type)
+            prf = ProcessedRunFolder.from_file_path(
+                file_path=file_path,
+                file_type=file_type,
+                cache=self.discovery_cache)
 
             self.add_processed_run_folder(prf=prf)
 
@@ -1477,7 +2192,17 @@ class Collection(object):
                 sample_group = list()
                 self.sample_groups[value] = sample_group
 
-            if sample not in sample_group:
+            # Test membership on a Python set of Sample objects, which hash by identity,
+            # while the Python list keeps the order of the sample annotation sheet.
+
+            if value in self._sample_group_set_dict:
+                sample_set = self._sample_group_set_dict[value]
+            else:
+                sample_set = set(sample_group)
+                self._sample_group_set_dict[value] = sample_set
+
+            if sample not in sample_set:
+                sample_set.add(sample)
                 sample_group.append(sample)
 
     def _process_file_type(self, row_dict, prefix):
@@ -1696,32 +2421,41 @@ class Collection(object):
         key = '{} ProcessedRunFolder'.format(prefix).lstrip(' ')
 
         if key in row_dict and row_dict[key]:
-            value = row_dict[key]
+            prf_value = row_dict[key]
         else:
-            value = ProcessedRunFolder.default_key
-
-        # The Collection.get_processed_run_folder method can automatically register
-        # ProcessedRunFolder objects of file type 'CASAVA'.
-
-        prf = self.get_processed_run_folder(file_path=value)
+            prf_value = ProcessedRunFolder.default_key
 
         key = '{} Project'.format(prefix).lstrip(' ')
 
         if key in row_dict and row_dict[key]:
-            value = row_dict[key]
+            project_value = row_dict[key]
         else:
-            value = Project.default_key
-
-        project = prf.projects[value]
+            project_value = Project.default_key
 
         key = '{} Sample'.format(prefix).lstrip(' ')
 
         if key in row_dict and row_dict[key]:
-            value = row_dict[key]
+            sample_value = row_dict[key]
         else:
-            value = Sample.default_key
+            sample_value = Sample.default_key
+
+        # Sample objects that have been looked up before are indexed by the three values.
 
-        sample = project.samples[value]
+        index_key = (prf_value, project_value, sample_value)
+
+        if index_key in self._sample_index_dict:
+            return self._sample_index_dict[index_key]
+
+        # The Collection.get_processed_run_folder method can automatically register
+        # ProcessedRunFolder objects of file type 'CASAVA'.
+
+        prf = self.get_processed_run_folder(file_path=prf_value)
+
+        project = prf.projects[project_value]
+
+        sample = project.samples[sample_value]
+
+        self._sample_index_dict[index_key] = sample
 
         return sample
 
@@ -1779,6 +2513,8 @@ class SampleGroup(object):
     @type name: str
     @ivar samples: Python C{list} of C{Sample} objects
     @type samples: list
+    @ivar _sample_set: Python C{set} of C{Sample} objects for membership tests on C{samples}
+    @type _sample_set: set
     """
 
     # TODO: The SampleGroup class is currently not in use.
@@ -1805,6 +2541,8 @@ class SampleGroup(object):
         else:
             self.samples = list()
 
+        self._sample_set = set(self.samples)
+
     def add_sample(self, sample):
         """Add a C{Sample} object.
 
@@ -1812,7 +2550,8 @@ class SampleGroup(object):
         @type sample: Sample
         """
 
-        if sample not in self.samples:
+        if sample not in self._sample_set:
+            self._sample_set.add(sample)
             self.samples.append(sample)
 
     def get_all_paired_reads(self, replicate_grouping):
@@ -1828,6 +2567,8 @@ class SampleGroup(object):
         """
 
         groups = dict()
+        # Python dict of replicate key and Python set of PairedReads objects, which hash by identity.
+        group_sets = dict()
 
         for sample in self.samples:
 
@@ -1837,13 +2578,15 @@ class SampleGroup(object):
 
                 if replicate_key not in groups:
                     groups[replicate_key] = list()
+                    group_sets[replicate_key] = set()
 
                 # groups[replicate_key].extend(replicate_dict[replicate_key])
 
                 # Add PairedReads objects one-by-one and check if they are not already there.
 
                 for paired_reads in replicate_dict[replicate_key]:
-                    if paired_reads not in groups[replicate_key]:
+                    if paired_reads not in group_sets[replicate_key]:
+                        group_sets[replicate_key].add(paired_reads)
                         groups[replicate_key].append(paired_reads)
 
         return groups
@@ -26,42 +26,190 @@ A package that centralises (SQLite) Database access.
 # You should have received a copy of the GNU Lesser General Public License
 # along with BSF Python.  If not, see <http://www.gnu.org/licenses/>.
 
+import contextlib
+import operator
+import os
 import sqlite3
 import string
+import threading
+
+
+class _Connection(sqlite3.Connection):
+    """The C{_Connection} class extends the C{sqlite3.Connection} class to track nested transactions.
+
+    @ivar transaction_depth: Depth of nested C{DatabaseConnection.transaction} contexts
+    @type transaction_depth: int
+    """
+
+    def __init__(self, *args, **kwargs):
+        """Initialise a C{_Connection} object.
+        """
+
+        super(_Connection, self).__init__(*args, **kwargs)
+
+        self.transaction_depth = 0
 
 
 class DatabaseConnection(object):
     """The C{DatabaseConnection} class encapsulates the C{sqlite3.Connection} class.
 
+    A single C{sqlite3.Connection} is shared by all C{DatabaseConnection} objects for the same
+    database file in the same process and thread. Connections wait for locks held by other processes
+    up to C{DatabaseConnection.timeout} seconds.
+    By default, connections use the rollback journal, which is safe for database files on network file
+    systems (e.g. NFS or Lustre) accessed by submitters on several hosts. If all processes run on a
+    single host, the write-ahead log (WAL) journal mode can be requested, so that readers do not block
+    writers and transactions require fewer synchronisations.
+    @cvar journal_mode: SQLite journal mode of the rollback journal
+    @type journal_mode: str
+    @cvar synchronous: SQLite synchronous setting of the rollback journal
+    @type synchronous: str
+    @cvar journal_mode_wal: SQLite journal mode of the write-ahead log
+    @type journal_mode_wal: str
+    @cvar synchronous_wal: SQLite synchronous setting of the write-ahead log, I{NORMAL} is safe in WAL mode
+    @type synchronous_wal: str
+    @cvar timeout: Number of seconds to wait for locks held by other connections
+    @type timeout: float
+    @cvar connection_dict: Python C{dict} of Python C{tuple} (process identifier, thread identifier,
+        real file path) key data and C{sqlite3.Connection} value data
+    @type connection_dict: dict
     @ivar file_path: File path
     @type file_path: str | unicode
     @ivar connection: Connection to an sqlite3 database
     @type connection: sqlite3.Connection
     """
 
-    def __init__(self, file_path):
+    journal_mode = 'DELETE'
+    synchronous = 'FULL'
+    journal_mode_wal = 'WAL'
+    synchronous_wal = 'NORMAL'
+    timeout = 60.0
+    connection_dict = dict()
+
+    @classmethod
+    def get_connection(cls, file_path, write_ahead_log=False):
+        """Get the shared C{sqlite3.Connection} for a database file, connecting upon first use.
+
+        @param file_path: File path
+        @type file_path: str | unicode
+        @param write_ahead_log: Use the write-ahead log (WAL) journal mode, which requires all processes
+            to run on the same host
+        @type write_ahead_log: bool
+        @return: SQLite connection
+        @rtype: sqlite3.Connection
+        """
+
+        key = (os.getpid(), threading.current_thread().ident, os.path.realpath(file_path))
+
+        if key not in cls.connection_dict:
+            connection = sqlite3.connect(database=file_path, timeout=cls.timeout, factory=_Connection)
+            if write_ahead_log:
+                connection.execute('PRAGMA journal_mode = {}'.format(cls.journal_mode_wal))
+                connection.execute('PRAGMA synchronous = {}'.format(cls.synchronous_wal))
+            else:
+                connection.execute('PRAGMA journal_mode = {}'.format(cls.journal_mode))
+                connection.execute('PRAGMA synchronous = {}'.format(cls.synchronous))
+            cls.connection_dict[key] = connection
+
+        return cls.connection_dict[key]
+
+    def __init__(self, file_path, write_ahead_log=False):
         """Initialise a C{DatabaseConnection} object and connect to the sqlite3 database behind.
 
         @param file_path: File path
         @type file_path: str | unicode
+        @param write_ahead_log: Use the write-ahead log (WAL) journal mode, which requires all processes
+            to run on the same host
+        @type write_ahead_log: bool
         """
 
         self.file_path = file_path
 
-        self.connection = sqlite3.connect(database=self.file_path)
+        self.connection = DatabaseConnection.get_connection(file_path=self.file_path, write_ahead_log=write_ahead_log)
+
+    def close(self):
+        """Close the shared C{sqlite3.Connection} for the database file.
+        """
+
+        for key in DatabaseConnection.connection_dict.keys():
+            if DatabaseConnection.connection_dict[key] is self.connection:
+                del DatabaseConnection.connection_dict[key]
+
+        self.connection.close()
+
+    @contextlib.contextmanager
+    def transaction(self):
+        """Provide a context, in which all statements are run in a single transaction.
+
+        The transaction acquires the write lock at the start (i.e. I{BEGIN IMMEDIATE}), so that
+        concurrent writers wait for each other, rather than failing to upgrade their locks.
+        The transaction is committed at the end of the context or rolled back upon an exception.
+        Nested contexts join the outermost transaction.
+        """
+
+        if self.connection.transaction_depth:
+            self.connection.transaction_depth += 1
+            try:
+                yield self
+            finally:
+                self.connection.transaction_depth -= 1
+            return
+
+        # Commit any transaction begun implicitly by the sqlite3 module before.
+
+        self.connection.commit()
+        self.connection.execute('BEGIN IMMEDIATE')
+        self.connection.transaction_depth = 1
+
+        try:
+            yield self
+        except:
+            self.connection.rollback()
+            raise
+        else:
+            self.connection.commit()
+        finally:
+            self.connection.transaction_depth = 0
 
     def create_schema(self):
         """Create and commit the database schema.
+
+        Tables and indexes missing from existing databases are created, so that databases of earlier
+        versions get upgraded. If indexes had to be added, statistics for the query planner are
+        gathered via the SQL C{ANALYZE} statement.
         """
 
+        index_count = 0
+
         job_submission_adaptor = JobSubmissionAdaptor(database_connection=self)
-        job_submission_adaptor.create_table()
+        index_count += job_submission_adaptor.create_table()
 
         process_slurm_adaptor = ProcessSLURMAdaptor(database_connection=self)
-        process_slurm_adaptor.create_table()
+        index_count += process_slurm_adaptor.create_table()
+
+        process_slurm_sync_adaptor = ProcessSLURMSyncAdaptor(database_connection=self)
+        index_count += process_slurm_sync_adaptor.create_table()
 
         process_sge_adaptor = ProcessSGEAdaptor(database_connection=self)
-        process_sge_adaptor.create_table()
+        index_count += process_sge_adaptor.create_table()
+
+        process_sge_sync_adaptor = ProcessSGESyncAdaptor(database_connection=self)
+        index_count += process_sge_sync_adaptor.create_table()
+
+        process_local_adaptor = ProcessLocalAdaptor(database_connection=self)
+        index_count += process_local_adaptor.create_table()
+
+        resource_sizing_adaptor = ResourceSizingAdaptor(database_connection=self)
+        index_count += resource_sizing_adaptor.create_table()
+
+        status_poll_adaptor = StatusPollAdaptor(database_connection=self)
+        index_count += status_poll_adaptor.create_table()
+
+        result_cache_adaptor = ResultCacheAdaptor(database_connection=self)
+        index_count += result_cache_adaptor.create_table()
+
+        if index_count:
+            self.connection.execute('ANALYZE')
 
         self.connection.commit()
 
@@ -70,6 +218,11 @@ class DatabaseAdaptor(object):
     """The C{DatabaseAdaptor} class represents as a super-class for object-specific table adaptors.
 
     Instance variables should be overridden in sub-classes.
+    @cvar fetch_size: Number of rows fetched from the SQLite cursor at once
+    @type fetch_size: int
+    @ivar object_type: Python class of the canonical objects, which must accept all column values
+        as positional arguments in the order of the column definition, or as keyword arguments
+    @type object_type: type
     @ivar table_name: SQL database table name
     @type table_name: str
     @ivar column_definition: Python C{list} of Python C{list} objects with
@@ -77,14 +230,19 @@ class DatabaseAdaptor(object):
     @type column_definition: list
     @ivar table_constraint: SQL table constraint expression
     @type table_constraint: list
+    @ivar index_definition: Python C{list} of Python C{list} objects with
+        Python C{str} (SQL index name) and Python C{str} (SQL indexed column expression) objects.
+    @type index_definition: list
     @ivar database_connection: database Connection
     @type database_connection: DatabaseConnection
     @ivar connection: SQLite connection
     @type connection: sqlite3.Connection
     """
 
+    fetch_size = 1000
+
     def __init__(self, database_connection, table_name=None, column_definition=None, table_constraint=None,
-                 connection=None):
+                 connection=None, index_definition=None, object_type=None):
         """Initialise a C{DatabaseAdaptor} object.
 
         @param database_connection: C{DatabaseConnection}
@@ -98,6 +256,12 @@ class DatabaseAdaptor(object):
         @type table_constraint: list
         @param connection: SQLite connection
         @type connection: sqlite3.Connection
+        @param index_definition: Python C{list} of Python C{list} objects with
+            Python C{str} (SQL index name) and Python C{str} (SQL indexed column expression) objects.
+        @type index_definition: list
+        @param object_type: Python class of the canonical objects, which must accept all column values
+            as positional arguments in the order of the column definition, or as keyword arguments
+        @type object_type: type
         """
 
         self.database_connection = database_connection
@@ -120,7 +284,14 @@ class DatabaseAdaptor(object):
         if connection:
             self.connection = connection
         else:
-            self.connection = sqlite3.connect(database=self.database_connection.file_path)
+            self.connection = self.database_connection.connection
+
+        if index_definition:
+            self.index_definition = index_definition
+        else:
+            self.index_definition = list()
+
+        self.object_type = object_type
 
     def _get_column_name_list_with_primary(self):
         """Build a Python C{list} of SQL column names including the primary key.
@@ -151,15 +322,48 @@ class DatabaseAdaptor(object):
         name_list = map(lambda x: x[0], filter(lambda x: 'AUTOINCREMENT' in x[1], self.column_definition))
         return name_list[0]
 
-    def _build_column_result_expression(self):
+    @staticmethod
+    def _build_drms_job_name_clause(drms_name):
+        """Build an SQL C{WHERE} clause matching the job names of a C{DRMS} name and its parameters.
+
+        Job names start with the C{DRMS.name} followed by an underscore. Since that also matches job names of
+        C{DRMS} objects with a longer name (e.g. I{gatk_haplotype} for I{gatk}), job names recorded for
+        those via C{JobSubmission} or C{ResourceSizing} objects are excluded. Prefixes are matched as ranges,
+        so that the indexes on job names and C{DRMS} names can be used.
+        @param drms_name: C{DRMS.name}
+        @type drms_name: str
+        @return: Python C{tuple} of Python C{str} (SQL C{WHERE} clause) and
+            Python C{list} of Python C{str} (parameter) objects
+        @rtype: (str, list)
+        """
+
+        # All names starting with the prefix sort between the prefix and the prefix with its last
+        # character incremented.
+
+        prefix = drms_name + '_'
+        parameter_list = [prefix, prefix[:-1] + chr(ord(prefix[-1]) + 1)]
+
+        return (
+            "job_name >= ? AND job_name < ? AND job_name NOT IN ("
+            "SELECT name FROM 'executable' WHERE drms_name >= ? AND drms_name < ? UNION "
+            "SELECT job_name FROM 'resource_sizing' WHERE drms_name >= ? AND drms_name < ?)",
+            parameter_list * 3)
+
+    def _build_column_result_expression(self, column_name_list=None):
         """Build an SQL expression of column names typically used in C{SELECT} statements.
 
-        This method simply lists all column names of the column definition.
+        This method simply lists all column names of the column definition or a projection thereof.
+        @param column_name_list: Python C{list} of Python C{str} (SQL column name) objects or
+            C{None} for all columns
+        @type column_name_list: list
         @return: Column result expression string
         @rtype: str
         """
 
-        return string.join(words=self._get_column_name_list_with_primary(), sep=', ')
+        if column_name_list is None:
+            column_name_list = self._get_column_name_list_with_primary()
+
+        return string.join(words=column_name_list, sep=', ')
 
     def _build_column_definition_expression(self):
         """Build an SQL expression of column definitions typically used in C{CREATE TABLE} statements.
@@ -207,16 +411,34 @@ class DatabaseAdaptor(object):
             words=map(lambda x: '{} = ?'.format(x), self._get_column_name_list_without_primary()),
             sep=', ')
 
-    def statement_create_table(self):
+    def statement_create_table(self, table_name=None):
         """Build an SQL C{CREATE TABLE} statement.
 
+        @param table_name: SQL database table name or C{None} for C{DatabaseAdaptor.table_name}
+        @type table_name: str
         @return: SQL C{CREATE TABLE} statement
         @rtype: str
         """
 
-        return "CREATE TABLE {!r} ({})".format(self.table_name, self._build_column_definition_expression())
+        if not table_name:
+            table_name = self.table_name
+
+        return "CREATE TABLE {!r} ({})".format(table_name, self._build_column_definition_expression())
 
-    def statement_select(self, where_clause=None, group_clause=None, having_clause=None):
+    def statement_create_index(self, index_name, column_expression):
+        """Build an SQL C{CREATE INDEX} statement.
+
+        @param index_name: SQL index name
+        @type index_name: str
+        @param column_expression: SQL indexed column expression
+        @type column_expression: str
+        @return: SQL C{CREATE INDEX} statement
+        @rtype: str
+        """
+
+        return "CREATE INDEX IF NOT EXISTS {!r} ON {!r} ({})".format(index_name, self.table_name, column_expression)
+
+    def statement_select(self, where_clause=None, group_clause=None, having_clause=None, column_name_list=None):
         """Build an SQL C{SELECT} statement.
 
         @param where_clause: SQL C{WHERE} clause
@@ -225,12 +447,17 @@ class DatabaseAdaptor(object):
         @type group_clause: str
         @param having_clause: SQL C{HAVING} clause
         @type having_clause: str
+        @param column_name_list: Python C{list} of Python C{str} (SQL column name) objects or
+            C{None} for all columns
+        @type column_name_list: list
         @return: SQL SELECT statement
         @rtype: str
         """
 
         statement = str()
-        statement += "SELECT {} FROM {!r}".format(self._build_column_result_expression(), self.table_name)
+        statement += "SELECT {} FROM {!r}".format(
+            self._build_column_result_expression(column_name_list=column_name_list),
+            self.table_name)
 
         if where_clause:
             statement += " WHERE "
@@ -247,52 +474,182 @@ class DatabaseAdaptor(object):
         return statement
 
     def create_table(self):
-        """Create the canonical table for the C{DatabaseAdaptor} sub-class.
-
-        Before attempting to execute the SQL C{CREATE TABLE} statement, this method checks in 'sqlite_master',
-        whether the table already exists in the SQLite database.
+        """Create the canonical table and its indexes for the C{DatabaseAdaptor} sub-class.
+
+        Before attempting to execute the SQL C{CREATE TABLE} and C{CREATE INDEX} statements, this method checks in
+        'sqlite_master', whether the table and indexes already exist in the SQLite database.
+        Indexes missing from an existing table are created, which upgrades databases of earlier versions.
+        If the columns or column types of an existing table differ from the column definition, the table is
+        rebuilt, retaining the values of all columns in common, and all its indexes are created again.
+        @return: Number of indexes created
+        @rtype: int
         """
 
         cursor = self.connection.cursor()
 
-        statement = "SELECT name FROM sqlite_master WHERE type = 'table' AND name = ?"
+        statement = "SELECT type, name FROM sqlite_master WHERE tbl_name = ?"
         parameters = list()
         parameters.append(self.table_name)
 
         cursor.execute(statement, parameters)
-        rows_list = cursor.fetchmany()
+        rows_list = cursor.fetchall()
 
         # If the list of rows is empty, create the table.
 
-        if not len(rows_list):
+        if not len(filter(lambda x: x[0] == 'table', rows_list)):
             self.database_connection.connection.cursor().execute(self.statement_create_table())
             # The commit method is called in the DatabaseAdaptor.create_schema method.
             # self.database_connection.connection.commit()
+            index_names = list()
+        elif self._upgrade_table():
+            # Dropping the former table has also dropped all its indexes.
+            index_names = list()
+        else:
+            index_names = map(lambda x: x[1], filter(lambda x: x[0] == 'index', rows_list))
+        index_count = 0
+
+        for index_name, column_expression in self.index_definition:
+            if index_name not in index_names:
+                self.database_connection.connection.cursor().execute(
+                    self.statement_create_index(index_name=index_name, column_expression=column_expression))
+                index_count += 1
+
+        return index_count
 
-    def _objects_from_statement(self, statement, parameters=None):
-        """Object-specific function to turn results of a C{SELECT} statement into objects.
+    def _upgrade_table(self):
+        """Rebuild an existing table, if its columns or column types differ from the column definition.
 
-        This method needs overriding in the corresponding sub-class.
+        The values of all columns in common are copied into a new table, before the former table gets replaced.
+        Since the Python C{sqlite3} module commits before data definition statements, the complete
+        rebuild is run as a single script in an explicit transaction.
+        @return: C{True} if the table has been rebuilt
+        @rtype: bool
+        """
+
+        cursor = self.connection.cursor()
+        cursor.execute("PRAGMA table_info({!r})".format(self.table_name))
+
+        # Compare the SQL column names and the declared column types i.e. the first word of the column constraint.
+
+        database_list = map(lambda x: (str(x[1]), str(x[2]).upper()), cursor.fetchall())
+        definition_list = map(lambda x: (x[0], string.upper(string.split(x[1])[0]) if x[1] else str()),
+                              self.column_definition)
+
+        if database_list == definition_list:
+            return False
+
+        database_names = map(lambda x: x[0], database_list)
+        column_expression = string.join(
+            words=filter(lambda x: x in database_names, self._get_column_name_list_with_primary()),
+            sep=', ')
+        upgrade_name = self.table_name + '_upgrade'
+
+        statement_list = list()
+        statement_list.append("BEGIN IMMEDIATE")
+        statement_list.append("DROP TABLE IF EXISTS {!r}".format(upgrade_name))
+        statement_list.append(self.statement_create_table(table_name=upgrade_name))
+        statement_list.append("INSERT INTO {!r} ({}) SELECT {} FROM {!r}".format(
+            upgrade_name, column_expression, column_expression, self.table_name))
+        statement_list.append("DROP TABLE {!r}".format(self.table_name))
+        statement_list.append("ALTER TABLE {!r} RENAME TO {!r}".format(upgrade_name, self.table_name))
+        statement_list.append("COMMIT")
+
+        try:
+            self.connection.executescript(string.join(words=statement_list, sep=';\n') + ';')
+        except sqlite3.Error:
+            # The sqlite3 module does not track transactions begun in scripts, so that the
+            # Connection.rollback() method would not have any effect.
+            try:
+                self.connection.execute("ROLLBACK")
+            except sqlite3.OperationalError:
+                pass
+            raise
+
+        return True
+
+    def _iterate_objects_from_statement(self, statement, parameters=None, column_name_list=None):
+        """Generate objects from the results of a C{SELECT} statement.
+
+        Rows are fetched in chunks of C{DatabaseAdaptor.fetch_size}, so that large results are streamed
+        in constant memory. Objects are built directly from the row tuples. For a projection, columns not
+        selected remain at the defaults of the C{DatabaseAdaptor.object_type}.
         @param statement: Complete SQL C{SELECT} statement
         @type statement: str
         @param parameters: Python C{list} of Python C{str} (parameter) objects or None
         @type parameters: list
+        @param column_name_list: Python C{list} of Python C{str} (SQL column name) objects selected by the
+            statement or C{None} for all columns
+        @type column_name_list: list
+        @return: Python generator of objects
+        @rtype: generator
+        """
+
+        object_type = self.object_type
+
+        cursor = self.database_connection.connection.cursor()
+
+        if parameters:
+            cursor.execute(statement, parameters)
+        else:
+            cursor.execute(statement)
+
+        while True:
+            rows_list = cursor.fetchmany(self.fetch_size)
+
+            if not len(rows_list):
+                break
+
+            if column_name_list is None:
+                for row in rows_list:
+                    yield object_type(*row)
+            else:
+                for row in rows_list:
+                    yield object_type(**dict(zip(column_name_list, row)))
+
+    def _objects_from_statement(self, statement, parameters=None, column_name_list=None):
+        """Turn results of a C{SELECT} statement into objects.
+
+        @param statement: Complete SQL C{SELECT} statement
+        @type statement: str
+        @param parameters: Python C{list} of Python C{str} (parameter) objects or None
+        @type parameters: list
+        @param column_name_list: Python C{list} of Python C{str} (SQL column name) objects selected by the
+            statement or C{None} for all columns
+        @type column_name_list: list
         @return: Python C{list} of objects
         @rtype: list
         """
 
-        return []
+        return list(self._iterate_objects_from_statement(
+            statement=statement,
+            parameters=parameters,
+            column_name_list=column_name_list))
+
+    def iterate_all(self, column_name_list=None):
+        """Generate all canonical objects corresponding to the C{DatabaseAdaptor} sub-class in constant memory.
+
+        @param column_name_list: Python C{list} of Python C{str} (SQL column name) objects to project on or
+            C{None} for all columns
+        @type column_name_list: list
+        @return: Python generator of objects
+        @rtype: generator
+        """
 
-    def select_all(self):
+        statement = self.statement_select(column_name_list=column_name_list)
+
+        return self._iterate_objects_from_statement(statement=statement, column_name_list=column_name_list)
+
+    def select_all(self, column_name_list=None):
         """Select all canonical objects corresponding to the C{DatabaseAdaptor} sub-class.
 
+        @param column_name_list: Python C{list} of Python C{str} (SQL column name) objects to project on or
+            C{None} for all columns
+        @type column_name_list: list
         @return: Python C{list} of objects
         @rtype: list
         """
 
-        statement = self.statement_select()
-
-        return self._objects_from_statement(statement=statement)
+        return list(self.iterate_all(column_name_list=column_name_list))
 
     def insert(self, data_object):
         """Insert a canonical object corresponding to the C{DatabaseAdaptor} sub-class.
@@ -361,6 +718,163 @@ class DatabaseAdaptor(object):
                   "  SQL statement: {!r}\n" \
                   "  Values: {!r}".format(statement, value_list)
 
+    @staticmethod
+    def _get_value_getter(column_name_list):
+        """Get a function returning a Python C{tuple} of attribute values of an object for SQL statements.
+
+        @param column_name_list: Python C{list} of Python C{str} (SQL column name) objects
+        @type column_name_list: list
+        @return: Function
+        @rtype: function
+        """
+
+        getter = operator.attrgetter(*column_name_list)
+
+        if len(column_name_list) == 1:
+            return lambda x: (getter(x),)
+        else:
+            return getter
+
+    def insert_many(self, data_object_list):
+        """Insert canonical objects corresponding to the C{DatabaseAdaptor} sub-class in a single transaction.
+
+        The primary key attributes of the objects are set to the row identifiers assigned by SQLite.
+        Unlike C{DatabaseAdaptor.insert}, the whole transaction is rolled back upon any error.
+        @param data_object_list: Python C{list} of objects
+        @type data_object_list: list
+        """
+
+        if not len(data_object_list):
+            return
+
+        column_name_list = self._get_column_name_list_without_primary()
+
+        value_list = map(self._get_value_getter(column_name_list=column_name_list), data_object_list)
+
+        primary_name = self._get_column_name_for_primary()
+
+        with self.database_connection.transaction():
+            cursor = self.database_connection.connection.cursor()
+            cursor.executemany(
+                "INSERT INTO {!r} ({}) VALUES ({})".format(
+                    self.table_name,
+                    self._build_column_insert_expression(),
+                    self._build_value_insert_expression()),
+                value_list)
+
+            if primary_name:
+                # Since the transaction holds the write lock, AUTOINCREMENT row identifiers
+                # have been assigned consecutively up to the one recorded in 'sqlite_sequence'.
+                cursor.execute("SELECT seq FROM sqlite_sequence WHERE name = ?", [self.table_name])
+                last_row_identifier = cursor.fetchone()[0]
+                for i in range(0, len(data_object_list)):
+                    data_object_list[i].__setattr__(
+                        primary_name,
+                        last_row_identifier - len(data_object_list) + 1 + i)
+
+    def update_many(self, data_object_list):
+        """Update canonical objects corresponding to the C{DatabaseAdaptor} sub-class in a single transaction.
+
+        @param data_object_list: Python C{list} of objects
+        @type data_object_list: list
+        """
+
+        if not len(data_object_list):
+            return
+
+        primary_name = self._get_column_name_for_primary()
+        if not primary_name:
+            raise Exception("Cannot update table {!r} without primary key.".format(self.table_name))
+
+        column_name_list = self._get_column_name_list_without_primary()
+        column_name_list.append(primary_name)
+
+        value_list = map(self._get_value_getter(column_name_list=column_name_list), data_object_list)
+
+        with self.database_connection.transaction():
+            self.database_connection.connection.executemany(
+                "UPDATE {!r} SET {} WHERE {} = ?".format(
+                    self.table_name,
+                    self._build_column_update_expression(),
+                    primary_name),
+                value_list)
+
+    def upsert_many(self, data_object_list, key_name):
+        """Update or insert canonical objects corresponding to the C{DatabaseAdaptor} sub-class
+        in a single transaction.
+
+        Objects are matched to existing rows via a column with a C{UNIQUE} constraint or
+        via a Python C{list} of columns, which together identify a row.
+        Existing rows are updated and their primary key is set in the objects,
+        all other objects are inserted. If several objects share a key, only the last one is stored.
+        @param data_object_list: Python C{list} of objects
+        @type data_object_list: list
+        @param key_name: SQL column name with a C{UNIQUE} constraint or
+            Python C{list} of Python C{str} (SQL column name) objects
+        @type key_name: str | list[str]
+        """
+
+        if not len(data_object_list):
+            return
+
+        primary_name = self._get_column_name_for_primary()
+        if not primary_name:
+            raise Exception("Cannot upsert into table {!r} without primary key.".format(self.table_name))
+
+        if isinstance(key_name, basestring):
+            key_name_list = [key_name]
+        else:
+            key_name_list = list(key_name)
+
+        object_dict = dict()
+        key_list = list()
+        for data_object in data_object_list:
+            key = tuple(map(lambda x: data_object.__getattribute__(x), key_name_list))
+            if key not in object_dict:
+                key_list.append(key)
+            object_dict[key] = data_object
+
+        with self.database_connection.transaction():
+            cursor = self.database_connection.connection.cursor()
+
+            # Look up primary keys in chunks, to stay below the SQLite limit of host parameters.
+            # Composite keys are looked up via their first column, which is expected to be indexed.
+
+            lookup_list = list()
+            lookup_set = set()
+            for key in key_list:
+                if key[0] not in lookup_set:
+                    lookup_set.add(key[0])
+                    lookup_list.append(key[0])
+
+            primary_dict = dict()
+            chunk_size = 500
+            for i in range(0, len(lookup_list), chunk_size):
+                chunk_list = lookup_list[i:i + chunk_size]
+                cursor.execute(
+                    "SELECT {}, {} FROM {!r} WHERE {} IN ({})".format(
+                        string.join(words=key_name_list, sep=', '),
+                        primary_name,
+                        self.table_name,
+                        key_name_list[0],
+                        string.join(words=map(lambda x: '?', chunk_list), sep=', ')),
+                    chunk_list)
+                for row in cursor.fetchall():
+                    primary_dict[tuple(row[:-1])] = row[-1]
+
+            update_list = list()
+            insert_list = list()
+            for key in key_list:
+                data_object = object_dict[key]
+                if key in primary_dict:
+                    data_object.__setattr__(primary_name, primary_dict[key])
+                    update_list.append(data_object)
+                else:
+                    insert_list.append(data_object)
+
+            self.update_many(data_object_list=update_list)
+            self.insert_many(data_object_list=insert_list)
+
 
 class JobSubmission(object):
     """The C{JobSubmission} class representing one process submitted into the
@@ -374,9 +888,13 @@ class JobSubmission(object):
     @type name: str
     @ivar command: Command line
     @type command: str
+    @ivar drms_name: C{DRMS.name}
+    @type drms_name: str
+    @ivar job_id: Latest C{Executable.process_identifier} or C{None}, if the DRMS does not assign one
+    @type job_id: str
     """
 
-    def __init__(self, executable_id=0, name=None, command=None):
+    def __init__(self, executable_id=0, name=None, command=None, drms_name=None, job_id=None):
         """Initialise a C{JobSubmission} object.
 
         @param executable_id: Primary key
@@ -385,10 +903,16 @@ class JobSubmission(object):
         @type name: str
         @param command: Command line
         @type command: str
+        @param drms_name: C{DRMS.name}
+        @type drms_name: str
+        @param job_id: Latest C{Executable.process_identifier} or C{None}, if the DRMS does not assign one
+        @type job_id: str
         """
         self.executable_id = executable_id
         self.name = name
         self.command = command
+        self.drms_name = drms_name
+        self.job_id = job_id
 
 
 class JobSubmissionAdaptor(DatabaseAdaptor):
@@ -404,6 +928,7 @@ class JobSubmissionAdaptor(DatabaseAdaptor):
 
         super(JobSubmissionAdaptor, self).__init__(
             database_connection=database_connection,
+            object_type=JobSubmission,
             table_name='executable',
             column_definition=[
                 # Primary key
@@ -411,40 +936,16 @@ class JobSubmissionAdaptor(DatabaseAdaptor):
                 # Name
                 ['name', 'TEXT UNIQUE'],
                 # Command as submitted into the DRMS
-                ['command', 'TEXT']
+                ['command', 'TEXT'],
+                # DRMS name
+                ['drms_name', 'TEXT'],
+                # Latest process identifier assigned by the DRMS
+                ['job_id', 'TEXT']
+            ],
+            index_definition=[
+                ['executable_drms_name', 'drms_name']
             ])
 
-    def _objects_from_statement(self, statement, parameters=None):
-        """C{JobSubmissionAdaptor}-specific function to turn results of a SQL C{SELECT} statement into
-        C{JobSubmission} objects.
-
-        @param statement: Complete SQL C{SELECT} statement
-        @type statement: str
-        @param parameters: Python C{list} of Python C{str} (parameter) objects or C{None}
-        @type parameters: list
-        @return: Python C{list} of objects
-        @rtype: list
-        """
-
-        object_list = list()
-
-        cursor = self.database_connection.connection.cursor()
-
-        if parameters:
-            cursor.execute(statement, parameters)
-        else:
-            cursor.execute(statement)
-
-        for row in cursor.fetchall():
-            object_instance = JobSubmission()
-            object_list.append(object_instance)
-            i = 0
-            for name in map(lambda x: x[0], self.column_definition):
-                object_instance.__setattr__(name, row[i])
-                i += 1
-
-        return object_list
-
     def select_by_name(self, name):
         """Select one C{JobSubmission} object by name.
 
@@ -468,6 +969,21 @@ class JobSubmissionAdaptor(DatabaseAdaptor):
         else:
             return
 
+    def select_all_by_drms_name(self, drms_name):
+        """Select all C{JobSubmission} objects by C{DRMS.name}.
+
+        @param drms_name: C{DRMS.name}
+        @type drms_name: str
+        @return: Python C{list} of C{JobSubmission} objects
+        @rtype: list
+        """
+
+        statement = self.statement_select(where_clause='drms_name = ?')
+        parameters = list()
+        parameters.append(drms_name)
+
+        return self._objects_from_statement(statement=statement, parameters=parameters)
+
 
 class ProcessSLURM(object):
     """The C{ProcessSLURM} class models one process in the Simple Linux Utility for Resource Management (SLURM)
@@ -482,44 +998,44 @@ class ProcessSLURM(object):
     @type job_name: str
     @ivar partition: Identifies the partition on which the job ran
     @type partition: str
-    @ivar max_vm_size: Maximum virtual memory size of all tasks in job
-    @type max_vm_size: str
+    @ivar max_vm_size: Maximum virtual memory size of all tasks in job, in bytes
+    @type max_vm_size: int
     @ivar max_vm_size_node: The node on which the maximum virtual memory size occurred
     @type max_vm_size_node: str
     @ivar max_vm_size_task: The task identifier where the maximum virtual memory size occurred
     @type max_vm_size_task: str
-    @ivar average_vm_size: Average virtual memory size of all tasks in job
-    @type average_vm_size: str
-    @ivar max_rss: Maximum resident set size of all tasks in job
-    @type max_rss: str
+    @ivar average_vm_size: Average virtual memory size of all tasks in job, in bytes
+    @type average_vm_size: int
+    @ivar max_rss: Maximum resident set size of all tasks in job, in bytes
+    @type max_rss: int
     @ivar max_rss_node: The node on which the maximum resident set size occurred
     @type max_rss_node: str
     @ivar max_rss_task: The task identifier where the maximum resident set size occurred
     @type max_rss_task: str
-    @ivar average_rss: Average resident set size of all tasks in job
-    @type average_rss: str
+    @ivar average_rss: Average resident set size of all tasks in job, in bytes
+    @type average_rss: int
     @ivar max_pages: Maximum number of page faults of all tasks in job
-    @type max_pages: str
+    @type max_pages: int
     @ivar max_pages_node: The node on which the maximum number of page faults occurred
     @type max_pages_node: str
     @ivar max_pages_task: The task identifier where the maximum number of page faults occurred
     @type max_pages_task: str
     @ivar average_pages: Average number of page faults of all tasks in job
-    @type average_pages: str
-    @ivar min_cpu: Minimum (system + user) CPU time of all tasks in job
-    @type min_cpu: str
+    @type average_pages: int
+    @ivar min_cpu: Minimum (system + user) CPU time of all tasks in job, in seconds
+    @type min_cpu: int
     @ivar min_cpu_node: The node on which the minimum CPU time occurred
     @type min_cpu_node: str
     @ivar min_cpu_task: The task identifier where the minimum CPU time occurred
     @type min_cpu_task: str
-    @ivar average_cpu: Average (system + user) CPU time of all tasks in job
-    @type average_cpu: str
+    @ivar average_cpu: Average (system + user) CPU time of all tasks in job, in seconds
+    @type average_cpu: int
     @ivar number_tasks: Total number of tasks in a job or step
-    @type number_tasks: str
+    @type number_tasks: int
     @ivar allocated_cpus: Count of allocated CPUs
-    @type allocated_cpus: str
-    @ivar elapsed: The jobs elapsed time
-    @type elapsed: str
+    @type allocated_cpus: int
+    @ivar elapsed: The jobs elapsed time, in seconds
+    @type elapsed: int
     @ivar state: Displays the job status, or state
         Value can be RUNNING, RESIZING, SUSPENDED, COMPLETED, CANCELLED, FAILED, TIMEOUT, PREEMPTED or NODE_FAIL
     @type state: str
@@ -533,25 +1049,43 @@ class ProcessSLURM(object):
     @ivar requested_memory: Minimum required memory for the job, in MB
     @type requested_memory: str
     @ivar consumed_energy: Total energy consumed by all tasks in job, in joules
-    @type consumed_energy: str
-    @ivar max_disk_read: Maximum number of bytes read by all tasks in job
-    @type max_disk_read: str
+    @type consumed_energy: int
+    @ivar max_disk_read: Maximum number of bytes read by all tasks in job, in bytes
+    @type max_disk_read: int
     @ivar max_disk_read_node: The node on which the maximum number of bytes read occurred
     @type max_disk_read_node: str
     @ivar max_disk_read_task: The task identifier where the maximum number of bytes read occurred
     @type max_disk_read_task: str
-    @ivar average_disk_read: Average number of bytes read by all tasks in job
-    @type average_disk_read: str
-    @ivar max_disk_write: Maximum number of bytes written by all tasks in job
-    @type max_disk_write: str
+    @ivar average_disk_read: Average number of bytes read by all tasks in job, in bytes
+    @type average_disk_read: int
+    @ivar max_disk_write: Maximum number of bytes written by all tasks in job, in bytes
+    @type max_disk_write: int
     @ivar max_disk_write_node: The node on which the maximum number of bytes written occurred
     @type max_disk_write_node: str
     @ivar max_disk_write_task: The task identifier where the maximum number of bytes written occurred
     @type max_disk_write_task: str
-    @ivar average_disk_write: Average number of bytes written by all tasks in job
-    @type average_disk_write: str
+    @ivar average_disk_write: Average number of bytes written by all tasks in job, in bytes
+    @type average_disk_write: int
+    @ivar submit_time: Time the job was submitted in ISO 8601 format
+    @type submit_time: str
+    @ivar start_time: Time the job started in ISO 8601 format
+    @type start_time: str
+    @ivar end_time: Time the job ended in ISO 8601 format
+    @type end_time: str
+    @ivar time_limit: Time limit of the job, in seconds
+    @type time_limit: int
     """
 
+    __slots__ = (
+        'process_slurm_id', 'job_id', 'job_name', 'partition', 'max_vm_size', 'max_vm_size_node', 'max_vm_size_task',
+        'average_vm_size', 'max_rss', 'max_rss_node', 'max_rss_task', 'average_rss', 'max_pages', 'max_pages_node',
+        'max_pages_task', 'average_pages', 'min_cpu', 'min_cpu_node', 'min_cpu_task', 'average_cpu', 'number_tasks',
+        'allocated_cpus', 'elapsed', 'state', 'exit_code', 'average_cpu_frequency', 'requested_cpu_frequency',
+        'requested_memory', 'consumed_energy', 'max_disk_read', 'max_disk_read_node', 'max_disk_read_task',
+        'average_disk_read', 'max_disk_write', 'max_disk_write_node', 'max_disk_write_task', 'average_disk_write',
+        'submit_time', 'start_time', 'end_time', 'time_limit'
+    )
+
     def __init__(self, process_slurm_id=None, job_id=None, job_name=None, partition=None,
                  max_vm_size=None, max_vm_size_node=None, max_vm_size_task=None, average_vm_size=None,
                  max_rss=None, max_rss_node=None, max_rss_task=None, average_rss=None,
@@ -561,7 +1095,8 @@ class ProcessSLURM(object):
                  average_cpu_frequency=None, requested_cpu_frequency=None, requested_memory=None,
                  consumed_energy=None,
                  max_disk_read=None, max_disk_read_node=None, max_disk_read_task=None, average_disk_read=None,
-                 max_disk_write=None, max_disk_write_node=None, max_disk_write_task=None, average_disk_write=None):
+                 max_disk_write=None, max_disk_write_node=None, max_disk_write_task=None, average_disk_write=None,
+                 submit_time=None, start_time=None, end_time=None, time_limit=None):
         """Initialise a ProcessSLURM object.
 
         @param process_slurm_id:
@@ -572,44 +1107,44 @@ class ProcessSLURM(object):
         @type job_name: str
         @param partition: Identifies the partition on which the job ran
         @type partition: str
-        @param max_vm_size: Maximum virtual memory size of all tasks in job
-        @type max_vm_size: str
+        @param max_vm_size: Maximum virtual memory size of all tasks in job, in bytes
+        @type max_vm_size: int
         @param max_vm_size_node: The node on which the maximum virtual memory size occurred
         @type max_vm_size_node: str
         @param max_vm_size_task: The task identifier where the maximum virtual memory size occurred
         @type max_vm_size_task: str
-        @param average_vm_size: Average virtual memory size of all tasks in job
-        @type average_vm_size: str
-        @param max_rss: Maximum resident set size of all tasks in job
-        @type max_rss: str
+        @param average_vm_size: Average virtual memory size of all tasks in job, in bytes
+        @type average_vm_size: int
+        @param max_rss: Maximum resident set size of all tasks in job, in bytes
+        @type max_rss: int
         @param max_rss_node: The node on which the maximum resident set size occurred
         @type max_rss_node: str
         @param max_rss_task: The task identifier where the maximum resident set size occurred
         @type max_rss_task: str
-        @param average_rss: Average resident set size of all tasks in job
-        @type average_rss: str
+        @param average_rss: Average resident set size of all tasks in job, in bytes
+        @type average_rss: int
         @param max_pages: Maximum number of page faults of all tasks in job
-        @type max_pages: str
+        @type max_pages: int
         @param max_pages_node: The node on which the maximum number of page faults occurred
         @type max_pages_node: str
         @param max_pages_task: The task identifier where the maximum number of page faults occurred
         @type max_pages_task: str
         @param average_pages: Average number of page faults of all tasks in job
-        @type average_pages: str
-        @param min_cpu: Minimum (system + user) CPU time of all tasks in job
-        @type min_cpu: str
+        @type average_pages: int
+        @param min_cpu: Minimum (system + user) CPU time of all tasks in job, in seconds
+        @type min_cpu: int
         @param min_cpu_node: The node on which the minimum CPU time occurred
         @type min_cpu_node: str
         @param min_cpu_task: The task identifier where the minimum CPU time occurred
         @type min_cpu_task: str
-        @param average_cpu: Average (system + user) CPU time of all tasks in job
-        @type average_cpu: str
+        @param average_cpu: Average (system + user) CPU time of all tasks in job, in seconds
+        @type average_cpu: int
         @param number_tasks: Total number of tasks in a job or step
-        @type number_tasks: str
+        @type number_tasks: int
         @param allocated_cpus: Count of allocated CPUs
-        @type allocated_cpus: str
-        @param elapsed: The jobs elapsed time
-        @type elapsed: str
+        @type allocated_cpus: int
+        @param elapsed: The jobs elapsed time, in seconds
+        @type elapsed: int
         @param state: Displays the job status, or state.
             Value can be RUNNING, RESIZING, SUSPENDED, COMPLETED, CANCELLED, FAILED, TIMEOUT, PREEMPTED or NODE_FAIL
         @type state: str
@@ -623,23 +1158,31 @@ class ProcessSLURM(object):
         @param requested_memory: Minimum required memory for the job, in MB
         @type requested_memory: str
         @param consumed_energy: Total energy consumed by all tasks in job, in joules
-        @type consumed_energy: str
-        @param max_disk_read: Maximum number of bytes read by all tasks in job
-        @type max_disk_read: str
+        @type consumed_energy: int
+        @param max_disk_read: Maximum number of bytes read by all tasks in job, in bytes
+        @type max_disk_read: int
         @param max_disk_read_node: The node on which the maximum number of bytes read occurred
         @type max_disk_read_node: str
         @param max_disk_read_task: The task identifier where the maximum number of bytes read occurred
         @type max_disk_read_task: str
-        @param average_disk_read: Average number of bytes read by all tasks in job
-        @type average_disk_read: str
-        @param max_disk_write: Maximum number of bytes written by all tasks in job
-        @type max_disk_write: str
+        @param average_disk_read: Average number of bytes read by all tasks in job, in bytes
+        @type average_disk_read: int
+        @param max_disk_write: Maximum number of bytes written by all tasks in job, in bytes
+        @type max_disk_write: int
         @param max_disk_write_node: The node on which the maximum number of bytes written occurred
         @type max_disk_write_node: str
         @param max_disk_write_task: The task identifier where the maximum number of bytes written occurred
         @type max_disk_write_task: str
-        @param average_disk_write: Average number of bytes written by all tasks in job
-        @type average_disk_write: str
+        @param average_disk_write: Average number of bytes written by all tasks in job, in bytes
+        @type average_disk_write: int
+        @param submit_time: Time the job was submitted in ISO 8601 format
+        @type submit_time: str
+        @param start_time: Time the job started in ISO 8601 format
+        @type start_time: str
+        @param end_time: Time the job ended in ISO 8601 format
+        @type end_time: str
+        @param time_limit: Time limit of the job, in seconds
+        @type time_limit: int
         """
         self.process_slurm_id = process_slurm_id
         self.job_id = job_id
@@ -678,6 +1221,10 @@ class ProcessSLURM(object):
         self.max_disk_write_node = max_disk_write_node
         self.max_disk_write_task = max_disk_write_task
         self.average_disk_write = average_disk_write
+        self.submit_time = submit_time
+        self.start_time = start_time
+        self.end_time = end_time
+        self.time_limit = time_limit
 
 
 class ProcessSLURMAdaptor(DatabaseAdaptor):
@@ -695,6 +1242,7 @@ class ProcessSLURMAdaptor(DatabaseAdaptor):
 
         super(ProcessSLURMAdaptor, self).__init__(
             database_connection=database_connection,
+            object_type=ProcessSLURM,
             table_name='process_slurm',
             column_definition=[
                 # Primary key
@@ -710,7 +1258,7 @@ class ProcessSLURMAdaptor(DatabaseAdaptor):
                 ['partition', 'TEXT'],
                 # MaxVMSize
                 # Maximum virtual memory size of all tasks in job.
-                ['max_vm_size', 'TEXT'],
+                ['max_vm_size', 'INTEGER'],
                 # MaxVMSizeNode
                 # The node on which the maximum virtual memory size occurred.
                 ['max_vm_size_node', 'TEXT'],
@@ -719,10 +1267,10 @@ class ProcessSLURMAdaptor(DatabaseAdaptor):
                 ['max_vm_size_task', 'TEXT'],
                 # AveVMSize
                 # Average virtual memory size of all tasks in job.
-                ['average_vm_size', 'TEXT'],
+                ['average_vm_size', 'INTEGER'],
                 # MaxRSS
                 # Maximum resident set size of all tasks in job.
-                ['max_rss', 'TEXT'],
+                ['max_rss', 'INTEGER'],
                 # MaxRSSNode
                 # The node on which the maximum resident set size occurred.
                 ['max_rss_node', 'TEXT'],
@@ -731,10 +1279,10 @@ class ProcessSLURMAdaptor(DatabaseAdaptor):
                 ['max_rss_task', 'TEXT'],
                 # AveRSS
                 # Average resident set size of all tasks in job.
-                ['average_rss', 'TEXT'],
+                ['average_rss', 'INTEGER'],
                 # MaxPages
                 # Maximum number of page faults of all tasks in job.
-                ['max_pages', 'TEXT'],
+                ['max_pages', 'INTEGER'],
                 # MaxPagesNode
                 # The node on which the maximum number of page faults occurred.
                 ['max_pages_node', 'TEXT'],
@@ -743,10 +1291,10 @@ class ProcessSLURMAdaptor(DatabaseAdaptor):
                 ['max_pages_task', 'TEXT'],
                 # AvePages
                 # Average number of page faults of all tasks in job.
-                ['average_pages', 'TEXT'],
+                ['average_pages', 'INTEGER'],
                 # MinCPU
                 # Minimum (system + user) CPU time of all tasks in job.
-                ['min_cpu', 'TEXT'],
+                ['min_cpu', 'INTEGER'],
                 # MinCPUNode
                 # The node on which the minimum CPU time occurred.
                 ['min_cpu_node', 'TEXT'],
@@ -755,16 +1303,16 @@ class ProcessSLURMAdaptor(DatabaseAdaptor):
                 ['min_cpu_task', 'TEXT'],
                 # AveCPU
                 # Average (system + user) CPU time of all tasks in job.
-                ['average_cpu', 'TEXT'],
+                ['average_cpu', 'INTEGER'],
                 # NTasks
                 # Total number of tasks in a job or step.
-                ['number_tasks', 'TEXT'],
+                ['number_tasks', 'INTEGER'],
                 # AllocCPUS
                 # Count of allocated CPUs.
-                ['allocated_cpus', 'TEXT'],
+                ['allocated_cpus', 'INTEGER'],
                 # Elapsed
                 # The jobs elapsed time.
-                ['elapsed', 'TEXT'],
+                ['elapsed', 'INTEGER'],
                 # State
                 # Displays the job status, or state.
                 # Value can be RUNNING, RESIZING, SUSPENDED, COMPLETED, CANCELLED, FAILED, TIMEOUT, PREEMPTED or
@@ -786,10 +1334,10 @@ class ProcessSLURMAdaptor(DatabaseAdaptor):
                 ['requested_memory', 'TEXT'],
                 # ConsumedEnergy
                 # Total energy consumed by all tasks in job, in joules.
-                ['consumed_energy', 'TEXT'],
+                ['consumed_energy', 'INTEGER'],
                 # MaxDiskRead
                 # Maximum number of bytes read by all tasks in job.
-                ['max_disk_read', 'TEXT'],
+                ['max_disk_read', 'INTEGER'],
                 # MaxDiskReadNode
                 # The node on which the maximum number of bytes read occurred.
                 ['max_disk_read_node', 'TEXT'],
@@ -798,10 +1346,10 @@ class ProcessSLURMAdaptor(DatabaseAdaptor):
                 ['max_disk_read_task', 'TEXT'],
                 # AveDiskRead
                 # Average number of bytes read by all tasks in job.
-                ['average_disk_read', 'TEXT'],
+                ['average_disk_read', 'INTEGER'],
                 # MaxDiskWrite
                 # Maximum number of bytes written by all tasks in job.
-                ['max_disk_write', 'TEXT'],
+                ['max_disk_write', 'INTEGER'],
                 # MaxDiskWriteNode
                 # The node on which the maximum number of bytes written occurred.
                 ['max_disk_write_node', 'TEXT'],
@@ -810,40 +1358,25 @@ class ProcessSLURMAdaptor(DatabaseAdaptor):
                 ['max_disk_write_task', 'TEXT'],
                 # AveDiskWrite
                 # Average number of bytes written by all tasks in job.
-                ['average_disk_write', 'TEXT']
+                ['average_disk_write', 'INTEGER'],
+                # Submit
+                # The time the job was submitted in ISO 8601 format.
+                ['submit_time', 'TEXT'],
+                # Start
+                # Initiation time of the job in ISO 8601 format.
+                ['start_time', 'TEXT'],
+                # End
+                # Termination time of the job in ISO 8601 format.
+                ['end_time', 'TEXT'],
+                # Timelimit
+                # The time limit of the job in seconds.
+                ['time_limit', 'INTEGER']
+            ],
+            index_definition=[
+                ['process_slurm_job_name', 'job_name'],
+                ['process_slurm_end_time', 'end_time']
             ])
 
-    def _objects_from_statement(self, statement, parameters=None):
-        """ProcessSLURMAdaptor-specific function to turn results of a SELECT statement into
-        ProcessSLURM objects.
-
-        @param statement: Complete SQL SELECT statement
-        @type statement: str
-        @param parameters: Python list of Python str (parameter) objects or None
-        @type parameters: list
-        @return: Python list of objects
-        @rtype: list
-        """
-
-        object_list = list()
-
-        cursor = self.database_connection.connection.cursor()
-
-        if parameters:
-            cursor.execute(statement, parameters)
-        else:
-            cursor.execute(statement)
-
-        for row in cursor.fetchall():
-            object_instance = ProcessSLURM()
-            object_list.append(object_instance)
-            i = 0
-            for name in map(lambda x: x[0], self.column_definition):
-                object_instance.__setattr__(name, row[i])
-                i += 1
-
-        return object_list
-
     def select_all_by_job_name(self, name):
         """Select all JobSubmission objects by job_name.
 
@@ -859,6 +1392,47 @@ class ProcessSLURMAdaptor(DatabaseAdaptor):
 
         return self._objects_from_statement(statement=statement, parameters=parameters)
 
+    def select_job_id_dict(self, name_list=None):
+        """Select the latest job identifier for each job name.
+
+        The same Executable can be submitted more than once into the DRMS, in which case
+        the job identifier of the last submission is returned.
+        @param name_list: Python list of Python str (job_name) objects to restrict the selection to or
+            None to select all job names
+        @type name_list: list
+        @return: Python dict of Python str (job_name) key data and Python str (job_id) value data
+        @rtype: dict
+        """
+
+        job_id_dict = dict()
+
+        cursor = self.database_connection.connection.cursor()
+
+        if name_list is None:
+            cursor.execute("SELECT job_name, job_id FROM {!r} ORDER BY {} ASC".format(
+                self.table_name,
+                self._get_column_name_for_primary()))
+
+            for row in cursor.fetchall():
+                job_id_dict[row[0]] = row[1]
+        else:
+            # Look up job names in chunks via the index, to stay below the SQLite limit of host parameters.
+
+            name_list = sorted(set(name_list))
+            chunk_size = 500
+            for i in range(0, len(name_list), chunk_size):
+                chunk_list = name_list[i:i + chunk_size]
+                cursor.execute("SELECT job_name, job_id FROM {!r} WHERE job_name IN ({}) ORDER BY {} ASC".format(
+                    self.table_name,
+                    string.join(words=map(lambda x: '?', chunk_list), sep=', '),
+                    self._get_column_name_for_primary()),
+                    chunk_list)
+
+                for row in cursor.fetchall():
+                    job_id_dict[row[0]] = row[1]
+
+        return job_id_dict
+
     def select_by_job_id(self, job_id):
         """Select one JobSubmission object by job_id.
 
@@ -881,6 +1455,157 @@ class ProcessSLURMAdaptor(DatabaseAdaptor):
         else:
             return
 
+    def select_state_dict(self, job_id_list):
+        """Select the state for each job identifier.
+
+        @param job_id_list: Python C{list} of Python C{str} (job_id) objects
+        @type job_id_list: list
+        @return: Python C{dict} of Python C{str} (job_id) key data and Python C{str} (state) value data
+        @rtype: dict
+        """
+
+        state_dict = dict()
+
+        cursor = self.database_connection.connection.cursor()
+
+        # Look up job identifiers in chunks via the unique index, to stay below the SQLite limit of host parameters.
+
+        job_id_list = sorted(set(job_id_list))
+        chunk_size = 500
+        for i in range(0, len(job_id_list), chunk_size):
+            chunk_list = job_id_list[i:i + chunk_size]
+            cursor.execute("SELECT job_id, state FROM {!r} WHERE job_id IN ({})".format(
+                self.table_name,
+                string.join(words=map(lambda x: '?', chunk_list), sep=', ')),
+                chunk_list)
+
+            for row in cursor.fetchall():
+                state_dict[row[0]] = row[1]
+
+        return state_dict
+
+    def select_wall_time_list(self, drms_name, limit=1000):
+        """Select the wall time of the latest successful C{ProcessSLURM} objects of a C{DRMS} name.
+
+        @param drms_name: C{DRMS.name}
+        @type drms_name: str
+        @param limit: Maximum number of C{ProcessSLURM} objects
+        @type limit: int
+        @return: Python C{list} of Python C{int} or Python C{float} (wall time in seconds) objects
+        @rtype: list
+        """
+
+        (where_clause, parameter_list) = self._build_drms_job_name_clause(drms_name=drms_name)
+
+        cursor = self.database_connection.connection.cursor()
+        cursor.execute(
+            "SELECT elapsed FROM {!r} "
+            "WHERE {} AND state = 'COMPLETED' AND elapsed IS NOT NULL "
+            "ORDER BY {} DESC LIMIT {:d}".format(
+                self.table_name,
+                where_clause,
+                self._get_column_name_for_primary(),
+                limit),
+            parameter_list)
+
+        return map(lambda x: x[0], cursor.fetchall())
+
+
+class ProcessSLURMSync(object):
+    """The C{ProcessSLURMSync} class models one synchronisation of C{ProcessSLURM} objects with the
+    SLURM accounting database.
+
+    The end time and job identifier of the latest finished job record the high-water mark, from which
+    the next synchronisation continues.
+    @ivar process_slurm_sync_id: Primary key
+    @type process_slurm_sync_id: int
+    @ivar sync_time: Time of the synchronisation in ISO 8601 format
+    @type sync_time: str
+    @ivar start_time: Start of the time window queried in ISO 8601 format
+    @type start_time: str
+    @ivar end_time: End time of the latest finished job in ISO 8601 format
+    @type end_time: str
+    @ivar job_id: Job identifier of the latest finished job
+    @type job_id: str
+    @ivar job_count: Number of job records stored
+    @type job_count: int
+    """
+
+    __slots__ = ('process_slurm_sync_id', 'sync_time', 'start_time', 'end_time', 'job_id', 'job_count')
+
+    def __init__(self, process_slurm_sync_id=None, sync_time=None, start_time=None, end_time=None, job_id=None,
+                 job_count=None):
+        """Initialise a C{ProcessSLURMSync} object.
+
+        @param process_slurm_sync_id: Primary key
+        @type process_slurm_sync_id: int
+        @param sync_time: Time of the synchronisation in ISO 8601 format
+        @type sync_time: str
+        @param start_time: Start of the time window queried in ISO 8601 format
+        @type start_time: str
+        @param end_time: End time of the latest finished job in ISO 8601 format
+        @type end_time: str
+        @param job_id: Job identifier of the latest finished job
+        @type job_id: str
+        @param job_count: Number of job records stored
+        @type job_count: int
+        """
+
+        self.process_slurm_sync_id = process_slurm_sync_id
+        self.sync_time = sync_time
+        self.start_time = start_time
+        self.end_time = end_time
+        self.job_id = job_id
+        self.job_count = job_count
+
+
+class ProcessSLURMSyncAdaptor(DatabaseAdaptor):
+    """The C{ProcessSLURMSyncAdaptor} class provides database access for the C{ProcessSLURMSync} class.
+    """
+
+    def __init__(self, database_connection):
+        """Initialise a C{ProcessSLURMSyncAdaptor} object.
+
+        @param database_connection: C{DatabaseConnection}
+        @type database_connection: DatabaseConnection
+        """
+
+        super(ProcessSLURMSyncAdaptor, self).__init__(
+            database_connection=database_connection,
+            object_type=ProcessSLURMSync,
+            table_name='process_slurm_sync',
+            column_definition=[
+                # Primary key
+                ['process_slurm_sync_id', 'INTEGER PRIMARY KEY ASC AUTOINCREMENT'],
+                # Time of the synchronisation in ISO 8601 format
+                ['sync_time', 'TEXT'],
+                # Start of the time window queried in ISO 8601 format
+                ['start_time', 'TEXT'],
+                # End time of the latest finished job in ISO 8601 format
+                ['end_time', 'TEXT'],
+                # Job identifier of the latest finished job
+                ['job_id', 'TEXT'],
+                # Number of job records stored
+                ['job_count', 'INTEGER']
+            ])
+
+    def select_latest(self):
+        """Select the latest C{ProcessSLURMSync} object, which holds the current high-water mark.
+
+        @return: C{ProcessSLURMSync} or C{None}
+        @rtype: ProcessSLURMSync
+        """
+
+        statement = self.statement_select()
+        statement += " ORDER BY {} DESC LIMIT 1".format(self._get_column_name_for_primary())
+
+        object_list = self._objects_from_statement(statement=statement)
+
+        if len(object_list):
+            return object_list[0]
+        else:
+            return
+
 
 class ProcessSGE(object):
     """The ProcessSLURM class models one process in the Son of Grid Engine (SGE)
@@ -905,12 +1630,12 @@ class ProcessSGE(object):
     @type account: str
     @ivar priority: Priority value assigned to the job, corresponding to the priority parameter in the
         queue configuration (see queue_conf(5))
-    @type priority: str
-    @ivar submission_time: Submission time
+    @type priority: int
+    @ivar submission_time: Submission time in ISO 8601 format
     @type submission_time: str
-    @ivar start_date: Start time
+    @ivar start_date: Start time in ISO 8601 format
     @type start_date: str
-    @ivar end_time: End time
+    @ivar end_time: End time in ISO 8601 format
     @type end_time: str
     @ivar failed: Indicates the problem which occurred in case a job could not be started on the execution host
     @type failed: str
@@ -919,10 +1644,10 @@ class ProcessSGE(object):
         terminates normally, the value of the command is its exit status. However, in the case that the command
         exits abnormally, a value of 0200 (octal), 128 (decimal) is added to the value of the command to make up
         the exit status.
-    @type exit_status: str
-    @ivar ru_wallclock: Difference between end_time and start_time (see above), except that if the job fails,
+    @type exit_status: int
+    @ivar ru_wallclock: Difference between end_time and start_time in seconds, except that if the job fails,
         it is zero
-    @type ru_wallclock: str
+    @type ru_wallclock: int
     @ivar project: The department which was assigned to the job
     @type project: str
     @ivar department: The parallel environment which was selected for the job
@@ -930,33 +1655,46 @@ class ProcessSGE(object):
     @ivar granted_pe: The number of slots which were dispatched to the job by the scheduler
     @type granted_pe: str
     @ivar slots: The number of slots which were dispatched to the job by the scheduler
-    @type slots: str
-    @ivar task_number: Array job task index number
+    @type slots: int
+    @ivar task_number: Array job task index number or 0 for non-array jobs
     @type task_number: str
     @ivar cpu: The CPU time usage in seconds
-    @type cpu: str
+    @type cpu: float
     @ivar mem: The integral memory usage in Gbytes seconds
-    @type mem: str
+    @type mem: float
     @ivar io: The amount of data transferred in input/output operations in GB (if available, otherwise 0)
-    @type io: str
+    @type io: float
     @ivar category: A string specifying the job category
     @type category: str
     @ivar iow: The input/output wait time in seconds (if available, otherwise 0)
-    @type iow: str
+    @type iow: float
     @ivar pe_taskid: If this identifier is set, the task was part of a parallel job, and was passed to Grid Engine
         via the qrsh -inherit interface.
     @type pe_taskid: str
     @ivar maxvmem: The maximum vmem size in bytes
-    @type maxvmem: str
+    @type maxvmem: int
     @ivar arid: Advance reservation identifier
-    @type arid: str
+    @type arid: int
+    @ivar ru_utime: User CPU time in seconds
+    @type ru_utime: float
+    @ivar ru_stime: System CPU time in seconds
+    @type ru_stime: float
+    @ivar ru_maxrss: Maximum resident set size in bytes
+    @type ru_maxrss: int
     """
 
+    __slots__ = (
+        'process_sge_id', 'qname', 'hostname', 'sge_group', 'owner', 'job_name', 'job_number', 'account', 'priority',
+        'submission_time', 'start_date', 'end_time', 'failed', 'exit_status', 'ru_wallclock', 'project', 'department',
+        'granted_pe', 'slots', 'task_number', 'cpu', 'mem', 'io', 'category', 'iow', 'pe_taskid', 'maxvmem', 'arid',
+        'ru_utime', 'ru_stime', 'ru_maxrss'
+    )
+
     def __init__(self, process_sge_id=None, qname=None, hostname=None, sge_group=None, owner=None, job_name=None,
                  job_number=None, account=None, priority=None, submission_time=None, start_date=None, end_time=None,
                  failed=None, exit_status=None, ru_wallclock=None, project=None, department=None, granted_pe=None,
                  slots=None, task_number=None, cpu=None, mem=None, io=None, category=None, iow=None, pe_taskid=None,
-                 maxvmem=None, arid=None):
+                 maxvmem=None, arid=None, ru_utime=None, ru_stime=None, ru_maxrss=None):
         """Initialise a ProcessSGE object.
 
         @param process_sge_id: Primary key
@@ -977,12 +1715,12 @@ class ProcessSGE(object):
         @type account: str
         @param priority: Priority value assigned to the job, corresponding to the priority parameter in the
             queue configuration (see queue_conf(5))
-        @type priority: str
-        @param submission_time: Submission time
+        @type priority: int
+        @param submission_time: Submission time in ISO 8601 format
         @type submission_time: str
-        @param start_date: Start time
+        @param start_date: Start time in ISO 8601 format
         @type start_date: str
-        @param end_time: End time
+        @param end_time: End time in ISO 8601 format
         @type end_time: str
         @param failed: Indicates the problem which occurred in case a job could not be started on the execution host
         @type failed: str
@@ -991,10 +1729,10 @@ class ProcessSGE(object):
             terminates normally, the value of the command is its exit status. However, in the case that the command
             exits abnormally, a value of 0200 (octal), 128 (decimal) is added to the value of the command to make up
             the exit status.
-        @type exit_status: str
-        @param ru_wallclock: Difference between end_time and start_time (see above), except that if the job fails,
+        @type exit_status: int
+        @param ru_wallclock: Difference between end_time and start_time in seconds, except that if the job fails,
             it is zero
-        @type ru_wallclock: str
+        @type ru_wallclock: int
         @param project: The department which was assigned to the job
         @type project: str
         @param department: The parallel environment which was selected for the job
@@ -1002,26 +1740,32 @@ class ProcessSGE(object):
         @param granted_pe: The number of slots which were dispatched to the job by the scheduler
         @type granted_pe: str
         @param slots: The number of slots which were dispatched to the job by the scheduler
-        @type slots: str
-        @param task_number: Array job task index number
+        @type slots: int
+        @param task_number: Array job task index number or 0 for non-array jobs
         @type task_number: str
         @param cpu: The CPU time usage in seconds
-        @type cpu: str
+        @type cpu: float
         @param mem: The integral memory usage in Gbytes seconds
-        @type mem: str
+        @type mem: float
         @param io: The amount of data transferred in input/output operations in GB (if available, otherwise 0)
-        @type io: str
+        @type io: float
         @param category: A string specifying the job category
         @type category: str
         @param iow: The input/output wait time in seconds (if available, otherwise 0)
-        @type iow: str
+        @type iow: float
         @param pe_taskid: If this identifier is set, the task was part of a parallel job, and was passed to Grid Engine
             via the qrsh -inherit interface.
         @type pe_taskid: str
         @param maxvmem: The maximum vmem size in bytes
-        @type maxvmem: str
+        @type maxvmem: int
         @param arid: Advance reservation identifier
-        @type arid: str
+        @type arid: int
+        @param ru_utime: User CPU time in seconds
+        @type ru_utime: float
+        @param ru_stime: System CPU time in seconds
+        @type ru_stime: float
+        @param ru_maxrss: Maximum resident set size in bytes
+        @type ru_maxrss: int
         """
         self.process_sge_id = process_sge_id
         self.qname = qname
@@ -1051,6 +1795,9 @@ class ProcessSGE(object):
         self.pe_taskid = pe_taskid
         self.maxvmem = maxvmem
         self.arid = arid
+        self.ru_utime = ru_utime
+        self.ru_stime = ru_stime
+        self.ru_maxrss = ru_maxrss
 
 
 class ProcessSGEAdaptor(DatabaseAdaptor):
@@ -1068,6 +1815,7 @@ class ProcessSGEAdaptor(DatabaseAdaptor):
 
         super(ProcessSGEAdaptor, self).__init__(
             database_connection=database_connection,
+            object_type=ProcessSGE,
             table_name='process_sge',
             column_definition=[
                 # Primary key
@@ -1097,15 +1845,15 @@ class ProcessSGEAdaptor(DatabaseAdaptor):
                 # priority
                 # Priority value assigned to the job, corresponding to the priority parameter in the queue configuration
                 # (see queue_conf(5)).
-                ['priority', 'TEXT'],
+                ['priority', 'INTEGER'],
                 # submission_time
-                # Submission time.
+                # Submission time, converted from seconds since the epoch into ISO 8601 format.
                 ['submission_time', 'TEXT'],
                 # start_time
-                # Start time.
+                # Start time, converted from seconds since the epoch into ISO 8601 format.
                 ['start_date', 'TEXT'],
                 # end_time
-                # End time.
+                # End time, converted from seconds since the epoch into ISO 8601 format.
                 ['end_time', 'TEXT'],
                 # failed
                 # Indicates the problem which occurred in case a job could not be started on the execution host
@@ -1121,10 +1869,10 @@ class ProcessSGEAdaptor(DatabaseAdaptor):
                 # the exit status.
                 #
                 # For example: If a job dies through signal 9 (SIGKILL) then the exit status becomes 128 + 9 = 137.
-                ['exit_status', 'TEXT'],
+                ['exit_status', 'INTEGER'],
                 # ru_wallclock
                 # Difference between end_time and start_time (see above), except that if the job fails, it is zero.
-                ['ru_wallclock', 'TEXT'],
+                ['ru_wallclock', 'INTEGER'],
                 # ru_utime
                 # ru_stime
                 # ru_maxrss
@@ -1144,6 +1892,7 @@ class ProcessSGEAdaptor(DatabaseAdaptor):
                 # ru_nivcsw
                 # These entries follow the contents of the standard Unix rusage structure as described in getrusage(2).
                 # Depending on the operating system where the job was executed, some of the fields may be 0.
+                # Only ru_utime, ru_stime and ru_maxrss are stored, see below.
                 #
                 # project
                 # The project which was assigned to the job.
@@ -1156,21 +1905,21 @@ class ProcessSGEAdaptor(DatabaseAdaptor):
                 ['granted_pe', 'TEXT'],
                 # slots
                 # The number of slots which were dispatched to the job by the scheduler.
-                ['slots', 'TEXT'],
+                ['slots', 'INTEGER'],
                 # task_number
-                # Array job task index number.
+                # Array job task index number or 0 for non-array jobs.
                 ['task_number', 'TEXT'],
                 # cpu
                 # The CPU time usage in seconds.
                 # The value may be affected by the ACCT_RESERVED_USAGE execd parameter (see sge_conf(5)).
-                ['cpu', 'TEXT'],
+                ['cpu', 'REAL'],
                 # mem
                 # The integral memory usage in Gbytes seconds.
                 # The value may be affected by the ACCT_RESERVED_USAGE execd parameter (see sge_conf(5)).
-                ['mem', 'TEXT'],
+                ['mem', 'REAL'],
                 # io
                 # The amount of data transferred in input/output operations (if available, otherwise 0).
-                ['io', 'TEXT'],
+                ['io', 'REAL'],
                 # category
                 # A string specifying the job category.
                 # This contains a space-separated pseudo options list for the sub, with components as follows:
@@ -1215,7 +1964,7 @@ class ProcessSGEAdaptor(DatabaseAdaptor):
                 ['category', 'TEXT'],
                 # iow
                 # The input/output wait time in seconds (if available, otherwise 0).
-                ['iow', 'TEXT'],
+                ['iow', 'REAL'],
                 # pe_taskid
                 # If this identifier is set, the task was part of a parallel job, and was passed to Grid Engine
                 # via the qrsh -inherit interface.
@@ -1223,40 +1972,768 @@ class ProcessSGEAdaptor(DatabaseAdaptor):
                 # maxvmem
                 # The maximum vmem size in bytes.
                 # The value may be affected by the ACCT_RESERVED_USAGE execd parameter (see sge_conf(5)).
-                ['maxvmem', 'TEXT'],
+                ['maxvmem', 'INTEGER'],
                 # arid
                 # Advance reservation identifier. If the job used the resources of an advance reservation,
                 # then this field contains a positive integer identifier; otherwise the value is "0" .
-                ['arid', 'TEXT']
+                ['arid', 'INTEGER'],
+                # ru_utime
+                # User CPU time in seconds.
+                ['ru_utime', 'REAL'],
+                # ru_stime
+                # System CPU time in seconds.
+                ['ru_stime', 'REAL'],
+                # ru_maxrss
+                # Maximum resident set size, converted from kilobytes into bytes.
+                ['ru_maxrss', 'INTEGER']
+            ],
+            index_definition=[
+                ['process_sge_job_name', 'job_name'],
+                ['process_sge_job_number', 'job_number']
             ])
 
-    def _objects_from_statement(self, statement, parameters=None):
-        """ProcessSLURMAdaptor-specific function to turn results of a SELECT statement into
-        ProcessSLURM objects.
+    def select_exit_dict(self, job_number_list):
+        """Select the failure code and exit status of the latest accounting record for each job number.
 
-        @param statement: Complete SQL SELECT statement
-        @type statement: str
-        @param parameters: Python list of Python str (parameter) objects or None
-        @type parameters: list
-        @return: Python list of objects
+        @param job_number_list: Python C{list} of Python C{str} (job_number) objects
+        @type job_number_list: list
+        @return: Python C{dict} of Python C{str} (job_number) key data and Python C{tuple} of
+            Python C{str} (failed) and Python C{int} (exit_status) value data
+        @rtype: dict
+        """
+
+        exit_dict = dict()
+
+        cursor = self.database_connection.connection.cursor()
+
+        # Look up job numbers in chunks via the index, to stay below the SQLite limit of host parameters.
+
+        job_number_list = sorted(set(job_number_list))
+        chunk_size = 500
+        for i in range(0, len(job_number_list), chunk_size):
+            chunk_list = job_number_list[i:i + chunk_size]
+            cursor.execute("SELECT job_number, failed, exit_status FROM {!r} WHERE job_number IN ({}) "
+                           "ORDER BY {} ASC".format(
+                               self.table_name,
+                               string.join(words=map(lambda x: '?', chunk_list), sep=', '),
+                               self._get_column_name_for_primary()),
+                           chunk_list)
+
+            for row in cursor.fetchall():
+                exit_dict[row[0]] = (row[1], row[2])
+
+        return exit_dict
+
+    def select_wall_time_list(self, drms_name, limit=1000):
+        """Select the wall time of the latest successful C{ProcessSGE} objects of a C{DRMS} name.
+
+        @param drms_name: C{DRMS.name}
+        @type drms_name: str
+        @param limit: Maximum number of C{ProcessSGE} objects
+        @type limit: int
+        @return: Python C{list} of Python C{int} or Python C{float} (wall time in seconds) objects
         @rtype: list
         """
 
-        object_list = list()
+        (where_clause, parameter_list) = self._build_drms_job_name_clause(drms_name=drms_name)
 
         cursor = self.database_connection.connection.cursor()
+        cursor.execute(
+            "SELECT ru_wallclock FROM {!r} "
+            "WHERE {} AND failed = '0' AND exit_status = 0 AND ru_wallclock IS NOT NULL "
+            "ORDER BY {} DESC LIMIT {:d}".format(
+                self.table_name,
+                where_clause,
+                self._get_column_name_for_primary(),
+                limit),
+            parameter_list)
+
+        return map(lambda x: x[0], cursor.fetchall())
+
+
+class ProcessSGESync(object):
+    """The C{ProcessSGESync} class models one synchronisation of C{ProcessSGE} objects with the
+    SGE accounting file.
+
+    The position after the last accounting record read, together with the job number and end time of
+    that record, records the high-water mark, from which the next synchronisation continues.
+    @ivar process_sge_sync_id: Primary key
+    @type process_sge_sync_id: int
+    @ivar sync_time: Time of the synchronisation in ISO 8601 format
+    @type sync_time: str
+    @ivar source: Accounting file path or I{qacct}
+    @type source: str
+    @ivar position: Byte offset into the accounting file or number of SGE qacct records read
+    @type position: int
+    @ivar job_number: Job number of the last accounting record read
+    @type job_number: str
+    @ivar end_time: End time of the last accounting record read in ISO 8601 format
+    @type end_time: str
+    @ivar job_count: Number of accounting records stored
+    @type job_count: int
+    """
 
-        if parameters:
-            cursor.execute(statement, parameters)
+    __slots__ = ('process_sge_sync_id', 'sync_time', 'source', 'position', 'job_number', 'end_time', 'job_count')
+
+    def __init__(self, process_sge_sync_id=None, sync_time=None, source=None, position=None, job_number=None,
+                 end_time=None, job_count=None):
+        """Initialise a C{ProcessSGESync} object.
+
+        @param process_sge_sync_id: Primary key
+        @type process_sge_sync_id: int
+        @param sync_time: Time of the synchronisation in ISO 8601 format
+        @type sync_time: str
+        @param source: Accounting file path or I{qacct}
+        @type source: str
+        @param position: Byte offset into the accounting file or number of SGE qacct records read
+        @type position: int
+        @param job_number: Job number of the last accounting record read
+        @type job_number: str
+        @param end_time: End time of the last accounting record read in ISO 8601 format
+        @type end_time: str
+        @param job_count: Number of accounting records stored
+        @type job_count: int
+        """
+
+        self.process_sge_sync_id = process_sge_sync_id
+        self.sync_time = sync_time
+        self.source = source
+        self.position = position
+        self.job_number = job_number
+        self.end_time = end_time
+        self.job_count = job_count
+
+
+class ProcessSGESyncAdaptor(DatabaseAdaptor):
+    """The C{ProcessSGESyncAdaptor} class provides database access for the C{ProcessSGESync} class.
+    """
+
+    def __init__(self, database_connection):
+        """Initialise a C{ProcessSGESyncAdaptor} object.
+
+        @param database_connection: C{DatabaseConnection}
+        @type database_connection: DatabaseConnection
+        """
+
+        super(ProcessSGESyncAdaptor, self).__init__(
+            database_connection=database_connection,
+            object_type=ProcessSGESync,
+            table_name='process_sge_sync',
+            column_definition=[
+                # Primary key
+                ['process_sge_sync_id', 'INTEGER PRIMARY KEY ASC AUTOINCREMENT'],
+                # Time of the synchronisation in ISO 8601 format
+                ['sync_time', 'TEXT'],
+                # Accounting file path or qacct
+                ['source', 'TEXT'],
+                # Byte offset into the accounting file or number of SGE qacct records read
+                ['position', 'INTEGER'],
+                # Job number of the last accounting record read
+                ['job_number', 'TEXT'],
+                # End time of the last accounting record read in ISO 8601 format
+                ['end_time', 'TEXT'],
+                # Number of accounting records stored
+                ['job_count', 'INTEGER']
+            ])
+
+    def select_latest(self, source):
+        """Select the latest C{ProcessSGESync} object for a source, which holds the current high-water mark.
+
+        @param source: Accounting file path or I{qacct}
+        @type source: str
+        @return: C{ProcessSGESync} or C{None}
+        @rtype: ProcessSGESync
+        """
+
+        statement = self.statement_select(where_clause='source = ?')
+        statement += " ORDER BY {} DESC LIMIT 1".format(self._get_column_name_for_primary())
+        parameters = list()
+        parameters.append(source)
+
+        object_list = self._objects_from_statement(statement=statement, parameters=parameters)
+
+        if len(object_list):
+            return object_list[0]
         else:
-            cursor.execute(statement)
+            return
+
+
+class ProcessLocal(object):
+    """The C{ProcessLocal} class models one process run on the local host by the C{bsf.drms.local} module.
+
+    @ivar process_local_id: Primary key
+    @type process_local_id: int
+    @ivar job_name: C{Executable.name}
+    @type job_name: str
+    @ivar hostname: Name of the host that ran the process
+    @type hostname: str
+    @ivar start_time: Start time in ISO 8601 format
+    @type start_time: str
+    @ivar wall_time: Wall time in seconds
+    @type wall_time: float
+    @ivar user_time: User CPU time in seconds
+    @type user_time: float
+    @ivar system_time: System CPU time in seconds
+    @type system_time: float
+    @ivar max_rss: Maximum resident set size in KiB
+    @type max_rss: int
+    @ivar exit_code: Exit code of the process, negative values indicate that the process received a signal
+    @type exit_code: int
+    @ivar state: Process state, which can be COMPLETED, FAILED or CANCELLED
+    @type state: str
+    """
+
+    __slots__ = (
+        'process_local_id', 'job_name', 'hostname', 'start_time', 'wall_time', 'user_time', 'system_time', 'max_rss',
+        'exit_code', 'state'
+    )
+
+    def __init__(self, process_local_id=None, job_name=None, hostname=None, start_time=None, wall_time=None,
+                 user_time=None, system_time=None, max_rss=None, exit_code=None, state=None):
+        """Initialise a C{ProcessLocal} object.
+
+        @param process_local_id: Primary key
+        @type process_local_id: int
+        @param job_name: C{Executable.name}
+        @type job_name: str
+        @param hostname: Name of the host that ran the process
+        @type hostname: str
+        @param start_time: Start time in ISO 8601 format
+        @type start_time: str
+        @param wall_time: Wall time in seconds
+        @type wall_time: float
+        @param user_time: User CPU time in seconds
+        @type user_time: float
+        @param system_time: System CPU time in seconds
+        @type system_time: float
+        @param max_rss: Maximum resident set size in KiB
+        @type max_rss: int
+        @param exit_code: Exit code of the process, negative values indicate that the process received a signal
+        @type exit_code: int
+        @param state: Process state, which can be COMPLETED, FAILED or CANCELLED
+        @type state: str
+        """
+
+        self.process_local_id = process_local_id
+        self.job_name = job_name
+        self.hostname = hostname
+        self.start_time = start_time
+        self.wall_time = wall_time
+        self.user_time = user_time
+        self.system_time = system_time
+        self.max_rss = max_rss
+        self.exit_code = exit_code
+        self.state = state
+
+
+class ProcessLocalAdaptor(DatabaseAdaptor):
+    """The C{ProcessLocalAdaptor} class provides database access for the C{ProcessLocal} class.
+    """
+
+    def __init__(self, database_connection):
+        """Initialise a C{ProcessLocalAdaptor} object.
+
+        @param database_connection: C{DatabaseConnection}
+        @type database_connection: DatabaseConnection
+        """
+
+        super(ProcessLocalAdaptor, self).__init__(
+            database_connection=database_connection,
+            object_type=ProcessLocal,
+            table_name='process_local',
+            column_definition=[
+                # Primary key
+                ['process_local_id', 'INTEGER PRIMARY KEY ASC AUTOINCREMENT'],
+                # Executable name
+                ['job_name', 'TEXT'],
+                # Host name
+                ['hostname', 'TEXT'],
+                # Start time in ISO 8601 format
+                ['start_time', 'TEXT'],
+                # Wall time in seconds
+                ['wall_time', 'REAL'],
+                # User CPU time in seconds
+                ['user_time', 'REAL'],
+                # System CPU time in seconds
+                ['system_time', 'REAL'],
+                # Maximum resident set size in KiB
+                ['max_rss', 'INTEGER'],
+                # Exit code, negative values indicate that the process received a signal
+                ['exit_code', 'INTEGER'],
+                # State (i.e. COMPLETED, FAILED or CANCELLED)
+                ['state', 'TEXT']
+            ],
+            index_definition=[
+                ['process_local_job_name', 'job_name']
+            ])
+
+    def select_all_by_job_name(self, name):
+        """Select all C{ProcessLocal} objects by job name.
+
+        The same C{Executable} can be run more than once.
+        @param name: Job name
+        @type name: str
+        @return: Python C{list} of C{ProcessLocal} objects
+        @rtype: list
+        """
+
+        statement = self.statement_select(where_clause='job_name = ?')
+        parameters = list()
+        parameters.append(name)
+
+        return self._objects_from_statement(statement=statement, parameters=parameters)
+
+    def select_state_dict(self):
+        """Select the latest state for each job name.
+
+        @return: Python C{dict} of Python C{str} (job_name) key data and Python C{str} (state) value data
+        @rtype: dict
+        """
+
+        state_dict = dict()
+
+        cursor = self.database_connection.connection.cursor()
+        cursor.execute("SELECT job_name, state FROM {!r} ORDER BY {} ASC".format(
+            self.table_name,
+            self._get_column_name_for_primary()))
 
         for row in cursor.fetchall():
-            object_instance = ProcessSGE()
-            object_list.append(object_instance)
-            i = 0
-            for name in map(lambda x: x[0], self.column_definition):
-                object_instance.__setattr__(name, row[i])
-                i += 1
-
-        return object_list
+            state_dict[row[0]] = row[1]
+
+        return state_dict
+
+    def select_wall_time_list(self, drms_name, limit=1000):
+        """Select the wall time of the latest successful C{ProcessLocal} objects of a C{DRMS} name.
+
+        @param drms_name: C{DRMS.name}
+        @type drms_name: str
+        @param limit: Maximum number of C{ProcessLocal} objects
+        @type limit: int
+        @return: Python C{list} of Python C{int} or Python C{float} (wall time in seconds) objects
+        @rtype: list
+        """
+
+        (where_clause, parameter_list) = self._build_drms_job_name_clause(drms_name=drms_name)
+
+        cursor = self.database_connection.connection.cursor()
+        cursor.execute(
+            "SELECT wall_time FROM {!r} "
+            "WHERE {} AND state = 'COMPLETED' AND wall_time IS NOT NULL "
+            "ORDER BY {} DESC LIMIT {:d}".format(
+                self.table_name,
+                where_clause,
+                self._get_column_name_for_primary(),
+                limit),
+            parameter_list)
+
+        return map(lambda x: x[0], cursor.fetchall())
+
+
+class ResourceSizing(object):
+    """The C{ResourceSizing} class models the resources requested for one C{Executable} of a C{DRMS}.
+
+    Resources are either predicted from the resource usage of earlier C{Executable} objects of the same
+    C{DRMS} name or taken from the static C{DRMS} configuration.
+    @ivar resource_sizing_id: Primary key
+    @type resource_sizing_id: int
+    @ivar drms_name: C{DRMS.name}
+    @type drms_name: str
+    @ivar job_name: C{Executable.name}
+    @type job_name: str
+    @ivar job_id: C{Executable.process_identifier} or C{None}, if the DRMS does not assign one
+    @type job_id: str
+    @ivar sizing_time: Time of the sizing in ISO 8601 format
+    @type sizing_time: str
+    @ivar input_size: Size of all input files in bytes
+    @type input_size: int
+    @ivar memory_limit: Memory limit requested in bytes
+    @type memory_limit: int
+    @ivar memory_source: Source of the memory limit, which can be I{history} or I{static}
+    @type memory_source: str
+    @ivar time_limit: Time limit requested in seconds
+    @type time_limit: int
+    @ivar time_source: Source of the time limit, which can be I{history} or I{static}
+    @type time_source: str
+    @ivar sample_count: Number of earlier C{Executable} objects the prediction is based on
+    @type sample_count: int
+    """
+
+    __slots__ = (
+        'resource_sizing_id', 'drms_name', 'job_name', 'job_id', 'sizing_time', 'input_size', 'memory_limit',
+        'memory_source', 'time_limit', 'time_source', 'sample_count'
+    )
+
+    def __init__(self, resource_sizing_id=None, drms_name=None, job_name=None, job_id=None, sizing_time=None,
+                 input_size=None, memory_limit=None, memory_source=None, time_limit=None, time_source=None,
+                 sample_count=None):
+        """Initialise a C{ResourceSizing} object.
+
+        @param resource_sizing_id: Primary key
+        @type resource_sizing_id: int
+        @param drms_name: C{DRMS.name}
+        @type drms_name: str
+        @param job_name: C{Executable.name}
+        @type job_name: str
+        @param job_id: C{Executable.process_identifier} or C{None}, if the DRMS does not assign one
+        @type job_id: str
+        @param sizing_time: Time of the sizing in ISO 8601 format
+        @type sizing_time: str
+        @param input_size: Size of all input files in bytes
+        @type input_size: int
+        @param memory_limit: Memory limit requested in bytes
+        @type memory_limit: int
+        @param memory_source: Source of the memory limit, which can be I{history} or I{static}
+        @type memory_source: str
+        @param time_limit: Time limit requested in seconds
+        @type time_limit: int
+        @param time_source: Source of the time limit, which can be I{history} or I{static}
+        @type time_source: str
+        @param sample_count: Number of earlier C{Executable} objects the prediction is based on
+        @type sample_count: int
+        """
+
+        self.resource_sizing_id = resource_sizing_id
+        self.drms_name = drms_name
+        self.job_name = job_name
+        self.job_id = job_id
+        self.sizing_time = sizing_time
+        self.input_size = input_size
+        self.memory_limit = memory_limit
+        self.memory_source = memory_source
+        self.time_limit = time_limit
+        self.time_source = time_source
+        self.sample_count = sample_count
+
+
+class ResourceSizingAdaptor(DatabaseAdaptor):
+    """The C{ResourceSizingAdaptor} class provides database access for the C{ResourceSizing} class.
+    """
+
+    def __init__(self, database_connection):
+        """Initialise a C{ResourceSizingAdaptor} object.
+
+        @param database_connection: C{DatabaseConnection}
+        @type database_connection: DatabaseConnection
+        """
+
+        super(ResourceSizingAdaptor, self).__init__(
+            database_connection=database_connection,
+            object_type=ResourceSizing,
+            table_name='resource_sizing',
+            column_definition=[
+                # Primary key
+                ['resource_sizing_id', 'INTEGER PRIMARY KEY ASC AUTOINCREMENT'],
+                # DRMS name
+                ['drms_name', 'TEXT'],
+                # Executable name
+                ['job_name', 'TEXT'],
+                # Process identifier assigned by the DRMS
+                ['job_id', 'TEXT'],
+                # Time of the sizing in ISO 8601 format
+                ['sizing_time', 'TEXT'],
+                # Size of all input files in bytes
+                ['input_size', 'INTEGER'],
+                # Memory limit requested in bytes
+                ['memory_limit', 'INTEGER'],
+                # Source of the memory limit (i.e. history or static)
+                ['memory_source', 'TEXT'],
+                # Time limit requested in seconds
+                ['time_limit', 'INTEGER'],
+                # Source of the time limit (i.e. history or static)
+                ['time_source', 'TEXT'],
+                # Number of earlier Executable objects the prediction is based on
+                ['sample_count', 'INTEGER']
+            ],
+            index_definition=[
+                ['resource_sizing_drms_name', 'drms_name']
+            ])
+
+    def select_usage_list(self, drms_name, implementation, limit=1000):
+        """Select the input size and the resource usage of the latest successful C{Executable} objects of a C{DRMS}.
+
+        The resource usage is looked up in the table of the C{DRMS} implementation, via the job identifier for
+        I{slurm} (including all job steps) and I{sge} or via the job name for I{local}.
+        @param drms_name: C{DRMS.name}
+        @type drms_name: str
+        @param implementation: C{DRMS.implementation} (i.e. I{slurm}, I{sge} or I{local})
+        @type implementation: str
+        @param limit: Maximum number of C{Executable} objects
+        @type limit: int
+        @return: Python C{list} of Python C{tuple} objects of
+            Python C{int} (input size in bytes), Python C{int} (memory in bytes) and
+            Python C{int} (wall time in seconds) objects
+        @rtype: list
+        """
+
+        if implementation == 'slurm':
+            # Job steps (e.g. 1234.batch) sort between the job identifier and the job identifier followed by '/'.
+            statement = \
+                "SELECT r.input_size, MAX(s.max_rss), MAX(s.elapsed) FROM {!r} AS r " \
+                "JOIN process_slurm AS j ON j.job_id = r.job_id AND j.state = 'COMPLETED' " \
+                "JOIN process_slurm AS s ON s.job_id >= r.job_id AND s.job_id < r.job_id || '/' " \
+                "WHERE r.drms_name = ? GROUP BY r.{} ".format(self.table_name, self._get_column_name_for_primary())
+        elif implementation == 'sge':
+            statement = \
+                "SELECT r.input_size, MAX(p.maxvmem), MAX(p.ru_wallclock) FROM {!r} AS r " \
+                "JOIN process_sge AS p ON p.job_number = r.job_id AND p.failed = '0' AND p.exit_status = 0 " \
+                "WHERE r.drms_name = ? GROUP BY r.{} ".format(self.table_name, self._get_column_name_for_primary())
+        elif implementation == 'local':
+            statement = \
+                "SELECT r.input_size, MAX(p.max_rss) * 1024, MAX(p.wall_time) FROM {!r} AS r " \
+                "JOIN process_local AS p ON p.job_name = r.job_name AND p.state = 'COMPLETED' " \
+                "WHERE r.drms_name = ? GROUP BY r.{} ".format(self.table_name, self._get_column_name_for_primary())
+        else:
+            return list()
+
+        statement += "ORDER BY r.{} DESC LIMIT {:d}".format(self._get_column_name_for_primary(), limit)
+        parameters = list()
+        parameters.append(drms_name)
+
+        cursor = self.connection.cursor()
+        cursor.execute(statement, parameters)
+
+        return cursor.fetchall()
+
+
+class StatusPoll(object):
+    """The C{StatusPoll} class models the number of C{Executable} objects of a C{DRMS} in each state
+    at the time of a status poll.
+
+    Attributes:
+    @ivar status_poll_id: Primary key
+    @type status_poll_id: int
+    @ivar poll_time: Time of the poll in ISO 8601 format
+    @type poll_time: str
+    @ivar drms_name: C{DRMS.name}
+    @type drms_name: str
+    @ivar pending: Number of pending C{Executable} objects
+    @type pending: int
+    @ivar running: Number of running C{Executable} objects
+    @type running: int
+    @ivar failed: Number of failed or cancelled C{Executable} objects
+    @type failed: int
+    @ivar done: Number of successfully completed C{Executable} objects
+    @type done: int
+    @ivar unknown: Number of C{Executable} objects in an unknown state (e.g. finished, but not yet accounted)
+    @type unknown: int
+    """
+
+    __slots__ = ('status_poll_id', 'poll_time', 'drms_name', 'pending', 'running', 'failed', 'done', 'unknown')
+
+    def __init__(self, status_poll_id=None, poll_time=None, drms_name=None,
+                 pending=0, running=0, failed=0, done=0, unknown=0):
+        """Initialise a C{StatusPoll} object.
+
+        @param status_poll_id: Primary key
+        @type status_poll_id: int
+        @param poll_time: Time of the poll in ISO 8601 format
+        @type poll_time: str
+        @param drms_name: C{DRMS.name}
+        @type drms_name: str
+        @param pending: Number of pending C{Executable} objects
+        @type pending: int
+        @param running: Number of running C{Executable} objects
+        @type running: int
+        @param failed: Number of failed or cancelled C{Executable} objects
+        @type failed: int
+        @param done: Number of successfully completed C{Executable} objects
+        @type done: int
+        @param unknown: Number of C{Executable} objects in an unknown state
+        @type unknown: int
+        """
+
+        self.status_poll_id = status_poll_id
+        self.poll_time = poll_time
+        self.drms_name = drms_name
+        self.pending = pending
+        self.running = running
+        self.failed = failed
+        self.done = done
+        self.unknown = unknown
+
+
+class StatusPollAdaptor(DatabaseAdaptor):
+    """The C{StatusPollAdaptor} class provides database access for the C{StatusPoll} class.
+    """
+
+    def __init__(self, database_connection):
+        """Initialise a C{StatusPollAdaptor} object.
+
+        @param database_connection: C{DatabaseConnection}
+        @type database_connection: DatabaseConnection
+        """
+
+        super(StatusPollAdaptor, self).__init__(
+            database_connection=database_connection,
+            object_type=StatusPoll,
+            table_name='status_poll',
+            column_definition=[
+                # Primary key
+                ['status_poll_id', 'INTEGER PRIMARY KEY ASC AUTOINCREMENT'],
+                # Time of the poll in ISO 8601 format
+                ['poll_time', 'TEXT'],
+                # DRMS name
+                ['drms_name', 'TEXT'],
+                # Number of pending Executable objects
+                ['pending', 'INTEGER'],
+                # Number of running Executable objects
+                ['running', 'INTEGER'],
+                # Number of failed or cancelled Executable objects
+                ['failed', 'INTEGER'],
+                # Number of successfully completed Executable objects
+                ['done', 'INTEGER'],
+                # Number of Executable objects in an unknown state
+                ['unknown', 'INTEGER']
+            ],
+            index_definition=[
+                ['status_poll_drms_name_poll_time', 'drms_name, poll_time']
+            ])
+
+    def select_earliest(self, drms_name, poll_time):
+        """Select the earliest C{StatusPoll} of a C{DRMS} at or after a point in time.
+
+        @param drms_name: C{DRMS.name}
+        @type drms_name: str
+        @param poll_time: Time in ISO 8601 format
+        @type poll_time: str
+        @return: C{StatusPoll} or C{None}
+        @rtype: StatusPoll | None
+        """
+
+        statement = self.statement_select(where_clause='drms_name = ? AND poll_time >= ?')
+        statement += " ORDER BY poll_time ASC LIMIT 1"
+        parameters = list()
+        parameters.append(drms_name)
+        parameters.append(poll_time)
+
+        object_list = self._objects_from_statement(statement=statement, parameters=parameters)
+
+        if len(object_list):
+            return object_list[0]
+        else:
+            return
+
+
+class ResultCache(object):
+    """The C{ResultCache} class models the cached result of one C{Executable}.
+
+    The cache key is a digest of the command line, the fingerprints of the declared input files and of the
+    program. The output manifest is only recorded, once the job of a submission with the same cache key
+    has completed successfully according to the job database and all declared output files have been found.
+
+    Attributes:
+    @ivar result_cache_id: Primary key
+    @type result_cache_id: int
+    @ivar name: C{Executable.name}
+    @type name: str
+    @ivar cache_key: Hexadecimal digest of the command line and input and program fingerprints
+    @type cache_key: str
+    @ivar command: Command line
+    @type command: str
+    @ivar submission_time: Time of the latest submission in ISO 8601 format
+    @type submission_time: str
+    @ivar job_name: Name of the job of the latest submission, which is the name of the packing C{Executable},
+        if the C{Executable} has been packed
+    @type job_name: str
+    @ivar completion_time: Time the output files were recorded in ISO 8601 format or C{None}
+    @type completion_time: str
+    @ivar output_manifest: JSON object of output file paths and their size and modification time or C{None}
+    @type output_manifest: str
+    """
+
+    __slots__ = (
+        'result_cache_id', 'name', 'cache_key', 'command', 'submission_time', 'job_name', 'completion_time',
+        'output_manifest'
+    )
+
+    def __init__(self, result_cache_id=None, name=None, cache_key=None, command=None, submission_time=None,
+                 job_name=None, completion_time=None, output_manifest=None):
+        """Initialise a C{ResultCache} object.
+
+        @param result_cache_id: Primary key
+        @type result_cache_id: int
+        @param name: C{Executable.name}
+        @type name: str
+        @param cache_key: Hexadecimal digest of the command line and input and program fingerprints
+        @type cache_key: str
+        @param command: Command line
+        @type command: str
+        @param submission_time: Time of the latest submission in ISO 8601 format
+        @type submission_time: str
+        @param job_name: Name of the job of the latest submission, which is the name of the packing
+            C{Executable}, if the C{Executable} has been packed
+        @type job_name: str
+        @param completion_time: Time the output files were recorded in ISO 8601 format or C{None}
+        @type completion_time: str
+        @param output_manifest: JSON object of output file paths and their size and modification time or C{None}
+        @type output_manifest: str
+        """
+
+        self.result_cache_id = result_cache_id
+        self.name = name
+        self.cache_key = cache_key
+        self.command = command
+        self.submission_time = submission_time
+        self.job_name = job_name
+        self.completion_time = completion_time
+        self.output_manifest = output_manifest
+
+
+class ResultCacheAdaptor(DatabaseAdaptor):
+    """The C{ResultCacheAdaptor} class provides database access for the C{ResultCache} class.
+    """
+
+    def __init__(self, database_connection):
+        """Initialise a C{ResultCacheAdaptor} object.
+
+        @param database_connection: C{DatabaseConnection}
+        @type database_connection: DatabaseConnection
+        """
+
+        super(ResultCacheAdaptor, self).__init__(
+            database_connection=database_connection,
+            object_type=ResultCache,
+            table_name='result_cache',
+            column_definition=[
+                # Primary key
+                ['result_cache_id', 'INTEGER PRIMARY KEY ASC AUTOINCREMENT'],
+                # Executable name
+                ['name', 'TEXT UNIQUE'],
+                # Digest of the command line and input and program fingerprints
+                ['cache_key', 'TEXT'],
+                # Command line
+                ['command', 'TEXT'],
+                # Time of the latest submission in ISO 8601 format
+                ['submission_time', 'TEXT'],
+                # Name of the job of the latest submission
+                ['job_name', 'TEXT'],
+                # Time the output files were recorded in ISO 8601 format
+                ['completion_time', 'TEXT'],
+                # JSON object of output file paths and their size and modification time
+                ['output_manifest', 'TEXT']
+            ])
+
+    def select_name_dict(self, name_list):
+        """Select C{ResultCache} objects by name.
+
+        @param name_list: Python C{list} of Python C{str} (C{Executable.name}) objects
+        @type name_list: list
+        @return: Python C{dict} of Python C{str} (C{Executable.name}) key data and C{ResultCache} value data
+        @rtype: dict
+        """
+
+        name_dict = dict()
+
+        # Look up names in chunks via the unique index, to stay below the SQLite limit of host parameters.
+
+        name_list = sorted(set(name_list))
+        chunk_size = 500
+        for i in range(0, len(name_list), chunk_size):
+            chunk_list = name_list[i:i + chunk_size]
+            statement = self.statement_select(
+                where_clause='name IN ({})'.format(string.join(words=map(lambda x: '?', chunk_list), sep=', ')))
+
+            for result_cache in self._objects_from_statement(statement=statement, parameters=chunk_list):
+                name_dict[result_cache.name] = result_cache
+
+        return name_dict
@@ -25,3 +25,643 @@ A package of classes and methods supporting a Distributed Resource Management Sy
 #
 # You should have received a copy of the GNU Lesser General Public License
 # along with BSF Python.  If not, see <http://www.gnu.org/licenses/>.
+
+
+import datetime
+import hashlib
+import importlib
+import json
+import math
+import os
+import Queue
+import re
+import string
+import threading
+import time
+
+from bsf.database import DatabaseConnection, JobSubmissionAdaptor, ResourceSizing, ResourceSizingAdaptor, \
+    ResultCache, ResultCacheAdaptor
+
+
+# Minimum memory limit in MiB and granularity of predicted memory limits.
+sizing_memory_minimum = 256
+
+# Minimum time limit in minutes of predicted time limits.
+sizing_minutes_minimum = 10
+
+
+def get_wave_list(executables):
+    """Get topological waves of C{Executable} objects.
+
+    The first wave contains all C{Executable} objects that do not depend on any other C{Executable}
+    in the list, each subsequent wave all C{Executable} objects that depend only on C{Executable}
+    objects of earlier waves. Dependencies on C{Executable} objects that are not in the list are
+    ignored. Within each wave, C{Executable} objects keep the order of the list.
+    @param executables: Python C{list} of C{Executable} objects
+    @type executables: list
+    @return: Python C{list} of Python C{list} objects of C{Executable} objects
+    @rtype: list
+    """
+
+    # Map names to list indices, to cope with Executable objects sharing a name.
+
+    index_dict = dict()
+    for index in range(0, len(executables)):
+        index_dict.setdefault(executables[index].name, list()).append(index)
+
+    dependency_list = list()
+    dependent_list = list()
+    for index in range(0, len(executables)):
+        dependency_list.append(set())
+        dependent_list.append(list())
+
+    for index in range(0, len(executables)):
+        for executable_name in executables[index].dependencies:
+            for dependency_index in index_dict.get(executable_name, list()):
+                if dependency_index != index and dependency_index not in dependency_list[index]:
+                    dependency_list[index].add(dependency_index)
+                    dependent_list[dependency_index].append(index)
+
+    wave_list = list()
+    count = 0
+
+    index_list = filter(lambda x: not len(dependency_list[x]), range(0, len(executables)))
+
+    while len(index_list):
+        wave_list.append(map(lambda x: executables[x], index_list))
+        count += len(index_list)
+
+        next_index_list = list()
+        for index in index_list:
+            for dependent_index in dependent_list[index]:
+                dependency_list[dependent_index].discard(index)
+                if not len(dependency_list[dependent_index]):
+                    next_index_list.append(dependent_index)
+
+        index_list = sorted(next_index_list)
+
+    if count < len(executables):
+        raise Exception(
+            'Circular dependencies among Executable objects {!r}.'.
+            format(map(lambda x: executables[x].name, filter(lambda x: len(dependency_list[x]),
+                                                            range(0, len(executables))))))
+
+    return wave_list
+
+
+def run_concurrently(function, keywords_list, threads=1):
+    """Call a function for each Python C{dict} of keyword arguments, with a bounded number of concurrent threads.
+
+    All calls are completed, before the first exception raised by any call, if any, is raised again.
+    @param function: Function
+    @type function: function
+    @param keywords_list: Python C{list} of Python C{dict} objects of keyword arguments
+    @type keywords_list: list
+    @param threads: Maximum number of concurrent threads, 1 calls the function in the current thread
+    @type threads: int
+    """
+
+    if threads < 2 or len(keywords_list) < 2:
+        for keywords in keywords_list:
+            function(**keywords)
+        return
+
+    keywords_queue = Queue.Queue()
+    for keywords in keywords_list:
+        keywords_queue.put(keywords)
+
+    exception_list = list()
+
+    def worker():
+        while True:
+            try:
+                worker_keywords = keywords_queue.get(block=False)
+            except Queue.Empty:
+                return
+            try:
+                function(**worker_keywords)
+            except Exception as exception:
+                exception_list.append(exception)
+
+    thread_list = list()
+    for index in range(0, min(threads, len(keywords_list))):
+        thread = threading.Thread(target=worker)
+        thread.daemon = True
+        thread.start()
+        thread_list.append(thread)
+
+    for thread in thread_list:
+        thread.join()
+
+    if len(exception_list):
+        raise exception_list[0]
+
+
+def get_memory(memory):
+    """Get the memory in MiB from a memory specification with an optional I{k}, I{M}, I{G} or I{T} suffix.
+
+    As for SLURM, a memory specification without suffix is in MiB.
+    @param memory: Memory specification
+    @type memory: str
+    @return: Memory in MiB or 0, if the memory specification could not be parsed
+    @rtype: int
+    """
+
+    factor_dict = {'k': 1.0 / 1024, 'm': 1, '': 1, 'g': 1024, 't': 1024 * 1024}
+
+    match = re.search(pattern=r'^(\d+)([kKmMgGtT]?)$', string=str(memory))
+
+    if not match:
+        return 0
+
+    return int(int(match.group(1)) * factor_dict[match.group(2).lower()])
+
+
+def get_input_size(executable, input_size_dict):
+    """Get the size of all input files of an C{Executable}.
+
+    Input files are the ones on the C{Executable.input_path_list} or, if none have been declared,
+    all existing files on the command line. If none of the input files exist yet, e.g. since they are
+    written by other C{Executable} objects, the input sizes of the C{Executable} objects it depends on
+    are summed up.
+    @param executable: C{Executable}
+    @type executable: Executable
+    @param input_size_dict: Python C{dict} of Python C{str} (C{Executable.name}) key data and
+        Python C{int} (input size in bytes) value data
+    @type input_size_dict: dict
+    @return: Input size in bytes
+    @rtype: int
+    """
+
+    if len(executable.input_path_list):
+        file_path_list = executable.input_path_list
+    else:
+        # Skip the program and consider the value of KEY=VALUE style options, too.
+        file_path_list = map(lambda x: x.split('=')[-1], executable.command_list()[1:])
+
+    input_size = 0
+
+    for file_path in set(file_path_list):
+        if os.path.isfile(file_path):
+            input_size += os.path.getsize(file_path)
+
+    if not input_size:
+        for executable_name in executable.dependencies:
+            input_size += input_size_dict.get(executable_name, 0)
+
+    return input_size
+
+
+def _get_quantile(value_list, fraction):
+    """Get a quantile of a Python C{list} of values.
+
+    @param value_list: Python C{list} of Python C{int} or Python C{float} objects
+    @type value_list: list
+    @param fraction: Fraction of values that are lower than or equal to the quantile
+    @type fraction: float
+    @return: Quantile
+    @rtype: float
+    """
+
+    value_list = sorted(value_list)
+
+    return float(value_list[min(len(value_list) - 1, max(0, int(math.ceil(fraction * len(value_list))) - 1))])
+
+
+def _predict_usage(sample_list, input_size, margin):
+    """Predict the resource usage for an input size from earlier samples.
+
+    If the samples cover different input sizes, a straight line is fitted by least squares, to which the
+    95% quantile of the residuals is added, so that fixed costs and costs scaling with the input size are
+    both accounted for. Otherwise, the 95% quantile of the samples is used. The prediction is scaled
+    by the safety margin.
+    @param sample_list: Python C{list} of Python C{tuple} objects of Python C{int} (input size) and
+        Python C{int} or Python C{float} (usage) objects
+    @type sample_list: list
+    @param input_size: Input size in bytes
+    @type input_size: int
+    @param margin: Safety margin factor
+    @type margin: float
+    @return: Predicted usage
+    @rtype: float
+    """
+
+    size_list = map(lambda x: x[0] or 0, sample_list)
+    usage_list = map(lambda x: x[1], sample_list)
+
+    if not input_size or len(set(size_list)) < 2:
+        return _get_quantile(value_list=usage_list, fraction=0.95) * margin
+
+    mean_size = float(sum(size_list)) / len(size_list)
+    mean_usage = float(sum(usage_list)) / len(usage_list)
+
+    variance = sum(map(lambda x: (x - mean_size) ** 2, size_list))
+    covariance = sum(map(lambda x, y: (x - mean_size) * (y - mean_usage), size_list, usage_list))
+
+    slope = max(0.0, covariance / variance)
+    intercept = mean_usage - slope * mean_size
+
+    residual_list = map(lambda x, y: y - (intercept + slope * x), size_list, usage_list)
+
+    return max(0.0, intercept + slope * input_size + _get_quantile(value_list=residual_list, fraction=0.95)) * margin
+
+
+def get_job_database_connection(drms):
+    """Get the C{DatabaseConnection} for the job database of a C{DRMS} with the resource usage.
+
+    This is the job database set via C{DRMS.sizing_database} or else the one of the C{DRMS.implementation}
+    in the C{DRMS.work_directory}.
+    @param drms: Distributed Resource Management System (C{DRMS})
+    @type drms: DRMS
+    @return: C{DatabaseConnection}
+    @rtype: DatabaseConnection
+    """
+
+    if drms.sizing_database:
+        database_path = drms.sizing_database
+    else:
+        database_path = os.path.join(drms.work_directory, 'bsfpython_{}_jobs.db'.format(drms.implementation))
+
+    database_connection = DatabaseConnection(file_path=database_path, write_ahead_log=drms.database_write_ahead_log)
+    database_connection.create_schema()
+
+    return database_connection
+
+
+def size_executables(drms):
+    """Predict the memory and time limits of the C{Executable} objects of a C{DRMS} from their history.
+
+    The input size and resource usage (i.e. maximum memory and wall time) of up to 1000 earlier successful
+    C{Executable} objects of the same C{DRMS.name} are read from the job database. Once at least
+    C{DRMS.sizing_samples} of them are available, the C{Executable.memory_limit_hard} and
+    C{Executable.time_limit} instance variables are set to the predicted usage for the input size of each
+    C{Executable}, including a safety margin of C{DRMS.sizing_margin}. Otherwise, the static limits of
+    the C{DRMS} apply. Memory limits are rounded up to multiples of C{sizing_memory_minimum} MiB and time
+    limits are at least C{sizing_minutes_minimum} minutes.
+    @param drms: Distributed Resource Management System (C{DRMS})
+    @type drms: DRMS
+    @return: Python C{list} of C{ResourceSizing} objects to record after submission
+    @rtype: list
+    """
+
+    database_connection = get_job_database_connection(drms=drms)
+    resource_sizing_adaptor = ResourceSizingAdaptor(database_connection=database_connection)
+
+    usage_list = resource_sizing_adaptor.select_usage_list(drms_name=drms.name, implementation=drms.implementation)
+
+    memory_sample_list = map(lambda x: (x[0], x[1]), filter(lambda x: x[1], usage_list))
+    time_sample_list = map(lambda x: (x[0], x[2]), filter(lambda x: x[2], usage_list))
+
+    static_memory = get_memory(memory=drms.memory_limit_hard) * 1024 * 1024 or None
+    static_time = drms.get_minutes(time_limit=drms.time_limit) * 60 or None
+
+    sizing_time = datetime.datetime.now().strftime('%Y-%m-%dT%H:%M:%S')
+
+    resource_sizing_list = list()
+
+    for executable in drms.executables:
+        if not executable.submit:
+            continue
+
+        input_size = get_input_size(executable=executable, input_size_dict=drms.input_size_dict)
+        drms.input_size_dict[executable.name] = input_size
+
+        resource_sizing = ResourceSizing(
+            drms_name=drms.name,
+            job_name=executable.name,
+            sizing_time=sizing_time,
+            input_size=input_size,
+            memory_limit=static_memory,
+            memory_source='static',
+            time_limit=static_time,
+            time_source='static',
+            sample_count=len(usage_list))
+
+        if len(memory_sample_list) >= drms.sizing_samples:
+            memory = _predict_usage(sample_list=memory_sample_list, input_size=input_size, margin=drms.sizing_margin)
+            memory = int(math.ceil(memory / 1024 / 1024 / sizing_memory_minimum)) * sizing_memory_minimum
+            memory = max(sizing_memory_minimum, memory)
+            executable.memory_limit_hard = '{:d}M'.format(memory)
+            resource_sizing.memory_limit = memory * 1024 * 1024
+            resource_sizing.memory_source = 'history'
+
+        if len(time_sample_list) >= drms.sizing_samples:
+            minutes = _predict_usage(sample_list=time_sample_list, input_size=input_size, margin=drms.sizing_margin)
+            minutes = max(sizing_minutes_minimum, int(math.ceil(minutes / 60)))
+            executable.time_limit = drms.get_time_limit(minutes=minutes)
+            resource_sizing.time_limit = minutes * 60
+            resource_sizing.time_source = 'history'
+
+        resource_sizing_list.append(resource_sizing)
+
+    return resource_sizing_list
+
+
+def record_sizing(drms, resource_sizing_list):
+    """Record C{ResourceSizing} objects together with the process identifiers assigned after submission.
+
+    @param drms: Distributed Resource Management System (C{DRMS})
+    @type drms: DRMS
+    @param resource_sizing_list: Python C{list} of C{ResourceSizing} objects
+    @type resource_sizing_list: list
+    """
+
+    executable_dict = dict(map(lambda x: (x.name, x), drms.executables))
+
+    for resource_sizing in resource_sizing_list:
+        if executable_dict[resource_sizing.job_name].process_identifier:
+            resource_sizing.job_id = executable_dict[resource_sizing.job_name].process_identifier
+
+    database_connection = get_job_database_connection(drms=drms)
+    resource_sizing_adaptor = ResourceSizingAdaptor(database_connection=database_connection)
+    resource_sizing_adaptor.insert_many(data_object_list=resource_sizing_list)
+
+
+def _get_file_fingerprint(file_path):
+    """Get the fingerprint of a file.
+
+    @param file_path: File path
+    @type file_path: str | unicode
+    @return: Python C{list} of Python C{int} (size) and Python C{float} (modification time) or C{None},
+        if the file does not exist
+    @rtype: list | None
+    """
+
+    try:
+        stat_result = os.stat(file_path)
+    except OSError:
+        return
+
+    return [stat_result.st_size, stat_result.st_mtime]
+
+
+def _get_program_path(program):
+    """Get the file path of a program, searching the PATH environment variable for a program without a directory.
+
+    @param program: Program
+    @type program: str
+    @return: Program file path or C{None}, if it could not be found
+    @rtype: str | None
+    """
+
+    if not program:
+        return
+
+    if os.path.dirname(program):
+        return program
+
+    for directory in os.environ.get('PATH', '').split(os.pathsep):
+        file_path = os.path.join(directory, program)
+        if os.path.isfile(file_path) and os.access(file_path, os.X_OK):
+            return file_path
+
+    return
+
+
+def get_cache_key(executable, output_key_dict):
+    """Get the result cache key of an C{Executable}.
+
+    The key is a digest of the command line, the fingerprints (i.e. size and modification time) of all files
+    on the C{Executable.input_path_list} and the fingerprint of the program, which stands in for its version.
+    Input files written by an upstream C{Executable} are represented by the cache key of that C{Executable}
+    rather than by their fingerprints, since they may not exist yet, so that the key remains the same until
+    the upstream C{Executable} changes.
+    @param executable: C{Executable}
+    @type executable: Executable
+    @param output_key_dict: Python C{dict} of Python C{str} (output file path) key data and
+        Python C{str} (cache key of the upstream C{Executable}) value data
+    @type output_key_dict: dict
+    @return: Hexadecimal SHA-1 digest
+    @rtype: str
+    """
+
+    input_list = list()
+
+    for file_path in sorted(set(executable.input_path_list)):
+        if file_path in output_key_dict:
+            input_list.append([file_path, output_key_dict[file_path]])
+        else:
+            input_list.append([file_path, _get_file_fingerprint(file_path=file_path)])
+
+    program_path = _get_program_path(program=executable.command)
+    if program_path:
+        program_list = [program_path, _get_file_fingerprint(file_path=program_path)]
+    else:
+        program_list = [executable.command, None]
+
+    return hashlib.sha1(json.dumps(obj=[executable.command_str(), input_list, program_list])).hexdigest()
+
+
+def get_result_cache_connection(drms):
+    """Get the C{DatabaseConnection} for the result cache in the C{DRMS.work_directory}.
+
+    The result cache is shared by all C{DRMS} implementations.
+    @param drms: Distributed Resource Management System (C{DRMS})
+    @type drms: DRMS
+    @return: C{DatabaseConnection}
+    @rtype: DatabaseConnection
+    """
+
+    database_connection = DatabaseConnection(
+        file_path=os.path.join(drms.work_directory, 'bsfpython_result_cache.db'),
+        write_ahead_log=drms.database_write_ahead_log)
+    database_connection.create_schema()
+
+    return database_connection
+
+
+def synchronise_job_database(module, database_connection):
+    """Synchronise the accounting records of a job database via a C{bsf.drms} implementation module.
+
+    Implementations without a C{synchronise_accounting} function are not synchronised. If the module
+    provides a C{get_accounting_file_path} function (e.g. SGE), the accounting file is read, as by the
+    bsf_sge_accounting.py script, so that both continue at the same high-water mark.
+    @param module: C{bsf.drms} implementation module
+    @type module: module
+    @param database_connection: C{DatabaseConnection}
+    @type database_connection: DatabaseConnection
+    """
+
+    if not hasattr(module, 'synchronise_accounting'):
+        return
+
+    if hasattr(module, 'get_accounting_file_path'):
+        accounting_path = module.get_accounting_file_path()
+        if accounting_path and os.path.isfile(accounting_path):
+            module.synchronise_accounting(database_connection=database_connection, file_path=accounting_path)
+            return
+
+    module.synchronise_accounting(database_connection=database_connection)
+
+
+def _get_completed_job_name_set(drms, job_name_list):
+    """Get the names of jobs of a C{DRMS} that have completed successfully according to its job database.
+
+    The accounting records of the job database are synchronised first. Implementations without a
+    C{get_job_state_dict} function (e.g. bash) never report jobs as completed.
+    @param drms: Distributed Resource Management System (C{DRMS})
+    @type drms: DRMS
+    @param job_name_list: Python C{list} of Python C{str} (C{JobSubmission.name}) objects
+    @type job_name_list: list
+    @return: Python C{set} of Python C{str} (C{JobSubmission.name}) objects
+    @rtype: set
+    """
+
+    module = importlib.import_module(string.join(words=(__name__, drms.implementation), sep='.'))
+
+    if not hasattr(module, 'get_job_state_dict'):
+        return set()
+
+    database_path = os.path.join(drms.work_directory, 'bsfpython_{}_jobs.db'.format(drms.implementation))
+
+    if not os.path.exists(database_path):
+        return set()
+
+    database_connection = DatabaseConnection(file_path=database_path, write_ahead_log=drms.database_write_ahead_log)
+    database_connection.create_schema()
+
+    synchronise_job_database(module=module, database_connection=database_connection)
+
+    job_name_set = set(job_name_list)
+    job_submission_adaptor = JobSubmissionAdaptor(database_connection=database_connection)
+    job_state_dict = module.get_job_state_dict(
+        job_submission_list=filter(
+            lambda x: x.name in job_name_set,
+            job_submission_adaptor.select_all_by_drms_name(drms_name=drms.name)),
+        database_connection=database_connection)
+
+    return set(filter(lambda x: job_state_dict[x] == 'done', job_state_dict))
+
+
+def consult_result_cache(drms, submitted_name_set, output_key_dict, debug=0):
+    """Mark C{Executable} objects of a C{DRMS} as satisfied by their cached results.
+
+    Only C{Executable} objects that declare output files via the C{Executable.output_path_list} are cached.
+    An C{Executable} is satisfied and its C{Executable.submit} instance variable set to C{False}, if its
+    cache key is unchanged, none of the C{Executable} objects it depends on gets submitted and its output
+    files still match the output manifest. If no output manifest has been recorded yet, the manifest is
+    recorded, once the job of the latest submission with the same cache key has completed successfully
+    according to the job database (see C{bsf.drms.synchronise_job_database}) and all output files exist and
+    have been modified since that submission. Since this needs to happen before C{Executable} objects
+    get packed, C{DRMS.pack} calls this function.
+    All C{Executable} objects that get submitted are added to the set of submitted names, so that
+    dependent C{Executable} objects in this or subsequent C{DRMS} objects get submitted, too.
+    The cache keys of all C{Executable} objects are added to the output key dict for each of their
+    output files, so that the cache keys of dependent C{Executable} objects can be derived from them.
+    @param drms: Distributed Resource Management System (C{DRMS})
+    @type drms: DRMS
+    @param submitted_name_set: Python C{set} of Python C{str} (C{Executable.name}) objects to be submitted
+    @type submitted_name_set: set
+    @param output_key_dict: Python C{dict} of Python C{str} (output file path) key data and
+        Python C{str} (cache key) value data
+    @type output_key_dict: dict
+    @param debug: Debug level
+    @type debug: int
+    @return: Python C{list} of C{ResultCache} objects to record after submission
+    @rtype: list
+    """
+
+    database_connection = get_result_cache_connection(drms=drms)
+    result_cache_adaptor = ResultCacheAdaptor(database_connection=database_connection)
+
+    result_cache_dict = result_cache_adaptor.select_name_dict(
+        name_list=map(lambda x: x.name, filter(lambda x: len(x.output_path_list), drms.executables)))
+
+    # Look up the jobs of all submissions without an output manifest at once.
+
+    job_name_list = map(
+        lambda x: x.job_name,
+        filter(lambda x: x.job_name and not x.output_manifest, result_cache_dict.itervalues()))
+
+    if len(job_name_list):
+        completed_job_name_set = _get_completed_job_name_set(drms=drms, job_name_list=job_name_list)
+    else:
+        completed_job_name_set = set()
+
+    current_time = datetime.datetime.now().strftime('%Y-%m-%dT%H:%M:%S')
+
+    completed_list = list()
+    result_cache_list = list()
+
+    for wave in get_wave_list(executables=drms.executables):
+        for executable in wave:
+            if not executable.submit:
+                continue
+
+            if not len(executable.output_path_list):
+                submitted_name_set.add(executable.name)
+                continue
+
+            cache_key = get_cache_key(executable=executable, output_key_dict=output_key_dict)
+            for file_path in executable.output_path_list:
+                output_key_dict[file_path] = cache_key
+
+            result_cache = result_cache_dict.get(executable.name)
+            reason = None
+
+            if filter(lambda x: x in submitted_name_set, executable.dependencies):
+                reason = 'a dependency gets submitted'
+            elif result_cache is None:
+                reason = 'no result has been cached'
+            elif result_cache.cache_key != cache_key:
+                reason = 'the command line, input files or program changed'
+            elif result_cache.output_manifest:
+                output_dict = json.loads(result_cache.output_manifest)
+                for file_path in executable.output_path_list:
+                    if output_dict.get(file_path) is None or \
+                            _get_file_fingerprint(file_path=file_path) != output_dict[file_path]:
+                        reason = 'output file {!r} changed'.format(file_path)
+                        break
+            elif result_cache.job_name not in completed_job_name_set:
+                reason = 'the latest submission has not completed successfully'
+            else:
+                # Accept output files written since the latest submission.
+                submission_seconds = time.mktime(
+                    datetime.datetime.strptime(result_cache.submission_time, '%Y-%m-%dT%H:%M:%S').timetuple())
+                output_dict = dict()
+                for file_path in executable.output_path_list:
+                    output_dict[file_path] = _get_file_fingerprint(file_path=file_path)
+                    if output_dict[file_path] is None or output_dict[file_path][1] < submission_seconds:
+                        reason = 'output file {!r} has not been written'.format(file_path)
+                        break
+                else:
+                    result_cache.completion_time = current_time
+                    result_cache.output_manifest = json.dumps(obj=output_dict, sort_keys=True)
+                    completed_list.append(result_cache)
+
+            if reason:
+                if debug > 0:
+                    print 'Submitting Executable {!r}, because {}.'.format(executable.name, reason)
+                submitted_name_set.add(executable.name)
+                result_cache_list.append(ResultCache(
+                    name=executable.name,
+                    cache_key=cache_key,
+                    command=executable.command_str(),
+                    submission_time=current_time))
+            else:
+                if debug > 0:
+                    print 'Skipping Executable {!r}, since its result has been cached.'.format(executable.name)
+                executable.submit = False
+
+    result_cache_adaptor.upsert_many(data_object_list=completed_list, key_name='name')
+
+    return result_cache_list
+
+
+def record_result_cache(drms, result_cache_list):
+    """Record C{ResultCache} objects of submitted C{Executable} objects without an output manifest.
+
+    The name of the job of each C{Executable} is resolved via C{DRMS.pack_name_dict}, so that its
+    completion can be verified via the job database before its output manifest gets recorded.
+    @param drms: Distributed Resource Management System (C{DRMS})
+    @type drms: DRMS
+    @param result_cache_list: Python C{list} of C{ResultCache} objects
+    @type result_cache_list: list
+    """
+
+    for result_cache in result_cache_list:
+        result_cache.job_name = drms.pack_name_dict.get(result_cache.name, result_cache.name)
+
+    database_connection = get_result_cache_connection(drms=drms)
+    result_cache_adaptor = ResultCacheAdaptor(database_connection=database_connection)
+    result_cache_adaptor.upsert_many(data_object_list=result_cache_list, key_name='name')
@@ -0,0 +1,343 @@
+"""bsf.drms.local
+
+A package of methods running Executable objects as child processes on the local host.
+"""
+
+#
+# Copyright 2013 Michael K. Schuster
+#
+# Biomedical Sequencing Facility (BSF), part of the genomics core facility
+# of the Research Center for Molecular Medicine (CeMM) of the
+# Austrian Academy of Sciences and the Medical University of Vienna (MUW).
+#
+#
+# This file is part of BSF Python.
+#
+# BSF Python is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# BSF Python is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with BSF Python.  If not, see <http://www.gnu.org/licenses/>.
+
+
+import datetime
+import errno
+import multiprocessing
+import os
+from Queue import Queue
+import socket
+from threading import Thread
+import warnings
+
+from bsf import Runnable
+from bsf.database import DatabaseConnection, \
+    JobSubmission, JobSubmissionAdaptor, \
+    ProcessLocal, ProcessLocalAdaptor
+from bsf.drms import get_memory, get_wave_list
+
+
+output_directory = 'bsfpython_local_output'
+
+# Number of CPUs of the local host available to child processes or None to use all CPUs.
+cpu_capacity = None
+
+# Memory of the local host available to child processes in MiB or None to use all physical memory.
+memory_capacity = None
+
+
+def _get_cpu_capacity():
+    """Get the number of CPUs available to child processes.
+
+    @return: Number of CPUs
+    @rtype: int
+    """
+
+    if cpu_capacity:
+        return cpu_capacity
+
+    try:
+        return multiprocessing.cpu_count()
+    except NotImplementedError:
+        return 1
+
+
+def _get_memory_capacity():
+    """Get the memory available to child processes.
+
+    @return: Memory in MiB or 0, if unknown
+    @rtype: int
+    """
+
+    if memory_capacity:
+        return memory_capacity
+
+    try:
+        return os.sysconf('SC_PAGE_SIZE') * os.sysconf('SC_PHYS_PAGES') // 1024 // 1024
+    except (ValueError, OSError):
+        return 0
+
+
+def submit(drms, debug=0):
+    """Run C{Executable} objects as child processes on the local host.
+
+    C{Executable} objects are started in the order of their dependencies, as long as the CPUs
+    (C{DRMS.threads} per C{Executable}) and the memory (C{Executable.memory_limit_hard} or
+    C{DRMS.memory_limit_hard} per C{Executable}) of the local host permit, those with the highest
+    C{Executable.priority} first. The function returns after all C{Executable} objects have finished.
+    Dependencies on C{Executable} objects of other C{DRMS} objects, which have been run before,
+    are resolved via the job database. C{Executable} objects depending on failed ones are cancelled.
+    In debug mode, the command lines are only written into a GNU Bourne-Again Shell (BASH) script.
+    @param drms: Distributed Resource Management System (C{DRMS})
+    @type drms: DRMS
+    @param debug: Debug level
+    @type debug: int
+    """
+
+    # Open or create a database.
+
+    database_path = os.path.join(drms.work_directory, 'bsfpython_local_jobs.db')
+
+    database_connection = DatabaseConnection(file_path=database_path, write_ahead_log=drms.database_write_ahead_log)
+    database_connection.create_schema()
+    job_submission_adaptor = JobSubmissionAdaptor(database_connection=database_connection)
+    process_local_adaptor = ProcessLocalAdaptor(database_connection=database_connection)
+
+    state_dict = process_local_adaptor.select_state_dict()
+
+    # Write standard output and standard error streams without file path into a
+    # 'bsfpython_local_output' directory under the 'working_directory'.
+
+    output_directory_path = os.path.join(drms.work_directory, output_directory)
+
+    if not os.path.isdir(output_directory_path):
+        # In principle, a race condition could occur as the directory
+        # could have been created after its existence has been checked.
+        try:
+            os.makedirs(output_directory_path)
+        except OSError as exception:
+            if exception.errno != errno.EEXIST:
+                raise
+
+    output = str()
+    output += "#! /bin/bash\n"
+    output += "\n"
+
+    if debug > 0:
+        output += "# BSF-Python debug mode: {}\n".format(debug)
+        output += "\n"
+
+    executable_list = filter(lambda x: x.submit, drms.executables)
+
+    for executable in executable_list:
+        if not executable.stdout_path:
+            executable.stdout_path = os.path.join(output_directory_path, executable.name + '.out')
+        if not executable.stderr_path:
+            executable.stderr_path = os.path.join(output_directory_path, executable.name + '.err')
+
+    # List the command lines in the order of the dependencies, so that the script can be run as is.
+
+    for wave in get_wave_list(executables=executable_list):
+        for executable in wave:
+            output += executable.command_str()
+            output += " 1>{}".format(executable.stdout_path)
+            output += " 2>{}".format(executable.stderr_path)
+            output += "\n"
+            output += "\n"
+
+    script_path = os.path.join(drms.work_directory, 'bsfpython_local_{}.bash'.format(drms.name))
+    script_file = open(name=script_path, mode='w')
+    script_file.write(output)
+    script_file.close()
+
+    # Regardless of running, UPDATE each Executable in or INSERT it into the SQLite database.
+
+    job_submission_adaptor.upsert_many(
+        data_object_list=map(
+            lambda x: JobSubmission(executable_id=0, name=x.name, command=x.command_str(), drms_name=drms.name),
+            drms.executables),
+        key_name='name')
+
+    if debug > 0:
+        return
+
+    # Requests exceeding the capacity of the local host are capped, so that they can run on their own.
+
+    cpu_total = _get_cpu_capacity()
+    memory_total = _get_memory_capacity()
+
+    cpu_request = min(max(1, int(drms.threads)), cpu_total)
+
+    def get_memory_request(executable_request):
+        if executable_request.memory_limit_hard:
+            executable_memory = get_memory(memory=executable_request.memory_limit_hard)
+        else:
+            executable_memory = get_memory(memory=drms.memory_limit_hard)
+        if memory_total:
+            executable_memory = min(executable_memory, memory_total)
+        return executable_memory
+
+    hostname = socket.gethostname()
+
+    # Executable objects that are ready start in the order of their priority, if any.
+
+    executable_dict = dict(map(lambda x: (x.name, x), executable_list))
+    pending_names = map(lambda x: x.name, sorted(executable_list, key=lambda x: -(x.priority or 0.0)))
+    running_names = set()
+    running_memory = 0
+    failed_names = set()
+    return_code_queue = Queue()
+
+    def run_executable_thread(thread_executable):
+        resource_usage_list = list()
+        try:
+            child_return_code = Runnable.run(executable=thread_executable, debug=debug,
+                                             resource_usage_list=resource_usage_list)
+        except (IOError, OSError) as exception:
+            # The child process could not be started, e.g. since the program does not exist.
+            print '[{}] Child process {!r} could not be started: {}'. \
+                format(datetime.datetime.now().isoformat(), thread_executable.name, exception)
+            child_return_code = 127
+        return_code_queue.put((thread_executable.name, child_return_code, resource_usage_list))
+
+    def record_process(job_name, state, exit_code=None, resource_usage_dict=None):
+        state_dict[job_name] = state
+        process_local = ProcessLocal(job_name=job_name, hostname=hostname, exit_code=exit_code, state=state)
+        if resource_usage_dict:
+            process_local.start_time = resource_usage_dict.get('start_time')
+            process_local.wall_time = resource_usage_dict.get('wall_time')
+            process_local.user_time = resource_usage_dict.get('user_time')
+            process_local.system_time = resource_usage_dict.get('system_time')
+            process_local.max_rss = resource_usage_dict.get('max_rss')
+        process_local_adaptor.insert_many(data_object_list=[process_local])
+
+    while len(pending_names) or len(running_names):
+
+        # Cancel pending Executable objects depending on failed or cancelled ones.
+
+        for name in list(pending_names):
+            executable = executable_dict[name]
+            if len(filter(lambda x: x in failed_names, executable.dependencies)):
+                warnings.warn(
+                    'Cancelling Executable {!r}, since an Executable it depends on has failed.'.format(name),
+                    UserWarning)
+                pending_names.remove(name)
+                failed_names.add(name)
+                record_process(job_name=name, state='CANCELLED')
+
+        # Start ready Executable objects, as long as the capacity of the local host permits.
+
+        for name in list(pending_names):
+            executable = executable_dict[name]
+
+            ready = True
+            for dependency in executable.dependencies:
+                if dependency in executable_dict and dependency != name:
+                    if dependency in pending_names or dependency in running_names:
+                        ready = False
+                        break
+                elif dependency in state_dict:
+                    if state_dict[dependency] != 'COMPLETED':
+                        # The Executable depends on another DRMS object, which has failed.
+                        failed_names.add(dependency)
+                        ready = False
+                        break
+                else:
+                    warnings.warn(
+                        "While running Executable with name {!r}, "
+                        "Executable with name {!r} that it depends on, "
+                        "has not been run before.".
+                        format(name, dependency),
+                        UserWarning)
+
+            if not ready:
+                continue
+
+            memory_request = get_memory_request(executable_request=executable)
+
+            if len(running_names) and \
+                    ((len(running_names) + 1) * cpu_request > cpu_total or
+                     (memory_total and running_memory + memory_request > memory_total)):
+                break
+
+            if debug > 0:
+                print '[{}] Starting Executable {!r}.'.format(datetime.datetime.now().isoformat(), name)
+
+            pending_names.remove(name)
+            running_names.add(name)
+            running_memory += memory_request
+
+            thread = Thread(target=run_executable_thread, args=(executable,))
+            thread.daemon = True  # Thread dies with the program.
+            thread.start()
+
+        if not len(running_names):
+            continue
+
+        (name, child_return_code, resource_usage_list) = return_code_queue.get(True)
+        running_names.remove(name)
+        running_memory -= get_memory_request(executable_request=executable_dict[name])
+
+        if len(resource_usage_list):
+            resource_usage_dict = resource_usage_list[-1]
+        else:
+            resource_usage_dict = None
+
+        if child_return_code:
+            Runnable.evaluate_return_code(executable=executable_dict[name], return_code=child_return_code)
+            failed_names.add(name)
+            record_process(job_name=name, state='FAILED', exit_code=child_return_code,
+                           resource_usage_dict=resource_usage_dict)
+        else:
+            record_process(job_name=name, state='COMPLETED', exit_code=child_return_code,
+                           resource_usage_dict=resource_usage_dict)
+
+    failed_list = filter(lambda x: x in failed_names, map(lambda x: x.name, executable_list))
+
+    if len(failed_list):
+        warnings.warn(
+            'Executable objects {!r} of DRMS {!r} have failed or have been cancelled.'.
+            format(failed_list, drms.name),
+            UserWarning)
+
+
+def get_job_state_dict(job_submission_list, database_connection, user=None, output=None):
+    """Get the state of C{JobSubmission} objects from the C{ProcessLocal} objects of the job database.
+
+    Since child processes are only recorded once they have finished, C{Executable} objects that are
+    pending or running cannot be told apart and are I{unknown}.
+    @param job_submission_list: Python C{list} of C{JobSubmission} objects
+    @type job_submission_list: list
+    @param database_connection: C{DatabaseConnection}
+    @type database_connection: DatabaseConnection
+    @param user: Ignored, since there is no scheduler to query
+    @type user: str
+    @param output: Ignored, since there is no scheduler to query
+    @type output: str
+    @return: Python C{dict} of Python C{str} (C{JobSubmission.name}) key data and
+        Python C{str} (I{failed}, I{done} or I{unknown}) value data
+    @rtype: dict
+    """
+
+    process_local_adaptor = ProcessLocalAdaptor(database_connection=database_connection)
+
+    state_dict = process_local_adaptor.select_state_dict()
+
+    job_state_dict = dict()
+
+    for job_submission in job_submission_list:
+        state = state_dict.get(job_submission.name)
+        if state == 'COMPLETED':
+            job_state_dict[job_submission.name] = 'done'
+        elif state in ('FAILED', 'CANCELLED'):
+            job_state_dict[job_submission.name] = 'failed'
+        else:
+            job_state_dict[job_submission.name] = 'unknown'
+
+    return job_state_dict
@@ -27,11 +27,19 @@ A package of methods supporting the Son of Grid Engine (SGE) system.
 # along with BSF Python.  If not, see <http://www.gnu.org/licenses/>.
 
 
+import datetime
 import errno
 import os.path
 import re
 import string
 import subprocess
+import tempfile
+import warnings
+from xml.etree import ElementTree
+
+from bsf.database import DatabaseConnection, JobSubmission, JobSubmissionAdaptor, \
+    ProcessSGE, ProcessSGEAdaptor, ProcessSGESync, ProcessSGESyncAdaptor
+from bsf.drms import get_wave_list, run_concurrently
 
 # TODO: This module could create a file that records SGE Process identifiers, which could be used by
 # further scripts to query the state of jobs.
@@ -39,11 +47,66 @@ import subprocess
 
 output_directory = 'bsfpython_sge_output'
 
+# SGE priority of Executable objects with the lowest priority. Executable objects on the critical path
+# get a priority of 0, since unprivileged users can only lower the priority of their jobs.
+priority_minimum = -1023
+
+
+def _submit_job(executable, command):
+    """Run the SGE qsub command and set the SGE process identifier and name in the C{Executable}.
+
+    @param executable: C{Executable}
+    @type executable: Executable
+    @param command: Python C{list} of Python C{str} (command line) objects
+    @type command: list
+    """
+
+    child_process = subprocess.Popen(args=command,
+                                     bufsize=4096,
+                                     stdin=subprocess.PIPE,
+                                     stdout=subprocess.PIPE,
+                                     stderr=subprocess.PIPE,
+                                     shell=False,
+                                     close_fds=True)
+
+    # Although subprocess.communicate() may block when memory buffers
+    # have been filled up, not much STDOUT and STDERR is expected from
+    # SGE qsub.
+
+    (child_stdout, child_stderr) = child_process.communicate(input=None)
+
+    child_return_code = child_process.returncode
+
+    if child_return_code:
+        raise Exception(
+            "SGE qsub returned exit code {!r}\n"
+            "STDOUT: {}\n"
+            "STDERR: {}\n"
+            "Command list representation: {!r}".
+            format(child_return_code, child_stdout, child_stderr, command))
+
+    # Parse the multi-line STDOUT string to get the SGE process identifier and name.
+    # The response to the SGE qsub command looks like:
+    # Your job 137657 ("ls") has been submitted
+
+    for line in child_stdout.splitlines(False):
+        match = re.search(pattern=r'Your job (\d+) \("([^"]+)"\) has been submitted',
+                          string=line)
+
+        if match:
+            executable.process_identifier = match.group(1)
+            executable.process_name = match.group(2)
+        else:
+            print('Could not parse SGE qsub response line {}'.format(line))
+
 
 def submit(drms, debug=0):
 
     """Submit C{Executable} objects into the Son of Grid Engine (SGE) Distributed Resource Management System (DRMS).
 
+    C{Executable} objects are submitted in topological waves of their dependencies, with up to
+    C{DRMS.submit_threads} concurrent submissions per wave. Submitted C{Executable} objects are recorded
+    as C{JobSubmission} objects with their SGE job number in the job database of the work directory.
     @param drms: Distributed Resource Management System (C{DRMS})
     @type drms: DRMS
     @param debug: Debug level
@@ -58,6 +121,8 @@ def submit(drms, debug=0):
         output += "# BSF-Python debug mode: {}\n".format(debug)
         output += "\n"
 
+    command_dict = dict()
+
     for executable in drms.executables:
 
         command = list()
@@ -96,6 +161,15 @@ def submit(drms, debug=0):
             if not drms.memory_free_virtual:
                 drms.memory_free_virtual = drms.memory_limit_hard
 
+        # A hard memory limit of the Executable overrides the one of the DRMS.
+
+        memory_free_virtual = drms.memory_free_virtual
+        memory_limit_hard = drms.memory_limit_hard
+
+        if executable.memory_limit_hard:
+            memory_free_virtual = executable.memory_limit_hard
+            memory_limit_hard = executable.memory_limit_hard
+
         resource_list = list()
 
         # Require physical memory to be free ...
@@ -107,12 +181,12 @@ def submit(drms, debug=0):
             resource_list.append('swap_free={}'.format(drms.memory_free_swap))
 
         # Require virtual memory to be free ...
-        if drms.memory_free_virtual:
-            resource_list.append('virtual_free={}'.format(drms.memory_free_virtual))
+        if memory_free_virtual:
+            resource_list.append('virtual_free={}'.format(memory_free_virtual))
 
         # Set hard virtual memory limit ...
-        if drms.memory_limit_hard:
-            resource_list.append('h_vmem={}'.format(drms.memory_limit_hard))
+        if memory_limit_hard:
+            resource_list.append('h_vmem={}'.format(memory_limit_hard))
 
         # Set soft virtual memory limit ...
         if drms.memory_limit_soft:
@@ -169,6 +243,12 @@ def submit(drms, debug=0):
             # The SGE qsub command can use -h to place a user hold.
             # The second form -h {u|s|o|n|U|O|S}... is only for the SGE qalter command.
 
+        # Job priority
+
+        if executable.priority is not None:
+            command.append('-p')
+            command.append('{:d}'.format(int(round((1.0 - min(1.0, executable.priority)) * priority_minimum))))
+
         # Job name
 
         if executable.name:
@@ -188,54 +268,630 @@ def submit(drms, debug=0):
         if executable.stderr_path:
             command.append("2>{}".format(executable.stderr_path))
 
-        # Finally, submit this command if requested and not in debug mode.
+        # Copy the SGE command line to the Bash script.
 
-        if executable.submit and debug == 0:
+        output += string.join(words=command, sep=' ') + "\n"
+        output += "\n"
 
-            child_process = subprocess.Popen(args=command,
-                                             bufsize=4096,
-                                             stdin=subprocess.PIPE,
-                                             stdout=subprocess.PIPE,
-                                             stderr=subprocess.PIPE,
-                                             shell=False,
-                                             close_fds=True)
+        command_dict[executable] = command
+
+    # Finally, submit the commands if requested and not in debug mode.
+    # Although SGE resolves job hold conditions by name, a job can only be held on jobs that exist already.
+    # Therefore, submit the Executable objects in topological waves of their dependencies,
+    # with up to DRMS.submit_threads concurrent submissions per wave.
+
+    if debug == 0:
+        try:
+            for wave in get_wave_list(executables=drms.executables):
+                run_concurrently(
+                    function=_submit_job,
+                    keywords_list=map(lambda x: {'executable': x, 'command': command_dict[x]},
+                                      filter(lambda x: x.submit, wave)),
+                    threads=drms.submit_threads)
+        finally:
+            # Record all Executable objects submitted, even if a submission failed,
+            # so that jobs submitted before remain tracked.
+
+            database_connection = DatabaseConnection(
+                file_path=os.path.join(drms.work_directory, 'bsfpython_sge_jobs.db'),
+                write_ahead_log=drms.database_write_ahead_log)
+            database_connection.create_schema()
+            job_submission_adaptor = JobSubmissionAdaptor(database_connection=database_connection)
+            job_submission_adaptor.upsert_many(
+                data_object_list=map(
+                    lambda x: JobSubmission(executable_id=0, name=x.name, command=x.command_str(),
+                                            drms_name=drms.name, job_id=x.process_identifier),
+                    filter(lambda x: x.process_identifier, drms.executables)),
+                key_name='name')
 
-            # Although subprocess.communicate() may block when memory buffers
-            # have been filled up, not much STDOUT and STDERR is expected from
-            # SGE qsub.
+    script_path = os.path.join(drms.work_directory, 'bsfpython_sge_{}.bash'.format(drms.name))
+    script_file = open(name=script_path, mode='w')
+    script_file.write(output)
+    script_file.close()
 
-            (child_stdout, child_stderr) = child_process.communicate(input=None)
 
-            child_return_code = child_process.returncode
+# Number of accounting records stored per transaction.
+accounting_batch_size = 1000
 
-            if child_return_code:
-                raise Exception(
-                    "SGE qsub returned exit code {!r}\n"
-                    "STDOUT: {}\n"
-                    "STDERR: {}\n"
-                    "Command list representation: {!r}".
-                    format(child_return_code, child_stdout, child_stderr, command))
+_number_pattern = re.compile(pattern=r'^(-?\d+(?:\.\d+)?(?:[eE][-+]?\d+)?)([KMGTP]?)')
 
-            # Parse the multi-line STDOUT string to get the SGE process identifier and name.
-            # The response to the SGE qsub command looks like:
-            # Your job 137657 ("ls") has been submitted
 
-            for line in child_stdout.splitlines(False):
-                match = re.search(pattern=r'Your job (\d+) \("([^"]+)"\) has been submitted',
-                                  string=line)
+def _get_text(value):
+    """Get an SGE accounting text value.
 
-                if match:
-                    executable.process_identifier = match.group(1)
-                    executable.process_name = match.group(2)
-                else:
-                    print('Could not parse SGE qsub response line {}'.format(line))
+    @param value: SGE accounting field value
+    @type value: str
+    @return: Text value or C{None} for an empty or undefined field
+    @rtype: str | None
+    """
 
-        # Copy the SGE command line to the Bash script.
+    if value and value not in ('undefined', '-/-'):
+        return value
+    else:
+        return
 
-        output += string.join(words=command, sep=' ') + "\n"
-        output += "\n"
 
-    script_path = os.path.join(drms.work_directory, 'bsfpython_sge_{}.bash'.format(drms.name))
-    script_file = open(name=script_path, mode='w')
-    script_file.write(output)
-    script_file.close()
+def _get_task_number(value):
+    """Get an SGE accounting array job task number.
+
+    Non-array jobs have task number 0 in the accounting file, but I{undefined} in SGE qacct output,
+    so that both get normalised to 0, as records are matched by job and task number.
+    @param value: SGE accounting field value
+    @type value: str
+    @return: Task number
+    @rtype: str
+    """
+
+    return _get_text(value=value) or '0'
+
+
+def _get_integer(value):
+    """Get an SGE accounting number with an optional I{K}, I{M}, I{G}, I{T} or I{P} suffix (base 1024) as integer.
+
+    Units following the number (e.g. I{s} for seconds in SGE qacct output) are ignored.
+    @param value: SGE accounting field value (e.g. 0, 3s, 123456789.000 or 17.223M)
+    @type value: str
+    @return: Integer value or C{None} if the value could not be parsed
+    @rtype: int | None
+    """
+
+    match = _number_pattern.search(string=value)
+
+    if not match:
+        return
+
+    return int(round(float(match.group(1)) * 1024 ** ' KMGTP'.index(match.group(2) or ' ')))
+
+
+def _get_float(value):
+    """Get an SGE accounting number as float.
+
+    Units following the number (e.g. I{s} for seconds or I{GBs} for the integral memory usage in
+    SGE qacct output) are ignored.
+    @param value: SGE accounting field value (e.g. 0.100, 0.100s or 12.345GBs)
+    @type value: str
+    @return: Float value or C{None} if the value could not be parsed
+    @rtype: float | None
+    """
+
+    match = _number_pattern.search(string=value)
+
+    if not match:
+        return
+
+    return float(match.group(1))
+
+
+def _get_kilobytes(value):
+    """Get an SGE accounting resident set size in kilobytes as bytes.
+
+    @param value: SGE accounting field value (e.g. 2412 or 2.355M)
+    @type value: str
+    @return: Bytes or C{None} if the value could not be parsed
+    @rtype: int | None
+    """
+
+    match = _number_pattern.search(string=value)
+
+    if not match:
+        return
+
+    if match.group(2):
+        return _get_integer(value=value)
+    else:
+        return int(round(float(match.group(1)) * 1024))
+
+
+def _get_epoch_time(value):
+    """Get an SGE accounting file time in seconds (or milliseconds) since the epoch in ISO 8601 format.
+
+    @param value: SGE accounting field value (e.g. 1397901600)
+    @type value: str
+    @return: Time in ISO 8601 format or C{None} for an unset time
+    @rtype: str | None
+    """
+
+    seconds = _get_float(value=value)
+
+    if not seconds:
+        return
+
+    # Later Grid Engine versions record milliseconds.
+
+    if seconds > 100000000000:
+        seconds /= 1000
+
+    return datetime.datetime.fromtimestamp(seconds).strftime('%Y-%m-%dT%H:%M:%S')
+
+
+def _get_qacct_time(value):
+    """Get an SGE qacct time in ISO 8601 format.
+
+    @param value: SGE qacct field value (e.g. Sat Apr 19 10:00:00 2014, 04/19/2014 10:00:00.000 or -/-)
+    @type value: str
+    @return: Time in ISO 8601 format or C{None} for an unset time
+    @rtype: str | None
+    """
+
+    for time_format in ('%a %b %d %H:%M:%S %Y', '%m/%d/%Y %H:%M:%S.%f', '%m/%d/%Y %H:%M:%S'):
+        try:
+            return datetime.datetime.strptime(value, time_format).strftime('%Y-%m-%dT%H:%M:%S')
+        except ValueError:
+            pass
+
+    return
+
+
+# ProcessSGE attributes and functions converting field values in the order of the SGE accounting file fields.
+# See man 5 accounting. Fields not stored are None.
+
+accounting_field_list = [
+    ['qname', _get_text],
+    ['hostname', _get_text],
+    ['sge_group', _get_text],
+    ['owner', _get_text],
+    ['job_name', _get_text],
+    ['job_number', _get_text],
+    ['account', _get_text],
+    ['priority', _get_integer],
+    ['submission_time', _get_epoch_time],
+    ['start_date', _get_epoch_time],
+    ['end_time', _get_epoch_time],
+    ['failed', _get_text],
+    ['exit_status', _get_integer],
+    ['ru_wallclock', _get_integer],
+    ['ru_utime', _get_float],
+    ['ru_stime', _get_float],
+    ['ru_maxrss', _get_kilobytes],
+    [None, None],  # ru_ixrss
+    [None, None],  # ru_ismrss
+    [None, None],  # ru_idrss
+    [None, None],  # ru_isrss
+    [None, None],  # ru_minflt
+    [None, None],  # ru_majflt
+    [None, None],  # ru_nswap
+    [None, None],  # ru_inblock
+    [None, None],  # ru_oublock
+    [None, None],  # ru_msgsnd
+    [None, None],  # ru_msgrcv
+    [None, None],  # ru_nsignals
+    [None, None],  # ru_nvcsw
+    [None, None],  # ru_nivcsw
+    ['project', _get_text],
+    ['department', _get_text],
+    ['granted_pe', _get_text],
+    ['slots', _get_integer],
+    ['task_number', _get_task_number],
+    ['cpu', _get_float],
+    ['mem', _get_float],
+    ['io', _get_float],
+    ['category', _get_text],
+    ['iow', _get_float],
+    ['pe_taskid', _get_text],
+    ['maxvmem', _get_integer],
+    ['arid', _get_integer]
+]
+
+# SGE qacct keys, corresponding ProcessSGE attributes and functions converting field values.
+
+qacct_field_dict = {
+    'qname': ['qname', _get_text],
+    'hostname': ['hostname', _get_text],
+    'group': ['sge_group', _get_text],
+    'owner': ['owner', _get_text],
+    'project': ['project', _get_text],
+    'department': ['department', _get_text],
+    'jobname': ['job_name', _get_text],
+    'jobnumber': ['job_number', _get_text],
+    'taskid': ['task_number', _get_task_number],
+    'pe_taskid': ['pe_taskid', _get_text],
+    'account': ['account', _get_text],
+    'priority': ['priority', _get_integer],
+    'qsub_time': ['submission_time', _get_qacct_time],
+    'start_time': ['start_date', _get_qacct_time],
+    'end_time': ['end_time', _get_qacct_time],
+    'granted_pe': ['granted_pe', _get_text],
+    'slots': ['slots', _get_integer],
+    'failed': ['failed', _get_text],
+    'exit_status': ['exit_status', _get_integer],
+    'ru_wallclock': ['ru_wallclock', _get_integer],
+    'ru_utime': ['ru_utime', _get_float],
+    'ru_stime': ['ru_stime', _get_float],
+    'ru_maxrss': ['ru_maxrss', _get_kilobytes],
+    'cpu': ['cpu', _get_float],
+    'mem': ['mem', _get_float],
+    'io': ['io', _get_float],
+    'iow': ['iow', _get_float],
+    'maxvmem': ['maxvmem', _get_integer],
+    'arid': ['arid', _get_integer],
+    'category': ['category', _get_text]
+}
+
+
+def _get_process_sge_from_file(line):
+    """Get a C{ProcessSGE} object from an SGE accounting file line.
+
+    @param line: SGE accounting file line
+    @type line: str
+    @return: C{ProcessSGE} or C{None}, if the line has too few fields
+    @rtype: ProcessSGE | None
+    """
+
+    field_list = line.rstrip('\n').split(':')
+
+    if len(field_list) < len(accounting_field_list):
+        return
+
+    process_sge = ProcessSGE()
+
+    for (field_value, (attribute_name, function)) in zip(field_list, accounting_field_list):
+        if attribute_name:
+            process_sge.__setattr__(attribute_name, function(field_value))
+
+    return process_sge
+
+
+def _get_process_sge_from_qacct(record_dict):
+    """Get a C{ProcessSGE} object from an SGE qacct record.
+
+    @param record_dict: Python C{dict} of Python C{str} (SGE qacct key) key and Python C{str} (value) value data
+    @type record_dict: dict
+    @return: C{ProcessSGE}
+    @rtype: ProcessSGE
+    """
+
+    process_sge = ProcessSGE()
+
+    for key in record_dict.keys():
+        if key in qacct_field_dict:
+            (attribute_name, function) = qacct_field_dict[key]
+            process_sge.__setattr__(attribute_name, function(record_dict[key]))
+
+    return process_sge
+
+
+def _iterate_qacct_records(owner=None):
+    """Generate SGE qacct -j records, in the order of the SGE accounting file.
+
+    @param owner: Owner to restrict the records to or C{None} for all owners
+    @type owner: str
+    @return: Python C{dict} of Python C{str} (SGE qacct key) key and Python C{str} (value) value data
+    @rtype: dict
+    """
+
+    command = list()
+    command.append('qacct')
+
+    if owner:
+        command.append('-o')
+        command.append(owner)
+
+    command.append('-j')
+
+    # Write STDERR into a temporary file, so that reading STDOUT line by line cannot block.
+
+    stderr_file = tempfile.TemporaryFile()
+
+    child_process = subprocess.Popen(args=command,
+                                     bufsize=-1,
+                                     stdin=None,
+                                     stdout=subprocess.PIPE,
+                                     stderr=stderr_file,
+                                     shell=False,
+                                     close_fds=True)
+
+    record_dict = None
+
+    try:
+        for line in child_process.stdout:
+            if line.startswith('====='):
+                if record_dict:
+                    yield record_dict
+                record_dict = dict()
+                continue
+
+            if record_dict is None:
+                continue
+
+            key_value_list = line.strip().split(None, 1)
+
+            if len(key_value_list) == 2:
+                record_dict[key_value_list[0]] = key_value_list[1]
+
+        if record_dict:
+            yield record_dict
+    finally:
+        child_process.stdout.close()
+        child_return_code = child_process.wait()
+
+    if child_return_code:
+        stderr_file.seek(0)
+        raise Exception(
+            "SGE qacct returned exit code {!r}\n"
+            "STDERR: {}\n"
+            "Command list representation: {!r}".
+            format(child_return_code, stderr_file.read(), command))
+
+    stderr_file.close()
+
+
+def get_accounting_file_path():
+    """Get the SGE accounting file path from the I{SGE_ROOT} and I{SGE_CELL} environment variables.
+
+    @return: SGE accounting file path or C{None}, if I{SGE_ROOT} is not set
+    @rtype: str | None
+    """
+
+    if 'SGE_ROOT' not in os.environ:
+        return
+
+    return os.path.join(os.environ['SGE_ROOT'], os.environ.get('SGE_CELL', 'default'), 'common', 'accounting')
+
+
+def synchronise_accounting(database_connection, file_path=None, owner=None):
+    """Synchronise C{ProcessSGE} objects incrementally with the SGE accounting file or SGE qacct.
+
+    Since the SGE accounting file is only ever appended to, each synchronisation continues at the byte
+    offset, at which the previous one has stopped. A shorter file or an offset not at the start of a
+    line indicate a rotated accounting file, which is then read from the start. If no accounting file
+    is given, the records of SGE qacct -j are read, skipping the number of records read before.
+    Since SGE qacct needs to read the complete accounting file, reading the file directly is much cheaper.
+    C{ProcessSGE} objects are upserted by job and task number in batches of C{accounting_batch_size},
+    each in a transaction together with the high-water mark, so that an interrupted synchronisation
+    neither loses records nor duplicates them, even if records are read again after a rotated
+    accounting file or from a different source.
+    @param database_connection: C{DatabaseConnection}
+    @type database_connection: DatabaseConnection
+    @param file_path: SGE accounting file path or C{None} for SGE qacct
+    @type file_path: str | unicode
+    @param owner: Owner to restrict SGE qacct records to or C{None} for all owners.
+        Records in the accounting file are never restricted.
+    @type owner: str
+    @return: C{ProcessSGESync} recording the synchronisation
+    @rtype: ProcessSGESync
+    """
+
+    process_sge_adaptor = ProcessSGEAdaptor(database_connection=database_connection)
+    process_sge_sync_adaptor = ProcessSGESyncAdaptor(database_connection=database_connection)
+
+    if file_path:
+        source = os.path.abspath(file_path)
+    elif owner:
+        source = 'qacct -o {}'.format(owner)
+    else:
+        source = 'qacct'
+
+    process_sge_sync = ProcessSGESync(
+        sync_time=datetime.datetime.now().strftime('%Y-%m-%dT%H:%M:%S'),
+        source=source,
+        position=0,
+        job_count=0)
+
+    previous_sync = process_sge_sync_adaptor.select_latest(source=source)
+
+    if previous_sync:
+        process_sge_sync.position = previous_sync.position
+        process_sge_sync.job_number = previous_sync.job_number
+        process_sge_sync.end_time = previous_sync.end_time
+
+    process_sge_list = list()
+
+    def store_batch():
+        with database_connection.transaction():
+            process_sge_adaptor.upsert_many(data_object_list=process_sge_list, key_name=['job_number', 'task_number'])
+            process_sge_sync.job_count += len(process_sge_list)
+            if process_sge_sync.process_sge_sync_id:
+                process_sge_sync_adaptor.update_many(data_object_list=[process_sge_sync])
+            else:
+                process_sge_sync_adaptor.insert_many(data_object_list=[process_sge_sync])
+        del process_sge_list[:]
+
+    if file_path:
+        accounting_file = open(file_path, 'rb')
+
+        try:
+            if process_sge_sync.position > os.fstat(accounting_file.fileno()).st_size:
+                process_sge_sync.position = 0
+
+            if process_sge_sync.position:
+                accounting_file.seek(process_sge_sync.position - 1)
+                if accounting_file.read(1) != '\n':
+                    process_sge_sync.position = 0
+
+            accounting_file.seek(process_sge_sync.position)
+
+            # Read line by line, since iterating over the file object reads ahead and loses the byte offset.
+
+            for line in iter(accounting_file.readline, ''):
+                if not line.endswith('\n'):
+                    # A record is still being written.
+                    break
+
+                process_sge_sync.position += len(line)
+
+                if line.startswith('#') or not line.strip():
+                    continue
+
+                process_sge = _get_process_sge_from_file(line=line)
+
+                if process_sge is None:
+                    warnings.warn('Could not parse SGE accounting line {!r}'.format(line), UserWarning)
+                    continue
+
+                process_sge_list.append(process_sge)
+                process_sge_sync.job_number = process_sge.job_number
+                process_sge_sync.end_time = process_sge.end_time
+
+                if len(process_sge_list) >= accounting_batch_size:
+                    store_batch()
+        finally:
+            accounting_file.close()
+    else:
+        def read_qacct_records(skip_number):
+            record_number = 0
+
+            for record_dict in _iterate_qacct_records(owner=owner):
+                record_number += 1
+
+                if record_number < skip_number:
+                    continue
+
+                process_sge = _get_process_sge_from_qacct(record_dict=record_dict)
+
+                if record_number == skip_number:
+                    # The last record read before must still be at the same position.
+                    if process_sge.job_number == previous_sync.job_number and \
+                            process_sge.end_time == previous_sync.end_time:
+                        continue
+                    else:
+                        return False
+
+                process_sge_list.append(process_sge)
+                process_sge_sync.position = record_number
+                process_sge_sync.job_number = process_sge.job_number
+                process_sge_sync.end_time = process_sge.end_time
+
+                if len(process_sge_list) >= accounting_batch_size:
+                    store_batch()
+
+            return record_number >= skip_number
+
+        if not read_qacct_records(skip_number=process_sge_sync.position):
+            # The accounting file has been rotated, so that all records need reading.
+            process_sge_sync.position = 0
+            read_qacct_records(skip_number=0)
+
+    store_batch()
+
+    return process_sge_sync
+
+
+def _run_qstat(user=None):
+    """Run SGE qstat once for all pending and running jobs.
+
+    @param user: User name to restrict the listing to or C{None} for the jobs of the current user
+    @type user: str
+    @return: SGE qstat -xml output
+    @rtype: str
+    """
+
+    command = list()
+    command.append('qstat')
+    command.append('-xml')
+
+    if user:
+        command.append('-u')
+        command.append(user)
+
+    child_process = subprocess.Popen(args=command,
+                                     bufsize=-1,
+                                     stdin=None,
+                                     stdout=subprocess.PIPE,
+                                     stderr=subprocess.PIPE,
+                                     shell=False,
+                                     close_fds=True)
+
+    (child_stdout, child_stderr) = child_process.communicate(input=None)
+
+    if child_process.returncode:
+        raise Exception(
+            "SGE qstat returned exit code {!r}\n"
+            "STDERR: {}\n"
+            "Command list representation: {!r}".
+            format(child_process.returncode, child_stderr, command))
+
+    return child_stdout
+
+
+def _get_qstat_state(value):
+    """Get the state of a job from SGE qstat state letters.
+
+    @param value: SGE qstat state letters (e.g. qw, hqw, r, t, Eqw, dr)
+    @type value: str
+    @return: I{pending}, I{running} or I{failed}
+    @rtype: str
+    """
+
+    if 'E' in value or 'd' in value:
+        # Jobs in error state or being deleted will not complete.
+        return 'failed'
+    elif 'r' in value or 't' in value or 's' in value or 'S' in value or 'T' in value:
+        return 'running'
+    else:
+        return 'pending'
+
+
+def get_job_state_dict(job_submission_list, database_connection, user=None, output=None):
+    """Get the state of C{JobSubmission} objects with a single SGE qstat call.
+
+    Jobs listed by SGE qstat are I{pending}, I{running} or, if in error state or being deleted, I{failed}.
+    The state of all other jobs is looked up in bulk in the C{ProcessSGE} objects of the job database,
+    which are kept up-to-date via C{synchronise_accounting}. Jobs without failure code and with exit status 0
+    are I{done}, all others I{failed}. Jobs that are neither listed nor accounted for are I{unknown}.
+    @param job_submission_list: Python C{list} of C{JobSubmission} objects
+    @type job_submission_list: list
+    @param database_connection: C{DatabaseConnection}
+    @type database_connection: DatabaseConnection
+    @param user: User name to restrict SGE qstat to or C{None} for the jobs of the current user
+    @type user: str
+    @param output: SGE qstat -xml output (e.g. for testing) or C{None} to run SGE qstat
+    @type output: str
+    @return: Python C{dict} of Python C{str} (C{JobSubmission.name}) key data and
+        Python C{str} (I{pending}, I{running}, I{failed}, I{done} or I{unknown}) value data
+    @rtype: dict
+    """
+
+    if output is None:
+        output = _run_qstat(user=user)
+
+    active_dict = dict()
+
+    for job_list_element in ElementTree.fromstring(output).iter('job_list'):
+        job_number = job_list_element.findtext('JB_job_number')
+        if job_number:
+            active_dict[job_number.strip()] = _get_qstat_state(value=job_list_element.findtext('state', default=''))
+
+    process_sge_adaptor = ProcessSGEAdaptor(database_connection=database_connection)
+
+    exit_dict = process_sge_adaptor.select_exit_dict(
+        job_number_list=filter(lambda x: x and x not in active_dict, map(lambda x: x.job_id, job_submission_list)))
+
+    job_state_dict = dict()
+
+    for job_submission in job_submission_list:
+        job_id = job_submission.job_id
+
+        if not job_id:
+            job_state = 'unknown'
+        elif job_id in active_dict:
+            job_state = active_dict[job_id]
+        elif job_id not in exit_dict:
+            job_state = 'unknown'
+        elif exit_dict[job_id][0] == '0' and exit_dict[job_id][1] == 0:
+            job_state = 'done'
+        else:
+            job_state = 'failed'
+
+        job_state_dict[job_submission.name] = job_state
+
+    return job_state_dict
@@ -27,25 +27,387 @@ A package of methods supporting the Simple Linux Utility for Resource Management
 # along with BSF Python.  If not, see <http://www.gnu.org/licenses/>.
 
 
+import datetime
 import errno
 import os.path
+import pipes
 import re
 import string
 import subprocess
+import tempfile
 import warnings
 
 from bsf.database import DatabaseConnection, \
     JobSubmission, JobSubmissionAdaptor, \
-    ProcessSLURM, ProcessSLURMAdaptor
+    ProcessSLURM, ProcessSLURMAdaptor, \
+    ProcessSLURMSync, ProcessSLURMSyncAdaptor
+from bsf.drms import get_wave_list, run_concurrently
 
 
 output_directory = 'bsfpython_slurm_output'
 
+# Minimum number of Executable objects to submit as a SLURM job array.
+array_minimum_size = 2
+
+# Maximum number of Executable objects in a SLURM job array, which should not exceed the MaxArraySize
+# parameter of the SLURM configuration.
+array_maximum_size = 1000
+
+# SLURM nice value of Executable objects with the lowest priority. Executable objects on the critical path
+# get a nice value of 0, since unprivileged users can only lower the priority of their jobs.
+nice_maximum = 10000
+
+
+def _get_priority_options(executable_list):
+    """Get SLURM sbatch options for the priority of C{Executable} objects.
+
+    The highest C{Executable.priority} of all C{Executable} objects (e.g. of a job array) applies.
+    @param executable_list: Python C{list} of C{Executable} objects
+    @type executable_list: list
+    @return: Python C{list} of Python C{str} (sbatch option) objects
+    @rtype: list
+    """
+
+    priority_list = filter(lambda x: x is not None, map(lambda x: x.priority, executable_list))
+
+    if not len(priority_list):
+        return list()
+
+    # The sbatch --nice option takes an optional argument, which requires the --option=value form.
+
+    return ['--nice={:d}'.format(int(round((1.0 - min(1.0, max(priority_list))) * nice_maximum)))]
+
+
+def _get_resource_options(drms, job_name, array=False, executable=None):
+    """Get SLURM sbatch options for the resources, working directory, output streams and the job name.
+
+    @param drms: Distributed Resource Management System (C{DRMS})
+    @type drms: DRMS
+    @param job_name: Job name
+    @type job_name: str
+    @param array: Name output stream files after the array job identifier and array index
+    @type array: bool
+    @param executable: C{Executable}, whose memory and time limits override the ones of the C{DRMS}, or C{None}
+    @type executable: Executable
+    @return: Python C{list} of Python C{str} (sbatch option) objects
+    @rtype: list
+    """
+
+    command = list()
+
+    # Add DRMS-specific options.
+
+    # Binary or script
+
+    # Job resource string ...
+
+    # SLURM-specific sanity checks ...
+
+    # If a hard memory limit has been set, use it as the minimum free required.
+
+    if drms.memory_limit_hard:
+        if not drms.memory_free_virtual:
+            drms.memory_free_virtual = drms.memory_limit_hard
+
+    # TODO: The memory must be specified in MB.
+    # Maybe it would be worth having a routine that converts suffixes into MB.
+    # This should use memory_limit_soft or memory_limit_hard.
+    # TODO: Not sure how to use this in a situation like BWA where a multi-threaded application does not use
+    # memory for each thread.
+
+    memory_limit_hard = drms.memory_limit_hard
+    time_limit = drms.time_limit
+
+    if executable:
+        if executable.memory_limit_hard:
+            memory_limit_hard = executable.memory_limit_hard
+        if executable.time_limit:
+            time_limit = executable.time_limit
+
+    if memory_limit_hard:
+        # command.append('--mem-per-cpu')
+        command.append('--mem')
+        command.append(memory_limit_hard)
+
+    command.append('--time')
+    command.append(time_limit)
+
+    # Propagate none of the environment variables.
+
+    command.append('--export')
+    command.append('NONE')
+
+    # Get the user environment resembling a login shell.
+
+    command.append('--get-user-env=L')
+    # command.append('L')
+
+    # Parallel environment
+
+    if drms.parallel_environment:
+        command.append('--distribution')
+        command.append(drms.parallel_environment)
+        command.append('--ntasks')
+        command.append('1')
+        command.append('--cpus-per-task')
+        command.append(str(drms.threads))
+
+    command.append('--requeue')
+
+    # The --share option may no longer be needed.
+    # command.append('--share')
+
+    # Queue name
+
+    if drms.queue:
+        command.append('--partition')
+        command.append(drms.queue)
+
+    # Working directory, standard output and standard error streams.
+
+    if drms.work_directory:
+        command.append('--workdir')
+        command.append(drms.work_directory)
+
+        # Write standard output and standard error streams into a
+        # 'bsfpython_slurm_output' directory under the 'working_directory'.
+
+        # TODO: Use slurm_output_name to keep --error and --output relative to the --workdir and
+        # slurm_output_path to create the directory.
+        output_directory_path = os.path.join(drms.work_directory, output_directory)
+
+        if not os.path.isdir(output_directory_path):
+            # In principle, a race condition could occur as the directory
+            # could have been created after its existence has been checked.
+            try:
+                os.makedirs(output_directory_path)
+            except OSError as exception:
+                if exception.errno != errno.EEXIST:
+                    raise
+
+        # For job arrays, %A and %a are replaced by the array job identifier and the array index, respectively.
+
+        if array:
+            job_pattern = '%A_%a'
+        else:
+            job_pattern = '%j'
+
+        command.append('--error')
+        command.append(os.path.join(output_directory, string.join(words=(job_name, job_pattern + '.err'), sep='_')))
+
+        command.append('--output')
+        command.append(os.path.join(output_directory, string.join(words=(job_name, job_pattern + '.out'), sep='_')))
+
+    # Job name
+
+    if job_name:
+        command.append('--job-name')
+        command.append(job_name)
+
+    return command
+
+
+def _get_dependency_options(job_id_dict, executable, debug=0):
+    """Get SLURM sbatch options for the job hold conditions of an C{Executable}.
+
+    @param job_id_dict: Python C{dict} of Python C{str} (job name) key data and
+        Python C{str} (latest job identifier) value data
+    @type job_id_dict: dict
+    @param executable: C{Executable}
+    @type executable: Executable
+    @param debug: Debug level
+    @type debug: int
+    @return: Python C{list} of Python C{str} (sbatch option) objects
+    @rtype: list
+    """
+
+    command = list()
+
+    # Job hold conditions
+    # A particular feature of SLURM is its inability to set process dependencies on process names.
+    # Rather, dependencies need setting on the process identifier, which is only obtained after
+    # submitting the process. Isn't that exactly what we have a scheduler for? Sigh.
+    # Consequently, SLURM process identifiers need to be tracked here, by means of an SQLite database,
+    # which is read once into a Python dict of job names and the latest job identifiers.
+    # Elements of SLURM job arrays are tracked under process identifiers of the form job_index,
+    # which SLURM accepts for dependencies on individual array elements.
+
+    process_identifier_list = list()
+    for executable_name in executable.dependencies:
+        if executable_name in job_id_dict:
+            # This Executable has been submitted at least once before.
+            # For the moment, set the dependency on the last submission.
+            process_identifier_list.append(job_id_dict[executable_name])
+        elif debug == 0:
+            warnings.warn(
+                "While submitting Executable with name {!r}, "
+                "Executable with name {!r} that it depends on, "
+                "has not been submitted before.".
+                format(executable.name, executable_name),
+                UserWarning)
+    if len(process_identifier_list):
+        # Only set the dependency option if there are some on the process identifier list.
+        # The identifier list may be empty if no dependencies exist or no Executable has been submitted before.
+        command.append('--dependency')
+        command.append(string.join(words=map(lambda x: 'afterok:' + x, process_identifier_list), sep=','))
+
+    return command
+
+
+def _run_sbatch(command):
+    """Run the SLURM sbatch command and return the SLURM process identifier.
+
+    @param command: Python C{list} of Python C{str} (command line) objects
+    @type command: list
+    @return: SLURM process identifier
+    @rtype: str
+    """
+
+    process_identifier = None
+
+    child_process = subprocess.Popen(args=command,
+                                     bufsize=4096,
+                                     stdin=subprocess.PIPE,
+                                     stdout=subprocess.PIPE,
+                                     stderr=subprocess.PIPE,
+                                     shell=False,
+                                     close_fds=True)
+
+    # Although subprocess.communicate() may block when memory buffers
+    # have been filled up, not much STDOUT and STDERR is expected from
+    # SLURM sbatch.
+
+    (child_stdout, child_stderr) = child_process.communicate(input=None)
+
+    child_return_code = child_process.returncode
+
+    if child_return_code:
+        raise Exception(
+            "SLURM sbatch returned exit code {!r}\n"
+            "STDOUT: {}\n"
+            "STDERR: {}\n"
+            "Command list representation: {!r}".
+            format(child_return_code, child_stdout, child_stderr, command))
+
+    # Parse the multi-line STDOUT string to get the SLURM process identifier and name.
+    # The response to the SLURM sbatch command looks like:
+    # Submitted batch job 137657
+
+    for line in child_stdout.splitlines(False):
+        match = re.search(pattern=r'Submitted batch job (\d+)', string=line)
+        if match:
+            process_identifier = match.group(1)
+        else:
+            print('Could not parse the process identifier from the SLURM sbatch response line {}'.format(line))
+
+    return process_identifier
+
+
+def _submit_job(process_identifier_dict, job_name, command):
+    """Submit a SLURM job and set its process identifier in a Python C{dict}.
+
+    @param process_identifier_dict: Python C{dict} of Python C{str} (job name) key data and
+        Python C{str} (SLURM process identifier) value data
+    @type process_identifier_dict: dict
+    @param job_name: Job name
+    @type job_name: str
+    @param command: Python C{list} of Python C{str} (command line) objects
+    @type command: list
+    """
+
+    process_identifier_dict[job_name] = _run_sbatch(command=command)
+
+
+def _get_array_family_list(drms):
+    """Get families of C{Executable} objects that can be submitted as SLURM job arrays.
+
+    A family consists of C{Executable} objects of the same C{DRMS}, which are submitted, not on hold,
+    do not depend on any other C{Executable} of the C{DRMS} and share the same dependencies and the same
+    memory and time limits. Since all other resources are those of the C{DRMS}, they differ only by their
+    command lines.
+    @param drms: Distributed Resource Management System (C{DRMS})
+    @type drms: DRMS
+    @return: Python C{list} of Python C{list} objects of C{Executable} objects
+    @rtype: list
+    """
+
+    executable_names = set(map(lambda x: x.name, drms.executables))
+
+    family_dict = dict()
+    family_list = list()
+
+    for executable in drms.executables:
+        if not executable.submit or executable.hold:
+            continue
+        if len(executable_names.intersection(executable.dependencies)):
+            continue
+        key = (tuple(sorted(executable.dependencies)), executable.memory_limit_hard, executable.time_limit)
+        if key not in family_dict or len(family_dict[key]) >= array_maximum_size:
+            family_dict[key] = list()
+            family_list.append(family_dict[key])
+        family_dict[key].append(executable)
+
+    return filter(lambda x: len(x) >= array_minimum_size, family_list)
+
+
+def _write_array_script(drms, array_name, family):
+    """Write a GNU Bourne-Again Shell (BASH) script mapping SLURM array indices to C{Executable} command lines.
+
+    @param drms: Distributed Resource Management System (C{DRMS})
+    @type drms: DRMS
+    @param array_name: SLURM job array name
+    @type array_name: str
+    @param family: Python C{list} of C{Executable} objects
+    @type family: list
+    @return: Script file path
+    @rtype: str | unicode
+    """
+
+    output = str()
+    output += "#! /bin/bash\n"
+    output += "\n"
+    output += "# Index-to-command table of the SLURM job array {}.\n".format(array_name)
+    output += "\n"
+    output += "case \"${SLURM_ARRAY_TASK_ID}\" in\n"
+
+    for index in range(0, len(family)):
+        executable = family[index]
+        output += "  {})\n".format(index)
+        output += "    # {}\n".format(executable.name)
+        output += "    exec " + string.join(words=map(lambda x: pipes.quote(x), executable.command_list()), sep=' ')
+        if executable.stdout_path:
+            output += " 1>{}".format(pipes.quote(executable.stdout_path))
+        if executable.stderr_path:
+            output += " 2>{}".format(pipes.quote(executable.stderr_path))
+        output += "\n"
+        output += "    ;;\n"
+
+    output += "  *)\n"
+    output += "    echo \"Unknown SLURM array index ${SLURM_ARRAY_TASK_ID}.\" 1>&2\n"
+    output += "    exit 1\n"
+    output += "    ;;\n"
+    output += "esac\n"
+
+    script_path = os.path.join(drms.work_directory, 'bsfpython_slurm_{}.bash'.format(array_name))
+    script_file = open(name=script_path, mode='w')
+    script_file.write(output)
+    script_file.close()
+
+    os.chmod(script_path, 0755)
+
+    return script_path
+
 
 def submit(drms, debug=0):
     """Submit C{Executable} objects into the Simple Linux Utility for Resource Management (SLURM)
     Distributed Resource Management System (DRMS).
 
+    Families of C{Executable} objects that differ only by their command lines are submitted as
+    SLURM job arrays. The array job and each array element are recorded as C{ProcessSLURM} objects,
+    so that dependencies can be set on individual elements via their C{Executable.name} or on the
+    whole array via its name.
+    C{Executable} objects are submitted in topological waves of their dependencies, with up to
+    C{DRMS.submit_threads} concurrent submissions per wave.
     @param drms: Distributed Resource Management System (C{DRMS})
     @type drms: DRMS
     @param debug: Debug level
@@ -56,13 +418,25 @@ def submit(drms, debug=0):
 
     database_path = os.path.join(drms.work_directory, 'bsfpython_slurm_jobs.db')
 
-    database_connection = DatabaseConnection(file_path=database_path)
+    database_connection = DatabaseConnection(file_path=database_path, write_ahead_log=drms.database_write_ahead_log)
     database_connection.create_schema()
     # TODO: Not sure it is a good idea to require this after every call?
     # Should this be part of the DatabaseConnection method?
     job_submission_adaptor = JobSubmissionAdaptor(database_connection=database_connection)
     process_slurm_adaptor = ProcessSLURMAdaptor(database_connection=database_connection)
 
+    # Read the latest job identifiers of all job names that Executable objects depend on once.
+    # Job identifiers are kept up-to-date in memory and written in a single transaction at the end.
+
+    dependency_names = set()
+    for executable in drms.executables:
+        dependency_names.update(executable.dependencies)
+
+    job_id_dict = process_slurm_adaptor.select_job_id_dict(name_list=list(dependency_names))
+
+    job_submission_list = list()
+    process_slurm_list = list()
+
     output = str()
     output += "#! /bin/bash\n"
     output += "\n"
@@ -71,208 +445,566 @@ def submit(drms, debug=0):
         output += "# BSF-Python debug mode: {}\n".format(debug)
         output += "\n"
 
+    # Map the first Executable of each family to the family, so that the job array gets submitted in its place.
+
+    array_family_dict = dict()
+    array_member_set = set()
+
+    for family in _get_array_family_list(drms=drms):
+        array_family_dict[family[0].name] = family
+        array_member_set.update(map(lambda x: x.name, family))
+
+    # Submit the Executable objects in topological waves, so that the SLURM process identifiers of all
+    # dependencies are known, before an Executable gets submitted. Within each wave, up to
+    # DRMS.submit_threads submissions run concurrently. SLURM command lines are kept in a Python dict,
+    # so that the Bash script lists them in the order of the DRMS.executables list.
+
+    command_dict = dict()
+
+    try:
+        for wave in get_wave_list(executables=drms.executables):
+
+            keywords_list = list()
+            process_identifier_dict = dict()
+
+            for executable in wave:
+
+                if executable.name in array_family_dict:
+
+                    family = array_family_dict[executable.name]
+
+                    array_name = '{}_array_{}'.format(drms.name, executable.name)
+
+                    command = list()
+                    command.append('sbatch')
+                    command.extend(_get_resource_options(
+                        drms=drms,
+                        job_name=array_name,
+                        array=True,
+                        executable=executable))
+
+                    command.extend(_get_priority_options(executable_list=family))
+
+                    command.append('--array')
+                    command.append('0-{}'.format(len(family) - 1))
+
+                    command.extend(_get_dependency_options(
+                        job_id_dict=job_id_dict,
+                        executable=executable,
+                        debug=debug))
+
+                    command.append(_write_array_script(drms=drms, array_name=array_name, family=family))
+
+                    # Submit this command if not in debug mode.
+
+                    if debug == 0:
+                        keywords_list.append({
+                            'process_identifier_dict': process_identifier_dict,
+                            'job_name': array_name,
+                            'command': command})
+
+                    command_dict[executable.name] = command
+
+                elif executable.name in array_member_set:
+
+                    # This Executable gets submitted as element of a SLURM job array.
+
+                    pass
+
+                else:
+
+                    command = list()
+                    command.append('sbatch')
+                    command.extend(_get_resource_options(
+                        drms=drms,
+                        job_name=executable.name,
+                        executable=executable))
+                    command.extend(_get_priority_options(executable_list=[executable]))
+                    command.extend(_get_dependency_options(
+                        job_id_dict=job_id_dict,
+                        executable=executable,
+                        debug=debug))
+
+                    command.extend(executable.command_list())
+
+                    if executable.stdout_path:
+                        command.append("1>{}".format(executable.stdout_path))
+                    if executable.stderr_path:
+                        command.append("2>{}".format(executable.stderr_path))
+
+                    # Submit this command if requested and not in debug mode.
+
+                    if executable.submit and debug == 0:
+                        keywords_list.append({
+                            'process_identifier_dict': process_identifier_dict,
+                            'job_name': executable.name,
+                            'command': command})
+
+                    command_dict[executable.name] = command
+
+            try:
+                run_concurrently(function=_submit_job, keywords_list=keywords_list, threads=drms.submit_threads)
+            finally:
+                # Set the results in the Executable.process_identifier instance variables,
+                # also of Executable objects submitted before a submission of this wave failed.
+
+                for executable in wave:
+
+                    if executable.name in array_family_dict:
+                        family = array_family_dict[executable.name]
+                        array_name = '{}_array_{}'.format(drms.name, executable.name)
+                        process_identifier = process_identifier_dict.get(array_name)
+
+                        if process_identifier:
+                            for index in range(0, len(family)):
+                                family[index].process_identifier = '{}_{}'.format(process_identifier, index)
+
+                            job_id_dict[array_name] = process_identifier
+                            process_slurm_list.append(ProcessSLURM(job_id=process_identifier, job_name=array_name))
+
+                    elif executable.name in process_identifier_dict:
+                        executable.process_identifier = process_identifier_dict[executable.name]
+
+                for executable in wave:
+
+                    # Only store a ProcessSLURM object, if an Executable has been submitted into SLURM.
+
+                    if not executable.process_identifier:
+                        continue
+
+                    if job_id_dict.get(executable.name) != executable.process_identifier:
+                        job_id_dict[executable.name] = executable.process_identifier
+                        process_slurm_list.append(
+                            ProcessSLURM(job_id=executable.process_identifier, job_name=executable.name))
+
+                    # Only UPDATE or INSERT submitted Executable objects, so that the latest job identifiers
+                    # of Executable objects not submitted this time (e.g. cached ones) are retained.
+
+                    job_submission_list.append(JobSubmission(
+                        executable_id=0,
+                        name=executable.name,
+                        command=executable.command_str(),
+                        drms_name=drms.name,
+                        job_id=executable.process_identifier))
+    finally:
+        # Write all JobSubmission and ProcessSLURM objects in a single transaction,
+        # even if a submission failed, so that jobs submitted before remain tracked.
+
+        with database_connection.transaction():
+            job_submission_adaptor.upsert_many(data_object_list=job_submission_list, key_name='name')
+            process_slurm_adaptor.upsert_many(data_object_list=process_slurm_list, key_name='job_id')
+
+    # Copy the SLURM command lines to the Bash script.
+
     for executable in drms.executables:
+        if executable.name in command_dict:
+            output += string.join(words=command_dict[executable.name], sep=' ') + "\n"
+            output += "\n"
 
-        command = list()
+    script_path = os.path.join(drms.work_directory, 'bsfpython_slurm_{}.bash'.format(drms.name))
+    script_file = open(name=script_path, mode='w')
+    script_file.write(output)
+    script_file.close()
 
-        command.append('sbatch')
 
-        # Add DRMS-specific options.
+# Number of seconds the time window of an accounting synchronisation overlaps the high-water mark,
+# so that job records reaching the SLURM accounting database late are not missed.
+accounting_overlap = 600
 
-        # Binary or script
+# Number of job records stored per transaction.
+accounting_batch_size = 1000
 
-        # Job resource string ...
+_integer_pattern = re.compile(pattern=r'^(\d+(?:\.\d+)?)([KMGTP]?)$')
 
-        # SLURM-specific sanity checks ...
+_seconds_pattern = re.compile(pattern=r'^(?:(?:(\d+)-)?(\d+):)?(\d+):(\d+(?:\.\d+)?)$')
 
-        # If a hard memory limit has been set, use it as the minimum free required.
 
-        if drms.memory_limit_hard:
-            if not drms.memory_free_virtual:
-                drms.memory_free_virtual = drms.memory_limit_hard
+def _get_text(value):
+    """Get a SLURM sacct text value.
 
-        # TODO: The memory must be specified in MB.
-        # Maybe it would be worth having a routine that converts suffixes into MB.
-        # This should use memory_limit_soft or memory_limit_hard.
-        # TODO: Not sure how to use this in a situation like BWA where a multi-threaded application does not use
-        # memory for each thread.
+    @param value: SLURM sacct field value
+    @type value: str
+    @return: Text value or C{None} for an empty field
+    @rtype: str | None
+    """
 
-        if drms.memory_limit_hard:
-            # command.append('--mem-per-cpu')
-            command.append('--mem')
-            command.append(drms.memory_limit_hard)
+    if value:
+        return value
+    else:
+        return
 
-        command.append('--time')
-        command.append(drms.time_limit)
 
-        # Propagate none of the environment variables.
+def _get_time(value):
+    """Get a SLURM sacct time value in ISO 8601 format.
 
-        command.append('--export')
-        command.append('NONE')
+    @param value: SLURM sacct field value (e.g. 2014-04-19T10:02:03, Unknown or None)
+    @type value: str
+    @return: Time in ISO 8601 format or C{None} for an unknown time
+    @rtype: str | None
+    """
 
-        # Get the user environment resembling a login shell.
+    if value and value[0].isdigit():
+        return value
+    else:
+        return
 
-        command.append('--get-user-env=L')
-        # command.append('L')
 
-        # Parallel environment
+def _get_integer(value):
+    """Get a SLURM sacct number with an optional I{K}, I{M}, I{G}, I{T} or I{P} suffix (base 1024) as integer.
 
-        if drms.parallel_environment:
-            command.append('--distribution')
-            command.append(drms.parallel_environment)
-            command.append('--ntasks')
-            command.append('1')
-            command.append('--cpus-per-task')
-            command.append(str(drms.threads))
+    Memory and disk values are thereby converted into bytes.
+    @param value: SLURM sacct field value (e.g. 0, 2412K or 1.50M)
+    @type value: str
+    @return: Integer value or C{None} if the value could not be parsed
+    @rtype: int | None
+    """
 
-        command.append('--requeue')
+    match = _integer_pattern.search(string=value)
 
-        # The --share option may no longer be needed.
-        # command.append('--share')
+    if not match:
+        return
 
-        # Queue name
+    return int(round(float(match.group(1)) * 1024 ** ' KMGTP'.index(match.group(2) or ' ')))
 
-        if drms.queue:
-            command.append('--partition')
-            command.append(drms.queue)
 
-        # Working directory, standard output and standard error streams.
+def _get_seconds(value):
+    """Get a SLURM sacct duration in I{[DD-[HH:]]MM:SS[.mmm]} format in seconds.
 
-        if drms.work_directory:
-            command.append('--workdir')
-            command.append(drms.work_directory)
+    @param value: SLURM sacct field value (e.g. 00:00.003, 01:02:03 or 1-01:02:03)
+    @type value: str
+    @return: Seconds or C{None} if the value could not be parsed (e.g. UNLIMITED)
+    @rtype: int | None
+    """
 
-            # Write standard output and standard error streams into a
-            # 'bsfpython_slurm_output' directory under the 'working_directory'.
+    match = _seconds_pattern.search(string=value)
+
+    if not match:
+        return
+
+    (days, hours, minutes, seconds) = match.groups()
+
+    return int(round(
+        int(days or 0) * 86400 + int(hours or 0) * 3600 + int(minutes) * 60 + float(seconds)))
+
+
+# SLURM sacct fields, corresponding ProcessSLURM attributes and functions converting field values.
+
+accounting_field_list = [
+    ['JobID', 'job_id', _get_text],
+    ['JobName', 'job_name', _get_text],
+    ['Partition', 'partition', _get_text],
+    ['MaxVMSize', 'max_vm_size', _get_integer],
+    ['MaxVMSizeNode', 'max_vm_size_node', _get_text],
+    ['MaxVMSizeTask', 'max_vm_size_task', _get_text],
+    ['AveVMSize', 'average_vm_size', _get_integer],
+    ['MaxRSS', 'max_rss', _get_integer],
+    ['MaxRSSNode', 'max_rss_node', _get_text],
+    ['MaxRSSTask', 'max_rss_task', _get_text],
+    ['AveRSS', 'average_rss', _get_integer],
+    ['MaxPages', 'max_pages', _get_integer],
+    ['MaxPagesNode', 'max_pages_node', _get_text],
+    ['MaxPagesTask', 'max_pages_task', _get_text],
+    ['AvePages', 'average_pages', _get_integer],
+    ['MinCPU', 'min_cpu', _get_seconds],
+    ['MinCPUNode', 'min_cpu_node', _get_text],
+    ['MinCPUTask', 'min_cpu_task', _get_text],
+    ['AveCPU', 'average_cpu', _get_seconds],
+    ['NTasks', 'number_tasks', _get_integer],
+    ['AllocCPUS', 'allocated_cpus', _get_integer],
+    ['Elapsed', 'elapsed', _get_seconds],
+    ['State', 'state', _get_text],
+    ['ExitCode', 'exit_code', _get_text],
+    ['AveCPUFreq', 'average_cpu_frequency', _get_text],
+    ['ReqCPUFreq', 'requested_cpu_frequency', _get_text],
+    ['ReqMem', 'requested_memory', _get_text],
+    ['ConsumedEnergy', 'consumed_energy', _get_integer],
+    ['MaxDiskRead', 'max_disk_read', _get_integer],
+    ['MaxDiskReadNode', 'max_disk_read_node', _get_text],
+    ['MaxDiskReadTask', 'max_disk_read_task', _get_text],
+    ['AveDiskRead', 'average_disk_read', _get_integer],
+    ['MaxDiskWrite', 'max_disk_write', _get_integer],
+    ['MaxDiskWriteNode', 'max_disk_write_node', _get_text],
+    ['MaxDiskWriteTask', 'max_disk_write_task', _get_text],
+    ['AveDiskWrite', 'average_disk_write', _get_integer],
+    ['Submit', 'submit_time', _get_time],
+    ['Start', 'start_time', _get_time],
+    ['End', 'end_time', _get_time],
+    ['Timelimit', 'time_limit', _get_seconds]
+]
+
+
+def _get_process_slurm(field_list):
+    """Get a C{ProcessSLURM} object from the fields of a SLURM sacct --parsable2 line.
+
+    @param field_list: Python C{list} of Python C{str} (field value) objects
+        in the order of C{accounting_field_list}
+    @type field_list: list
+    @return: C{ProcessSLURM} or C{None}, if the number of fields does not match
+    @rtype: ProcessSLURM | None
+    """
 
-            # TODO: Use slurm_output_name to keep --error and --output relative to the --workdir and
-            # slurm_output_path to create the directory.
-            output_directory_path = os.path.join(drms.work_directory, output_directory)
+    # Job names may contain the field separator, which shifts all subsequent fields.
 
-            if not os.path.isdir(output_directory_path):
-                # In principle, a race condition could occur as the directory
-                # could have been created after its existence has been checked.
-                try:
-                    os.makedirs(output_directory_path)
-                except OSError as exception:
-                    if exception.errno != errno.EEXIST:
-                        raise
+    surplus = len(field_list) - len(accounting_field_list)
 
-            command.append('--error')
-            command.append(os.path.join(output_directory, string.join(words=(executable.name, '%j.err'), sep='_')))
+    if surplus < 0:
+        return
 
-            command.append('--output')
-            command.append(os.path.join(output_directory, string.join(words=(executable.name, '%j.out'), sep='_')))
+    if surplus > 0:
+        field_list[1:surplus + 2] = [string.join(words=field_list[1:surplus + 2], sep='|')]
 
-        # Job name
+    process_slurm = ProcessSLURM()
 
-        if executable.name:
-            command.append('--job-name')
-            command.append(executable.name)
+    for (field_value, (field_name, attribute_name, function)) in zip(field_list, accounting_field_list):
+        process_slurm.__setattr__(attribute_name, function(field_value))
 
-        # Job hold conditions
-        # A particular feature of SLURM is its inability to set process dependencies on process names.
-        # Rather, dependencies need setting on the process identifier, which is only obtained after
-        # submitting the process. Isn't that exactly what we have a scheduler for? Sigh.
-        # Consequently, SLURM process identifiers need to be tracked here, by means of an SQLite database.
+    return process_slurm
 
-        process_identifier_list = list()
-        for executable_name in executable.dependencies:
-            process_slurm_list = process_slurm_adaptor.select_all_by_job_name(name=executable_name)
-            if len(process_slurm_list):
-                # This Executable has been submitted at least once before.
-                # For the moment, set the dependency on the last submission.
-                process_identifier_list.append(process_slurm_list[-1].job_id)
-            elif debug == 0:
-                warnings.warn(
-                    "While submitting Executable with name {!r}, "
-                    "Executable with name {!r} that it depends on, "
-                    "has not been submitted before.".
-                    format(executable.name, executable_name),
-                    UserWarning)
-        if len(process_identifier_list):
-            # Only set the dependency option if there are some on the process identifier list.
-            # The identifier list may be empty if no dependencies exist or no Executable has been submitted before.
-            command.append('--dependency')
-            command.append(string.join(words=map(lambda x: 'afterok:' + x, process_identifier_list), sep=','))
 
-        command.extend(executable.command_list())
+def _get_job_id_key(job_id):
+    """Get a key for ordering SLURM job identifiers numerically.
 
-        if executable.stdout_path:
-            command.append("1>{}".format(executable.stdout_path))
-        if executable.stderr_path:
-            command.append("2>{}".format(executable.stderr_path))
+    SLURM job identifiers of jobs, array tasks and job steps (e.g. I{1000}, I{1000_5}, I{1000_5.batch}) are
+    compared by their numeric components, so that I{9} sorts before I{10} and array tasks sort by task
+    identifier. The job identifier itself breaks ties between job steps of the same numeric components.
+    @param job_id: SLURM job identifier or C{None}
+    @type job_id: str | None
+    @return: Python C{tuple} of Python C{tuple} of Python C{int} (numeric components) and
+        Python C{str} (job identifier) objects
+    @rtype: tuple
+    """
 
-        # Finally, submit this command if requested and not in debug mode.
+    if job_id is None:
+        return tuple(), str()
+
+    return tuple(map(lambda x: int(x), re.findall(pattern=r'[0-9]+', string=job_id))), job_id
+
+
+def synchronise_accounting(database_connection, user=None, start_time=None):
+    """Synchronise C{ProcessSLURM} objects incrementally with the SLURM accounting database.
+
+    SLURM sacct reports all jobs that were pending, running or finished since the start of the time window.
+    The window starts at the high-water mark of the previous synchronisation, less C{accounting_overlap}
+    seconds, so that only new or changed jobs are fetched. The output of SLURM sacct is parsed line by line
+    and C{ProcessSLURM} objects are updated or inserted by job identifier in batches of
+    C{accounting_batch_size}. Jobs and job steps are stored as separate objects.
+    The new high-water mark, the end time and job identifier of the latest finished job, is only
+    recorded after all job records have been stored, so that an interrupted synchronisation gets repeated.
+    Job identifiers of jobs finishing at the same time are compared numerically via C{_get_job_id_key}.
+    @param database_connection: C{DatabaseConnection}
+    @type database_connection: DatabaseConnection
+    @param user: User name to restrict the synchronisation to or C{None} for the current user
+    @type user: str
+    @param start_time: Start of the time window in ISO 8601 format for the first synchronisation or
+        C{None} for the SLURM sacct default (i.e. midnight)
+    @type start_time: str
+    @return: C{ProcessSLURMSync} recording the synchronisation
+    @rtype: ProcessSLURMSync
+    """
 
-        if executable.submit and debug == 0:
+    process_slurm_adaptor = ProcessSLURMAdaptor(database_connection=database_connection)
+    process_slurm_sync_adaptor = ProcessSLURMSyncAdaptor(database_connection=database_connection)
 
-            child_process = subprocess.Popen(args=command,
-                                             bufsize=4096,
-                                             stdin=subprocess.PIPE,
-                                             stdout=subprocess.PIPE,
-                                             stderr=subprocess.PIPE,
-                                             shell=False,
-                                             close_fds=True)
+    process_slurm_sync = ProcessSLURMSync(sync_time=datetime.datetime.now().strftime('%Y-%m-%dT%H:%M:%S'))
 
-            # Although subprocess.communicate() may block when memory buffers
-            # have been filled up, not much STDOUT and STDERR is expected from
-            # SLURM sbatch.
+    previous_sync = process_slurm_sync_adaptor.select_latest()
 
-            (child_stdout, child_stderr) = child_process.communicate(input=None)
+    if previous_sync and previous_sync.end_time:
+        process_slurm_sync.start_time = (
+            datetime.datetime.strptime(previous_sync.end_time, '%Y-%m-%dT%H:%M:%S') -
+            datetime.timedelta(seconds=accounting_overlap)).strftime('%Y-%m-%dT%H:%M:%S')
+        process_slurm_sync.end_time = previous_sync.end_time
+        process_slurm_sync.job_id = previous_sync.job_id
+    else:
+        process_slurm_sync.start_time = start_time
 
-            child_return_code = child_process.returncode
+    command = list()
+    command.append('sacct')
+    command.append('--parsable2')
+    command.append('--noheader')
+    command.append('--format')
+    command.append(string.join(words=map(lambda x: x[0], accounting_field_list), sep=','))
 
-            if child_return_code:
-                raise Exception(
-                    "SLURM sbatch returned exit code {!r}\n"
-                    "STDOUT: {}\n"
-                    "STDERR: {}\n"
-                    "Command list representation: {!r}".
-                    format(child_return_code, child_stdout, child_stderr, command))
+    if user:
+        command.append('--user')
+        command.append(user)
 
-            # Parse the multi-line STDOUT string to get the SLURM process identifier and name.
-            # The response to the SLURM sbatch command looks like:
-            # Submitted batch job 137657
-            # Set the result in the Executable.process_identifier instance variable.
+    if process_slurm_sync.start_time:
+        command.append('--starttime')
+        command.append(process_slurm_sync.start_time)
 
-            for line in child_stdout.splitlines(False):
-                match = re.search(pattern=r'Submitted batch job (\d+)', string=line)
-                if match:
-                    executable.process_identifier = match.group(1)
-                else:
-                    print('Could not parse the process identifier from the SLURM sbatch response line {}'.format(line))
+    # Write STDERR into a temporary file, so that reading STDOUT line by line cannot block.
 
-        # Copy the SLURM command line to the Bash script.
+    stderr_file = tempfile.TemporaryFile()
 
-        output += string.join(words=command, sep=' ') + "\n"
-        output += "\n"
+    child_process = subprocess.Popen(args=command,
+                                     bufsize=-1,
+                                     stdin=None,
+                                     stdout=subprocess.PIPE,
+                                     stderr=stderr_file,
+                                     shell=False,
+                                     close_fds=True)
+
+    job_count = 0
+    process_slurm_list = list()
+
+    try:
+        for line in child_process.stdout:
+            process_slurm = _get_process_slurm(field_list=line.rstrip('\n').split('|'))
+
+            if process_slurm is None:
+                warnings.warn('Could not parse SLURM sacct line {!r}'.format(line), UserWarning)
+                continue
+
+            process_slurm_list.append(process_slurm)
+
+            if process_slurm.end_time and \
+                    (process_slurm.end_time, _get_job_id_key(job_id=process_slurm.job_id)) > \
+                    (process_slurm_sync.end_time, _get_job_id_key(job_id=process_slurm_sync.job_id)):
+                process_slurm_sync.end_time = process_slurm.end_time
+                process_slurm_sync.job_id = process_slurm.job_id
 
-        # Regardless of an actual Executable submission, UPDATE it in or INSERT it into the SQLite database.
+            if len(process_slurm_list) >= accounting_batch_size:
+                process_slurm_adaptor.upsert_many(data_object_list=process_slurm_list, key_name='job_id')
+                job_count += len(process_slurm_list)
+                process_slurm_list = list()
 
-        job_submission = job_submission_adaptor.select_by_name(name=executable.name)
-        if job_submission:
-            job_submission.command = executable.command_str()
-            job_submission_adaptor.update(data_object=job_submission)
+        process_slurm_adaptor.upsert_many(data_object_list=process_slurm_list, key_name='job_id')
+        job_count += len(process_slurm_list)
+    finally:
+        child_process.stdout.close()
+        child_return_code = child_process.wait()
+
+    if child_return_code:
+        stderr_file.seek(0)
+        raise Exception(
+            "SLURM sacct returned exit code {!r}\n"
+            "STDERR: {}\n"
+            "Command list representation: {!r}".
+            format(child_return_code, stderr_file.read(), command))
+
+    stderr_file.close()
+
+    process_slurm_sync.job_count = job_count
+
+    with database_connection.transaction():
+        process_slurm_sync_adaptor.insert_many(data_object_list=[process_slurm_sync])
+
+    return process_slurm_sync
+
+
+# SLURM squeue states of jobs that have been allocated resources. All other jobs listed are pending.
+squeue_running_states = ('RUNNING', 'COMPLETING', 'SUSPENDED', 'STOPPED', 'SIGNALING', 'STAGE_OUT')
+
+# SLURM sacct states of jobs that have not finished (yet).
+accounting_active_states = ('PENDING', 'RUNNING', 'REQUEUED', 'RESIZING', 'SUSPENDED', 'REQUEUE_HOLD')
+
+
+def _run_squeue(user=None):
+    """Run SLURM squeue once for all pending and running jobs.
+
+    Job arrays are listed with one line per array element.
+    @param user: User name to restrict the listing to or C{None} for the jobs of all users
+    @type user: str
+    @return: SLURM squeue output
+    @rtype: str
+    """
+
+    command = list()
+    command.append('squeue')
+    command.append('--array')
+    command.append('--noheader')
+    command.append('--format=%i|%j|%T')
+
+    if user:
+        command.append('--user')
+        command.append(user)
+
+    child_process = subprocess.Popen(args=command,
+                                     bufsize=-1,
+                                     stdin=None,
+                                     stdout=subprocess.PIPE,
+                                     stderr=subprocess.PIPE,
+                                     shell=False,
+                                     close_fds=True)
+
+    (child_stdout, child_stderr) = child_process.communicate(input=None)
+
+    if child_process.returncode:
+        raise Exception(
+            "SLURM squeue returned exit code {!r}\n"
+            "STDERR: {}\n"
+            "Command list representation: {!r}".
+            format(child_process.returncode, child_stderr, command))
+
+    return child_stdout
+
+
+def get_job_state_dict(job_submission_list, database_connection, user=None, output=None):
+    """Get the state of C{JobSubmission} objects with a single SLURM squeue call.
+
+    Jobs listed by SLURM squeue are either I{pending} or I{running}. The state of all other jobs is
+    looked up in bulk in the C{ProcessSLURM} objects of the job database, which are kept up-to-date via
+    C{synchronise_accounting}. Successfully completed jobs are I{done}, jobs that were cancelled or failed
+    otherwise are I{failed}. Jobs that are neither listed nor accounted for or that have not been submitted
+    are I{unknown}.
+    @param job_submission_list: Python C{list} of C{JobSubmission} objects
+    @type job_submission_list: list
+    @param database_connection: C{DatabaseConnection}
+    @type database_connection: DatabaseConnection
+    @param user: User name to restrict SLURM squeue to or C{None} for the jobs of all users
+    @type user: str
+    @param output: SLURM squeue --array --noheader --format=%i|%j|%T output (e.g. for testing) or
+        C{None} to run SLURM squeue
+    @type output: str
+    @return: Python C{dict} of Python C{str} (C{JobSubmission.name}) key data and
+        Python C{str} (I{pending}, I{running}, I{failed}, I{done} or I{unknown}) value data
+    @rtype: dict
+    """
+
+    if output is None:
+        output = _run_squeue(user=user)
+
+    # The job identifier is the first and the state the last field, since job names may contain the separator.
+
+    active_dict = dict()
+
+    for line in output.splitlines():
+        field_list = line.strip().split('|')
+        if len(field_list) < 3:
+            continue
+        if field_list[-1] in squeue_running_states:
+            active_dict[field_list[0]] = 'running'
         else:
-            job_submission = JobSubmission(
-                executable_id=0,
-                name=executable.name,
-                command=executable.command_str())
-            job_submission_adaptor.insert(data_object=job_submission)
+            active_dict[field_list[0]] = 'pending'
+
+    process_slurm_adaptor = ProcessSLURMAdaptor(database_connection=database_connection)
 
-        # Only store a ProcessSLURM object, if an Executable has been submitted into SLURM.
+    accounting_dict = process_slurm_adaptor.select_state_dict(
+        job_id_list=filter(lambda x: x and x not in active_dict, map(lambda x: x.job_id, job_submission_list)))
 
-        if executable.process_identifier:
-            process_slurm = process_slurm_adaptor.select_by_job_id(job_id=executable.process_identifier)
-            if not process_slurm:
-                process_slurm = ProcessSLURM(job_id=executable.process_identifier, job_name=executable.name)
-                process_slurm_adaptor.insert(data_object=process_slurm)
+    job_state_dict = dict()
 
-        # The commit statement should affect both insert statements above.
-        job_submission_adaptor.database_connection.connection.commit()
+    for job_submission in job_submission_list:
+        job_id = job_submission.job_id
 
-    script_path = os.path.join(drms.work_directory, 'bsfpython_slurm_{}.bash'.format(drms.name))
-    script_file = open(name=script_path, mode='w')
-    script_file.write(output)
-    script_file.close()
+        if not job_id:
+            job_state = 'unknown'
+        elif job_id in active_dict:
+            job_state = active_dict[job_id]
+        elif not accounting_dict.get(job_id):
+            job_state = 'unknown'
+        else:
+            # SLURM sacct states may carry a suffix (e.g. CANCELLED by 1234).
+            accounting_state = accounting_dict[job_id].split()[0]
+            if accounting_state == 'COMPLETED':
+                job_state = 'done'
+            elif accounting_state in accounting_active_states:
+                # No longer listed by SLURM squeue, but the accounting is not up-to-date yet.
+                job_state = 'unknown'
+            else:
+                job_state = 'failed'
+
+        job_state_dict[job_submission.name] = job_state
+
+    return job_state_dict
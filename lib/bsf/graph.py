@@ -0,0 +1,413 @@
+"""bsf.graph
+
+A package of classes and methods modelling the dependency graph of Executable objects
+across the DRMS objects of an Analysis.
+"""
+
+#
+# Copyright 2014 Michael K. Schuster
+#
+# Biomedical Sequencing Facility (BSF), part of the genomics core facility
+# of the Research Center for Molecular Medicine (CeMM) of the
+# Austrian Academy of Sciences and the Medical University of Vienna (MUW).
+#
+#
+# This file is part of BSF Python.
+#
+# BSF Python is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# BSF Python is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with BSF Python.  If not, see <http://www.gnu.org/licenses/>.
+
+
+import datetime
+import string
+
+from bsf.database import ProcessLocalAdaptor, ProcessSGEAdaptor, ProcessSLURMAdaptor
+from bsf.drms import get_job_database_connection, get_memory
+
+
+def get_history_cost(drms, limit=1000):
+    """Get the median wall time of earlier, successful C{Executable} objects of a C{DRMS}.
+
+    Earlier C{Executable} objects are identified in the job database of the C{DRMS} implementation
+    by job names starting with the C{DRMS.name} followed by an underscore, excluding the job names of
+    C{DRMS} objects with a longer name starting the same way.
+    @param drms: Distributed Resource Management System (C{DRMS})
+    @type drms: DRMS
+    @param limit: Maximum number of earlier C{Executable} objects
+    @type limit: int
+    @return: Median wall time in seconds or None, if no history is available
+    @rtype: float
+    """
+
+    adaptor_dict = {
+        'slurm': ProcessSLURMAdaptor,
+        'sge': ProcessSGEAdaptor,
+        'local': ProcessLocalAdaptor,
+    }
+
+    if drms.implementation not in adaptor_dict:
+        return
+
+    database_connection = get_job_database_connection(drms=drms)
+    adaptor = adaptor_dict[drms.implementation](database_connection=database_connection)
+
+    wall_time_list = sorted(adaptor.select_wall_time_list(drms_name=drms.name, limit=limit))
+
+    if not len(wall_time_list):
+        return
+
+    middle = len(wall_time_list) // 2
+
+    if len(wall_time_list) % 2:
+        return float(wall_time_list[middle])
+    else:
+        return (wall_time_list[middle - 1] + wall_time_list[middle]) / 2.0
+
+
+class ExecutableNode(object):
+    """The C{ExecutableNode} class represents an C{Executable} in the dependency graph.
+
+    Attributes:
+    @ivar executable: C{Executable}
+    @type executable: Executable
+    @ivar drms_name: C{DRMS.name}
+    @type drms_name: str
+    @ivar cost: Estimated wall time in seconds
+    @type cost: float
+    @ivar cost_source: Source of the estimate (i.e. I{history}, I{limit}, I{default} or
+        I{none} for C{Executable} objects that are not submitted)
+    @type cost_source: str
+    @ivar dependency_list: Python C{list} of C{ExecutableNode} objects this one depends on
+    @type dependency_list: list
+    @ivar dependent_list: Python C{list} of C{ExecutableNode} objects depending on this one
+    @type dependent_list: list
+    @ivar start_time: Earliest start time in seconds, given unlimited resources
+    @type start_time: float
+    @ivar bottom_level: Length in seconds of the longest path from the start of this C{ExecutableNode}
+        to the end of the graph
+    @type bottom_level: float
+    @ivar threads: Number of threads requested
+    @type threads: int
+    @ivar memory: Memory requested in MiB or 0, if unknown
+    @type memory: int
+    """
+
+    def __init__(self, executable, drms_name=None, cost=0.0, cost_source=None,
+                 dependency_list=None, dependent_list=None, start_time=0.0, bottom_level=0.0,
+                 threads=1, memory=0):
+        """Initialise an C{ExecutableNode} object.
+
+        @param executable: C{Executable}
+        @type executable: Executable
+        @param drms_name: C{DRMS.name}
+        @type drms_name: str
+        @param cost: Estimated wall time in seconds
+        @type cost: float
+        @param cost_source: Source of the estimate (i.e. I{history}, I{limit}, I{default} or I{none})
+        @type cost_source: str
+        @param dependency_list: Python C{list} of C{ExecutableNode} objects this one depends on
+        @type dependency_list: list
+        @param dependent_list: Python C{list} of C{ExecutableNode} objects depending on this one
+        @type dependent_list: list
+        @param start_time: Earliest start time in seconds
+        @type start_time: float
+        @param bottom_level: Length in seconds of the longest path to the end of the graph
+        @type bottom_level: float
+        @param threads: Number of threads requested
+        @type threads: int
+        @param memory: Memory requested in MiB or 0, if unknown
+        @type memory: int
+        """
+
+        self.executable = executable
+
+        if drms_name:
+            self.drms_name = drms_name
+        else:
+            self.drms_name = str()
+
+        self.cost = cost
+
+        if cost_source:
+            self.cost_source = cost_source
+        else:
+            self.cost_source = str()
+
+        if dependency_list:
+            self.dependency_list = dependency_list
+        else:
+            self.dependency_list = list()
+
+        if dependent_list:
+            self.dependent_list = dependent_list
+        else:
+            self.dependent_list = list()
+
+        self.start_time = start_time
+        self.bottom_level = bottom_level
+        self.threads = threads
+        self.memory = memory
+
+    def trace(self, level):
+        """Trace an C{ExecutableNode} object.
+
+        @param level: Indentation level
+        @type level: int
+        @return: Trace information
+        @rtype: str
+        """
+
+        indent = '  ' * level
+        output = str()
+        output += '{}{!r}\n'.format(indent, self)
+        output += '{}  executable:   {!r}\n'.format(indent, self.executable.name)
+        output += '{}  drms_name:    {!r}\n'.format(indent, self.drms_name)
+        output += '{}  cost:         {!r}\n'.format(indent, self.cost)
+        output += '{}  cost_source:  {!r}\n'.format(indent, self.cost_source)
+        output += '{}  dependencies: {!r}\n'.format(indent, map(lambda x: x.executable.name, self.dependency_list))
+        output += '{}  dependents:   {!r}\n'.format(indent, map(lambda x: x.executable.name, self.dependent_list))
+        output += '{}  start_time:   {!r}\n'.format(indent, self.start_time)
+        output += '{}  bottom_level: {!r}\n'.format(indent, self.bottom_level)
+        output += '{}  threads:      {!r}\n'.format(indent, self.threads)
+        output += '{}  memory:       {!r}\n'.format(indent, self.memory)
+
+        return output
+
+
+class ExecutableGraph(object):
+    """The C{ExecutableGraph} class represents the directed acyclic graph of C{Executable} objects
+    of several C{DRMS} objects and their dependencies.
+
+    The critical path is the longest chain of dependent C{Executable} objects, in terms of their
+    estimated wall time, which bounds the makespan of the whole graph, even if resources were unlimited.
+    C{Executable} objects with a long path ahead of them get a higher priority, so that they start
+    before C{Executable} objects that have plenty of slack.
+
+    Attributes:
+    @cvar default_cost: Wall time in seconds of C{Executable} objects without history or time limit
+    @type default_cost: int
+    @ivar node_list: Python C{list} of C{ExecutableNode} objects in topological order,
+        once the graph has been computed
+    @type node_list: list
+    @ivar makespan: Expected makespan in seconds, given unlimited resources
+    @type makespan: float
+    @ivar critical_path: Python C{list} of C{ExecutableNode} objects on the critical path
+    @type critical_path: list
+    """
+
+    default_cost = 3600
+
+    @classmethod
+    def from_drms_list(cls, drms_list, name_dict=None):
+        """Create an C{ExecutableGraph} from the C{Executable} objects of a Python C{list} of C{DRMS} objects.
+
+        The wall time of each C{Executable} is estimated from the median wall time of earlier, successful
+        C{Executable} objects of the same C{DRMS} via C{get_history_cost}. C{DRMS} objects that have packed
+        C{Executable} objects and C{DRMS} objects without history fall back to the time limit of the
+        C{Executable} or the C{DRMS} and finally to C{ExecutableGraph.default_cost}. C{Executable} objects
+        that are not submitted have no cost. Threads and memory requested are the ones of the C{DRMS},
+        unless the C{Executable} overrides the memory limit. The graph gets computed before it is returned.
+        @param drms_list: Python C{list} of C{DRMS} objects
+        @type drms_list: list
+        @param name_dict: Python C{dict} of Python C{str} (C{Executable.name}) key data and
+            Python C{str} (C{Executable.name}) value data redirecting dependencies (e.g. C{DRMS.pack_name_dict})
+        @type name_dict: dict
+        @return: C{ExecutableGraph}
+        @rtype: ExecutableGraph
+        """
+
+        if not name_dict:
+            name_dict = dict()
+
+        node_list = list()
+
+        for drms in drms_list:
+            if drms.packed and drms.get_pack_size() > 1:
+                history_cost = None
+            else:
+                history_cost = get_history_cost(drms=drms)
+
+            drms_seconds = drms.get_minutes(time_limit=drms.time_limit) * 60
+
+            for executable in drms.executables:
+                node = ExecutableNode(
+                    executable=executable,
+                    drms_name=drms.name,
+                    threads=max(1, int(drms.threads)),
+                    memory=get_memory(memory=executable.memory_limit_hard or drms.memory_limit_hard))
+
+                if not executable.submit:
+                    node.cost = 0.0
+                    node.cost_source = 'none'
+                elif history_cost is not None:
+                    node.cost = history_cost
+                    node.cost_source = 'history'
+                elif executable.time_limit and drms.get_minutes(time_limit=executable.time_limit):
+                    node.cost = float(drms.get_minutes(time_limit=executable.time_limit) * 60)
+                    node.cost_source = 'limit'
+                elif drms_seconds:
+                    node.cost = float(drms_seconds)
+                    node.cost_source = 'limit'
+                else:
+                    node.cost = float(cls.default_cost)
+                    node.cost_source = 'default'
+
+                node_list.append(node)
+
+        # Map names to nodes, to cope with Executable objects sharing a name.
+
+        node_dict = dict()
+        for node in node_list:
+            node_dict.setdefault(node.executable.name, list()).append(node)
+
+        for node in node_list:
+            for executable_name in node.executable.dependencies:
+                for dependency_node in node_dict.get(name_dict.get(executable_name, executable_name), list()):
+                    if dependency_node is not node and dependency_node not in node.dependency_list:
+                        node.dependency_list.append(dependency_node)
+                        dependency_node.dependent_list.append(node)
+
+        executable_graph = cls(node_list=node_list)
+        executable_graph.compute()
+
+        return executable_graph
+
+    def __init__(self, node_list=None, makespan=0.0, critical_path=None):
+        """Initialise an C{ExecutableGraph} object.
+
+        @param node_list: Python C{list} of C{ExecutableNode} objects
+        @type node_list: list
+        @param makespan: Expected makespan in seconds
+        @type makespan: float
+        @param critical_path: Python C{list} of C{ExecutableNode} objects on the critical path
+        @type critical_path: list
+        """
+
+        if node_list:
+            self.node_list = node_list
+        else:
+            self.node_list = list()
+
+        self.makespan = makespan
+
+        if critical_path:
+            self.critical_path = critical_path
+        else:
+            self.critical_path = list()
+
+    def trace(self, level):
+        """Trace an C{ExecutableGraph} object.
+
+        @param level: Indentation level
+        @type level: int
+        @return: Trace information
+        @rtype: str
+        """
+
+        indent = '  ' * level
+        output = str()
+        output += '{}{!r}\n'.format(indent, self)
+        output += '{}  makespan:      {!r}\n'.format(indent, self.makespan)
+        output += '{}  critical_path: {!r}\n'.format(indent, map(lambda x: x.executable.name, self.critical_path))
+
+        output += '{}  Python list of ExecutableNode objects:\n'.format(indent)
+        for node in self.node_list:
+            output += node.trace(level=level + 2)
+
+        return output
+
+    def compute(self):
+        """Compute the earliest start times, bottom levels, the makespan and the critical path.
+
+        The C{ExecutableGraph.node_list} gets sorted topologically, keeping the original order as far as possible.
+        @raise Exception: Circular dependencies among C{Executable} objects
+        """
+
+        dependency_count_dict = dict(map(lambda x: (x, len(x.dependency_list)), self.node_list))
+
+        sorted_list = filter(lambda x: not dependency_count_dict[x], self.node_list)
+
+        index = 0
+        while index < len(sorted_list):
+            for dependent_node in sorted_list[index].dependent_list:
+                dependency_count_dict[dependent_node] -= 1
+                if not dependency_count_dict[dependent_node]:
+                    sorted_list.append(dependent_node)
+            index += 1
+
+        if len(sorted_list) < len(self.node_list):
+            raise Exception(
+                'Circular dependencies among Executable objects {!r}.'.
+                format(map(lambda x: x.executable.name, filter(lambda x: dependency_count_dict[x], self.node_list))))
+
+        self.node_list = sorted_list
+
+        for node in self.node_list:
+            node.start_time = max([0.0] + map(lambda x: x.start_time + x.cost, node.dependency_list))
+
+        for node in reversed(self.node_list):
+            node.bottom_level = node.cost + max([0.0] + map(lambda x: x.bottom_level, node.dependent_list))
+
+        self.makespan = max([0.0] + map(lambda x: x.bottom_level, self.node_list))
+
+        # Follow the longest path from the start of the graph.
+
+        self.critical_path = list()
+
+        candidate_list = filter(lambda x: not len(x.dependency_list), self.node_list)
+
+        while len(candidate_list):
+            node = max(candidate_list, key=lambda x: x.bottom_level)
+            self.critical_path.append(node)
+            candidate_list = node.dependent_list
+
+    def assign_priorities(self):
+        """Set the C{Executable.priority} of each C{Executable} to the ratio of its bottom level and the makespan.
+
+        C{Executable} objects on the critical path get the highest priority of 1.0.
+        """
+
+        for node in self.node_list:
+            if self.makespan:
+                node.executable.priority = round(node.bottom_level / self.makespan, 4)
+            else:
+                node.executable.priority = 1.0
+
+    def report(self):
+        """Report the expected makespan and the critical path.
+
+        @return: Report
+        @rtype: str
+        """
+
+        output = str()
+        output += 'Expected makespan: {} ({:d} seconds) for {:d} Executable objects\n'. \
+            format(datetime.timedelta(seconds=int(self.makespan)), int(self.makespan), len(self.node_list))
+
+        source_dict = dict()
+        for node in self.node_list:
+            source_dict[node.cost_source] = source_dict.get(node.cost_source, 0) + 1
+
+        output += 'Cost estimates: {}\n'.format(string.join(
+            words=map(lambda x: '{} {:d}'.format(x, source_dict[x]), sorted(source_dict.keys())),
+            sep=', '))
+
+        output += 'Critical path:\n'
+        for node in self.critical_path:
+            output += '  {:>16s}  {:>16s}  {:8s}  {}\n'.format(
+                str(datetime.timedelta(seconds=int(node.start_time))),
+                str(datetime.timedelta(seconds=int(node.cost))),
+                node.cost_source,
+                node.executable.name)
+
+        return output
@@ -0,0 +1,45 @@
+"""bsf.runnables.pack
+
+A package of classes and methods to run a group of Executable objects packed into a single DRMS job.
+"""
+
+#
+# Copyright 2014 Michael K. Schuster
+#
+# Biomedical Sequencing Facility (BSF), part of the genomics core facility
+# of the Research Center for Molecular Medicine (CeMM) of the
+# Austrian Academy of Sciences and the Medical University of Vienna (MUW).
+#
+#
+# This file is part of BSF Python.
+#
+# BSF Python is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# BSF Python is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with BSF Python.  If not, see <http://www.gnu.org/licenses/>.
+
+
+def run(runnable):
+    """Run the the C{Runnable}.
+
+    The packed C{Executable} objects are run concurrently, up to C{Runnable.threads} at a time,
+    in the order of their dependencies. Each C{Executable} writes its own I{STDOUT} and I{STDERR} files,
+    while its return code and resource usage are recorded in the C{Runnable.resource_usage_path} file.
+    Completed C{Executable} objects are recorded in the C{Checkpoint} and not run again, if the job
+    needs re-submitting.
+
+    @param runnable: C{Runnable}
+    @type runnable: Runnable
+    """
+
+    runnable.run_executable_graph(debug=runnable.debug)
+
+    # Job done.
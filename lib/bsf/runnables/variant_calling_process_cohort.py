@@ -34,213 +34,18 @@ import shutil
 from bsf import Runnable
 
 
-sample_names = list()
-
-
-def run_gatk_combine_gvcfs(runnable):
-    """Run the I{GATK CombineGVCFs} step.
-
-    @param runnable: C{Runnable}
-    @type runnable: Runnable
-    """
-
-    if os.path.exists(runnable.file_path_dict['combined_gvcf_idx']):
-        return
-
-    runnable.run_executable(name='gatk_combine_gvcfs')
-
-
-def run_gatk_combine_gvcfs_accessory(runnable):
-    """Run the I{GATK CombineGVCFs} step on accessory GVCF files.
-
-    It is only required for hierarchically merging samples before GenotypeGVCFs,
-    if accessory samples for recalibration need processing.
-    @param runnable: C{Runnable}
-    @type runnable: Runnable
-    """
-
-    if os.path.exists(runnable.file_path_dict['temporary_gvcf_idx']):
-        return
-
-    run_gatk_combine_gvcfs(runnable=runnable)
-    if 'gatk_combine_gvcfs_accessory' in runnable.executable_dict:
-        runnable.run_executable(name='gatk_combine_gvcfs_accessory')
-
-
-def run_gatk_genotype_gvcfs(runnable):
-    """Run the I{GATK GenotypeGVCFs} step.
-
-    @param runnable: C{Runnable}
-    @type runnable: Runnable
-    """
-
-    if os.path.exists(runnable.file_path_dict['genotyped_raw_idx']):
-        return
-
-    run_gatk_combine_gvcfs_accessory(runnable=runnable)
-    runnable.run_executable(name='gatk_genotype_gvcfs')
-
-
-def run_gatk_variant_recalibrator_snp(runnable):
-    """Run the I{GATK VariantRecalibrator} for I{SNPs}.
-
-    @param runnable: C{Runnable}
-    @type runnable: Runnable
-    """
-
-    if os.path.exists(runnable.file_path_dict['recalibration_snp']):
-        return
-
-    run_gatk_genotype_gvcfs(runnable=runnable)
-    runnable.run_executable(name='gatk_variant_recalibrator_snp')
-
-
-def run_gatk_variant_recalibrator_indel(runnable):
-    """Run the I{GATK VariantRecalibrator} for I{INDELs}.
-
-    @param runnable: C{Runnable}
-    @type runnable: Runnable
-    """
-
-    if os.path.exists(runnable.file_path_dict['recalibration_indel']):
-        return
-
-    run_gatk_variant_recalibrator_snp(runnable=runnable)
-    runnable.run_executable(name='gatk_variant_recalibrator_indel')
-
-
-def run_gatk_apply_recalibration_snp(runnable):
-    """Run the I{GATK ApplyRecalibration} step for I{SNPs}.
-
-    @param runnable: C{Runnable}
-    @type runnable: Runnable
-    """
-
-    if os.path.exists(runnable.file_path_dict['recalibrated_snp_raw_indel_idx']):
-        return
-
-    run_gatk_variant_recalibrator_indel(runnable=runnable)
-    runnable.run_executable(name='gatk_apply_recalibration_snp')
-
-
-def run_gatk_apply_recalibration_indel(runnable):
-    """Run the I{GATK ApplyRecalibration} step for I{INDELs}.
-
-    @param runnable: C{Runnable}
-    @type runnable: Runnable
-    """
-
-    if os.path.exists(runnable.file_path_dict['recalibrated_snp_recalibrated_indel_idx']):
-        return
-
-    run_gatk_apply_recalibration_snp(runnable=runnable)
-    runnable.run_executable(name='gatk_apply_recalibration_indel')
-
-
-def run_gatk_select_variants_cohort(runnable):
-    """Run the I{GATK SelectVariants} step only, if accessory GVCF files have been used.
-
-    @param runnable: C{Runnable}
-    @type runnable: Runnable
-    """
-
-    if os.path.exists(runnable.file_path_dict['multi_sample_idx']):
-        return
-
-    run_gatk_apply_recalibration_indel(runnable=runnable)
-    if 'gatk_select_variants_cohort' in runnable.executable_dict:
-        runnable.run_executable(name='gatk_select_variants_cohort')
-
-
-def run_snpeff(runnable):
-    """Run the I{snpEff} tool.
-
-    @param runnable: C{Runnable}
-    @type runnable: Runnable
-    """
-
-    if os.path.exists(runnable.file_path_dict['snpeff_vcf']):
-        return
-
-    run_gatk_select_variants_cohort(runnable=runnable)
-    runnable.run_executable(name='snpeff')
-
-
-def run_gatk_variant_annotator(runnable):
-    """Run the I{GATK VariantAnnotator} step.
-
-    @param runnable: C{Runnable}
-    @type runnable: Runnable
-    """
-
-    if os.path.exists(runnable.file_path_dict['annotated_idx']):
-        return
-
-    run_snpeff(runnable=runnable)
-    runnable.run_executable(name='gatk_variant_annotator')
-
-
-def run_gatk_select_variants(runnable):
-    """Run the I{GATK SelectVariants} step.
-
-    @param runnable: C{Runnable}
-    @type runnable: Runnable
-    """
-
-    # Check that all files of this function have already been created.
-
-    complete = True
-    for sample_name in sample_names:
-        if not os.path.exists(runnable.file_path_dict['sample_vcf_' + sample_name]):
-            complete = False
-            break
-    if complete:
-        return
-
-    run_gatk_variant_annotator(runnable=runnable)
-
-    # The GATK SelectVariants step has to be run for each sample name separately.
-
-    for sample_name in sample_names:
-        if os.path.exists(runnable.file_path_dict['sample_vcf_' + sample_name]):
-            continue
-        runnable.run_executable(name='gatk_select_variants_sample_' + sample_name)
-
-
-def run_gatk_variants_to_table(runnable):
-    """Run the I{GATK VariantsToTable} step.
-
-    @param runnable: C{Runnable}
-    @type runnable: Runnable
-    """
-
-    # Check that all files of this function have already been created.
-
-    complete = True
-    for sample_name in sample_names:
-        if not os.path.exists(runnable.file_path_dict['sample_csv_' + sample_name]):
-            complete = False
-            break
-    if complete:
-        return
-
-    run_gatk_select_variants(runnable=runnable)
-
-    # The GATK SelectVariants step has to be run for each sample name separately.
-
-    for sample_name in sample_names:
-        if os.path.exists(runnable.file_path_dict['sample_csv_' + sample_name]):
-            continue
-        runnable.run_executable(name='gatk_variants_to_table_sample_' + sample_name)
-
-
 def run(runnable):
     """Run the the C{Runnable}.
 
+    The C{Executable} objects declare their input and output file paths, so that independent steps,
+    such as the I{GATK VariantRecalibrator} for I{SNPs} and I{INDELs} or the sample-specific
+    I{GATK SelectVariants} and I{GATK VariantsToTable} steps, run concurrently.
     @param runnable: C{Runnable}
     @type runnable: Runnable
     """
 
+    assert isinstance(runnable, Runnable)
+
     # Create a temporary directory.
 
     path_temporary = runnable.file_path_dict['temporary_directory']
@@ -252,19 +57,9 @@ def run(runnable):
             if exception.errno != errno.EEXIST:
                 raise
 
-    # Get all sample names, from file_path_dict keys that start with 'sample_vcf_'.
-
-    keys = runnable.file_path_dict.keys()
-    keys.sort(cmp=lambda x, y: cmp(x.name, y.name))
-
-    for key in keys:
-        if key[:11] == 'sample_vcf_':
-            sample_names.append(key[11:])
-
-    # Run the chain of executables back up the function hierarchy so that
-    # dependencies on temporarily created files become simple to manage.
+    # Run the graph of executables within the threads and memory allocated to the job.
 
-    run_gatk_variants_to_table(runnable=runnable)
+    runnable.run_executable_graph(debug=runnable.debug)
 
     # Remove the temporary directory and everything within it.
 
@@ -41,7 +41,7 @@ def run_picard_mark_duplicates(runnable):
     @type runnable: Runnable
     """
 
-    if os.path.exists(runnable.file_path_dict['duplicates_marked_bam']):
+    if runnable.is_complete(name='picard_mark_duplicates'):
         return
 
     # The Picard MarkDuplicates step may be skipped.
@@ -65,7 +65,7 @@ def run_gatk_realigner_target_creator(runnable):
     @type runnable: Runnable
     """
 
-    if os.path.exists(runnable.file_path_dict['realigner_targets']):
+    if runnable.is_complete(name='gatk_realigner_target_creator'):
         return
 
     run_picard_mark_duplicates(runnable=runnable)
@@ -79,7 +79,7 @@ def run_gatk_indel_realigner(runnable):
     @type runnable: Runnable
     """
 
-    if os.path.exists(runnable.file_path_dict['realigned_bam']):
+    if runnable.is_complete(name='gatk_indel_realigner'):
         return
 
     run_gatk_realigner_target_creator(runnable=runnable)
@@ -98,7 +98,7 @@ def run_gatk_base_recalibrator_pre(runnable):
     @type runnable: Runnable
     """
 
-    if os.path.exists(runnable.file_path_dict['recalibration_table_pre']):
+    if runnable.is_complete(name='gatk_base_recalibrator_pre'):
         return
 
     run_gatk_indel_realigner(runnable=runnable)
@@ -112,7 +112,7 @@ def run_gatk_base_recalibrator_post(runnable):
     @type runnable: Runnable
     """
 
-    if os.path.exists(runnable.file_path_dict['recalibration_table_post']):
+    if runnable.is_complete(name='gatk_base_recalibrator_post'):
         return
 
     run_gatk_base_recalibrator_pre(runnable=runnable)
@@ -126,7 +126,7 @@ def run_gatk_analyze_covariates(runnable):
     @type runnable: Runnable
     """
 
-    if os.path.exists(runnable.file_path_dict['recalibration_plot']):
+    if runnable.is_complete(name='gatk_analyze_covariates'):
         return
 
     run_gatk_base_recalibrator_post(runnable=runnable)
@@ -140,7 +140,7 @@ def run_gatk_print_reads(runnable):
     @type runnable: Runnable
     """
 
-    if os.path.exists(runnable.file_path_dict['recalibrated_bam']):
+    if runnable.is_complete(name='gatk_print_reads'):
         return
 
     run_gatk_analyze_covariates(runnable=runnable)
@@ -159,7 +159,7 @@ def run_picard_collect_alignment_summary_metrics(runnable):
     @type runnable: Runnable
     """
 
-    if os.path.exists(runnable.file_path_dict['alignment_summary_metrics']):
+    if runnable.is_complete(name='picard_collect_alignment_summary_metrics'):
         return
 
     run_gatk_print_reads(runnable=runnable)
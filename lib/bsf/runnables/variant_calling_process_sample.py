@@ -41,7 +41,7 @@ def run_picard_merge_sam_files(runnable):
     @type runnable: Runnable
     """
 
-    if os.path.exists(runnable.file_path_dict['merged_bam']):
+    if runnable.is_complete(name='picard_merge_sam_files'):
         return
 
     runnable.run_executable(name='picard_merge_sam_files')
@@ -55,7 +55,7 @@ def run_picard_mark_duplicates(runnable):
     @type runnable: Runnable
     """
 
-    if os.path.exists(runnable.file_path_dict['duplicates_marked_bam']):
+    if runnable.is_complete(name='picard_mark_duplicates'):
         return
 
     run_picard_merge_sam_files(runnable=runnable)
@@ -79,7 +79,7 @@ def run_gatk_realigner_target_creator(runnable):
     @type runnable: Runnable
     """
 
-    if os.path.exists(runnable.file_path_dict['realigner_targets']):
+    if runnable.is_complete(name='gatk_realigner_target_creator'):
         return
 
     run_picard_mark_duplicates(runnable=runnable)
@@ -93,7 +93,7 @@ def run_gatk_indel_realigner(runnable):
     @type runnable: Runnable
     """
 
-    if os.path.exists(runnable.file_path_dict['realigned_bam']):
+    if runnable.is_complete(name='gatk_indel_realigner'):
         return
 
     run_gatk_realigner_target_creator(runnable=runnable)
@@ -115,7 +115,7 @@ def run_picard_collect_alignment_summary_metrics(runnable):
     @type runnable: Runnable
     """
 
-    if os.path.exists(runnable.file_path_dict['alignment_summary_metrics']):
+    if runnable.is_complete(name='picard_collect_alignment_summary_metrics'):
         return
 
     run_gatk_indel_realigner(runnable=runnable)
@@ -129,7 +129,7 @@ def run_gatk_haplotype_caller(runnable):
     @type runnable: Runnable
     """
 
-    if os.path.exists(runnable.file_path_dict['raw_variants_gvcf_idx']):
+    if runnable.is_complete(name='gatk_haplotype_caller'):
         return
 
     run_picard_collect_alignment_summary_metrics(runnable=runnable)
@@ -0,0 +1,558 @@
+"""bsf.simulation
+
+A package of classes and methods simulating the scheduling of the Executable objects of an Analysis
+on a model of a cluster, without submitting them into a DRMS.
+"""
+
+#
+# Copyright 2014 Michael K. Schuster
+#
+# Biomedical Sequencing Facility (BSF), part of the genomics core facility
+# of the Research Center for Molecular Medicine (CeMM) of the
+# Austrian Academy of Sciences and the Medical University of Vienna (MUW).
+#
+#
+# This file is part of BSF Python.
+#
+# BSF Python is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# BSF Python is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with BSF Python.  If not, see <http://www.gnu.org/licenses/>.
+
+
+import datetime
+import heapq
+import warnings
+
+from bsf.drms import get_wave_list
+
+
+def _format_seconds(seconds):
+    """Format seconds as I{[days, ]hours:minutes:seconds}.
+
+    @param seconds: Seconds
+    @type seconds: int | float
+    @return: Formatted seconds
+    @rtype: str
+    """
+
+    return str(datetime.timedelta(seconds=int(round(seconds))))
+
+
+class ClusterModel(object):
+    """The C{ClusterModel} class models a cluster of identical nodes.
+
+    Attributes:
+    @ivar nodes: Number of nodes
+    @type nodes: int
+    @ivar cores: Number of cores per node
+    @type cores: int
+    @ivar memory: Memory per node in MiB or 0 for unlimited memory
+    @type memory: int
+    """
+
+    def __init__(self, nodes=1, cores=1, memory=0):
+        """Initialise a C{ClusterModel} object.
+
+        @param nodes: Number of nodes
+        @type nodes: int
+        @param cores: Number of cores per node
+        @type cores: int
+        @param memory: Memory per node in MiB or 0 for unlimited memory
+        @type memory: int
+        """
+
+        self.nodes = nodes
+        self.cores = cores
+        self.memory = memory
+
+    def trace(self, level):
+        """Trace a C{ClusterModel} object.
+
+        @param level: Indentation level
+        @type level: int
+        @return: Trace information
+        @rtype: str
+        """
+
+        indent = '  ' * level
+        output = str()
+        output += '{}{!r}\n'.format(indent, self)
+        output += '{}  nodes:  {!r}\n'.format(indent, self.nodes)
+        output += '{}  cores:  {!r}\n'.format(indent, self.cores)
+        output += '{}  memory: {!r}\n'.format(indent, self.memory)
+
+        return output
+
+
+class SimulatedJob(object):
+    """The C{SimulatedJob} class models a DRMS job running one or, if packed, more C{Executable} objects.
+
+    Attributes:
+    @ivar name: Job name
+    @type name: str
+    @ivar drms_name: C{DRMS.name}
+    @type drms_name: str
+    @ivar index: Submission order
+    @type index: int
+    @ivar duration: Duration in seconds
+    @type duration: float
+    @ivar threads: Number of cores requested
+    @type threads: int
+    @ivar memory: Memory requested in MiB
+    @type memory: int
+    @ivar priority: Priority (i.e. the bottom level in the C{ExecutableGraph})
+    @type priority: float
+    @ivar member_count: Number of C{Executable} objects run by the job
+    @type member_count: int
+    @ivar dependency_list: Python C{list} of C{SimulatedJob} objects this one depends on
+    @type dependency_list: list
+    @ivar dependent_list: Python C{list} of C{SimulatedJob} objects depending on this one
+    @type dependent_list: list
+    @ivar ready_time: Time in seconds, at which all dependencies have finished
+    @type ready_time: float
+    @ivar start_time: Start time in seconds
+    @type start_time: float
+    @ivar end_time: End time in seconds
+    @type end_time: float
+    """
+
+    def __init__(self, name, drms_name=None, index=0, duration=0.0, threads=1, memory=0, priority=0.0,
+                 member_count=1, dependency_list=None, dependent_list=None):
+        """Initialise a C{SimulatedJob} object.
+
+        @param name: Job name
+        @type name: str
+        @param drms_name: C{DRMS.name}
+        @type drms_name: str
+        @param index: Submission order
+        @type index: int
+        @param duration: Duration in seconds
+        @type duration: float
+        @param threads: Number of cores requested
+        @type threads: int
+        @param memory: Memory requested in MiB
+        @type memory: int
+        @param priority: Priority (i.e. the bottom level in the C{ExecutableGraph})
+        @type priority: float
+        @param member_count: Number of C{Executable} objects run by the job
+        @type member_count: int
+        @param dependency_list: Python C{list} of C{SimulatedJob} objects this one depends on
+        @type dependency_list: list
+        @param dependent_list: Python C{list} of C{SimulatedJob} objects depending on this one
+        @type dependent_list: list
+        """
+
+        self.name = name
+
+        if drms_name:
+            self.drms_name = drms_name
+        else:
+            self.drms_name = str()
+
+        self.index = index
+        self.duration = duration
+        self.threads = threads
+        self.memory = memory
+        self.priority = priority
+        self.member_count = member_count
+
+        if dependency_list:
+            self.dependency_list = dependency_list
+        else:
+            self.dependency_list = list()
+
+        if dependent_list:
+            self.dependent_list = dependent_list
+        else:
+            self.dependent_list = list()
+
+        self.ready_time = None
+        self.start_time = None
+        self.end_time = None
+
+
+class Simulation(object):
+    """The C{Simulation} class replays the dependency graph of C{Executable} objects on a C{ClusterModel}
+    as a discrete-event simulation.
+
+    Whenever a job finishes, jobs that are ready are started on the first node with enough free cores and
+    memory, either in the order of their priority or in the order of submission. Jobs that do not fit
+    are skipped in favour of smaller ones further down the queue (i.e. backfilling without reservations).
+
+    Attributes:
+    @ivar cluster_model: C{ClusterModel}
+    @type cluster_model: ClusterModel
+    @ivar job_list: Python C{list} of C{SimulatedJob} objects in submission order
+    @type job_list: list
+    @ivar job_overhead: Scheduling and start-up overhead in seconds added to each job
+    @type job_overhead: int
+    @ivar prioritise: Start ready jobs in the order of their priority rather than in submission order
+    @type prioritise: bool
+    @ivar makespan: Makespan in seconds
+    @type makespan: float
+    @ivar core_seconds: Core seconds allocated by all jobs
+    @type core_seconds: float
+    @ivar memory_seconds: MiB seconds allocated by all jobs
+    @type memory_seconds: float
+    @ivar peak_cores: Maximum number of cores allocated at the same time
+    @type peak_cores: int
+    @ivar peak_memory: Maximum memory in MiB allocated at the same time
+    @type peak_memory: int
+    @ivar peak_jobs: Maximum number of jobs running at the same time
+    @type peak_jobs: int
+    @ivar capped_count: Number of jobs whose request exceeded a node and was capped
+    @type capped_count: int
+    """
+
+    @classmethod
+    def from_executable_graph(cls, executable_graph, cluster_model, job_overhead=0, pack_dict=None):
+        """Create a C{Simulation} from an C{ExecutableGraph}.
+
+        C{Executable} objects that are not submitted are considered finished. If requested, C{Executable}
+        objects of a C{DRMS} are packed into jobs by topological wave, as C{DRMS.pack} would, so that the effect
+        of packing can be simulated without packing the C{DRMS} objects. A packed job requests the cores and
+        memory of all C{Executable} objects running concurrently and lasts as long as the longest
+        C{Executable} or the sum of all divided by the number of concurrent C{Executable} objects.
+        Requests exceeding a node get capped to the node, as they would otherwise never start.
+        @param executable_graph: C{ExecutableGraph}
+        @type executable_graph: ExecutableGraph
+        @param cluster_model: C{ClusterModel}
+        @type cluster_model: ClusterModel
+        @param job_overhead: Scheduling and start-up overhead in seconds added to each job
+        @type job_overhead: int
+        @param pack_dict: Python C{dict} of Python C{str} (C{DRMS.name}) key data and
+            Python C{tuple} of Python C{int} (pack size) and Python C{int} (pack threads) value data
+        @type pack_dict: dict
+        @return: C{Simulation}
+        @rtype: Simulation
+        """
+
+        if not pack_dict:
+            pack_dict = dict()
+
+        # Group the submitted ExecutableNode objects of each DRMS by topological wave, as DRMS.pack would.
+
+        drms_name_list = list()
+        drms_node_dict = dict()
+
+        for node in executable_graph.node_list:
+            if not node.executable.submit:
+                continue
+
+            if node.drms_name not in drms_node_dict:
+                drms_name_list.append(node.drms_name)
+                drms_node_dict[node.drms_name] = list()
+            drms_node_dict[node.drms_name].append(node)
+
+        group_list = list()
+
+        for drms_name in drms_name_list:
+            (pack_size, pack_threads) = pack_dict.get(drms_name, (1, 1))
+
+            if pack_size < 2:
+                group_list.extend(map(lambda x: [x], drms_node_dict[drms_name]))
+                continue
+
+            node_name_dict = dict(map(lambda x: (x.executable.name, x), drms_node_dict[drms_name]))
+
+            for wave in get_wave_list(executables=map(lambda x: x.executable, drms_node_dict[drms_name])):
+                for index in range(0, len(wave), pack_size):
+                    group_list.append(map(lambda x: node_name_dict[x.name], wave[index:index + pack_size]))
+
+        job_list = list()
+        job_dict = dict()
+        pack_count_dict = dict()
+        member_cost_dict = dict()
+
+        for group in group_list:
+            drms_name = group[0].drms_name
+            (pack_size, pack_threads) = pack_dict.get(drms_name, (1, 1))
+            pack_threads = max(1, pack_threads)
+
+            if pack_size < 2:
+                name = group[0].executable.name
+                threads = group[0].threads
+                memory = group[0].memory
+            else:
+                pack_count_dict[drms_name] = pack_count_dict.get(drms_name, 0) + 1
+                name = '{}_pack_{:04d}'.format(drms_name, pack_count_dict[drms_name])
+                threads = group[0].threads * pack_threads
+                memory = group[0].memory * pack_threads
+
+            job = SimulatedJob(name=name, drms_name=drms_name, index=len(job_list),
+                               threads=threads, memory=memory, member_count=0)
+            job_list.append(job)
+            member_cost_dict[job] = list()
+
+            for node in group:
+                job.member_count += 1
+                job.priority = max(job.priority, node.bottom_level)
+                member_cost_dict[job].append(node.cost)
+                job_dict[node] = job
+
+        for job in job_list:
+            (pack_size, pack_threads) = pack_dict.get(job.drms_name, (1, 1))
+            cost_list = member_cost_dict[job]
+            job.duration = max(max(cost_list), sum(cost_list) / max(1, min(pack_threads, len(cost_list)))) + \
+                job_overhead
+
+        for node in executable_graph.node_list:
+            if node not in job_dict:
+                continue
+            job = job_dict[node]
+            for dependency_node in node.dependency_list:
+                if dependency_node not in job_dict:
+                    continue
+                dependency_job = job_dict[dependency_node]
+                if dependency_job is not job and dependency_job not in job.dependency_list:
+                    job.dependency_list.append(dependency_job)
+                    dependency_job.dependent_list.append(job)
+
+        simulation = cls(cluster_model=cluster_model, job_list=job_list, job_overhead=job_overhead)
+
+        for job in job_list:
+            if job.threads > cluster_model.cores or (cluster_model.memory and job.memory > cluster_model.memory):
+                job.threads = min(job.threads, cluster_model.cores)
+                if cluster_model.memory:
+                    job.memory = min(job.memory, cluster_model.memory)
+                simulation.capped_count += 1
+
+        if simulation.capped_count:
+            warnings.warn(
+                'The requests of {:d} jobs exceeded a node of the cluster model and were capped.'.
+                format(simulation.capped_count),
+                UserWarning)
+
+        return simulation
+
+    def __init__(self, cluster_model, job_list=None, job_overhead=0):
+        """Initialise a C{Simulation} object.
+
+        @param cluster_model: C{ClusterModel}
+        @type cluster_model: ClusterModel
+        @param job_list: Python C{list} of C{SimulatedJob} objects in submission order
+        @type job_list: list
+        @param job_overhead: Scheduling and start-up overhead in seconds added to each job
+        @type job_overhead: int
+        """
+
+        self.cluster_model = cluster_model
+
+        if job_list:
+            self.job_list = job_list
+        else:
+            self.job_list = list()
+
+        self.job_overhead = job_overhead
+        self.prioritise = False
+        self.makespan = 0.0
+        self.core_seconds = 0.0
+        self.memory_seconds = 0.0
+        self.peak_cores = 0
+        self.peak_memory = 0
+        self.peak_jobs = 0
+        self.capped_count = 0
+
+    def trace(self, level):
+        """Trace a C{Simulation} object.
+
+        @param level: Indentation level
+        @type level: int
+        @return: Trace information
+        @rtype: str
+        """
+
+        indent = '  ' * level
+        output = str()
+        output += '{}{!r}\n'.format(indent, self)
+        output += '{}  job_list:       {!r}\n'.format(indent, len(self.job_list))
+        output += '{}  job_overhead:   {!r}\n'.format(indent, self.job_overhead)
+        output += '{}  prioritise:     {!r}\n'.format(indent, self.prioritise)
+        output += '{}  makespan:       {!r}\n'.format(indent, self.makespan)
+        output += '{}  core_seconds:   {!r}\n'.format(indent, self.core_seconds)
+        output += '{}  memory_seconds: {!r}\n'.format(indent, self.memory_seconds)
+        output += '{}  peak_cores:     {!r}\n'.format(indent, self.peak_cores)
+        output += '{}  peak_memory:    {!r}\n'.format(indent, self.peak_memory)
+        output += '{}  peak_jobs:      {!r}\n'.format(indent, self.peak_jobs)
+        output += '{}  capped_count:   {!r}\n'.format(indent, self.capped_count)
+        output += self.cluster_model.trace(level=level + 1)
+
+        return output
+
+    def run(self, prioritise=True):
+        """Run the simulation.
+
+        @param prioritise: Start ready jobs in the order of their priority rather than in submission order
+        @type prioritise: bool
+        @raise Exception: Jobs could not be started, e.g. due to circular dependencies
+        """
+
+        self.prioritise = prioritise
+        self.makespan = 0.0
+        self.core_seconds = 0.0
+        self.memory_seconds = 0.0
+        self.peak_cores = 0
+        self.peak_memory = 0
+        self.peak_jobs = 0
+
+        free_cores_list = [self.cluster_model.cores] * self.cluster_model.nodes
+        free_memory_list = [self.cluster_model.memory] * self.cluster_model.nodes
+
+        dependency_count_dict = dict()
+        ready_list = list()
+
+        for job in self.job_list:
+            job.ready_time = None
+            job.start_time = None
+            job.end_time = None
+            dependency_count_dict[job] = len(job.dependency_list)
+            if not dependency_count_dict[job]:
+                job.ready_time = 0.0
+                ready_list.append(job)
+
+        # The event queue holds Python tuple objects of end time, submission order, job and node index.
+
+        event_list = list()
+        current_time = 0.0
+        used_cores = 0
+        used_memory = 0
+        finished_count = 0
+
+        while len(ready_list) or len(event_list):
+
+            if prioritise:
+                ready_list.sort(key=lambda x: (-x.priority, x.index))
+            else:
+                ready_list.sort(key=lambda x: x.index)
+
+            waiting_list = list()
+
+            for job in ready_list:
+                node_index = None
+                for index in range(0, self.cluster_model.nodes):
+                    if free_cores_list[index] >= job.threads and \
+                            (not self.cluster_model.memory or free_memory_list[index] >= job.memory):
+                        node_index = index
+                        break
+
+                if node_index is None:
+                    waiting_list.append(job)
+                    continue
+
+                free_cores_list[node_index] -= job.threads
+                free_memory_list[node_index] -= job.memory
+                used_cores += job.threads
+                used_memory += job.memory
+
+                job.start_time = current_time
+                job.end_time = current_time + job.duration
+                heapq.heappush(event_list, (job.end_time, job.index, job, node_index))
+
+                self.core_seconds += job.threads * job.duration
+                self.memory_seconds += job.memory * job.duration
+
+            ready_list = waiting_list
+
+            self.peak_cores = max(self.peak_cores, used_cores)
+            self.peak_memory = max(self.peak_memory, used_memory)
+            self.peak_jobs = max(self.peak_jobs, len(event_list))
+
+            if not len(event_list):
+                break
+
+            # Finish all jobs ending at the same time, before starting further jobs.
+
+            current_time = event_list[0][0]
+
+            while len(event_list) and event_list[0][0] == current_time:
+                (end_time, index, job, node_index) = heapq.heappop(event_list)
+                free_cores_list[node_index] += job.threads
+                free_memory_list[node_index] += job.memory
+                used_cores -= job.threads
+                used_memory -= job.memory
+                finished_count += 1
+
+                for dependent_job in job.dependent_list:
+                    dependency_count_dict[dependent_job] -= 1
+                    if not dependency_count_dict[dependent_job]:
+                        dependent_job.ready_time = current_time
+                        ready_list.append(dependent_job)
+
+        if finished_count < len(self.job_list):
+            raise Exception(
+                'Jobs {!r} could not be started.'.
+                format(map(lambda x: x.name, filter(lambda x: x.start_time is None, self.job_list))))
+
+        self.makespan = current_time
+
+    def get_hotspot_list(self):
+        """Get the queue time per C{DRMS}, which is the time jobs wait for resources, once they are ready.
+
+        @return: Python C{list} of Python C{tuple} objects of Python C{str} (C{DRMS.name}),
+            Python C{int} (number of jobs), Python C{float} (total queue time in seconds) and
+            Python C{float} (maximum queue time in seconds) objects, sorted by total queue time
+        @rtype: list
+        """
+
+        hotspot_dict = dict()
+
+        for job in self.job_list:
+            queue_time = job.start_time - job.ready_time
+            (job_count, total_time, maximum_time) = hotspot_dict.get(job.drms_name, (0, 0.0, 0.0))
+            hotspot_dict[job.drms_name] = (job_count + 1, total_time + queue_time, max(maximum_time, queue_time))
+
+        hotspot_list = map(lambda x: (x, ) + hotspot_dict[x], hotspot_dict.keys())
+        hotspot_list.sort(key=lambda x: (-x[2], x[0]))
+
+        return hotspot_list
+
+    def report(self, hotspots=10):
+        """Report the makespan, the utilisation and the queue time hotspots.
+
+        @param hotspots: Maximum number of C{DRMS} objects listed as queue time hotspots
+        @type hotspots: int
+        @return: Report
+        @rtype: str
+        """
+
+        total_cores = self.cluster_model.nodes * self.cluster_model.cores
+        total_memory = self.cluster_model.nodes * self.cluster_model.memory
+
+        output = str()
+        output += 'Cluster model: {:d} nodes with {:d} cores and {:d} MiB memory each\n'.format(
+            self.cluster_model.nodes, self.cluster_model.cores, self.cluster_model.memory)
+        output += 'Jobs: {:d} running {:d} Executable objects, {} order, {:d} seconds overhead per job\n'.format(
+            len(self.job_list),
+            sum(map(lambda x: x.member_count, self.job_list)),
+            'priority' if self.prioritise else 'submission',
+            self.job_overhead)
+        output += 'Makespan: {} ({:d} seconds)\n'.format(_format_seconds(self.makespan), int(self.makespan))
+
+        if self.makespan:
+            output += 'Core utilisation: {:.1%}, peak {:d} of {:d} cores\n'.format(
+                self.core_seconds / (total_cores * self.makespan), self.peak_cores, total_cores)
+            if total_memory:
+                output += 'Memory utilisation: {:.1%}, peak {:d} of {:d} MiB\n'.format(
+                    self.memory_seconds / (total_memory * self.makespan), self.peak_memory, total_memory)
+            else:
+                output += 'Memory: peak {:d} MiB\n'.format(self.peak_memory)
+            output += 'Peak concurrent jobs: {:d}\n'.format(self.peak_jobs)
+
+        if self.capped_count:
+            output += 'Jobs capped to the size of a node: {:d}\n'.format(self.capped_count)
+
+        output += 'Queue time hotspots:\n'
+        for (drms_name, job_count, total_time, maximum_time) in self.get_hotspot_list()[:hotspots]:
+            output += '  {:<32s} {:6d} jobs  mean {:>16s}  max {:>16s}\n'.format(
+                drms_name, job_count, _format_seconds(total_time / job_count), _format_seconds(maximum_time))
+
+        return output
@@ -0,0 +1,361 @@
+"""bsf.status
+
+A package of classes and methods reporting the progress of the Executable objects of an Analysis
+after their submission into a DRMS.
+"""
+
+#
+# Copyright 2014 Michael K. Schuster
+#
+# Biomedical Sequencing Facility (BSF), part of the genomics core facility
+# of the Research Center for Molecular Medicine (CeMM) of the
+# Austrian Academy of Sciences and the Medical University of Vienna (MUW).
+#
+#
+# This file is part of BSF Python.
+#
+# BSF Python is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# BSF Python is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with BSF Python.  If not, see <http://www.gnu.org/licenses/>.
+
+
+import datetime
+import importlib
+import os
+import string
+
+from bsf.database import DatabaseConnection, JobSubmissionAdaptor, StatusPoll, StatusPollAdaptor
+from bsf.drms import synchronise_job_database
+
+# States reported by the get_job_state_dict functions of the DRMS implementation modules.
+state_names = ('pending', 'running', 'failed', 'done', 'unknown')
+
+time_format = '%Y-%m-%dT%H:%M:%S'
+
+
+def _format_seconds(seconds):
+    """Format seconds as I{[days, ]hours:minutes:seconds}.
+
+    @param seconds: Seconds or C{None}
+    @type seconds: int | float | None
+    @return: Formatted seconds or I{-}, if C{None}
+    @rtype: str
+    """
+
+    if seconds is None:
+        return '-'
+    else:
+        return str(datetime.timedelta(seconds=int(round(seconds))))
+
+
+class DRMSStatus(object):
+    """The C{DRMSStatus} class models the progress of the C{Executable} objects of one C{DRMS}.
+
+    Attributes:
+    @ivar drms_name: C{DRMS.name}
+    @type drms_name: str
+    @ivar implementation: C{DRMS.implementation}
+    @type implementation: str
+    @ivar pending: Number of pending C{Executable} objects
+    @type pending: int
+    @ivar running: Number of running C{Executable} objects
+    @type running: int
+    @ivar failed: Number of failed or cancelled C{Executable} objects
+    @type failed: int
+    @ivar done: Number of successfully completed C{Executable} objects
+    @type done: int
+    @ivar unknown: Number of C{Executable} objects in an unknown state
+    @type unknown: int
+    @ivar throughput: C{Executable} objects done per hour or C{None}, if not known yet
+    @type throughput: float | None
+    """
+
+    def __init__(self, drms_name=None, implementation=None,
+                 pending=0, running=0, failed=0, done=0, unknown=0, throughput=None):
+        """Initialise a C{DRMSStatus} object.
+
+        @param drms_name: C{DRMS.name}
+        @type drms_name: str
+        @param implementation: C{DRMS.implementation}
+        @type implementation: str
+        @param pending: Number of pending C{Executable} objects
+        @type pending: int
+        @param running: Number of running C{Executable} objects
+        @type running: int
+        @param failed: Number of failed or cancelled C{Executable} objects
+        @type failed: int
+        @param done: Number of successfully completed C{Executable} objects
+        @type done: int
+        @param unknown: Number of C{Executable} objects in an unknown state
+        @type unknown: int
+        @param throughput: C{Executable} objects done per hour or C{None}, if not known yet
+        @type throughput: float | None
+        """
+
+        self.drms_name = drms_name
+        self.implementation = implementation
+        self.pending = pending
+        self.running = running
+        self.failed = failed
+        self.done = done
+        self.unknown = unknown
+        self.throughput = throughput
+
+    def get_total(self):
+        """Get the total number of C{Executable} objects.
+
+        @return: Total number of C{Executable} objects
+        @rtype: int
+        """
+
+        return self.pending + self.running + self.failed + self.done + self.unknown
+
+    def get_remaining(self):
+        """Get the number of C{Executable} objects that have not finished (yet).
+
+        C{Executable} objects in an unknown state count as remaining.
+        @return: Number of remaining C{Executable} objects
+        @rtype: int
+        """
+
+        return self.pending + self.running + self.unknown
+
+    def get_eta(self):
+        """Get the estimated time in seconds until all remaining C{Executable} objects are done.
+
+        @return: Estimated time in seconds or C{None}, if the throughput is not known or zero
+        @rtype: float | None
+        """
+
+        if not self.get_remaining():
+            return 0.0
+        elif self.throughput:
+            return self.get_remaining() * 3600.0 / self.throughput
+        else:
+            return
+
+    def trace(self, level):
+        """Trace a C{DRMSStatus} object.
+
+        @param level: Indentation level
+        @type level: int
+        @return: Trace information
+        @rtype: str
+        """
+
+        indent = '  ' * level
+        output = str()
+        output += '{}{!r}\n'.format(indent, self)
+        output += '{}  drms_name:      {!r}\n'.format(indent, self.drms_name)
+        output += '{}  implementation: {!r}\n'.format(indent, self.implementation)
+        output += '{}  pending:        {!r}\n'.format(indent, self.pending)
+        output += '{}  running:        {!r}\n'.format(indent, self.running)
+        output += '{}  failed:         {!r}\n'.format(indent, self.failed)
+        output += '{}  done:           {!r}\n'.format(indent, self.done)
+        output += '{}  unknown:        {!r}\n'.format(indent, self.unknown)
+        output += '{}  throughput:     {!r}\n'.format(indent, self.throughput)
+
+        return output
+
+
+class AnalysisStatus(object):
+    """The C{AnalysisStatus} class models the progress of all C{DRMS} objects of an C{Analysis}.
+
+    Attributes:
+    @ivar poll_time: Time of the poll in ISO 8601 format
+    @type poll_time: str
+    @ivar drms_status_list: Python C{list} of C{DRMSStatus} objects
+    @type drms_status_list: list
+    """
+
+    @classmethod
+    def from_analysis(cls, analysis, user=None, output_dict=None, window=3600, poll_time=None, synchronise=False):
+        """Create an C{AnalysisStatus} object by polling the DRMS implementations of an C{Analysis}.
+
+        The C{DRMS} objects are grouped by their implementation and work directory, which identifies a
+        job database. For each group, the C{JobSubmission} objects of all C{DRMS} objects are read and
+        the C{get_job_state_dict} function of the C{bsf.drms} implementation module is called once, so
+        that the DRMS is queried once per poll regardless of the number of jobs. Implementations without
+        a C{get_job_state_dict} function (e.g. bash) are skipped. If requested, the accounting records of the
+        job database are synchronised first via the C{bsf.drms.synchronise_job_database} function.
+        The counts of each C{DRMS} are recorded as C{StatusPoll} objects, so that the throughput can be
+        calculated from the earliest C{StatusPoll} within the time window.
+        @param analysis: C{Analysis}
+        @type analysis: Analysis
+        @param user: User name to restrict DRMS queries to
+        @type user: str
+        @param output_dict: Python C{dict} of Python C{str} (C{DRMS.implementation}) key data and
+            Python C{str} (canned DRMS output e.g. for testing) value data
+        @type output_dict: dict
+        @param window: Time window in seconds for calculating the throughput
+        @type window: int
+        @param poll_time: Time of the poll in ISO 8601 format or C{None} for now
+        @type poll_time: str
+        @param synchronise: Synchronise the accounting records before polling
+        @type synchronise: bool
+        @return: C{AnalysisStatus}
+        @rtype: AnalysisStatus
+        """
+
+        if output_dict is None:
+            output_dict = dict()
+
+        if poll_time is None:
+            poll_time = datetime.datetime.now().strftime(time_format)
+
+        window_time = (datetime.datetime.strptime(poll_time, time_format) -
+                       datetime.timedelta(seconds=window)).strftime(time_format)
+
+        analysis_status = cls(poll_time=poll_time)
+
+        # Group DRMS objects by their job database, keeping the order of the first DRMS.
+
+        group_dict = dict()
+        group_list = list()
+
+        for drms in analysis.drms_list:
+            key = (drms.implementation, drms.work_directory)
+            if key not in group_dict:
+                group_dict[key] = list()
+                group_list.append(key)
+            group_dict[key].append(drms)
+
+        for key in group_list:
+            (implementation, work_directory) = key
+
+            module = importlib.import_module(string.join(words=('bsf', 'drms', implementation), sep='.'))
+
+            if not hasattr(module, 'get_job_state_dict'):
+                continue
+
+            database_path = os.path.join(work_directory, 'bsfpython_{}_jobs.db'.format(implementation))
+
+            if not os.path.exists(database_path):
+                # Nothing has been submitted yet.
+                continue
+
+            database_connection = DatabaseConnection(
+                file_path=database_path,
+                write_ahead_log=any(map(lambda x: x.database_write_ahead_log, group_dict[key])))
+            database_connection.create_schema()
+
+            if synchronise:
+                synchronise_job_database(module=module, database_connection=database_connection)
+
+            job_submission_adaptor = JobSubmissionAdaptor(database_connection=database_connection)
+            status_poll_adaptor = StatusPollAdaptor(database_connection=database_connection)
+
+            job_submission_dict = dict()
+            job_submission_list = list()
+
+            for drms in group_dict[key]:
+                job_submission_dict[drms.name] = job_submission_adaptor.select_all_by_drms_name(drms_name=drms.name)
+                job_submission_list.extend(job_submission_dict[drms.name])
+
+            job_state_dict = module.get_job_state_dict(
+                job_submission_list=job_submission_list,
+                database_connection=database_connection,
+                user=user,
+                output=output_dict.get(implementation))
+
+            status_poll_list = list()
+
+            for drms in group_dict[key]:
+                drms_status = DRMSStatus(drms_name=drms.name, implementation=implementation)
+
+                for job_submission in job_submission_dict[drms.name]:
+                    state = job_state_dict.get(job_submission.name, 'unknown')
+                    setattr(drms_status, state, getattr(drms_status, state) + 1)
+
+                # The throughput is the rate of Executable objects done since the earliest poll in the window.
+
+                status_poll = status_poll_adaptor.select_earliest(drms_name=drms.name, poll_time=window_time)
+
+                if status_poll is not None and status_poll.poll_time < poll_time:
+                    elapsed = (datetime.datetime.strptime(poll_time, time_format) -
+                               datetime.datetime.strptime(status_poll.poll_time, time_format)).total_seconds()
+                    drms_status.throughput = max(0, drms_status.done - status_poll.done) * 3600.0 / elapsed
+
+                analysis_status.drms_status_list.append(drms_status)
+
+                status_poll_list.append(StatusPoll(
+                    poll_time=poll_time,
+                    drms_name=drms.name,
+                    pending=drms_status.pending,
+                    running=drms_status.running,
+                    failed=drms_status.failed,
+                    done=drms_status.done,
+                    unknown=drms_status.unknown))
+
+            status_poll_adaptor.insert_many(data_object_list=status_poll_list)
+
+        return analysis_status
+
+    def __init__(self, poll_time=None, drms_status_list=None):
+        """Initialise an C{AnalysisStatus} object.
+
+        @param poll_time: Time of the poll in ISO 8601 format
+        @type poll_time: str
+        @param drms_status_list: Python C{list} of C{DRMSStatus} objects
+        @type drms_status_list: list
+        """
+
+        self.poll_time = poll_time
+
+        if drms_status_list is None:
+            self.drms_status_list = list()
+        else:
+            self.drms_status_list = drms_status_list
+
+    def get_summary(self):
+        """Get a C{DRMSStatus} summarising all C{DRMS} objects.
+
+        The throughput is the sum over all C{DRMS} objects with a known throughput.
+        @return: C{DRMSStatus}
+        @rtype: DRMSStatus
+        """
+
+        summary = DRMSStatus(drms_name='Total')
+
+        for drms_status in self.drms_status_list:
+            for state in state_names:
+                setattr(summary, state, getattr(summary, state) + getattr(drms_status, state))
+            if drms_status.throughput is not None:
+                summary.throughput = (summary.throughput or 0.0) + drms_status.throughput
+
+        return summary
+
+    def report(self):
+        """Report the progress of all C{DRMS} objects as a table.
+
+        @return: Report
+        @rtype: str
+        """
+
+        output = str()
+        output += 'Status at {}\n'.format(self.poll_time)
+        output += '{:24s} {:>8s} {:>8s} {:>8s} {:>8s} {:>8s} {:>8s} {:>10s} {:>16s}\n'.format(
+            'DRMS', 'Total', 'Pending', 'Running', 'Failed', 'Done', 'Unknown', 'Done/h', 'ETA')
+
+        for drms_status in self.drms_status_list + [self.get_summary()]:
+            output += '{:24s} {:8d} {:8d} {:8d} {:8d} {:8d} {:8d} {:>10s} {:>16s}\n'.format(
+                drms_status.drms_name,
+                drms_status.get_total(),
+                drms_status.pending,
+                drms_status.running,
+                drms_status.failed,
+                drms_status.done,
+                drms_status.unknown,
+                '-' if drms_status.throughput is None else '{:.1f}'.format(drms_status.throughput),
+                _format_seconds(seconds=drms_status.get_eta()))
+
+        return output